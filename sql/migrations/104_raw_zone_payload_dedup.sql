@@ -0,0 +1,143 @@
+-- =============================================================================
+-- MIGRATION: Raw Zone Payload Deduplication and Compression
+-- =============================================================================
+-- Purpose: Support the bulk RAW zone writer (src/data/pipeline/raw_storage.py)
+--   - payload_hash: content hash used to skip byte-identical re-collections
+--   - payload_encoding / payload_compressed: optional brotli-compressed payload
+--     for large responses; the JSON column is NULL for compressed rows
+--   - (key, collected_at DESC) indexes covering payload_hash so the latest
+--     hash per game/sportsbook is an index-only lookup
+-- Readers must go through decode_raw_payload() to see compressed payloads.
+-- =============================================================================
+
+-- raw_data.action_network_odds
+ALTER TABLE IF EXISTS raw_data.action_network_odds
+    ADD COLUMN IF NOT EXISTS payload_hash VARCHAR(32),
+    ADD COLUMN IF NOT EXISTS payload_encoding VARCHAR(10),
+    ADD COLUMN IF NOT EXISTS payload_compressed BYTEA,
+    ALTER COLUMN raw_odds DROP NOT NULL;
+
+DO $$
+BEGIN
+    IF to_regclass('raw_data.action_network_odds') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_action_network_odds_latest_payload
+        ON raw_data.action_network_odds (external_game_id, sportsbook_key, collected_at DESC) INCLUDE (payload_hash);
+
+        BEGIN
+            ALTER TABLE raw_data.action_network_odds
+                ADD CONSTRAINT chk_action_network_odds_payload_present
+                CHECK (raw_odds IS NOT NULL OR payload_compressed IS NOT NULL) NOT VALID;
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+    END IF;
+END $$;
+
+-- raw_data.action_network_games
+ALTER TABLE IF EXISTS raw_data.action_network_games
+    ADD COLUMN IF NOT EXISTS payload_hash VARCHAR(32),
+    ADD COLUMN IF NOT EXISTS payload_encoding VARCHAR(10),
+    ADD COLUMN IF NOT EXISTS payload_compressed BYTEA,
+    ALTER COLUMN raw_response DROP NOT NULL;
+
+DO $$
+BEGIN
+    IF to_regclass('raw_data.action_network_games') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_action_network_games_latest_payload
+        ON raw_data.action_network_games (external_game_id, collected_at DESC) INCLUDE (payload_hash);
+
+        BEGIN
+            ALTER TABLE raw_data.action_network_games
+                ADD CONSTRAINT chk_action_network_games_payload_present
+                CHECK (raw_response IS NOT NULL OR payload_compressed IS NOT NULL) NOT VALID;
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+    END IF;
+END $$;
+
+-- raw_data.action_network_history
+ALTER TABLE IF EXISTS raw_data.action_network_history
+    ADD COLUMN IF NOT EXISTS payload_hash VARCHAR(32),
+    ADD COLUMN IF NOT EXISTS payload_encoding VARCHAR(10),
+    ADD COLUMN IF NOT EXISTS payload_compressed BYTEA,
+    ALTER COLUMN raw_history DROP NOT NULL;
+
+DO $$
+BEGIN
+    IF to_regclass('raw_data.action_network_history') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_action_network_history_latest_payload
+        ON raw_data.action_network_history (external_game_id, collected_at DESC) INCLUDE (payload_hash);
+
+        BEGIN
+            ALTER TABLE raw_data.action_network_history
+                ADD CONSTRAINT chk_action_network_history_payload_present
+                CHECK (raw_history IS NOT NULL OR payload_compressed IS NOT NULL) NOT VALID;
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+    END IF;
+END $$;
+
+-- raw_data.sbd_betting_splits
+ALTER TABLE IF EXISTS raw_data.sbd_betting_splits
+    ADD COLUMN IF NOT EXISTS payload_hash VARCHAR(32),
+    ADD COLUMN IF NOT EXISTS payload_encoding VARCHAR(10),
+    ADD COLUMN IF NOT EXISTS payload_compressed BYTEA,
+    ALTER COLUMN raw_response DROP NOT NULL;
+
+DO $$
+BEGIN
+    IF to_regclass('raw_data.sbd_betting_splits') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_sbd_betting_splits_latest_payload
+        ON raw_data.sbd_betting_splits (external_matchup_id, collected_at DESC) INCLUDE (payload_hash);
+
+        BEGIN
+            ALTER TABLE raw_data.sbd_betting_splits
+                ADD CONSTRAINT chk_sbd_betting_splits_payload_present
+                CHECK (raw_response IS NOT NULL OR payload_compressed IS NOT NULL) NOT VALID;
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+    END IF;
+END $$;
+
+-- raw_data.vsin_data
+ALTER TABLE IF EXISTS raw_data.vsin_data
+    ADD COLUMN IF NOT EXISTS payload_hash VARCHAR(32),
+    ADD COLUMN IF NOT EXISTS payload_encoding VARCHAR(10),
+    ADD COLUMN IF NOT EXISTS payload_compressed BYTEA,
+    ALTER COLUMN raw_response DROP NOT NULL;
+
+DO $$
+BEGIN
+    IF to_regclass('raw_data.vsin_data') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_vsin_data_latest_payload
+        ON raw_data.vsin_data (external_id, collected_at DESC) INCLUDE (payload_hash);
+
+        BEGIN
+            ALTER TABLE raw_data.vsin_data
+                ADD CONSTRAINT chk_vsin_data_payload_present
+                CHECK (raw_response IS NOT NULL OR payload_compressed IS NOT NULL) NOT VALID;
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+    END IF;
+END $$;
+
+-- raw_data.mlb_stats_api_games
+ALTER TABLE IF EXISTS raw_data.mlb_stats_api_games
+    ADD COLUMN IF NOT EXISTS payload_hash VARCHAR(32),
+    ADD COLUMN IF NOT EXISTS payload_encoding VARCHAR(10),
+    ADD COLUMN IF NOT EXISTS payload_compressed BYTEA,
+    ALTER COLUMN raw_response DROP NOT NULL;
+
+DO $$
+BEGIN
+    IF to_regclass('raw_data.mlb_stats_api_games') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_mlb_stats_api_games_latest_payload
+        ON raw_data.mlb_stats_api_games (external_game_id, collected_at DESC) INCLUDE (payload_hash);
+
+        BEGIN
+            ALTER TABLE raw_data.mlb_stats_api_games
+                ADD CONSTRAINT chk_mlb_stats_api_games_payload_present
+                CHECK (raw_response IS NOT NULL OR payload_compressed IS NOT NULL) NOT VALID;
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+    END IF;
+END $$;
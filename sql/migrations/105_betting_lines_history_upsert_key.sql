@@ -0,0 +1,48 @@
+-- =============================================================================
+-- MIGRATION: Betting Lines History Upsert Key
+-- =============================================================================
+-- Purpose: Support bulk line-history persistence in ActionNetworkRepository
+--   - Unique (game_id, sportsbook_id, market_type, odds_timestamp) key used as
+--     the ON CONFLICT target when a game's history is COPY-loaded per market
+--   - Partial on sportsbook_id IS NOT NULL: rows without a resolved sportsbook
+--     cannot be told apart by this key (several books may share the NULL), so
+--     they are neither deduplicated nor constrained here. The repository only
+--     upserts rows whose sportsbook resolved.
+-- Existing duplicate history rows with a sportsbook_id are collapsed to the
+-- most recently inserted row per key first. Any failure aborts the migration:
+-- without the index every history upsert would fail at runtime.
+-- =============================================================================
+
+DO $$
+BEGIN
+    IF to_regclass('curated.betting_lines_unified') IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Earlier builds of this key covered NULL sportsbook_ids as well
+    IF EXISTS (
+        SELECT 1
+        FROM pg_index
+        WHERE indexrelid = to_regclass('curated.uq_betting_lines_unified_history_key')
+          AND indpred IS NULL
+    ) THEN
+        DROP INDEX curated.uq_betting_lines_unified_history_key;
+    END IF;
+
+    DELETE FROM curated.betting_lines_unified AS line
+    USING (
+        SELECT id,
+               row_number() OVER (
+                   PARTITION BY game_id, sportsbook_id, market_type, odds_timestamp
+                   ORDER BY id DESC
+               ) AS position
+        FROM curated.betting_lines_unified
+        WHERE sportsbook_id IS NOT NULL
+    ) AS ranked
+    WHERE line.id = ranked.id
+      AND ranked.position > 1;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_betting_lines_unified_history_key
+    ON curated.betting_lines_unified (game_id, sportsbook_id, market_type, odds_timestamp)
+    WHERE sportsbook_id IS NOT NULL;
+END $$;
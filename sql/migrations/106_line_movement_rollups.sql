@@ -0,0 +1,99 @@
+-- =============================================================================
+-- MIGRATION: Line Movement Rollups
+-- =============================================================================
+-- Purpose: Pre-aggregated line movement history for dashboards and the CLI
+--   - curated.line_movement_rollups: one row per game / sportsbook / market /
+--     side and time bucket ('5m' and '1h') with open/high/low/close odds and
+--     line values plus observation and movement counts
+--   - curated.line_movement_rollup_state: id watermark over
+--     curated.line_movement_history so refreshes only touch new rows
+--   - curated.line_movement_rollup_summary: opening/closing summary per
+--     market read from the hourly rollups (column-compatible with
+--     curated.line_movement_summary)
+-- Maintained by LineMovementRollupService
+-- (src/services/analytics/line_movement_rollup_service.py).
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS curated.line_movement_rollups (
+    bucket_width VARCHAR(4) NOT NULL CHECK (bucket_width IN ('5m', '1h')),
+    game_id INTEGER NOT NULL,
+    sportsbook_id INTEGER NOT NULL,
+    bet_type VARCHAR(20) NOT NULL,
+    side VARCHAR(10) NOT NULL,
+    bucket_start TIMESTAMPTZ NOT NULL,
+
+    -- OHLC odds and line values within the bucket
+    open_odds INTEGER NOT NULL,
+    high_odds INTEGER NOT NULL,
+    low_odds INTEGER NOT NULL,
+    close_odds INTEGER NOT NULL,
+    open_line DECIMAL(4,1),
+    high_line DECIMAL(4,1),
+    low_line DECIMAL(4,1),
+    close_line DECIMAL(4,1),
+
+    -- Activity within the bucket; movements compare against the previous
+    -- observation of the same market, which may sit in an earlier bucket
+    observations INTEGER NOT NULL,
+    odds_movements INTEGER NOT NULL DEFAULT 0,
+    line_movements INTEGER NOT NULL DEFAULT 0,
+    first_timestamp TIMESTAMPTZ NOT NULL,
+    last_timestamp TIMESTAMPTZ NOT NULL,
+
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (bucket_width, game_id, sportsbook_id, bet_type, side, bucket_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_line_movement_rollups_game_market
+ON curated.line_movement_rollups (game_id, bet_type, bucket_width, bucket_start);
+
+CREATE TABLE IF NOT EXISTS curated.line_movement_rollup_state (
+    rollup_name VARCHAR(50) PRIMARY KEY,
+    last_source_id BIGINT NOT NULL DEFAULT 0,
+    last_refreshed_at TIMESTAMPTZ,
+    last_refresh_rows INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT INTO curated.line_movement_rollup_state (rollup_name)
+VALUES ('line_movement_history')
+ON CONFLICT (rollup_name) DO NOTHING;
+
+-- Covers the "which markets changed since the watermark" scan
+DO $$
+BEGIN
+    IF to_regclass('curated.line_movement_history') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_line_movement_history_series
+        ON curated.line_movement_history (game_id, sportsbook_id, bet_type, side, line_timestamp);
+    END IF;
+END $$;
+
+CREATE OR REPLACE VIEW curated.line_movement_rollup_summary AS
+SELECT
+    r.game_id,
+    r.sportsbook_id,
+    s.display_name AS sportsbook_name,
+    r.bet_type,
+    r.side,
+    g.home_team,
+    g.away_team,
+    g.game_datetime,
+    (ARRAY_AGG(r.open_odds ORDER BY r.bucket_start ASC))[1] AS opening_odds,
+    (ARRAY_AGG(r.open_line ORDER BY r.bucket_start ASC))[1] AS opening_line_value,
+    (ARRAY_AGG(r.close_odds ORDER BY r.bucket_start DESC))[1] AS closing_odds,
+    (ARRAY_AGG(r.close_line ORDER BY r.bucket_start DESC))[1] AS closing_line_value,
+    (ARRAY_AGG(r.close_odds ORDER BY r.bucket_start DESC))[1]
+        - (ARRAY_AGG(r.open_odds ORDER BY r.bucket_start ASC))[1] AS odds_movement,
+    (ARRAY_AGG(r.close_line ORDER BY r.bucket_start DESC))[1]
+        - (ARRAY_AGG(r.open_line ORDER BY r.bucket_start ASC))[1] AS line_movement,
+    SUM(r.observations) AS total_movements,
+    SUM(r.odds_movements) AS odds_changes,
+    SUM(r.line_movements) AS line_changes,
+    MIN(r.first_timestamp) AS opening_timestamp,
+    MAX(r.last_timestamp) AS closing_timestamp
+FROM curated.line_movement_rollups r
+JOIN curated.sportsbooks s ON r.sportsbook_id = s.id
+JOIN curated.games_complete g ON r.game_id = g.id
+WHERE r.bucket_width = '1h'
+GROUP BY r.game_id, r.sportsbook_id, s.display_name, r.bet_type, r.side,
+         g.home_team, g.away_team, g.game_datetime;
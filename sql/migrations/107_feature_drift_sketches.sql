@@ -0,0 +1,28 @@
+-- =============================================================================
+-- MIGRATION: Feature Drift Sketches
+-- =============================================================================
+-- Purpose: Incrementally maintained feature distributions for drift detection
+--   - curated.ml_feature_drift_sketches: one row per model / model version /
+--     day holding a mergeable sketch (fixed-bin histogram plus running
+--     moments) for every tracked feature and feature importance
+-- Updated as predictions are stored and read by FeatureDriftDetectionService
+-- (src/ml/services/feature_drift_detection_service.py); sketch format in
+-- src/ml/monitoring/drift_sketches.py.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS curated.ml_feature_drift_sketches (
+    model_name VARCHAR(100) NOT NULL,
+    model_version VARCHAR(50) NOT NULL,
+    window_start DATE NOT NULL,
+
+    -- {feature_name: {"n", "mean", "m2", "min", "max", "bins": {index: count}}}
+    sketches JSONB NOT NULL DEFAULT '{}'::jsonb,
+    sample_count BIGINT NOT NULL DEFAULT 0,
+
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (model_name, model_version, window_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_ml_feature_drift_sketches_window
+ON curated.ml_feature_drift_sketches (model_name, window_start);
@@ -39,6 +39,7 @@ except ImportError:
     mlflow = None
     MlflowClient = None
 
+from ...core import odds_math
 from ...core.config import get_settings
 from ...core.datetime_utils import EST
 from ...core.exceptions import BacktestingError
@@ -795,13 +796,10 @@ class MLIntegratedBacktestingEngine:
     ) -> Decimal:
         """Calculate optimal bet size using Kelly criterion"""
         try:
-            # Kelly fraction = (bp - q) / b
-            # Where b = odds, p = win probability, q = loss probability
-            
             win_prob = probability if probability > 0.5 else (1 - probability)
-            odds = 1.91  # Simplified odds
+            odds = 1.91  # Simplified decimal odds (about -110)
             
-            kelly_fraction = (odds * win_prob - 1) / (odds - 1)
+            kelly_fraction = odds_math.kelly_fraction(win_prob, odds)
             kelly_fraction = max(0, min(kelly_fraction, config.max_bet_percentage))
             
             # Apply confidence adjustment
@@ -22,12 +22,15 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any
 
+import numpy as np
+
 from src.analysis.models.unified_models import (
     SignalType,
     StrategyCategory,
     UnifiedBettingSignal,
 )
 from src.analysis.strategies.base import BaseStrategyProcessor, StrategyProcessorMixin
+from src.core import odds_math
 from src.core.exceptions import StrategyError
 from src.data.database import UnifiedRepository
 
@@ -166,8 +169,8 @@ class UnifiedBookConflictProcessor(BaseStrategyProcessor, StrategyProcessorMixin
 
         try:
             # Get multi-book odds data
-            multi_book_data = await self._get_multi_book_odds_data(
-                game_data, minutes_ahead
+            multi_book_data = await self.run_phase(
+                "data_fetch", self._get_multi_book_odds_data(game_data, minutes_ahead)
             )
 
             if not multi_book_data:
@@ -217,7 +220,9 @@ class UnifiedBookConflictProcessor(BaseStrategyProcessor, StrategyProcessorMixin
                     continue
 
             # Apply conflict-specific filtering and ranking
-            signals = await self._apply_conflict_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_conflict_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} book conflict signals")
             return signals
@@ -388,26 +393,21 @@ class UnifiedBookConflictProcessor(BaseStrategyProcessor, StrategyProcessorMixin
         conflicts = []
 
         try:
-            # Find best odds for each side
-            best_home_odds = float("-inf")
-            best_away_odds = float("-inf")
-            best_home_book = None
-            best_away_book = None
-
-            for book_name, lines in book_lines.items():
-                home_odds = lines.get("home", 0)
-                away_odds = lines.get("away", 0)
+            if not book_lines:
+                return conflicts
 
-                if home_odds > best_home_odds:
-                    best_home_odds = home_odds
-                    best_home_book = book_name
+            books = list(book_lines)
+            home = np.array([lines.get("home", 0) for lines in book_lines.values()], dtype=float)
+            away = np.array([lines.get("away", 0) for lines in book_lines.values()], dtype=float)
 
-                if away_odds > best_away_odds:
-                    best_away_odds = away_odds
-                    best_away_book = book_name
+            # Find best odds for each side (first book wins ties)
+            best_home_book = books[int(np.argmax(home))]
+            best_away_book = books[int(np.argmax(away))]
+            best_home_odds = book_lines[best_home_book].get("home", 0)
+            best_away_odds = book_lines[best_away_book].get("away", 0)
 
             # Check for arbitrage opportunity
-            if best_home_book and best_away_book and best_home_book != best_away_book:
+            if best_home_book != best_away_book:
                 arbitrage_profit = self._calculate_arbitrage_profit(
                     best_home_odds, best_away_odds
                 )
@@ -428,20 +428,18 @@ class UnifiedBookConflictProcessor(BaseStrategyProcessor, StrategyProcessorMixin
                         }
                     )
 
-            # Check for significant discrepancies
-            max_discrepancy = 0
-            discrepancy_books = []
-
-            for book1_name, lines1 in book_lines.items():
-                for book2_name, lines2 in book_lines.items():
-                    if book1_name != book2_name:
-                        home_diff = abs(lines1.get("home", 0) - lines2.get("home", 0))
-                        away_diff = abs(lines1.get("away", 0) - lines2.get("away", 0))
-                        max_diff = max(home_diff, away_diff)
-
-                        if max_diff > max_discrepancy:
-                            max_discrepancy = max_diff
-                            discrepancy_books = [book1_name, book2_name]
+            # Check for significant discrepancies across every book pair at once
+            pair_discrepancy = np.maximum(
+                np.abs(home[:, None] - home[None, :]),
+                np.abs(away[:, None] - away[None, :]),
+            )
+            book1, book2 = np.unravel_index(
+                np.argmax(pair_discrepancy), pair_discrepancy.shape
+            )
+            max_discrepancy = float(pair_discrepancy[book1, book2])
+            discrepancy_books = (
+                [books[book1], books[book2]] if max_discrepancy > 0 else []
+            )
 
             if max_discrepancy >= self.min_discrepancy_threshold:
                 severity = self._determine_conflict_severity(max_discrepancy)
@@ -568,23 +566,9 @@ class UnifiedBookConflictProcessor(BaseStrategyProcessor, StrategyProcessorMixin
     def _calculate_arbitrage_profit(self, odds1: float, odds2: float) -> float:
         """Calculate arbitrage profit percentage"""
         try:
-            # Convert American odds to decimal
-            if odds1 > 0:
-                decimal1 = (odds1 / 100) + 1
-            else:
-                decimal1 = (100 / abs(odds1)) + 1
-
-            if odds2 > 0:
-                decimal2 = (odds2 / 100) + 1
-            else:
-                decimal2 = (100 / abs(odds2)) + 1
-
-            # Calculate arbitrage profit
-            arbitrage_percentage = (1 / decimal1) + (1 / decimal2)
-            profit = (1 - arbitrage_percentage) if arbitrage_percentage < 1 else 0
-
-            return max(0, profit)
-
+            return odds_math.arbitrage_profit(
+                odds_math.american_to_decimal(odds1), odds_math.american_to_decimal(odds2)
+            )
         except Exception:
             return 0
 
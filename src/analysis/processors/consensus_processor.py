@@ -147,8 +147,8 @@ class UnifiedConsensusProcessor(BaseStrategyProcessor, StrategyProcessorMixin):
 
         try:
             # Get consensus splits data
-            consensus_data = await self._get_consensus_splits_data(
-                game_data, minutes_ahead
+            consensus_data = await self.run_phase(
+                "data_fetch", self._get_consensus_splits_data(game_data, minutes_ahead)
             )
 
             if not consensus_data:
@@ -197,7 +197,9 @@ class UnifiedConsensusProcessor(BaseStrategyProcessor, StrategyProcessorMixin):
                     continue
 
             # Apply final filtering and ranking
-            signals = await self._apply_consensus_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_consensus_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} consensus signals")
             return signals
@@ -166,7 +166,9 @@ class UnifiedHybridSharpProcessor(BaseStrategyProcessor, StrategyProcessorMixin)
 
         try:
             # Get hybrid data with both line movement and sharp action
-            hybrid_data = await self._get_hybrid_sharp_data(game_data, minutes_ahead)
+            hybrid_data = await self.run_phase(
+                "data_fetch", self._get_hybrid_sharp_data(game_data, minutes_ahead)
+            )
 
             if not hybrid_data:
                 self.logger.info("No hybrid sharp data available for analysis")
@@ -213,7 +215,9 @@ class UnifiedHybridSharpProcessor(BaseStrategyProcessor, StrategyProcessorMixin)
                     continue
 
             # Apply final filtering and ranking
-            signals = await self._apply_hybrid_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_hybrid_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} hybrid sharp signals")
             return signals
@@ -153,8 +153,8 @@ class UnifiedLateFlipProcessor(BaseStrategyProcessor, StrategyProcessorMixin):
 
         try:
             # Get betting data with historical timeline
-            betting_timeline = await self._get_betting_timeline_data(
-                game_data, minutes_ahead
+            betting_timeline = await self.run_phase(
+                "data_fetch", self._get_betting_timeline_data(game_data, minutes_ahead)
             )
 
             if not betting_timeline:
@@ -200,7 +200,9 @@ class UnifiedLateFlipProcessor(BaseStrategyProcessor, StrategyProcessorMixin):
                     continue
 
             # Apply final filtering and ranking
-            signals = await self._apply_flip_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_flip_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} late flip signals")
             return signals
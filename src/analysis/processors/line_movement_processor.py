@@ -154,7 +154,9 @@ class UnifiedLineMovementProcessor(BaseStrategyProcessor, StrategyProcessorMixin
 
         try:
             # Get line movement data with historical tracking
-            movement_data = await self._get_line_movement_data(game_data, minutes_ahead)
+            movement_data = await self.run_phase(
+                "data_fetch", self._get_line_movement_data(game_data, minutes_ahead)
+            )
 
             if not movement_data:
                 self.logger.info("No line movement data available for analysis")
@@ -201,7 +203,9 @@ class UnifiedLineMovementProcessor(BaseStrategyProcessor, StrategyProcessorMixin
                     continue
 
             # Apply final filtering and ranking
-            signals = await self._apply_movement_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_movement_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} line movement signals")
             return signals
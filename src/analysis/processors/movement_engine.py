@@ -0,0 +1,354 @@
+"""
+Columnar line movement engine.
+
+Holds the line movements of one or more games as typed polars columns, one
+row per consecutive pair of Action Network history entries, and computes
+the movement patterns used by MovementAnalyzer (market summaries, RLM,
+cross-book consensus, rapid movements, arbitrage) as group-by operations.
+
+Rows are keyed by ``game`` (the position of the game in the analyzed slate)
+so a whole slate is analyzed in one pass. Result models are built by the
+analyzer from the frames returned here.
+"""
+
+from collections.abc import Callable, Sequence
+from datetime import datetime, timedelta, timezone
+
+import polars as pl
+
+MARKETS = ("moneyline", "spread", "total")
+
+# Direction codes stored in the ``direction`` column
+UP, DOWN, STABLE = 1, -1, 0
+
+# Magnitude thresholds (MODERATE, SIGNIFICANT, MAJOR) per market family
+MONEYLINE_MAGNITUDE_THRESHOLDS = (5, 15, 25)
+POINTS_MAGNITUDE_THRESHOLDS = (0.5, 1.0, 2.0)
+
+CROSS_BOOK_BUCKET_US = 5 * 60 * 1_000_000
+RAPID_WINDOW_US = 10 * 60 * 1_000_000
+RLM_RECENT_MOVEMENTS = 5
+ARBITRAGE_MIN_DISCREPANCY = 20
+
+SERIES_KEYS = ["game", "sportsbook_id", "market_type"]
+
+HISTORY_SCHEMA = {
+    "game": pl.Int32,
+    "item": pl.Int32,
+    "sportsbook_id": pl.Utf8,
+    "market_type": pl.Utf8,
+    "updated_at": pl.Utf8,
+    "value": pl.Float64,
+    "odds": pl.Float64,
+}
+
+SNAPSHOT_SCHEMA = {
+    "game": pl.Int32,
+    "sportsbook_id": pl.Utf8,
+    "market_type": pl.Utf8,
+    "tickets_percent": pl.Int64,
+    "money_percent": pl.Int64,
+    "tickets_count": pl.Int64,
+    "money_amount": pl.Float64,
+}
+
+
+def _to_float(value) -> float | None:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value) -> int | None:
+    try:
+        return None if value is None else int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _direction(delta: pl.Expr) -> pl.Expr:
+    return delta.sign().fill_null(0).cast(pl.Int8)
+
+
+def _magnitude(amount: pl.Expr, thresholds: tuple[float, float, float]) -> pl.Expr:
+    return sum((amount >= threshold).cast(pl.Int8) for threshold in thresholds)
+
+
+def parse_timestamps(
+    timestamps: pl.Series,
+    now: datetime,
+    fallback: Callable[[str], datetime] | None = None,
+) -> pl.Series:
+    """
+    Parse ISO-8601 strings to int64 microseconds since the epoch (UTC).
+
+    The column is parsed in bulk; only strings neither bulk format accepts
+    go through ``fallback``. Empty or unparseable timestamps become ``now``.
+    """
+    normalized = timestamps.str.replace(r"Z$", "+00:00")
+    parsed = normalized.str.to_datetime(
+        "%Y-%m-%dT%H:%M:%S%.f%z", time_unit="us", time_zone="UTC", strict=False
+    )
+    naive = normalized.str.to_datetime(
+        "%Y-%m-%dT%H:%M:%S%.f", time_unit="us", strict=False
+    ).dt.replace_time_zone("UTC")
+    micros = parsed.fill_null(naive).cast(pl.Int64)
+
+    now_us = int(now.timestamp() * 1_000_000)
+    if fallback is not None:
+        missing = (micros.is_null() & (timestamps.fill_null("") != "")).arg_true()
+        if len(missing):
+            micros = micros.scatter(
+                missing,
+                [
+                    int(fallback(timestamps[index]).timestamp() * 1_000_000)
+                    for index in missing.to_list()
+                ],
+            )
+    return micros.fill_null(now_us).alias("ts")
+
+
+class MovementFrame:
+    """Typed movement and betting-split columns for a slate of games."""
+
+    def __init__(self, movements: pl.DataFrame, snapshots: pl.DataFrame, now: datetime):
+        self.movements = movements
+        self.snapshots = snapshots
+        self.now = now
+
+    @classmethod
+    def from_games(
+        cls,
+        games: Sequence[dict],
+        now: datetime | None = None,
+        parse_fallback: Callable[[str], datetime] | None = None,
+    ) -> "MovementFrame":
+        """
+        Flatten raw Action Network game data into movement columns.
+
+        Args:
+            games: Game dicts with ``raw_data`` keyed by sportsbook ID
+            now: Reference time for missing timestamps and recency windows
+            parse_fallback: Parser for timestamps the bulk parser rejects
+        """
+        now = now or datetime.now(timezone.utc)
+        history = {name: [] for name in HISTORY_SCHEMA}
+        snapshots = {name: [] for name in SNAPSHOT_SCHEMA}
+        item = 0
+
+        for game_index, game_data in enumerate(games):
+            raw_data = game_data.get("raw_data") or {}
+            for sportsbook_id, sportsbook_data in raw_data.items():
+                event_data = sportsbook_data.get("event", {})
+                for market_type in MARKETS:
+                    market_data = event_data.get(market_type, [])
+                    if not isinstance(market_data, list):
+                        continue
+
+                    for market_item in market_data:
+                        entries = market_item.get("history", [])
+                        if len(entries) >= 2:
+                            item += 1
+                            for entry in entries:
+                                history["game"].append(game_index)
+                                history["item"].append(item)
+                                history["sportsbook_id"].append(str(sportsbook_id))
+                                history["market_type"].append(market_type)
+                                history["updated_at"].append(entry.get("updated_at") or "")
+                                history["value"].append(_to_float(entry.get("value")))
+                                history["odds"].append(_to_float(entry.get("odds")))
+
+                        bet_info = market_item.get("bet_info", {})
+                        if bet_info:
+                            tickets = bet_info.get("tickets", {})
+                            money = bet_info.get("money", {})
+                            snapshots["game"].append(game_index)
+                            snapshots["sportsbook_id"].append(str(sportsbook_id))
+                            snapshots["market_type"].append(market_type)
+                            snapshots["tickets_percent"].append(_to_int(tickets.get("percent")))
+                            snapshots["money_percent"].append(_to_int(money.get("percent")))
+                            snapshots["tickets_count"].append(_to_int(tickets.get("value")))
+                            snapshots["money_amount"].append(_to_float(money.get("value")))
+
+        history_frame = pl.DataFrame(history, schema=HISTORY_SCHEMA)
+        snapshot_frame = pl.DataFrame(snapshots, schema=SNAPSHOT_SCHEMA)
+        return cls(cls._pair_movements(history_frame, now, parse_fallback), snapshot_frame, now)
+
+    @staticmethod
+    def _pair_movements(
+        history: pl.DataFrame,
+        now: datetime,
+        parse_fallback: Callable[[str], datetime] | None,
+    ) -> pl.DataFrame:
+        """Turn history entries into one row per consecutive pair."""
+        is_moneyline = pl.col("market_type") == "moneyline"
+        delta = (
+            pl.when(is_moneyline)
+            .then(pl.col("odds") - pl.col("previous_odds"))
+            .otherwise(pl.col("value") - pl.col("previous_value"))
+        )
+        amount = pl.col("movement_amount")
+
+        movements = (
+            history.with_columns(
+                pl.col("odds").shift(1).over("item").alias("previous_odds"),
+                pl.col("value").shift(1).over("item").alias("previous_value"),
+            )
+            .filter(pl.col("odds").is_not_null() & pl.col("previous_odds").is_not_null())
+            .with_columns(
+                _direction(delta).alias("direction"),
+                delta.abs().alias("movement_amount"),
+            )
+            .with_columns(
+                pl.when(is_moneyline)
+                .then(_magnitude(amount, MONEYLINE_MAGNITUDE_THRESHOLDS))
+                .otherwise(_magnitude(amount, POINTS_MAGNITUDE_THRESHOLDS))
+                .fill_null(0)
+                .cast(pl.Int8)
+                .alias("magnitude")
+            )
+        )
+        if movements.is_empty():
+            timestamps = pl.Series("ts", [], dtype=pl.Int64)
+        else:
+            timestamps = parse_timestamps(
+                movements.get_column("updated_at"), now, parse_fallback
+            )
+        return (
+            movements.with_columns(timestamps)
+            .with_columns(pl.col("ts").cast(pl.Datetime("us", "UTC")).alias("timestamp"))
+            .with_row_index("seq")
+            .drop("updated_at")
+        )
+
+    def market_summaries(self) -> pl.DataFrame:
+        """Movement counts and dominant direction per game and market."""
+        return (
+            self.movements.group_by(["game", "market_type"])
+            .agg(
+                pl.len().alias("total_movements"),
+                (pl.col("magnitude") >= 2).sum().alias("significant_movements"),
+                (pl.col("magnitude") == 3).sum().alias("major_movements"),
+                _direction(pl.col("direction").sum()).alias("dominant_direction"),
+            )
+            .sort(["game", "market_type"])
+        )
+
+    def reverse_line_movements(self) -> pl.DataFrame:
+        """
+        Series whose recent line direction opposes the public side.
+
+        Uses the last five movements of each (game, book, market) series and
+        the latest betting-split snapshot for it.
+        """
+        recent = (
+            self.movements.sort(["ts", "seq"])
+            .group_by(SERIES_KEYS, maintain_order=True)
+            .tail(RLM_RECENT_MOVEMENTS)
+            .group_by(SERIES_KEYS, maintain_order=True)
+            .agg(
+                pl.len().alias("movements"),
+                _direction(pl.col("direction").sum()).alias("line_direction"),
+                pl.col("movement_amount").fill_null(0).sum().alias("line_movement_amount"),
+                pl.col("seq").min().alias("first_seq"),
+            )
+            .filter(pl.col("movements") >= 2)
+        )
+        latest_snapshot = self.snapshots.group_by(SERIES_KEYS, maintain_order=True).agg(
+            pl.col("tickets_percent").last()
+        )
+        tickets = pl.col("tickets_percent").fill_null(50)
+
+        return (
+            recent.join(latest_snapshot, on=SERIES_KEYS, how="inner")
+            .with_columns(
+                pl.when(tickets > 55)
+                .then(UP)
+                .when(tickets < 45)
+                .then(DOWN)
+                .otherwise(STABLE)
+                .cast(pl.Int8)
+                .alias("public_direction")
+            )
+            .filter(
+                (pl.col("line_direction") != STABLE)
+                & (pl.col("line_direction") != pl.col("public_direction"))
+            )
+            .sort("first_seq")
+        )
+
+    def cross_book_movements(self, min_books: int = 3) -> pl.DataFrame:
+        """Consensus of movements bucketed to five minutes per game and market."""
+        keys = ["game", "bucket", "market_type"]
+        bucketed = self.movements.with_columns(
+            (pl.col("ts") - pl.col("ts") % CROSS_BOOK_BUCKET_US).alias("bucket")
+        )
+        groups = (
+            bucketed.group_by(keys, maintain_order=True)
+            .agg(
+                pl.len().alias("movements"),
+                pl.col("sportsbook_id").unique(maintain_order=True).alias("books"),
+                (pl.col("direction") == UP).sum().alias("up"),
+                (pl.col("direction") == DOWN).sum().alias("down"),
+                (pl.col("direction") == STABLE).sum().alias("stable"),
+                pl.col("movement_amount").fill_null(0).mean().alias("average_movement"),
+            )
+            .filter(pl.col("movements") >= min_books)
+            .with_columns(
+                # Ties resolve in UP, DOWN, STABLE order
+                pl.when((pl.col("up") >= pl.col("down")) & (pl.col("up") >= pl.col("stable")))
+                .then(UP)
+                .when(pl.col("down") >= pl.col("stable"))
+                .then(DOWN)
+                .otherwise(STABLE)
+                .cast(pl.Int8)
+                .alias("consensus"),
+                (
+                    pl.max_horizontal("up", "down", "stable") / pl.col("movements")
+                ).alias("consensus_ratio"),
+            )
+        )
+        divergent = (
+            bucketed.join(groups.select(keys + ["consensus"]), on=keys, how="inner")
+            .filter(pl.col("direction") != pl.col("consensus"))
+            .group_by(keys, maintain_order=True)
+            .agg(pl.col("sportsbook_id").alias("divergent_books"))
+        )
+        return groups.join(divergent, on=keys, how="left").with_columns(
+            pl.col("divergent_books").fill_null(pl.lit([], dtype=pl.List(pl.Utf8))),
+            pl.col("bucket").cast(pl.Datetime("us", "UTC")).alias("timestamp"),
+            (
+                (pl.col("books").list.len() >= 3) & (pl.col("consensus") != STABLE)
+            ).alias("steam_move"),
+        )
+
+    def rapid_movements(self, min_span_us: int = RAPID_WINDOW_US) -> pl.DataFrame:
+        """Count windows of three consecutive movements within ten minutes."""
+        return (
+            self.movements.sort(["ts", "seq"])
+            .with_columns(
+                (pl.col("ts").shift(-2).over(SERIES_KEYS) - pl.col("ts")).alias("span")
+            )
+            .group_by(SERIES_KEYS, maintain_order=True)
+            .agg((pl.col("span") <= min_span_us).sum().alias("windows"))
+            .filter(pl.col("windows") > 0)
+        )
+
+    def arbitrage_opportunities(self, window: timedelta = timedelta(hours=1)) -> pl.DataFrame:
+        """Markets where the latest odds across books differ by more than 20."""
+        cutoff_us = int((self.now - window).timestamp() * 1_000_000)
+        return (
+            self.movements.filter(pl.col("ts") > cutoff_us)
+            .group_by(["game", "market_type", "sportsbook_id"], maintain_order=True)
+            .agg(pl.col("odds").last())
+            .group_by(["game", "market_type"], maintain_order=True)
+            .agg(
+                pl.col("sportsbook_id").alias("books"),
+                (pl.col("odds").max() - pl.col("odds").min()).alias("discrepancy"),
+            )
+            .filter(
+                (pl.col("books").list.len() >= 2)
+                & (pl.col("discrepancy") > ARBITRAGE_MIN_DISCREPANCY)
+            )
+        )
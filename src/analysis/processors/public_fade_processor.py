@@ -143,7 +143,9 @@ class UnifiedPublicFadeProcessor(BaseStrategyProcessor, StrategyProcessorMixin):
 
         try:
             # Get public betting data with multi-book information
-            public_data = await self._get_public_betting_data(game_data, minutes_ahead)
+            public_data = await self.run_phase(
+                "data_fetch", self._get_public_betting_data(game_data, minutes_ahead)
+            )
 
             if not public_data:
                 self.logger.info("No public betting data available for fade analysis")
@@ -188,7 +190,9 @@ class UnifiedPublicFadeProcessor(BaseStrategyProcessor, StrategyProcessorMixin):
                     continue
 
             # Apply final filtering and ranking
-            signals = await self._apply_fade_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_fade_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} public fade signals")
             return signals
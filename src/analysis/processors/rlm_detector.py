@@ -155,7 +155,9 @@ class ActionNetworkRLMDetector(BaseStrategyProcessor, StrategyProcessorMixin):
                     continue
 
             # Apply RLM-specific filtering and ranking
-            signals = await self._apply_rlm_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_rlm_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} RLM signals")
             return signals
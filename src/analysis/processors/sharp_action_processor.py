@@ -130,7 +130,9 @@ class UnifiedSharpActionProcessor(BaseStrategyProcessor, StrategyProcessorMixin)
 
         try:
             # Get betting splits data
-            splits_data = await self._get_betting_splits_data(game_data, minutes_ahead)
+            splits_data = await self.run_phase(
+                "data_fetch", self._get_betting_splits_data(game_data, minutes_ahead)
+            )
 
             if not splits_data:
                 self.logger.info(
@@ -171,7 +173,9 @@ class UnifiedSharpActionProcessor(BaseStrategyProcessor, StrategyProcessorMixin)
                     continue
 
             # Apply final filtering and ranking
-            signals = await self._apply_final_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_final_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} sharp action signals")
             return signals
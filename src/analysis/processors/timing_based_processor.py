@@ -211,7 +211,9 @@ class UnifiedTimingBasedProcessor(BaseStrategyProcessor, StrategyProcessorMixin)
 
         try:
             # Get betting splits data with timing information
-            splits_data = await self._get_timing_splits_data(game_data, minutes_ahead)
+            splits_data = await self.run_phase(
+                "data_fetch", self._get_timing_splits_data(game_data, minutes_ahead)
+            )
 
             if not splits_data:
                 self.logger.info("No timing splits data available for analysis")
@@ -250,7 +252,9 @@ class UnifiedTimingBasedProcessor(BaseStrategyProcessor, StrategyProcessorMixin)
                     continue
 
             # Apply timing-specific filtering and ranking
-            signals = await self._apply_timing_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_timing_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} timing-based signals")
             return signals
@@ -33,6 +33,7 @@ from src.analysis.models.unified_models import (
     UnifiedBettingSignal,
 )
 from src.analysis.strategies.base import BaseStrategyProcessor, StrategyProcessorMixin
+from src.core import odds_math
 from src.core.exceptions import StrategyError
 from src.data.database import UnifiedRepository
 
@@ -153,7 +154,9 @@ class UnifiedUnderdogValueProcessor(BaseStrategyProcessor, StrategyProcessorMixi
 
         try:
             # Get betting data with odds and public splits
-            value_data = await self._get_underdog_value_data(game_data, minutes_ahead)
+            value_data = await self.run_phase(
+                "data_fetch", self._get_underdog_value_data(game_data, minutes_ahead)
+            )
 
             if not value_data:
                 self.logger.info("No underdog value data available for analysis")
@@ -200,7 +203,9 @@ class UnifiedUnderdogValueProcessor(BaseStrategyProcessor, StrategyProcessorMixi
                     continue
 
             # Apply final filtering and ranking
-            signals = await self._apply_value_filtering(signals)
+            signals = await self.run_phase(
+                "filtering", self._apply_value_filtering(signals), rows_in=len(signals)
+            )
 
             self.logger.info(f"Generated {len(signals)} underdog value signals")
             return signals
@@ -421,10 +426,7 @@ class UnifiedUnderdogValueProcessor(BaseStrategyProcessor, StrategyProcessorMixi
 
     def _calculate_implied_probability(self, american_odds: int) -> float:
         """Calculate implied probability from American odds"""
-        if american_odds > 0:
-            return 100 / (american_odds + 100)
-        else:
-            return abs(american_odds) / (abs(american_odds) + 100)
+        return odds_math.implied_probability(american_odds)
 
     def _is_significant_value_opportunity(self, value_analysis: dict[str, Any]) -> bool:
         """Check if value opportunity is significant enough for betting"""
@@ -17,9 +17,10 @@ Part of Phase 3: Strategy Integration - Unified Architecture Migration
 
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any
+from typing import Any, TypeVar
 
 import pytz
 
@@ -29,10 +30,13 @@ from src.analysis.models.unified_models import (
     StrategyCategory,
     UnifiedBettingSignal,
 )
+from src.analysis.strategies import profiling
 from src.core.config import get_settings
 from src.core.logging import LogComponent, get_logger
 from src.data.database import UnifiedRepository
 
+T = TypeVar("T")
+
 
 class ProcessingStatus(str, Enum):
     """Processing status for strategy execution"""
@@ -307,6 +311,18 @@ class BaseStrategyProcessor(ABC):
 
     # Enhanced processing methods
 
+    async def run_phase(
+        self, phase: str, awaitable: Awaitable[T], rows_in: int | None = None
+    ) -> T:
+        """
+        Await one phase of process_signals ("data_fetch", "filtering", ...).
+
+        When the orchestrator is profiling this run, the phase's wall time,
+        database time and row counts are recorded; otherwise this is a plain
+        await. Unmarked time counts as signal computation.
+        """
+        return await profiling.run_phase(phase, awaitable, rows_in=rows_in)
+
     async def process_with_error_handling(
         self, game_data: list[dict[str, Any]], context: dict[str, Any]
     ) -> list[UnifiedBettingSignal]:
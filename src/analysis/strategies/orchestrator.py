@@ -5,6 +5,7 @@ Coordinates execution of multiple strategies with:
 - Parallel strategy execution with resource management
 - Dependency resolution and execution ordering
 - Performance monitoring and resource optimization
+- Per-strategy phase profiling and execution timelines
 - Error handling and recovery strategies
 - Real-time progress tracking and reporting
 
@@ -13,6 +14,7 @@ Part of Phase 3: Strategy Integration - Unified Architecture Migration
 
 import asyncio
 import concurrent.futures
+import contextlib
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -24,6 +26,7 @@ from src.analysis.models.unified_models import (
     UnifiedBettingSignal,
 )
 from src.analysis.strategies.factory import StrategyFactory
+from src.analysis.strategies.profiling import StrategyProfile, profile_strategy
 from src.core.exceptions import StrategyError
 from src.core.logging import LogComponent, get_logger
 from src.data.database import UnifiedRepository
@@ -77,6 +80,7 @@ class StrategyExecutionResult:
     error_message: str | None = None
     signals: list[UnifiedBettingSignal] = field(default_factory=list)
     performance_metrics: dict[str, Any] = field(default_factory=dict)
+    profile: StrategyProfile | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
@@ -98,6 +102,33 @@ class OrchestrationResult:
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
+    def get_timeline(self) -> list[dict[str, Any]]:
+        """
+        Execution timeline: when each strategy ran relative to the start of
+        the orchestration, and how its run split across phases.
+        """
+        timeline = []
+        for name, strategy_result in self.strategy_results.items():
+            profile = strategy_result.profile
+            if profile is None or profile.started_at is None or self.started_at is None:
+                continue
+            start = (profile.started_at - self.started_at).total_seconds()
+            timeline.append(
+                {
+                    "strategy_name": name,
+                    "status": strategy_result.status.value,
+                    "start_seconds": start,
+                    "end_seconds": start + profile.duration_seconds,
+                    "duration_seconds": profile.duration_seconds,
+                    "database_seconds": profile.database_seconds,
+                    "phases": {
+                        phase: span.to_dict()
+                        for phase, span in profile.phase_breakdown().items()
+                    },
+                }
+            )
+        return sorted(timeline, key=lambda entry: entry["start_seconds"])
+
 
 class StrategyOrchestrator:
     """
@@ -143,6 +174,10 @@ class StrategyOrchestrator:
 
         # Performance tracking
         self._performance_metrics: dict[str, dict[str, Any]] = {}
+        self.latency_budget_seconds = config.get("strategy_latency_budget_seconds", 30.0)
+
+        # Profiler captures hook the whole thread, so captured runs take turns
+        self._capture_lock = asyncio.Lock()
 
         # Thread pool for CPU-bound operations
         self._thread_pool = concurrent.futures.ThreadPoolExecutor(
@@ -428,6 +463,11 @@ class StrategyOrchestrator:
         )
 
         result.strategy_results[strategy_name] = strategy_result
+        profile = StrategyProfile(
+            strategy_name=strategy_name,
+            execution_id=execution_id,
+            profiler=self._get_capture_profiler(strategy_name, plan.context),
+        )
 
         try:
             # Get strategy instance
@@ -435,11 +475,14 @@ class StrategyOrchestrator:
             if not strategy:
                 raise StrategyError(f"Strategy {strategy_name} not available")
 
-            # Execute strategy with timeout
-            signals = await asyncio.wait_for(
-                strategy.process_with_error_handling(game_data, plan.context),
-                timeout=plan.timeout_seconds,
-            )
+            # Execute strategy with timeout, collecting phase spans
+            capture_lock = self._capture_lock if profile.profiler else contextlib.nullcontext()
+            async with capture_lock:
+                with profile_strategy(profile):
+                    signals = await asyncio.wait_for(
+                        strategy.process_with_error_handling(game_data, plan.context),
+                        timeout=plan.timeout_seconds,
+                    )
 
             # Record successful execution
             strategy_result.status = ExecutionStatus.COMPLETED
@@ -482,6 +525,56 @@ class StrategyOrchestrator:
                 exc_info=True,
             )
 
+        if profile.started_at is not None:
+            strategy_result.profile = profile
+            self._record_profile(profile)
+
+    def _get_capture_profiler(
+        self, strategy_name: str, context: dict[str, Any]
+    ) -> str | None:
+        """Profiler to capture this strategy's run with, if one was requested"""
+        requested = context.get("profile_strategies") or []
+        if strategy_name in requested or "all" in requested:
+            return context.get("profiler", "cprofile")
+        return None
+
+    def _record_profile(self, profile: StrategyProfile) -> None:
+        """Export phase timings and flag runs over the latency budget"""
+        breakdown = profile.phase_breakdown()
+
+        try:
+            from src.services.monitoring.prometheus_metrics_service import (
+                get_metrics_service,
+            )
+
+            metrics = get_metrics_service()
+            for phase, span in breakdown.items():
+                metrics.record_strategy_phase(
+                    profile.strategy_name, phase, span.duration_seconds, span.database.seconds
+                )
+            metrics.record_strategy_phase(
+                profile.strategy_name, "total", profile.duration_seconds, profile.database_seconds
+            )
+        except Exception as e:
+            self.logger.debug(f"Strategy phase metrics not recorded: {e}")
+
+        if profile.duration_seconds > self.latency_budget_seconds:
+            slowest = profile.slowest_phase()
+            self.logger.warning(
+                f"Strategy {profile.strategy_name} took {profile.duration_seconds:.2f}s, "
+                f"over the {self.latency_budget_seconds:.2f}s latency budget; slowest phase "
+                f"{slowest.phase} took {slowest.duration_seconds:.2f}s "
+                f"({slowest.database.seconds:.2f}s in {slowest.database.queries} queries, "
+                f"{slowest.rows_out} rows)",
+                extra={"execution_id": profile.execution_id},
+            )
+
+        if profile.profile_output:
+            self.logger.info(
+                f"Captured {profile.profiler} profile for strategy {profile.strategy_name}",
+                extra={"execution_id": profile.execution_id},
+            )
+
     # Strategy execution convenience methods
 
     async def execute_all_strategies(
@@ -564,8 +657,48 @@ class StrategyOrchestrator:
             "total_signals_generated": total_signals,
             "average_execution_time_seconds": avg_execution_time,
             "signals_per_execution": total_signals / len(recent_executions),
+            "latency_budget_seconds": self.latency_budget_seconds,
+            "strategy_phases": self._summarize_strategy_phases(recent_executions),
         }
 
+    def _summarize_strategy_phases(
+        self, executions: list[OrchestrationResult]
+    ) -> dict[str, dict[str, Any]]:
+        """Per-strategy run and phase timings across executions, slowest first"""
+        profiles: dict[str, list[StrategyProfile]] = {}
+        for execution in executions:
+            for name, strategy_result in execution.strategy_results.items():
+                if strategy_result.profile is not None:
+                    profiles.setdefault(name, []).append(strategy_result.profile)
+
+        summary = {}
+        for name, runs in profiles.items():
+            durations = [run.duration_seconds for run in runs]
+            phases: dict[str, dict[str, float]] = {}
+            for run in runs:
+                for phase, span in run.phase_breakdown().items():
+                    totals = phases.setdefault(
+                        phase,
+                        {"avg_seconds": 0.0, "max_seconds": 0.0, "avg_database_seconds": 0.0},
+                    )
+                    totals["avg_seconds"] += span.duration_seconds / len(runs)
+                    totals["max_seconds"] = max(totals["max_seconds"], span.duration_seconds)
+                    totals["avg_database_seconds"] += span.database.seconds / len(runs)
+
+            summary[name] = {
+                "runs": len(runs),
+                "avg_seconds": sum(durations) / len(runs),
+                "max_seconds": max(durations),
+                "over_budget_runs": sum(
+                    1 for duration in durations if duration > self.latency_budget_seconds
+                ),
+                "phases": phases,
+            }
+
+        return dict(
+            sorted(summary.items(), key=lambda item: item[1]["max_seconds"], reverse=True)
+        )
+
     async def __aenter__(self):
         """Async context manager entry"""
         return self
@@ -0,0 +1,229 @@
+"""
+Strategy Profiling
+
+Per-run instrumentation for strategy processors:
+- Phase spans (data fetch, signal computation, filtering) with row counts
+  and database time
+- Optional cProfile or pyinstrument capture of a single strategy run
+
+The orchestrator activates a StrategyProfile around each processor run and
+processors mark their phases with ``BaseStrategyProcessor.run_phase``. Time
+not covered by a marked phase is attributed to signal computation. Outside
+an active profile, run_phase is a plain await.
+"""
+
+import contextlib
+import contextvars
+import cProfile
+import io
+import pstats
+import time
+from collections.abc import Awaitable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, TypeVar
+
+from src.core.exceptions import StrategyError
+from src.data.database.query_timing import QueryTimer, time_queries
+
+T = TypeVar("T")
+
+DATA_FETCH = "data_fetch"
+SIGNAL_COMPUTATION = "signal_computation"
+FILTERING = "filtering"
+PHASES = (DATA_FETCH, SIGNAL_COMPUTATION, FILTERING)
+
+PROFILERS = ("cprofile", "pyinstrument")
+CPROFILE_REPORT_LINES = 40
+
+
+@dataclass
+class PhaseSpan:
+    """Time, rows and database time of one processor phase"""
+
+    phase: str
+    start_offset_seconds: float | None = None  # from the start of the run
+    duration_seconds: float = 0.0
+    rows_in: int | None = None
+    rows_out: int | None = None
+    database: QueryTimer = field(default_factory=QueryTimer)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phase": self.phase,
+            "start_offset_seconds": self.start_offset_seconds,
+            "duration_seconds": self.duration_seconds,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "database_seconds": self.database.seconds,
+            "database_queries": self.database.queries,
+        }
+
+
+@dataclass
+class StrategyProfile:
+    """Instrumentation collected for one strategy processor run"""
+
+    strategy_name: str
+    execution_id: str
+    profiler: str | None = None
+    started_at: datetime | None = None
+    duration_seconds: float = 0.0
+    phases: dict[str, PhaseSpan] = field(default_factory=dict)
+    # Queries issued outside any marked phase
+    database: QueryTimer = field(default_factory=QueryTimer)
+    profile_output: str | None = None
+    _start: float = field(default=0.0, repr=False)
+
+    def span(self, phase: str) -> PhaseSpan:
+        if phase not in self.phases:
+            self.phases[phase] = PhaseSpan(phase=phase)
+        return self.phases[phase]
+
+    @property
+    def database_seconds(self) -> float:
+        return self.database.seconds + sum(s.database.seconds for s in self.phases.values())
+
+    def phase_breakdown(self) -> dict[str, PhaseSpan]:
+        """
+        Marked phases plus signal computation.
+
+        Unless the processor marked it, signal computation is the run time
+        not spent in other phases, its database time the queries issued
+        outside them, and its output the rows that went into filtering.
+        """
+        breakdown = dict(self.phases)
+        if SIGNAL_COMPUTATION not in breakdown:
+            marked = sum(span.duration_seconds for span in breakdown.values())
+            filtering = breakdown.get(FILTERING)
+            breakdown[SIGNAL_COMPUTATION] = PhaseSpan(
+                phase=SIGNAL_COMPUTATION,
+                duration_seconds=max(self.duration_seconds - marked, 0.0),
+                rows_in=breakdown[DATA_FETCH].rows_out if DATA_FETCH in breakdown else None,
+                rows_out=filtering.rows_in if filtering else None,
+                database=self.database,
+            )
+        return {
+            phase: breakdown[phase]
+            for phase in sorted(breakdown, key=lambda p: PHASES.index(p) if p in PHASES else len(PHASES))
+        }
+
+    def slowest_phase(self) -> PhaseSpan | None:
+        breakdown = self.phase_breakdown()
+        return max(breakdown.values(), key=lambda span: span.duration_seconds, default=None)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "strategy_name": self.strategy_name,
+            "execution_id": self.execution_id,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "duration_seconds": self.duration_seconds,
+            "database_seconds": self.database_seconds,
+            "phases": {phase: span.to_dict() for phase, span in self.phase_breakdown().items()},
+            "profiler": self.profiler,
+            "profile_output": self.profile_output,
+        }
+
+
+_active_profile: contextvars.ContextVar[StrategyProfile | None] = contextvars.ContextVar(
+    "strategy_profile", default=None
+)
+
+
+def current_profile() -> StrategyProfile | None:
+    return _active_profile.get()
+
+
+class _CProfileCapture:
+    """Deterministic profile of everything running on the event loop thread"""
+
+    def __init__(self):
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop(self) -> str:
+        self._profiler.disable()
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(CPROFILE_REPORT_LINES)
+        return stream.getvalue()
+
+
+class _PyinstrumentCapture:
+    """Sampling profile of the current task (pyinstrument is optional)"""
+
+    def __init__(self):
+        try:
+            from pyinstrument import Profiler
+        except ImportError as e:
+            raise StrategyError(
+                "pyinstrument is not installed; install it or use the cprofile profiler"
+            ) from e
+        self._profiler = Profiler(async_mode="enabled")
+        self._profiler.start()
+
+    def stop(self) -> str:
+        self._profiler.stop()
+        return self._profiler.output_text()
+
+
+def _start_capture(profiler: str | None) -> _CProfileCapture | _PyinstrumentCapture | None:
+    if profiler is None:
+        return None
+    if profiler == "cprofile":
+        return _CProfileCapture()
+    if profiler == "pyinstrument":
+        return _PyinstrumentCapture()
+    raise StrategyError(f"Unknown profiler {profiler!r}; expected one of {PROFILERS}")
+
+
+@contextlib.contextmanager
+def profile_strategy(profile: StrategyProfile) -> Iterator[StrategyProfile]:
+    """
+    Collect phase spans (and the optional profiler capture) for one run.
+
+    Tasks created inside the block, such as the one ``asyncio.wait_for``
+    runs the processor in, inherit the active profile.
+    """
+    capture = _start_capture(profile.profiler)
+    profile.started_at = datetime.now()
+    profile._start = time.perf_counter()
+    token = _active_profile.set(profile)
+    try:
+        with time_queries(profile.database):
+            yield profile
+    finally:
+        _active_profile.reset(token)
+        profile.duration_seconds = time.perf_counter() - profile._start
+        if capture is not None:
+            profile.profile_output = capture.stop()
+
+
+async def run_phase(phase: str, awaitable: Awaitable[T], rows_in: int | None = None) -> T:
+    """
+    Await ``awaitable`` as ``phase`` of the active profile.
+
+    The span records wall time, database time and, when the result is sized,
+    the rows it returned. Time is recorded even when the phase is cancelled
+    by a strategy timeout, so the phase that blew the budget still shows up.
+    """
+    profile = _active_profile.get()
+    if profile is None:
+        return await awaitable
+
+    span = profile.span(phase)
+    if span.start_offset_seconds is None:
+        span.start_offset_seconds = time.perf_counter() - profile._start
+    if rows_in is not None:
+        span.rows_in = (span.rows_in or 0) + rows_in
+
+    start = time.perf_counter()
+    try:
+        with time_queries(span.database):
+            result = await awaitable
+    finally:
+        span.duration_seconds += time.perf_counter() - start
+
+    if hasattr(result, "__len__"):
+        span.rows_out = (span.rows_out or 0) + len(result)
+    return result
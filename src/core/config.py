@@ -23,6 +23,9 @@ from pydantic_settings import BaseSettings
 from .exceptions import ConfigurationError
 from .pydantic_compat import computed_field, field_validator, model_validator
 
+# Repository root; local data (caches, trained artifacts) lives under data/
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
 
 class DatabaseSettings(BaseSettings):
     """Unified database configuration supporting multiple database types."""
@@ -321,6 +324,12 @@ class DataSourceSettings(BaseSettings):
         description="Data source priority order",
     )
 
+    mlb_stats_api_cache_dir: Path = Field(
+        default=PROJECT_ROOT / "data" / "cache" / "mlb_stats_api",
+        description="On-disk cache of MLB Stats API schedules for completed dates",
+        env="MLB_STATS_API_CACHE_DIR",
+    )
+
     class Config:
         env_prefix = ""
         case_sensitive = False
@@ -421,6 +430,11 @@ class MLPipelineSettings(BaseSettings):
         default=10, ge=1, le=50, description="Maximum number of models to keep in memory"
     )
 
+    pattern_model_dir: Path = Field(
+        default=PROJECT_ROOT / "data" / "models" / "pattern_recognition",
+        description="Directory of offline-trained opportunity pattern models",
+    )
+
     # Redis Feature Store
     redis_socket_timeout: float = Field(
         default=5.0, ge=1.0, le=30.0, description="Redis socket timeout in seconds"
@@ -447,6 +461,23 @@ class MLPipelineSettings(BaseSettings):
         default=4, ge=1, le=24, description="Cache TTL for predictions in hours"
     )
 
+    prediction_write_batch_size: int = Field(
+        default=100, ge=1, le=1000, description="Predictions persisted per batched database write"
+    )
+
+    prediction_write_flush_seconds: float = Field(
+        default=1.0, ge=0.05, le=60.0, description="Maximum delay before queued predictions are written"
+    )
+
+    prediction_write_queue_size: int = Field(
+        default=5000, ge=10, le=100000, description="Queued predictions before new ones are spooled to disk"
+    )
+
+    prediction_spool_path: Path = Field(
+        default=PROJECT_ROOT / "data" / "spool" / "ml_predictions.jsonl",
+        description="Local spool file for predictions awaiting a database write",
+    )
+
     # Performance Targets
     api_response_target_ms: int = Field(
         default=100, ge=10, le=1000, description="Target API response time in milliseconds"
@@ -870,6 +901,12 @@ class MonitoringSettings(BaseSettings):
         description="Histogram buckets for pipeline stage duration metrics",
     )
 
+    # Strategy processor phase metrics buckets
+    strategy_phase_duration_buckets: list[float] = Field(
+        default=[0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60],
+        description="Histogram buckets for strategy processor phase duration metrics",
+    )
+
     # Database query metrics buckets
     database_query_duration_buckets: list[float] = Field(
         default=[0.01, 0.05, 0.1, 0.5, 1, 2, 5],
@@ -1114,6 +1151,30 @@ class DashboardSettings(BaseSettings):
         env="DASHBOARD_RECONNECT_INTERVAL",
     )
 
+    websocket_client_queue_size: int = Field(
+        default=100,
+        ge=1,
+        le=10000,
+        description="Pending messages buffered per WebSocket client before the oldest are dropped",
+        env="DASHBOARD_WS_CLIENT_QUEUE",
+    )
+
+    websocket_send_timeout: float = Field(
+        default=5.0,
+        ge=0.1,
+        le=60.0,
+        description="Seconds a single WebSocket send may take before the client is disconnected as stalled",
+        env="DASHBOARD_WS_SEND_TIMEOUT",
+    )
+
+    event_debounce_seconds: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=30.0,
+        description="Window for collapsing bursts of monitoring events into one health refresh",
+        env="DASHBOARD_EVENT_DEBOUNCE",
+    )
+
     # Display settings
     recent_pipelines_limit: int = Field(
         default=5,
@@ -1131,6 +1192,29 @@ class DashboardSettings(BaseSettings):
         env="DASHBOARD_NOTIFICATION_TIMEOUT",
     )
 
+    # Analytics result cache
+    analytics_cache_max_entries: int = Field(
+        default=256,
+        ge=0,
+        le=10000,
+        description="In-memory statistical analysis results kept (0 disables the cache)",
+        env="ANALYTICS_CACHE_MAX_ENTRIES",
+    )
+
+    analytics_cache_ttl_seconds: int = Field(
+        default=86400,
+        ge=60,
+        le=604800,
+        description="Lifetime of cached analysis results in seconds",
+        env="ANALYTICS_CACHE_TTL",
+    )
+
+    analytics_cache_redis_url: str | None = Field(
+        default=None,
+        description="Optional Redis URL sharing analysis results across API workers",
+        env="ANALYTICS_CACHE_REDIS_URL",
+    )
+
     class Config:
         env_prefix = ""
         case_sensitive = False
@@ -0,0 +1,190 @@
+"""
+Odds Math
+
+Shared betting arithmetic: American/decimal conversion, implied probability,
+vig removal and no-vig fair odds, expected value, Kelly sizing, arbitrage
+detection and American odds movement.
+
+Every function has a scalar form for per-bet code paths and an ``_array``
+form that takes NumPy arrays (or anything ``np.asarray`` accepts) and
+broadcasts, for scoring slates and scanning every book pair of a market in
+one pass. Invalid odds (0 American, decimal <= 1) raise in the scalar forms
+and come back as NaN in the array forms.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+ArrayLike = np.ndarray | Sequence[float] | float
+
+
+# Scalar forms
+
+
+def american_to_decimal(american_odds: float) -> float:
+    """Decimal odds (total return per unit staked) for American odds."""
+    if american_odds > 0:
+        return american_odds / 100 + 1
+    return 100 / abs(american_odds) + 1
+
+
+def decimal_to_american(decimal_odds: float) -> float:
+    """American odds for decimal odds."""
+    if decimal_odds >= 2:
+        return (decimal_odds - 1) * 100
+    return -100 / (decimal_odds - 1)
+
+
+def implied_probability(american_odds: float) -> float:
+    """Break-even win probability implied by American odds (vig included)."""
+    if american_odds > 0:
+        return 100 / (american_odds + 100)
+    return abs(american_odds) / (abs(american_odds) + 100)
+
+
+def remove_vig(probabilities: Sequence[float]) -> list[float]:
+    """Fair probabilities for a market's implied probabilities (proportional method)."""
+    total = sum(probabilities)
+    return [probability / total for probability in probabilities]
+
+
+def fair_odds(american_odds_a: float, american_odds_b: float) -> tuple[float, float]:
+    """No-vig American odds for both sides of a two-way market."""
+    fair_a, fair_b = remove_vig(
+        [implied_probability(american_odds_a), implied_probability(american_odds_b)]
+    )
+    return decimal_to_american(1 / fair_a), decimal_to_american(1 / fair_b)
+
+
+def expected_value(win_probability: float, decimal_odds: float, stake: float = 1.0) -> float:
+    """Expected profit of a bet of ``stake`` at ``decimal_odds``."""
+    return stake * (win_probability * (decimal_odds - 1) - (1 - win_probability))
+
+
+def kelly_fraction(win_probability: float, decimal_odds: float) -> float:
+    """
+    Full Kelly fraction of bankroll, (bp - q) / b with b = decimal_odds - 1.
+
+    Negative when the bet has negative expectation; callers apply their own
+    fractional-Kelly multipliers and caps.
+    """
+    net_odds = decimal_odds - 1
+    return (net_odds * win_probability - (1 - win_probability)) / net_odds
+
+
+def arbitrage_profit(decimal_odds_a: float, decimal_odds_b: float) -> float:
+    """Guaranteed margin, 1 - (1/a + 1/b), of backing both sides; 0 if none."""
+    return max(0.0, 1 - (1 / decimal_odds_a + 1 / decimal_odds_b))
+
+
+def american_odds_change(previous_odds: float, current_odds: float) -> float:
+    """
+    Movement between two American prices.
+
+    Crossing zero from either side collapses to ``current + previous``
+    (e.g. -101 -> +101 is a 2 point move); otherwise the change is the plain
+    difference.
+    """
+    if (previous_odds < 0 < current_odds) or (current_odds < 0 < previous_odds):
+        return current_odds + previous_odds
+    return current_odds - previous_odds
+
+
+# Vectorized forms
+
+
+def american_to_decimal_array(american_odds: ArrayLike) -> np.ndarray:
+    """Vectorized american_to_decimal."""
+    odds = np.asarray(american_odds, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            odds > 0, odds / 100 + 1, np.where(odds < 0, 100 / np.abs(odds) + 1, np.nan)
+        )
+
+
+def decimal_to_american_array(decimal_odds: ArrayLike) -> np.ndarray:
+    """Vectorized decimal_to_american."""
+    odds = np.asarray(decimal_odds, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            odds >= 2, (odds - 1) * 100, np.where(odds > 1, -100 / (odds - 1), np.nan)
+        )
+
+
+def implied_probability_array(american_odds: ArrayLike) -> np.ndarray:
+    """Vectorized implied_probability."""
+    return 1 / american_to_decimal_array(american_odds)
+
+
+def remove_vig_array(probabilities: ArrayLike, axis: int = -1) -> np.ndarray:
+    """Vectorized remove_vig over the outcomes along ``axis``."""
+    implied = np.asarray(probabilities, dtype=np.float64)
+    return implied / implied.sum(axis=axis, keepdims=True)
+
+
+def fair_odds_array(
+    american_odds_a: ArrayLike, american_odds_b: ArrayLike
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized fair_odds."""
+    implied_a = implied_probability_array(american_odds_a)
+    implied_b = implied_probability_array(american_odds_b)
+    total = implied_a + implied_b
+    return (
+        decimal_to_american_array(total / implied_a),
+        decimal_to_american_array(total / implied_b),
+    )
+
+
+def expected_value_array(
+    win_probability: ArrayLike, decimal_odds: ArrayLike, stake: ArrayLike = 1.0
+) -> np.ndarray:
+    """Vectorized expected_value."""
+    probability = np.asarray(win_probability, dtype=np.float64)
+    odds = np.asarray(decimal_odds, dtype=np.float64)
+    return np.asarray(stake, dtype=np.float64) * (probability * (odds - 1) - (1 - probability))
+
+
+def kelly_fraction_array(win_probability: ArrayLike, decimal_odds: ArrayLike) -> np.ndarray:
+    """Vectorized kelly_fraction."""
+    probability = np.asarray(win_probability, dtype=np.float64)
+    net_odds = np.asarray(decimal_odds, dtype=np.float64) - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (net_odds * probability - (1 - probability)) / net_odds
+
+
+def arbitrage_profit_array(
+    decimal_odds_a: ArrayLike, decimal_odds_b: ArrayLike
+) -> np.ndarray:
+    """Vectorized arbitrage_profit; NaN prices never show a profit."""
+    margin = 1 - (
+        1 / np.asarray(decimal_odds_a, dtype=np.float64)
+        + 1 / np.asarray(decimal_odds_b, dtype=np.float64)
+    )
+    return np.where(margin > 0, margin, 0.0)
+
+
+def arbitrage_margin_matrix(
+    decimal_odds_a: ArrayLike, decimal_odds_b: ArrayLike
+) -> np.ndarray:
+    """
+    Arbitrage margin for every (book i on side A, book j on side B) pair.
+
+    Inputs have shape ``(..., books)``; the result has shape
+    ``(..., books, books)`` with ``[..., i, j]`` = 1 - (1/a_i + 1/b_j).
+    Positive entries are arbitrage opportunities, so a whole slate of markets
+    is scanned with one broadcast instead of a loop over book pairs.
+    """
+    inverse_a = 1 / np.asarray(decimal_odds_a, dtype=np.float64)
+    inverse_b = 1 / np.asarray(decimal_odds_b, dtype=np.float64)
+    return 1 - (inverse_a[..., :, None] + inverse_b[..., None, :])
+
+
+def american_odds_change_array(
+    previous_odds: ArrayLike, current_odds: ArrayLike
+) -> np.ndarray:
+    """Vectorized american_odds_change; missing odds (NaN) propagate as NaN."""
+    previous = np.asarray(previous_odds, dtype=np.float64)
+    current = np.asarray(current_odds, dtype=np.float64)
+    crosses_zero = ((previous < 0) & (current > 0)) | ((previous > 0) & (current < 0))
+    return np.where(crosses_zero, current + previous, current - previous)
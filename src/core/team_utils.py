@@ -7,6 +7,8 @@ team name population from various data sources.
 """
 
 import asyncio
+import re
+from functools import lru_cache
 from typing import Dict, Any, Optional, TypedDict
 from dataclasses import dataclass
 
@@ -340,6 +342,259 @@ MLB_TEAM_MAPPINGS = {
 }
 
 
+# Additional aliases: alternative abbreviations, cities, short nicknames and
+# historical names seen across sources. Ambiguous cities (Chicago, New York,
+# Los Angeles) are deliberately absent so they resolve the same way the
+# substring fallback always has.
+TEAM_ALIASES = {
+    # Alternative abbreviations
+    "CHW": "CWS",
+    "WAS": "WSH",
+    "WSN": "WSH",
+    "ANA": "LAA",
+    "TBR": "TB",
+    "AZ": "ARI",
+    "KCR": "KC",
+    "SDP": "SD",
+    "SFG": "SF",
+    # Cities
+    "Baltimore": "BAL",
+    "Boston": "BOS",
+    "Tampa Bay": "TB",
+    "Tampa": "TB",
+    "Toronto": "TOR",
+    "Cleveland": "CLE",
+    "Detroit": "DET",
+    "Kansas City": "KC",
+    "Minnesota": "MIN",
+    "Houston": "HOU",
+    "Anaheim": "LAA",
+    "Oakland": "OAK",
+    "Seattle": "SEA",
+    "Texas": "TEX",
+    "Atlanta": "ATL",
+    "Miami": "MIA",
+    "Florida": "MIA",
+    "Philadelphia": "PHI",
+    "Washington": "WSH",
+    "Cincinnati": "CIN",
+    "Milwaukee": "MIL",
+    "Pittsburgh": "PIT",
+    "St. Louis": "STL",
+    "Arizona": "ARI",
+    "Colorado": "COL",
+    "San Diego": "SD",
+    "San Francisco": "SF",
+    # Nicknames and historical names
+    "O's": "BAL",
+    "Yanks": "NYY",
+    "Devil Rays": "TB",
+    "Jays": "TOR",
+    "ChiSox": "CWS",
+    "Indians": "CLE",
+    "K.C.": "KC",
+    "A's": "OAK",
+    "M's": "SEA",
+    "Phils": "PHI",
+    "Nats": "WSH",
+    "ChiCubs": "CHC",
+    "Cards": "STL",
+    "StL": "STL",
+    "SF Giants": "SF",
+}
+
+# MLB Stats API team IDs
+MLB_STATS_API_TEAM_IDS = {
+    108: "LAA", 109: "ARI", 110: "BAL", 111: "BOS", 112: "CHC", 113: "CIN",
+    114: "CLE", 115: "COL", 116: "DET", 117: "HOU", 118: "KC", 119: "LAD",
+    120: "WSH", 121: "NYM", 133: "OAK", 134: "PIT", 135: "SD", 136: "SEA",
+    137: "SF", 138: "STL", 139: "TB", 140: "TEX", 141: "TOR", 142: "MIN",
+    143: "PHI", 144: "ATL", 145: "CWS", 146: "MIA", 147: "NYY", 158: "MIL",
+}
+
+# Action Network team IDs
+# Discovered from data analysis and Action Network API documentation
+ACTION_NETWORK_TEAM_IDS = {
+    189: "NYY", 194: "BOS", 195: "TOR", 196: "TB", 197: "BAL",
+    200: "CWS", 201: "CLE", 205: "DET", 203: "KC", 207: "MIN",
+    208: "HOU", 210: "LAA", 211: "OAK", 209: "SEA", 206: "TEX",
+    198: "ATL", 199: "MIA", 204: "NYM", 212: "PHI", 216: "WSH",
+    213: "CHC", 202: "CIN", 214: "MIL", 215: "PIT", 217: "STL",
+    218: "ARI", 219: "COL", 220: "LAD", 221: "SD", 222: "SF",
+}
+
+_TOKEN_PATTERN = re.compile(r"[\w.'-]+")
+
+# Words that appear in team names without identifying a team on their own
+# ("Mexico City" is not Kansas City, "Red" is not the Red Sox)
+GENERIC_TEAM_TOKENS = frozenset(
+    {
+        "angeles", "bay", "blue", "city", "la", "los", "new", "ny", "red",
+        "saint", "san", "sox", "st", "st.", "white", "york",
+    }
+)
+
+
+def _is_abbreviation(name: str) -> bool:
+    return name.isupper()
+
+
+class TeamResolutionIndex:
+    """
+    Precompiled team resolution index shared by every module.
+
+    Built once from MLB_TEAM_MAPPINGS, TEAM_ALIASES and the source-specific
+    team ID tables:
+    - an exact and a casefolded hash map over every known name and alias
+    - a phrase index of distinctive names (nicknames and unique cities),
+      matched on whole words so generic words never pick a team
+    - per-source team ID maps (MLB Stats API, Action Network)
+
+    Known names resolve with a single dict lookup. Unseen strings fall back to
+    the phrase index and then the legacy partial-name scan over
+    MLB_TEAM_MAPPINGS; those results are memoized in an LRU so repeated
+    spellings in a batch are O(1) as well.
+    """
+
+    def __init__(
+        self,
+        mappings: Dict[str, str],
+        aliases: Dict[str, str],
+        source_ids: Dict[str, Dict[int, str]],
+        cache_size: int = 4096,
+    ):
+        self._exact: Dict[str, str] = {}
+        self._folded: Dict[str, str] = {}
+        # MLB_TEAM_MAPPINGS first so its entries win, in declaration order
+        for name, abbrev in (*mappings.items(), *aliases.items()):
+            self._exact.setdefault(name, abbrev)
+            self._folded.setdefault(name.casefold(), abbrev)
+
+        # Abbreviations are left out: as words inside free text they are too
+        # easily ordinary words ("min", "was", "sea")
+        phrase_teams: Dict[tuple, set] = {}
+        for name, abbrev in self._exact.items():
+            tokens = tuple(_TOKEN_PATTERN.findall(name.casefold()))
+            if (
+                not tokens
+                or _is_abbreviation(name)
+                or GENERIC_TEAM_TOKENS.issuperset(tokens)
+            ):
+                continue
+            phrase_teams.setdefault(tokens, set()).add(abbrev)
+        # First word -> unambiguous phrases starting with it
+        self._phrases: Dict[str, list] = {}
+        for tokens, teams in phrase_teams.items():
+            if len(teams) == 1:
+                self._phrases.setdefault(tokens[0], []).append(
+                    (tokens, next(iter(teams)))
+                )
+
+        self._substring_scan = [
+            (name.casefold(), tuple(_TOKEN_PATTERN.findall(name.casefold())), abbrev)
+            for name, abbrev in mappings.items()
+        ]
+        self._source_ids = {
+            source: {str(team_id): abbrev for team_id, abbrev in ids.items()}
+            for source, ids in source_ids.items()
+        }
+        self.abbreviations = frozenset(mappings.values())
+        self._resolve_unseen = lru_cache(maxsize=cache_size)(self._resolve_uncached)
+
+    def resolve(self, team_name: Any) -> Optional[str]:
+        """
+        Resolve a team name, alias or abbreviation to its abbreviation.
+
+        Returns:
+            Team abbreviation, or None if the input does not identify a team
+        """
+        if not team_name or not isinstance(team_name, str) or len(team_name) > 100:
+            return None
+
+        abbrev = self._exact.get(team_name)
+        if abbrev is not None:
+            return abbrev
+
+        clean_name = team_name.strip()
+        if not clean_name:
+            return None
+
+        abbrev = self._folded.get(clean_name.casefold())
+        if abbrev is not None:
+            return abbrev
+
+        return self._resolve_unseen(clean_name.casefold())
+
+    def _resolve_uncached(self, folded_name: str) -> Optional[str]:
+        tokens = tuple(_TOKEN_PATTERN.findall(folded_name))
+        if len(tokens) == 1 and tokens[0] in GENERIC_TEAM_TOKENS:
+            return None
+
+        # Distinctive names as whole words (e.g. "Pittsburgh" in
+        # "Pittsburgh Baseball Club")
+        matches = {
+            abbrev
+            for start, token in enumerate(tokens)
+            for phrase, abbrev in self._phrases.get(token, ())
+            if tokens[start : start + len(phrase)] == phrase
+        }
+        if len(matches) == 1:
+            return matches.pop()
+
+        # Partial names (e.g. "Chicago" in "Chicago White Sox"), or a known
+        # name appearing as whole words in a longer string
+        for full_name, full_tokens, abbrev in self._substring_scan:
+            if folded_name in full_name or _contains_phrase(tokens, full_tokens):
+                return abbrev
+
+        return None
+
+    def from_source_id(self, source: str, team_id: Any) -> Optional[str]:
+        """Resolve a source-specific team ID (e.g. Action Network 189 -> NYY)."""
+        return self._source_ids.get(source, {}).get(str(team_id))
+
+    def cache_info(self):
+        """LRU statistics for strings resolved through the fallback path."""
+        return self._resolve_unseen.cache_info()
+
+
+def _contains_phrase(tokens: tuple, phrase: tuple) -> bool:
+    """Whether ``phrase`` appears as consecutive words in ``tokens``."""
+    size = len(phrase)
+    return any(
+        tokens[start : start + size] == phrase
+        for start in range(len(tokens) - size + 1)
+    )
+
+
+_team_index: Optional[TeamResolutionIndex] = None
+
+
+def get_team_index() -> TeamResolutionIndex:
+    """Get the shared team resolution index, building it on first use."""
+    global _team_index
+    if _team_index is None:
+        _team_index = TeamResolutionIndex(
+            MLB_TEAM_MAPPINGS,
+            TEAM_ALIASES,
+            {
+                "mlb_stats_api": MLB_STATS_API_TEAM_IDS,
+                "action_network": ACTION_NETWORK_TEAM_IDS,
+            },
+        )
+    return _team_index
+
+
+def resolve_team_abbreviation(team_name: Any) -> Optional[str]:
+    """
+    Resolve a team name to its abbreviation, or None if it is not a known team.
+
+    Unlike normalize_team_name this never invents an abbreviation, which makes
+    it suitable for matching games across sources.
+    """
+    return get_team_index().resolve(team_name)
+
+
 def normalize_team_name(team_name: str) -> str:
     """
     Normalize team name to database-compatible abbreviation.
@@ -366,30 +621,15 @@ def normalize_team_name(team_name: str) -> str:
     if len(team_name) > 100:
         return "UNK"  # Reject suspiciously long inputs
 
-    # Clean the input
-    clean_name = team_name.strip()
+    abbrev = get_team_index().resolve(team_name)
+    if abbrev is not None:
+        return abbrev
 
     # Handle empty string after stripping
+    clean_name = team_name.strip()
     if not clean_name:
         return "UNK"
 
-    # Try exact match first
-    if clean_name in MLB_TEAM_MAPPINGS:
-        return MLB_TEAM_MAPPINGS[clean_name]
-
-    # Try case-insensitive match
-    for full_name, abbrev in MLB_TEAM_MAPPINGS.items():
-        if clean_name.lower() == full_name.lower():
-            return abbrev
-
-    # Try partial matching (for cases like "Cubs" in "Chicago Cubs")
-    for full_name, abbrev in MLB_TEAM_MAPPINGS.items():
-        if (
-            clean_name.lower() in full_name.lower()
-            or full_name.lower() in clean_name.lower()
-        ):
-            return abbrev
-
     # If no match found, create a safe abbreviation
     # Take first 3 characters, uppercase
     safe_abbrev = clean_name[:3].upper()
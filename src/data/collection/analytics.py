@@ -19,6 +19,7 @@ import psycopg2
 import structlog
 from psycopg2.extras import RealDictCursor
 
+from ...core import odds_math
 from ...core.config import UnifiedSettings
 
 logger = structlog.get_logger(__name__)
@@ -561,10 +562,7 @@ class ArbitrageDetector:
 
     def _calculate_implied_probability(self, odds: int) -> float:
         """Calculate implied probability from American odds."""
-        if odds > 0:
-            return 100 / (odds + 100)
-        else:
-            return abs(odds) / (abs(odds) + 100)
+        return odds_math.implied_probability(odds)
 
 
 class MarketAnalyzer:
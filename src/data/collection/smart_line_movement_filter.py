@@ -6,13 +6,191 @@ Filters line movement data to eliminate noise and keep only significant movement
 Based on the filtering logic from the previous conversation.
 """
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+import polars as pl
 import structlog
 
+from ...core.odds_math import american_odds_change as _american_odds_change
+from ...core.odds_math import american_odds_change_array as american_odds_change
+
 logger = structlog.get_logger(__name__)
 
+# Significance thresholds shared by the row-wise and columnar filters
+ODDS_CHANGE_THRESHOLD = 5
+LINE_VALUE_CHANGE_THRESHOLD = 0.5
+TIME_GAP_THRESHOLD_US = 3600 * 1_000_000  # 1 hour in microseconds
+
+# Sentinel for movements without a parseable timestamp (sorts first, like "")
+_MISSING_TIMESTAMP = np.iinfo(np.int64).min
+
+
+def _to_epoch_microseconds(timestamps: Any) -> np.ndarray:
+    """Normalize datetime64 / int64 timestamps to int64 epoch microseconds."""
+    if isinstance(timestamps, pl.Series):
+        timestamps = timestamps.to_numpy()
+    array = np.asarray(timestamps)
+
+    if np.issubdtype(array.dtype, np.datetime64):
+        missing = np.isnat(array)
+        result = array.astype("datetime64[us]").astype(np.int64)
+        result[missing] = _MISSING_TIMESTAMP
+        return result
+
+    if array.dtype == object or np.issubdtype(array.dtype, np.floating):
+        result = np.full(len(array), _MISSING_TIMESTAMP, dtype=np.int64)
+        for i, value in enumerate(array):
+            if value is not None and value == value:  # skip None and NaN
+                result[i] = int(value)
+        return result
+
+    return array.astype(np.int64, copy=False)
+
+
+def _to_float_column(values: Any, length: int) -> np.ndarray:
+    """Convert an optional odds/line column to float64 with NaN for missing."""
+    if values is None:
+        return np.full(length, np.nan)
+    if isinstance(values, pl.Series):
+        return values.cast(pl.Float64).to_numpy()
+    array = np.asarray(values)
+    if array.dtype == object:
+        return np.array(
+            [np.nan if value is None else float(value) for value in array],
+            dtype=np.float64,
+        )
+    return array.astype(np.float64, copy=False)
+
+
+def _next_significant_indices(
+    ts: np.ndarray,
+    odds: np.ndarray,
+    values: np.ndarray,
+    series_ids: np.ndarray,
+    series_last: np.ndarray,
+) -> np.ndarray:
+    """
+    For every movement i, find the first later movement in its series that is
+    significant relative to i (capped at the series' last index).
+
+    The one-hour rule is resolved for all movements at once with a binary
+    search over (series, timestamp) keys; odds and line changes are then
+    checked one offset at a time across every unresolved movement, so each
+    pass is a single vectorized comparison.
+    """
+    n = len(ts)
+    has_time = ts != _MISSING_TIMESTAMP
+
+    # First index strictly more than an hour later, within the same series
+    horizon = series_last.copy()
+    if has_time.any():
+        rebased = np.zeros(n, dtype=np.int64)
+        rebased[has_time] = ts[has_time] - ts[has_time].min() + 1
+        span = int(rebased.max()) + TIME_GAP_THRESHOLD_US + 1
+        if int(series_ids.max()) < np.iinfo(np.int64).max // span:
+            keys = series_ids * span + rebased
+            found = np.searchsorted(keys, keys + TIME_GAP_THRESHOLD_US, side="right")
+        else:  # keys would overflow int64: search series by series
+            found = np.empty(n, dtype=np.int64)
+            starts = np.flatnonzero(np.r_[True, series_ids[1:] != series_ids[:-1]])
+            for start, stop in zip(starts, np.r_[starts[1:], n], strict=False):
+                found[start:stop] = start + np.searchsorted(
+                    rebased[start:stop],
+                    rebased[start:stop] + TIME_GAP_THRESHOLD_US,
+                    side="right",
+                )
+        horizon[has_time] = np.minimum(found[has_time], series_last[has_time])
+
+    next_index = horizon
+    active = np.flatnonzero(np.arange(1, n + 1) < horizon)
+    offset = 1
+    while active.size:
+        candidates = active + offset
+        inside = candidates < horizon[active]
+        active = active[inside]
+        candidates = candidates[inside]
+        if not active.size:
+            break
+
+        odds_change = american_odds_change(odds[active], odds[candidates])
+        with np.errstate(invalid="ignore"):
+            significant = (np.abs(odds_change) >= ODDS_CHANGE_THRESHOLD) | (
+                np.abs(values[candidates] - values[active])
+                >= LINE_VALUE_CHANGE_THRESHOLD
+            )
+        next_index[active[significant]] = candidates[significant]
+        active = active[~significant]
+        offset += 1
+
+    return next_index
+
+
+def significant_movement_mask(
+    timestamps: Any,
+    odds: Any = None,
+    values: Any = None,
+    series_ids: Any = None,
+) -> np.ndarray:
+    """
+    Compute the keep mask for one or more movement series.
+
+    Produces exactly the keep/drop decisions of
+    ``SmartLineMovementFilter.filter_movements``: the first and last movement
+    of each series are always kept and every middle movement is compared
+    against the last *kept* one. The "next significant movement" is computed
+    for all rows in vectorized form; following that chain from each series'
+    first row then costs one integer hop per kept movement.
+
+    Args:
+        timestamps: Timestamps as datetime64 values or int64 epoch microseconds
+            (int64 minimum for missing), chronological within each series
+        odds: American odds per movement (NaN/None when absent)
+        values: Line values per movement (NaN/None when absent)
+        series_ids: Non-decreasing integer id per row marking contiguous
+            series (market/side/book); a single series when omitted
+
+    Returns:
+        Boolean array aligned with the inputs, True for movements to keep
+    """
+    ts = _to_epoch_microseconds(timestamps)
+    n = len(ts)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+
+    if series_ids is None:
+        ids = np.zeros(n, dtype=np.int64)
+    else:
+        ids = np.asarray(series_ids, dtype=np.int64)
+
+    boundaries = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+    starts = np.r_[0, boundaries]
+    lasts = np.r_[boundaries - 1, n - 1]
+    series_last = np.repeat(lasts, np.diff(np.r_[starts, n]))
+
+    keep[starts] = True
+    keep[lasts] = True
+
+    next_index = _next_significant_indices(
+        ts,
+        _to_float_column(odds, n),
+        _to_float_column(values, n),
+        ids,
+        series_last,
+    ).tolist()
+
+    for anchor, last in zip(starts.tolist(), lasts.tolist(), strict=False):
+        while True:
+            anchor = next_index[anchor]
+            if anchor >= last:
+                break
+            keep[anchor] = True
+
+    return keep
+
 
 class SmartLineMovementFilter:
     """
@@ -98,7 +276,7 @@ class SmartLineMovementFilter:
             )
 
             # Keep if corrected odds changed by more than 5 points
-            if abs(corrected_odds_change) >= 5:
+            if abs(corrected_odds_change) >= ODDS_CHANGE_THRESHOLD:
                 return True
 
         # Check for line value changes (spread/totals)
@@ -107,7 +285,7 @@ class SmartLineMovementFilter:
 
         if current_value is not None and previous_value is not None:
             # Keep if line changed by more than 0.5
-            if abs(current_value - previous_value) >= 0.5:
+            if abs(current_value - previous_value) >= LINE_VALUE_CHANGE_THRESHOLD:
                 return True
 
         # Check for time-based significance (keep movements more than 1 hour apart)
@@ -120,7 +298,7 @@ class SmartLineMovementFilter:
             )
 
             time_diff = (current_time - previous_time).total_seconds()
-            if time_diff > 3600:  # 1 hour
+            if time_diff > TIME_GAP_THRESHOLD_US / 1_000_000:  # 1 hour
                 return True
         except:
             pass
@@ -146,24 +324,118 @@ class SmartLineMovementFilter:
         Returns:
             Corrected odds change
         """
-        # Both odds same sign: simple difference
-        if (previous_odds > 0 and current_odds > 0) or (
-            previous_odds < 0 and current_odds < 0
-        ):
-            return current_odds - previous_odds
+        return _american_odds_change(previous_odds, current_odds)
+
+    def filter_movement_arrays(
+        self,
+        timestamps: Any,
+        odds: Any = None,
+        values: Any = None,
+    ) -> np.ndarray:
+        """
+        Columnar variant of filter_movements for a single market/side series.
+
+        Inputs are sorted chronologically (stable, missing timestamps first) to
+        match the row-wise filter, so callers may pass unsorted arrays.
+
+        Args:
+            timestamps: datetime64 values or int64 epoch microseconds
+            odds: American odds per movement (NaN/None when absent)
+            values: Line values per movement (NaN/None when absent)
+
+        Returns:
+            Indices into the inputs of the kept movements, in chronological order
+        """
+        ts = _to_epoch_microseconds(timestamps)
+        if len(ts) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        order = np.argsort(ts, kind="stable")
+        odds_arr = _to_float_column(odds, len(ts))[order]
+        values_arr = _to_float_column(values, len(ts))[order]
+        keep = significant_movement_mask(ts[order], odds_arr, values_arr)
+        kept = order[keep]
+
+        self.total_count += len(ts)
+        self.filtered_count += len(kept)
+        return kept
+
+    def filter_movements_frame(
+        self,
+        frame: pl.DataFrame,
+        group_by: Sequence[str] = ("market_type", "side"),
+        timestamp_column: str = "updated_at",
+        odds_column: str = "odds",
+        value_column: str = "value",
+    ) -> pl.DataFrame:
+        """
+        Filter a polars frame of movements, one series per ``group_by`` key.
 
-        # Crossing zero: special handling for American odds
-        elif previous_odds < 0 and current_odds > 0:
-            # From negative to positive: -101 to +101 = 2 points
-            return (current_odds - 100) + (100 - abs(previous_odds))
+        String timestamps (Action Network ``updated_at`` ISO strings) are parsed
+        once for the whole column; unparseable values count as missing.
+
+        Args:
+            frame: Movements with timestamp, odds and line value columns
+            group_by: Columns identifying a movement series (market, side, book)
+            timestamp_column: Name of the timestamp column
+            odds_column: Name of the American odds column
+            value_column: Name of the line value column
 
-        elif previous_odds > 0 and current_odds < 0:
-            # From positive to negative: +101 to -101 = -2 points
-            return -((abs(current_odds) - 100) + (100 - previous_odds))
+        Returns:
+            Filtered frame with kept movements, chronological within each series
+        """
+        if frame.is_empty():
+            return frame
 
+        ts_dtype = frame.schema[timestamp_column]
+        if ts_dtype == pl.Utf8:
+            parsed = frame.get_column(timestamp_column).str.to_datetime(
+                time_unit="us", time_zone="UTC", strict=False
+            )
+        elif isinstance(ts_dtype, pl.Datetime):
+            parsed = frame.get_column(timestamp_column).dt.cast_time_unit("us")
         else:
-            # Fallback to simple difference
-            return current_odds - previous_odds
+            parsed = frame.get_column(timestamp_column)
+        working = frame.with_columns(
+            parsed.cast(pl.Int64).fill_null(_MISSING_TIMESTAMP).alias("__movement_ts")
+        )
+
+        keys = [column for column in group_by if column in working.columns]
+        if keys:
+            # Number series in order of first appearance
+            is_first = pl.struct(keys).is_first_distinct()
+            working = working.with_columns(
+                pl.when(is_first)
+                .then(is_first.cast(pl.Int64).cum_sum())
+                .alias("__series_id")
+            ).with_columns(pl.col("__series_id").max().over(keys))
+        else:
+            working = working.with_columns(pl.lit(0, dtype=pl.Int64).alias("__series_id"))
+        working = working.sort(["__series_id", "__movement_ts"], maintain_order=True)
+
+        def optional_column(name: str) -> pl.Series | None:
+            return working.get_column(name) if name in working.columns else None
+
+        keep = significant_movement_mask(
+            working.get_column("__movement_ts").to_numpy(),
+            optional_column(odds_column),
+            optional_column(value_column),
+            working.get_column("__series_id").to_numpy(),
+        )
+        result = working.filter(pl.Series(keep)).drop(
+            ["__movement_ts", "__series_id"]
+        )
+
+        self.total_count += frame.height
+        self.filtered_count += result.height
+
+        logger.debug(
+            "Filtered movement frame",
+            original=frame.height,
+            filtered=result.height,
+            reduction_pct=((frame.height - result.height) / frame.height * 100),
+        )
+        return result
 
     def get_stats(self) -> dict[str, Any]:
         """Get filtering statistics."""
@@ -10,19 +10,67 @@ the curated schema tables:
 - operational.extraction_log (for tracking)
 """
 
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any
 
 import structlog
 
-from ..models.unified.actionnetwork import (
-    ActionNetworkHistoricalData,
-    ActionNetworkHistoricalEntry,
-)
+from ..models.unified.actionnetwork import ActionNetworkHistoricalData
 from .connection import DatabaseConnection
 
 logger = structlog.get_logger(__name__)
 
+HISTORY_TABLE = "curated.betting_lines_unified"
+
+# Columns shared by every market row, in COPY order
+HISTORY_SHARED_COLUMNS: tuple[str, ...] = (
+    "game_id",
+    "sportsbook_id",
+    "sportsbook",
+    "market_type",
+    "odds_timestamp",
+    "source",
+    "data_quality",
+    "game_datetime",
+    "home_team",
+    "away_team",
+)
+
+# Market-specific columns; these are the columns refreshed on upsert
+HISTORY_MARKET_COLUMNS: dict[str, tuple[str, ...]] = {
+    "moneyline": (
+        "home_ml",
+        "away_ml",
+        "home_bets_percentage",
+        "away_bets_percentage",
+        "home_money_percentage",
+        "away_money_percentage",
+    ),
+    "spread": (
+        "home_spread",
+        "away_spread",
+        "home_spread_price",
+        "away_spread_price",
+        "home_bets_percentage",
+        "away_bets_percentage",
+        "home_money_percentage",
+        "away_money_percentage",
+    ),
+    "total": (
+        "total_line",
+        "over_price",
+        "under_price",
+        "over_bets_percentage",
+        "under_bets_percentage",
+        "over_money_percentage",
+        "under_money_percentage",
+    ),
+}
+
+# Action Network market name -> market_type stored in the unified table
+HISTORY_MARKET_TYPES = {"moneyline": "moneyline", "spread": "spread", "total": "totals"}
+
 
 class ActionNetworkRepository:
     """Repository for Action Network data using curated schema."""
@@ -31,6 +79,9 @@ class ActionNetworkRepository:
         self.connection = connection
         self.logger = logger.bind(component="ActionNetworkRepository")
 
+        # Action Network book ID -> curated.sportsbooks.id, loaded once
+        self._sportsbook_ids: dict[str, int | None] | None = None
+
         # Action Network sportsbook ID mapping
         self.action_network_books = {
             "15": "DraftKings",
@@ -263,6 +314,9 @@ class ActionNetworkRepository:
         """
         Save Action Network historical data to curated schema tables.
 
+        The whole history of the game is flattened into one row batch per
+        market and each batch is written with a single COPY + upsert.
+
         Args:
             historical_data: Parsed Action Network data
 
@@ -279,16 +333,21 @@ class ActionNetworkRepository:
                 # This is the most important step - save to central tracking
                 game_id = await self._ensure_game_exists(conn, historical_data)
 
-                # STEP 2: Ensure sportsbooks exist
-                await self._ensure_sportsbooks_exist(conn)
+                # STEP 2: Ensure sportsbooks exist and resolve their IDs once
+                sportsbook_ids = await self._load_sportsbook_ids(conn)
 
-                # Save each entry using the central game_id
-                total_saved = 0
-                for entry in historical_data.historical_entries:
-                    saved_count = await self._save_historical_entry(
-                        conn, game_id, historical_data, entry
-                    )
-                    total_saved += saved_count
+                # STEP 3: Flatten every entry into per-market row batches
+                market_rows, counters = self._flatten_historical_data(
+                    game_id, historical_data, sportsbook_ids
+                )
+
+                # STEP 4: One bulk write per market
+                async with conn.transaction():
+                    for market_name, rows in market_rows.items():
+                        if rows:
+                            await self._copy_market_rows(conn, market_name, rows)
+
+                total_saved = sum(len(rows) for rows in market_rows.values())
 
                 # Update extraction log with team abbreviations
                 home_abbr = self._get_team_abbreviation(historical_data.home_team)
@@ -308,9 +367,14 @@ class ActionNetworkRepository:
                     "Historical data saved to curated schema",
                     game_id=historical_data.game_id,
                     saved_count=total_saved,
+                    **counters,
                 )
 
-                return {"success": True, "saved_count": total_saved}
+                return {
+                    "success": True,
+                    "saved_count": total_saved,
+                    "counters": dict(counters),
+                }
 
         except Exception as e:
             self.logger.error(
@@ -322,79 +386,282 @@ class ActionNetworkRepository:
 
     async def _ensure_sportsbooks_exist(self, conn) -> None:
         """Ensure Action Network sportsbooks exist in curated.sportsbooks."""
-        for book_id, book_name in self.action_network_books.items():
-            abbreviation = book_name.replace(" ", "").upper()[:10]
-            self.logger.info(
-                "Ensuring sportsbook exists",
-                book_id=book_id,
-                book_name=book_name,
-                abbreviation=abbreviation,
-            )
+        await conn.executemany(
+            """
+            INSERT INTO curated.sportsbooks (name, display_name, abbreviation, is_active, supports_live_betting)
+            VALUES ($1, $2, $3, true, true)
+            ON CONFLICT (name) DO NOTHING
+        """,
+            [
+                (book_name, book_name, book_name.replace(" ", "").upper()[:10])
+                for book_name in self.action_network_books.values()
+            ],
+        )
 
-            await conn.execute(
-                """
-                INSERT INTO curated.sportsbooks (name, display_name, abbreviation, is_active, supports_live_betting)
-                VALUES ($1, $2, $3, true, true)
-                ON CONFLICT (name) DO NOTHING
-            """,
-                book_name,
-                book_name,
-                abbreviation,
+    async def _load_sportsbook_ids(self, conn) -> dict[str, int | None]:
+        """
+        Resolve all Action Network book IDs to internal sportsbook IDs.
+
+        Resolution happens in a single query and is kept for the lifetime of
+        the repository once every book resolves; books that do not resolve
+        yet are retried on the next save.
+        """
+        if self._sportsbook_ids is not None:
+            return self._sportsbook_ids
+
+        await self._ensure_sportsbooks_exist(conn)
+        rows = await conn.fetch(
+            """
+            SELECT b.external_id,
+                   curated.resolve_sportsbook_id(b.external_id, b.name, 'ACTION_NETWORK') AS sportsbook_id
+            FROM unnest($1::text[], $2::text[]) AS b(external_id, name)
+        """,
+            list(self.action_network_books.keys()),
+            list(self.action_network_books.values()),
+        )
+        sportsbook_ids = {row["external_id"]: row["sportsbook_id"] for row in rows}
+
+        unresolved = [
+            book_id for book_id in self.action_network_books
+            if sportsbook_ids.get(book_id) is None
+        ]
+        if unresolved:
+            self.logger.warning(
+                "Unresolved Action Network sportsbooks", book_ids=unresolved
             )
+        else:
+            self._sportsbook_ids = sportsbook_ids
+        return sportsbook_ids
 
-    async def _save_historical_entry(
+    def _flatten_historical_data(
         self,
-        conn,
         game_id: int,
         historical_data: ActionNetworkHistoricalData,
-        entry: ActionNetworkHistoricalEntry,
-    ) -> int:
-        """Save a single historical entry to appropriate curated schema tables."""
-        saved_count = 0
+        sportsbook_ids: dict[str, int | None],
+    ) -> tuple[dict[str, list[dict[str, Any]]], Counter]:
+        """
+        Flatten a game's history into row batches keyed by market.
 
-        # Extract market data from the raw event data
-        event_data = entry.event
+        Rows sharing a sportsbook and timestamp within a market are merged so
+        per-side items (home/away, over/under) end up in one row instead of
+        overwriting each other on upsert. Items from books without a resolved
+        sportsbook_id are skipped: the upsert key treats NULL IDs as equal, so
+        every unresolved book would overwrite the same row.
+        """
+        counters: Counter = Counter()
+        merged: dict[str, dict[tuple, dict[str, Any]]] = {
+            market_name: {} for market_name in HISTORY_MARKET_COLUMNS
+        }
+        shared = {
+            "game_id": game_id,
+            "source": "ACTION_NETWORK",
+            "data_quality": "HIGH",
+            "game_datetime": historical_data.game_datetime,
+            "home_team": self._get_team_abbreviation(historical_data.home_team),
+            "away_team": self._get_team_abbreviation(historical_data.away_team),
+        }
+        # Entries without a timestamp share one collection time per save
+        fallback_timestamp = datetime.now()
+
+        for entry in historical_data.historical_entries:
+            counters["entries"] += 1
+            event_data = entry.event or {}
+            odds_timestamp = entry.timestamp or fallback_timestamp
+
+            for market_name, extract in (
+                ("moneyline", self._moneyline_rows),
+                ("spread", self._spread_rows),
+                ("total", self._total_rows),
+            ):
+                market_data = event_data.get(market_name)
+                if not market_data or not isinstance(market_data, list):
+                    continue
+
+                for book_id, values in extract(market_data, counters):
+                    if sportsbook_ids.get(book_id) is None:
+                        counters["unresolved_book_items"] += 1
+                        continue
+                    key = (book_id, odds_timestamp)
+                    row = merged[market_name].get(key)
+                    if row is None:
+                        merged[market_name][key] = {
+                            **shared,
+                            "sportsbook_id": sportsbook_ids.get(book_id),
+                            "sportsbook": self.action_network_books[book_id],
+                            "market_type": HISTORY_MARKET_TYPES[market_name],
+                            "odds_timestamp": odds_timestamp,
+                            **values,
+                        }
+                    else:
+                        counters[f"{market_name}_merged"] += 1
+                        row.update(
+                            {k: v for k, v in values.items() if v is not None}
+                        )
 
-        self.logger.info(
-            "Processing historical entry",
-            game_id=historical_data.game_id,
-            timestamp=entry.timestamp,
-            event_keys=list(event_data.keys()) if event_data else [],
-        )
+        market_rows = {
+            market_name: list(rows.values()) for market_name, rows in merged.items()
+        }
+        for market_name, rows in market_rows.items():
+            counters[f"{market_name}_rows"] = len(rows)
+        return market_rows, counters
+
+    def _known_book(self, market_item: dict, counters: Counter) -> str | None:
+        """Return the item's book ID if it is a tracked Action Network book."""
+        book_id = str(market_item.get("book_id", ""))
+        if book_id not in self.action_network_books:
+            counters["unknown_book_items"] += 1
+            return None
+        return book_id
+
+    @staticmethod
+    def _side_percentages(market_item: dict) -> tuple[Any, Any]:
+        """Extract (tickets %, money %) from an item's bet_info block."""
+        bet_info = market_item.get("bet_info") or {}
+        tickets_info = bet_info.get("tickets") or {}
+        money_info = bet_info.get("money") or {}
+        return tickets_info.get("percent"), money_info.get("percent")
+
+    def _moneyline_rows(self, market_data: list[dict], counters: Counter):
+        """Yield (book_id, values) moneyline rows built from per-side items."""
+        sportsbook_data: dict[str, dict[str, dict | None]] = {}
+        for market_item in market_data:
+            book_id = self._known_book(market_item, counters)
+            if book_id is None:
+                continue
+            sides = sportsbook_data.setdefault(book_id, {"home": None, "away": None})
+            side = (market_item.get("side") or "").lower()
+            if side in sides:
+                sides[side] = market_item
+
+        for book_id, sides in sportsbook_data.items():
+            home, away = sides["home"] or {}, sides["away"] or {}
+            if home.get("odds") is None and away.get("odds") is None:
+                counters["skipped_items"] += 1
+                continue
 
-        # Process each market type from the event data
-        for market_name in ["moneyline", "spread", "total"]:
-            if market_name in event_data and event_data[market_name]:
-                market_data = event_data[market_name]
-                self.logger.info(
-                    "Found market data",
-                    market_name=market_name,
-                    data_type=type(market_data).__name__,
-                    data_length=len(market_data)
-                    if isinstance(market_data, list)
-                    else "N/A",
+            home_bets_pct, home_money_pct = self._side_percentages(home)
+            away_bets_pct, away_money_pct = self._side_percentages(away)
+            yield book_id, {
+                "home_ml": home.get("odds"),
+                "away_ml": away.get("odds"),
+                "home_bets_percentage": home_bets_pct,
+                "away_bets_percentage": away_bets_pct,
+                "home_money_percentage": home_money_pct,
+                "away_money_percentage": away_money_pct,
+            }
+
+    def _spread_rows(self, market_data: list[dict], counters: Counter):
+        """Yield (book_id, values) spread rows, one per market item."""
+        for market_item in market_data:
+            book_id = self._known_book(market_item, counters)
+            if book_id is None:
+                continue
+
+            values = {
+                "home_spread": market_item.get("home_spread"),
+                "away_spread": market_item.get("away_spread"),
+                "home_spread_price": market_item.get("home_spread_odds"),
+                "away_spread_price": market_item.get("away_spread_odds"),
+            }
+
+            # If data is provided per side, extract from side-specific fields
+            side = (market_item.get("side") or "").lower()
+            if side in ("home", "away") and not (
+                values["home_spread"] or values["away_spread"]
+            ):
+                values[f"{side}_spread"] = market_item.get("value") or market_item.get(
+                    "spread"
                 )
+                values[f"{side}_spread_price"] = market_item.get("odds")
 
-                if isinstance(market_data, list):
-                    if market_name == "moneyline":
-                        saved_count += await self._save_moneyline_data(
-                            conn, game_id, historical_data, entry, market_data
-                        )
-                    elif market_name == "spread":
-                        saved_count += await self._save_spread_data(
-                            conn, game_id, historical_data, entry, market_data
-                        )
-                    elif market_name == "total":
-                        saved_count += await self._save_total_data(
-                            conn, game_id, historical_data, entry, market_data
-                        )
+            if values["home_spread"] is None and values["away_spread"] is None:
+                counters["skipped_items"] += 1
+                continue
 
-        self.logger.info(
-            "Completed historical entry processing",
-            game_id=historical_data.game_id,
-            saved_count=saved_count,
+            # bet_splits is the legacy format, bet_info the Action Network API format
+            bet_splits = market_item.get("bet_splits") or {}
+            for column in (
+                "home_bets_percentage",
+                "away_bets_percentage",
+                "home_money_percentage",
+                "away_money_percentage",
+            ):
+                values[column] = bet_splits.get(column)
+            if side in ("home", "away"):
+                bets_pct, money_pct = self._side_percentages(market_item)
+                if bets_pct is not None:
+                    values[f"{side}_bets_percentage"] = bets_pct
+                if money_pct is not None:
+                    values[f"{side}_money_percentage"] = money_pct
+
+            yield book_id, values
+
+    def _total_rows(self, market_data: list[dict], counters: Counter):
+        """Yield (book_id, values) total rows, one per market item."""
+        for market_item in market_data:
+            book_id = self._known_book(market_item, counters)
+            if book_id is None:
+                continue
+
+            total_line = market_item.get("total")
+            if total_line is None:
+                counters["skipped_items"] += 1
+                continue
+
+            values = {
+                "total_line": total_line,
+                "over_price": market_item.get("over_odds"),
+                "under_price": market_item.get("under_odds"),
+            }
+
+            # bet_splits is the legacy format, bet_info the Action Network API format
+            bet_splits = market_item.get("bet_splits") or {}
+            for column in (
+                "over_bets_percentage",
+                "under_bets_percentage",
+                "over_money_percentage",
+                "under_money_percentage",
+            ):
+                values[column] = bet_splits.get(column)
+            side = (market_item.get("side") or "").lower()
+            if side in ("over", "under"):
+                bets_pct, money_pct = self._side_percentages(market_item)
+                if bets_pct is not None:
+                    values[f"{side}_bets_percentage"] = bets_pct
+                if money_pct is not None:
+                    values[f"{side}_money_percentage"] = money_pct
+
+            yield book_id, values
+
+    async def _copy_market_rows(
+        self, conn, market_name: str, rows: list[dict[str, Any]]
+    ) -> None:
+        """COPY one market's rows into a temp table and upsert them in one statement."""
+        market_columns = HISTORY_MARKET_COLUMNS[market_name]
+        columns = HISTORY_SHARED_COLUMNS + market_columns
+        staging_table = f"_an_history_{market_name}"
+
+        await conn.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} "
+            f"(LIKE {HISTORY_TABLE} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+        await conn.copy_records_to_table(
+            staging_table,
+            records=[tuple(row.get(column) for column in columns) for row in rows],
+            columns=list(columns),
+        )
+
+        column_list = ", ".join(columns)
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in market_columns)
+        await conn.execute(
+            f"""
+            INSERT INTO {HISTORY_TABLE} ({column_list})
+            SELECT {column_list} FROM {staging_table}
+            ON CONFLICT (game_id, sportsbook_id, market_type, odds_timestamp)
+                WHERE sportsbook_id IS NOT NULL
+            DO UPDATE SET {updates}, updated_at = NOW()
+        """
         )
-        return saved_count
 
     async def resolve_sportsbook_id(
         self, conn, external_id: str, source: str = "ACTION_NETWORK"
@@ -423,413 +690,6 @@ class ActionNetworkRepository:
         filled_fields = sum(1 for value in fields.values() if value is not None)
         return filled_fields / total_fields if total_fields > 0 else 0.0
 
-    async def _save_moneyline_data(
-        self,
-        conn,
-        game_id: int,
-        historical_data: ActionNetworkHistoricalData,
-        entry: ActionNetworkHistoricalEntry,
-        market_data: list[dict],
-    ) -> int:
-        """Save moneyline data to curated.betting_lines_unified -- NOTE: Add WHERE market_type = 'moneyline'."""
-        saved_count = 0
-
-        self.logger.info(
-            "Processing moneyline data",
-            game_id=historical_data.game_id,
-            market_items=len(market_data),
-        )
-
-        # Group market items by sportsbook
-        sportsbook_data = {}
-        for market_item in market_data:
-            book_id = str(market_item.get("book_id", ""))
-            if book_id not in self.action_network_books:
-                continue
-
-            if book_id not in sportsbook_data:
-                sportsbook_data[book_id] = {"home": None, "away": None}
-
-            side = market_item.get("side", "").lower()
-            if side in ["home", "away"]:
-                sportsbook_data[book_id][side] = market_item
-
-        # Process each sportsbook's data
-        for book_id, sides_data in sportsbook_data.items():
-            sportsbook_name = self.action_network_books[book_id]
-
-            # Use new sportsbook ID resolution system
-            sportsbook_id_result = await self.resolve_sportsbook_id(
-                conn, book_id, "ACTION_NETWORK"
-            )
-
-            # Extract odds from home and away sides
-            home_odds = sides_data["home"].get("odds") if sides_data["home"] else None
-            away_odds = sides_data["away"].get("odds") if sides_data["away"] else None
-
-            if home_odds is None and away_odds is None:
-                continue
-
-            # Extract betting splits (if available)
-            home_bets_pct = None
-            away_bets_pct = None
-            home_money_pct = None
-            away_money_pct = None
-
-            if sides_data["home"]:
-                home_bet_info = sides_data["home"].get("bet_info", {})
-                if home_bet_info:
-                    tickets_info = home_bet_info.get("tickets", {})
-                    money_info = home_bet_info.get("money", {})
-                    if "percent" in tickets_info:
-                        home_bets_pct = tickets_info["percent"]
-                    if "percent" in money_info:
-                        home_money_pct = money_info["percent"]
-
-            if sides_data["away"]:
-                away_bet_info = sides_data["away"].get("bet_info", {})
-                if away_bet_info:
-                    tickets_info = away_bet_info.get("tickets", {})
-                    money_info = away_bet_info.get("money", {})
-                    if "percent" in tickets_info:
-                        away_bets_pct = tickets_info["percent"]
-                    if "percent" in money_info:
-                        away_money_pct = money_info["percent"]
-
-            # Get team abbreviations
-            home_abbr = self._get_team_abbreviation(historical_data.home_team)
-            away_abbr = self._get_team_abbreviation(historical_data.away_team)
-
-            # Use current timestamp if entry timestamp is None
-            odds_timestamp = entry.timestamp if entry.timestamp else datetime.now()
-
-            self.logger.info(
-                "Inserting moneyline data",
-                game_id=historical_data.game_id,
-                sportsbook=sportsbook_name,
-                home_team=f"{historical_data.home_team} -> {home_abbr}",
-                away_team=f"{historical_data.away_team} -> {away_abbr}",
-                home_odds=home_odds,
-                away_odds=away_odds,
-                home_bets_pct=home_bets_pct,
-                away_bets_pct=away_bets_pct,
-                home_money_pct=home_money_pct,
-                away_money_pct=away_money_pct,
-                odds_timestamp=odds_timestamp,
-            )
-
-            # Insert into moneyline table
-            try:
-                await conn.execute(
-                    """
-                    INSERT INTO curated.betting_lines_unified -- NOTE: Add WHERE market_type = 'moneyline' (
-                        game_id, sportsbook_id, sportsbook, home_ml, away_ml, odds_timestamp,
-                        home_bets_percentage, away_bets_percentage, home_money_percentage, away_money_percentage,
-                        source, data_quality, game_datetime, home_team, away_team
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15
-                    )
-                """,
-                    game_id,
-                    sportsbook_id_result,
-                    sportsbook_name,
-                    home_odds,
-                    away_odds,
-                    odds_timestamp,
-                    home_bets_pct,
-                    away_bets_pct,
-                    home_money_pct,
-                    away_money_pct,
-                    "ACTION_NETWORK",
-                    "HIGH",
-                    historical_data.game_datetime,
-                    home_abbr,
-                    away_abbr,
-                )
-                self.logger.info(
-                    "Successfully inserted moneyline data",
-                    game_id=historical_data.game_id,
-                    sportsbook=sportsbook_name,
-                )
-            except Exception as e:
-                self.logger.error(
-                    "Failed to insert moneyline data",
-                    game_id=historical_data.game_id,
-                    sportsbook=sportsbook_name,
-                    error=str(e),
-                    home_abbr=home_abbr,
-                    away_abbr=away_abbr,
-                    source="ACTION_NETWORK",
-                    data_quality="HIGH",
-                )
-            saved_count += 1
-
-        return saved_count
-
-    async def _save_spread_data(
-        self,
-        conn,
-        game_id: int,
-        historical_data: ActionNetworkHistoricalData,
-        entry: ActionNetworkHistoricalEntry,
-        market_data: list[dict],
-    ) -> int:
-        """Save spread data to curated.betting_lines_unified -- NOTE: Add WHERE market_type = 'spread's."""
-        saved_count = 0
-
-        for market_item in market_data:
-            book_id = str(market_item.get("book_id", ""))
-            if book_id not in self.action_network_books:
-                continue
-
-            sportsbook_name = self.action_network_books[book_id]
-
-            # Use new sportsbook ID resolution system
-            sportsbook_id_result = await self.resolve_sportsbook_id(
-                conn, book_id, "ACTION_NETWORK"
-            )
-
-            # Extract spread data - Action Network may provide data per side
-            home_spread = market_item.get("home_spread")
-            away_spread = market_item.get("away_spread")
-            home_spread_price = market_item.get("home_spread_odds")
-            away_spread_price = market_item.get("away_spread_odds")
-
-            # If data is provided per side, extract from side-specific fields
-            side = market_item.get("side", "").lower()
-            if side and not (home_spread or away_spread):
-                spread_value = market_item.get("value") or market_item.get("spread")
-                spread_odds = market_item.get("odds")
-
-                if side == "home":
-                    home_spread = spread_value
-                    home_spread_price = spread_odds
-                elif side == "away":
-                    away_spread = spread_value
-                    away_spread_price = spread_odds
-
-            if home_spread is None and away_spread is None:
-                continue
-
-            # Extract betting percentage data from Action Network format
-            home_bets_pct = None
-            away_bets_pct = None
-            home_money_pct = None
-            away_money_pct = None
-
-            # Try to extract from bet_splits first (legacy format)
-            bet_splits = market_item.get("bet_splits", {})
-            if bet_splits:
-                home_bets_pct = bet_splits.get("home_bets_percentage")
-                away_bets_pct = bet_splits.get("away_bets_percentage")
-                home_money_pct = bet_splits.get("home_money_percentage")
-                away_money_pct = bet_splits.get("away_money_percentage")
-
-            # Also try to extract from bet_info structure (Action Network API format)
-            bet_info = market_item.get("bet_info", {})
-            if bet_info:
-                tickets_info = bet_info.get("tickets", {})
-                money_info = bet_info.get("money", {})
-
-                if "percent" in tickets_info:
-                    side = market_item.get("side", "").lower()
-                    if side == "home":
-                        home_bets_pct = tickets_info["percent"]
-                    elif side == "away":
-                        away_bets_pct = tickets_info["percent"]
-
-                if "percent" in money_info:
-                    side = market_item.get("side", "").lower()
-                    if side == "home":
-                        home_money_pct = money_info["percent"]
-                    elif side == "away":
-                        away_money_pct = money_info["percent"]
-
-            # Log the spread data being inserted
-            self.logger.info(
-                "Inserting spread data",
-                game_id=historical_data.game_id,
-                sportsbook=sportsbook_name,
-                home_spread=home_spread,
-                away_spread=away_spread,
-                home_spread_price=home_spread_price,
-                away_spread_price=away_spread_price,
-                home_bets_pct=home_bets_pct,
-                away_bets_pct=away_bets_pct,
-                home_money_pct=home_money_pct,
-                away_money_pct=away_money_pct,
-            )
-
-            # Insert into spreads table
-            await conn.execute(
-                """
-                INSERT INTO curated.betting_lines_unified -- NOTE: Add WHERE market_type = 'spread's (
-                    game_id, sportsbook_id, sportsbook, home_spread, away_spread,
-                    home_spread_price, away_spread_price, odds_timestamp,
-                    home_bets_percentage, away_bets_percentage, home_money_percentage, away_money_percentage,
-                    source, data_quality, game_datetime, home_team, away_team
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17
-                )
-                ON CONFLICT (game_id, sportsbook_id, odds_timestamp)
-                DO UPDATE SET
-                    home_spread = EXCLUDED.home_spread,
-                    away_spread = EXCLUDED.away_spread,
-                    home_spread_price = EXCLUDED.home_spread_price,
-                    away_spread_price = EXCLUDED.away_spread_price,
-                    home_bets_percentage = EXCLUDED.home_bets_percentage,
-                    away_bets_percentage = EXCLUDED.away_bets_percentage,
-                    home_money_percentage = EXCLUDED.home_money_percentage,
-                    away_money_percentage = EXCLUDED.away_money_percentage,
-                    updated_at = NOW()
-            """,
-                game_id,
-                sportsbook_id_result,
-                sportsbook_name,
-                home_spread,
-                away_spread,
-                home_spread_price,
-                away_spread_price,
-                entry.timestamp,
-                home_bets_pct,
-                away_bets_pct,
-                home_money_pct,
-                away_money_pct,
-                "ACTION_NETWORK",
-                "HIGH",
-                historical_data.game_datetime,
-                self._get_team_abbreviation(historical_data.home_team),
-                self._get_team_abbreviation(historical_data.away_team),
-            )
-            saved_count += 1
-
-        return saved_count
-
-    async def _save_total_data(
-        self,
-        conn,
-        game_id: int,
-        historical_data: ActionNetworkHistoricalData,
-        entry: ActionNetworkHistoricalEntry,
-        market_data: list[dict],
-    ) -> int:
-        """Save total data to curated.betting_lines_unified -- NOTE: Add WHERE market_type = 'totals'."""
-        saved_count = 0
-
-        for market_item in market_data:
-            book_id = str(market_item.get("book_id", ""))
-            if book_id not in self.action_network_books:
-                continue
-
-            sportsbook_name = self.action_network_books[book_id]
-
-            # Use new sportsbook ID resolution system
-            sportsbook_id_result = await self.resolve_sportsbook_id(
-                conn, book_id, "ACTION_NETWORK"
-            )
-
-            # Extract total data
-            total_line = market_item.get("total")
-            over_odds = market_item.get("over_odds")
-            under_odds = market_item.get("under_odds")
-
-            if total_line is None:
-                continue
-
-            # Extract betting percentage data from Action Network format
-            # The market_item structure depends on the data format
-            over_bets_pct = None
-            under_bets_pct = None
-            over_money_pct = None
-            under_money_pct = None
-
-            # Try to extract from bet_splits first (legacy format)
-            bet_splits = market_item.get("bet_splits", {})
-            if bet_splits:
-                over_bets_pct = bet_splits.get("over_bets_percentage")
-                under_bets_pct = bet_splits.get("under_bets_percentage")
-                over_money_pct = bet_splits.get("over_money_percentage")
-                under_money_pct = bet_splits.get("under_money_percentage")
-
-            # Also try to extract from bet_info structure (Action Network API format)
-            bet_info = market_item.get("bet_info", {})
-            if bet_info:
-                tickets_info = bet_info.get("tickets", {})
-                money_info = bet_info.get("money", {})
-
-                # For totals, bet_info might contain overall percentages
-                # that need to be split into over/under
-                if "percent" in tickets_info:
-                    # This would be the percentage for this specific side
-                    side = market_item.get("side", "").lower()
-                    if side == "over":
-                        over_bets_pct = tickets_info["percent"]
-                    elif side == "under":
-                        under_bets_pct = tickets_info["percent"]
-
-                if "percent" in money_info:
-                    side = market_item.get("side", "").lower()
-                    if side == "over":
-                        over_money_pct = money_info["percent"]
-                    elif side == "under":
-                        under_money_pct = money_info["percent"]
-
-            # Log the totals data being inserted
-            self.logger.info(
-                "Inserting totals data",
-                game_id=historical_data.game_id,
-                sportsbook=sportsbook_name,
-                total_line=total_line,
-                over_odds=over_odds,
-                under_odds=under_odds,
-                over_bets_pct=over_bets_pct,
-                under_bets_pct=under_bets_pct,
-                over_money_pct=over_money_pct,
-                under_money_pct=under_money_pct,
-            )
-
-            # Insert into totals table
-            await conn.execute(
-                """
-                INSERT INTO curated.betting_lines_unified -- NOTE: Add WHERE market_type = 'totals' (
-                    game_id, sportsbook_id, sportsbook, total_line, over_price, under_price, odds_timestamp,
-                    over_bets_percentage, under_bets_percentage, over_money_percentage, under_money_percentage,
-                    source, data_quality, game_datetime, home_team, away_team
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16
-                )
-                ON CONFLICT (game_id, sportsbook_id, odds_timestamp)
-                DO UPDATE SET
-                    total_line = EXCLUDED.total_line,
-                    over_price = EXCLUDED.over_price,
-                    under_price = EXCLUDED.under_price,
-                    over_bets_percentage = EXCLUDED.over_bets_percentage,
-                    under_bets_percentage = EXCLUDED.under_bets_percentage,
-                    over_money_percentage = EXCLUDED.over_money_percentage,
-                    under_money_percentage = EXCLUDED.under_money_percentage,
-                    updated_at = NOW()
-            """,
-                game_id,
-                sportsbook_id_result,
-                sportsbook_name,
-                total_line,
-                over_odds,
-                under_odds,
-                entry.timestamp,
-                over_bets_pct,
-                under_bets_pct,
-                over_money_pct,
-                under_money_pct,
-                "ACTION_NETWORK",
-                "HIGH",
-                historical_data.game_datetime,
-                self._get_team_abbreviation(historical_data.home_team),
-                self._get_team_abbreviation(historical_data.away_team),
-            )
-            saved_count += 1
-
-        return saved_count
-
     async def _update_extraction_log(
         self,
         conn,
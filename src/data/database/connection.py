@@ -16,9 +16,10 @@ import psycopg2
 import psycopg2.pool
 from psycopg2.extras import RealDictCursor
 
-from ...core.config import UnifiedSettings
+from ...core.config import UnifiedSettings, get_settings
 from ...core.exceptions import DatabaseError
 from ...core.logging import LogComponent, get_logger
+from .query_timing import current_query_timer
 
 logger = get_logger(__name__, LogComponent.DATABASE)
 
@@ -228,8 +229,13 @@ class DatabaseConnection:
             )
 
         async with self._async_pool.acquire() as connection:
+            timer = current_query_timer()
             try:
-                yield connection
+                if timer is None:
+                    yield connection
+                else:
+                    with connection.query_logger(timer.record):
+                        yield connection
             except Exception as e:
                 # Log connection error
                 logger.error(
@@ -492,6 +498,11 @@ class ConnectionPool:
         Returns:
             DatabaseConnection instance
         """
+        if not self._connections:
+            # Entry points no longer register connections up front; set up
+            # the configured databases on first use
+            initialize_connections(get_settings())
+
         connection_name = name or self._default_connection
 
         if not connection_name:
@@ -0,0 +1,51 @@
+"""
+Query Timing
+
+Attributes database time to whatever is running in the current context.
+While a QueryTimer is active (see ``time_queries``), every async connection
+handed out by DatabaseConnection reports the elapsed time of its queries to
+that timer through an asyncpg query logger.
+
+asyncpg delivers query log records on the next event loop iteration, so read
+a timer after the timed work has been awaited rather than inside it.
+"""
+
+import contextlib
+import contextvars
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+
+# Identity equality keeps the bound ``record`` method hashable; asyncpg keeps
+# query loggers in a set
+@dataclass(eq=False)
+class QueryTimer:
+    """Query count and database time accumulated for one unit of work."""
+
+    queries: int = 0
+    seconds: float = 0.0
+
+    def record(self, logged_query) -> None:
+        """asyncpg query logger callback."""
+        self.queries += 1
+        self.seconds += logged_query.elapsed
+
+
+_active_timer: contextvars.ContextVar[QueryTimer | None] = contextvars.ContextVar(
+    "query_timer", default=None
+)
+
+
+def current_query_timer() -> QueryTimer | None:
+    """Timer for the current context, if queries are being timed."""
+    return _active_timer.get()
+
+
+@contextlib.contextmanager
+def time_queries(timer: QueryTimer) -> Iterator[QueryTimer]:
+    """Attribute queries on connections acquired inside the block to ``timer``."""
+    token = _active_timer.set(timer)
+    try:
+        yield timer
+    finally:
+        _active_timer.reset(token)
@@ -14,6 +14,7 @@ from enum import Enum
 
 from pydantic import Field
 
+from ....core import odds_math
 from ....core.pydantic_compat import field_validator
 from .base import SourcedModel, UnifiedEntity, ValidatedModel
 
@@ -208,10 +209,7 @@ class OddsData(SourcedModel, ValidatedModel):
             return self.odds_american
 
         if self.odds_decimal is not None:
-            if self.odds_decimal >= 2.0:
-                return int((self.odds_decimal - 1) * 100)
-            else:
-                return int(-100 / (self.odds_decimal - 1))
+            return int(odds_math.decimal_to_american(self.odds_decimal))
 
         if self.implied_probability is not None:
             if self.implied_probability >= 0.5:
@@ -227,10 +225,7 @@ class OddsData(SourcedModel, ValidatedModel):
             return self.odds_decimal
 
         if self.odds_american is not None:
-            if self.odds_american > 0:
-                return (self.odds_american / 100) + 1
-            else:
-                return (100 / abs(self.odds_american)) + 1
+            return odds_math.american_to_decimal(self.odds_american)
 
         if self.implied_probability is not None:
             return 1 / self.implied_probability
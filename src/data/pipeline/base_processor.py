@@ -10,6 +10,9 @@ Reference: docs/SYSTEM_DESIGN_ANALYSIS.md
 import asyncio
 import time
 from abc import abstractmethod
+from typing import Any
+
+import polars as pl
 
 from ...core.config import get_settings
 from ...core.logging import LogComponent, get_logger
@@ -26,6 +29,15 @@ from .zone_interface import (
 logger = get_logger(__name__, LogComponent.CORE)
 
 
+def _present(column: pl.Series) -> pl.Series:
+    """Vectorized truthiness for optional string columns."""
+    if column.dtype == pl.Null:
+        return pl.Series(column.name, [False] * len(column))
+    if column.dtype == pl.Utf8:
+        return column.is_not_null() & (column != "")
+    return column.is_not_null()
+
+
 class BaseZoneProcessor(DataZone):
     """
     Base implementation for all zone processors.
@@ -38,6 +50,10 @@ class BaseZoneProcessor(DataZone):
     - Validation framework
     """
 
+    # Columns exposed to validate_batch / score_batch by batch_frame()
+    BATCH_FIELDS: tuple[str, ...] = ("source", "external_id")
+    BATCH_PRESENCE_FIELDS: tuple[str, ...] = ("raw_data",)
+
     def __init__(self, config: ZoneConfig):
         super().__init__(config)
         self.settings = get_settings()
@@ -78,43 +94,10 @@ class BaseZoneProcessor(DataZone):
                     f"Batch size {len(records)} exceeds configured limit {self.config.batch_size}"
                 )
 
-            # Process records
-            successful_records = []
-            failed_records = []
-            errors = []
-
-            for record in records:
-                try:
-                    # Validate record if enabled
-                    if self.config.validation_enabled:
-                        is_valid = await self.validate_record(record)
-                        if not is_valid:
-                            failed_records.append(record)
-                            continue
-
-                    # Calculate quality score
-                    quality_score = await self.get_quality_score(record)
-                    record.quality_score = quality_score
-
-                    # Check quality threshold
-                    if quality_score < self.config.quality_threshold:
-                        logger.warning(
-                            f"Record quality {quality_score} below threshold {self.config.quality_threshold}"
-                        )
-                        failed_records.append(record)
-                        continue
-
-                    # Process individual record
-                    processed_record = await self.process_record(record, **kwargs)
-                    if processed_record:
-                        successful_records.append(processed_record)
-                    else:
-                        failed_records.append(record)
-
-                except Exception as e:
-                    logger.error(f"Error processing record {record.external_id}: {e}")
-                    failed_records.append(record)
-                    errors.append(str(e))
+            # Process records through the batch contract
+            successful_records, failed_records, errors = await self._run_batch(
+                records, **kwargs
+            )
 
             # Store processed records
             if successful_records:
@@ -166,6 +149,206 @@ class BaseZoneProcessor(DataZone):
 
         return result
 
+    async def _run_batch(
+        self, records: list[DataRecord], **kwargs
+    ) -> tuple[list[DataRecord], list[DataRecord], list[str]]:
+        """Validate, score and transform a batch; returns (successful, failed, errors)."""
+        errors: list[str] = []
+        frame = self.batch_frame(records)
+
+        if self.config.validation_enabled:
+            valid = list(await self.validate_batch(frame, records, errors=errors))
+        else:
+            valid = [True] * len(records)
+
+        scores = list(await self.score_batch(frame, records, errors=errors))
+        eligible = []
+        failed_records = []
+        for record, is_valid, score in zip(records, valid, scores, strict=True):
+            # A record whose scoring raised has no score
+            if not is_valid or score is None:
+                failed_records.append(record)
+                continue
+
+            record.quality_score = score
+            # Check quality threshold
+            if score < self.config.quality_threshold:
+                logger.warning(
+                    f"Record quality {score} below threshold {self.config.quality_threshold}"
+                )
+                failed_records.append(record)
+                continue
+            eligible.append(record)
+
+        successful_records = []
+        transformed = await self.transform_batch(eligible, errors=errors, **kwargs)
+        for record, processed_record in zip(eligible, transformed, strict=True):
+            if processed_record:
+                successful_records.append(processed_record)
+            else:
+                failed_records.append(record)
+
+        return successful_records, failed_records, errors
+
+    def batch_frame(self, records: list[DataRecord]) -> pl.DataFrame:
+        """
+        Columnar view of a batch for vectorized validation and scoring.
+
+        Scalar fields are copied as-is; payload fields are reduced to presence
+        flags since they are not columnar. Subclasses extend the view through
+        BATCH_FIELDS / BATCH_PRESENCE_FIELDS.
+        """
+        columns: dict[str, list[Any]] = {
+            field: [getattr(record, field, None) for record in records]
+            for field in self.BATCH_FIELDS
+        }
+        for field in self.BATCH_PRESENCE_FIELDS:
+            columns[f"has_{field}"] = [
+                bool(getattr(record, field, None)) for record in records
+            ]
+        return pl.DataFrame(columns, strict=False)
+
+    async def validate_batch(
+        self,
+        frame: pl.DataFrame,
+        records: list[DataRecord],
+        errors: list[str] | None = None,
+    ) -> list[bool]:
+        """
+        Validate a batch. Falls back to validate_record for custom validators.
+
+        Args:
+            frame: Columnar view from batch_frame()
+            records: The records backing ``frame``
+            errors: Collects the messages of per-record exceptions
+
+        Returns:
+            One validity flag per record
+        """
+        if self._overrides("validate_record"):
+            valid = []
+            for record in records:
+                try:
+                    valid.append(await self.validate_record(record))
+                except Exception as e:
+                    logger.error(f"Error processing record {record.external_id}: {e}")
+                    if errors is not None:
+                        errors.append(str(e))
+                    valid.append(False)
+            return valid
+
+        has_source = _present(frame["source"])
+        has_identity = _present(frame["external_id"]) | frame["has_raw_data"]
+        valid = (has_source & has_identity).to_list()
+
+        for index, record in enumerate(records):
+            if not valid[index]:
+                record.validation_errors = record.validation_errors or []
+                record.validation_errors.append(
+                    "Missing source"
+                    if not has_source[index]
+                    else "Missing external_id and raw_data"
+                )
+
+        # Zone-specific validation
+        return await self.validate_batch_custom(frame, records, valid)
+
+    async def validate_batch_custom(
+        self, frame: pl.DataFrame, records: list[DataRecord], valid: list[bool]
+    ) -> list[bool]:
+        """
+        Custom batch validation. Override in subclasses.
+
+        Defaults to validate_record_custom for each record that passed the
+        base checks, so zones with only a per-record validator keep working.
+        """
+        if not self._overrides("validate_record_custom"):
+            return valid
+
+        for index, record in enumerate(records):
+            if not valid[index]:
+                continue
+            try:
+                valid[index] = await self.validate_record_custom(record)
+            except Exception as e:
+                logger.error(f"Validation error for record {record.external_id}: {e}")
+                record.validation_errors = record.validation_errors or []
+                record.validation_errors.append(f"Validation exception: {e}")
+                valid[index] = False
+        return valid
+
+    async def score_batch(
+        self,
+        frame: pl.DataFrame,
+        records: list[DataRecord],
+        errors: list[str] | None = None,
+    ) -> list[float | None]:
+        """
+        Quality-score a batch. Falls back to get_quality_score when a zone
+        customizes any of the per-record scoring hooks.
+
+        Args:
+            frame: Columnar view from batch_frame()
+            records: The records backing ``frame``
+            errors: Collects the messages of per-record exceptions
+
+        Returns:
+            One quality score between 0.0 and 1.0 per record, or None for a
+            record whose scoring raised
+        """
+        if any(
+            self._overrides(name)
+            for name in (
+                "get_quality_score",
+                "_calculate_completeness_score",
+                "_calculate_accuracy_score",
+                "_calculate_consistency_score",
+            )
+        ):
+            scores = []
+            for record in records:
+                try:
+                    scores.append(await self.get_quality_score(record))
+                except Exception as e:
+                    logger.error(f"Error processing record {record.external_id}: {e}")
+                    if errors is not None:
+                        errors.append(str(e))
+                    scores.append(None)
+            return scores
+
+        # Required fields share 0.8, optional fields 0.2 (see _calculate_completeness_score)
+        completeness = (
+            _present(frame["source"]).cast(pl.Float64) * 0.4
+            + _present(frame["external_id"]).cast(pl.Float64) * 0.4
+            + frame["has_raw_data"].cast(pl.Float64) * 0.2
+        )
+        # Default accuracy and consistency are 1.0
+        return ((completeness + 2.0) / 3.0).to_list()
+
+    async def transform_batch(
+        self, records: list[DataRecord], errors: list[str] | None = None, **kwargs
+    ) -> list[DataRecord | None]:
+        """
+        Transform a batch. Defaults to process_record per record.
+
+        Returns:
+            One processed record (or None on failure) per input record
+        """
+        processed = []
+        for record in records:
+            try:
+                processed.append(await self.process_record(record, **kwargs))
+            except Exception as e:
+                logger.error(f"Error processing record {record.external_id}: {e}")
+                if errors is not None:
+                    errors.append(str(e))
+                processed.append(None)
+        return processed
+
+    def _overrides(self, name: str) -> bool:
+        """Whether this zone replaces a per-record hook of the base class."""
+        return getattr(type(self), name) is not getattr(BaseZoneProcessor, name)
+
     @abstractmethod
     async def process_record(self, record: DataRecord, **kwargs) -> DataRecord | None:
         """
@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from typing import Any
 
+from ...core import odds_math
 from ...core.logging import LogComponent, get_logger
 from .base_processor import BaseZoneProcessor
 from .zone_interface import (
@@ -389,10 +390,7 @@ class CuratedZoneProcessor(BaseZoneProcessor):
     def _american_to_decimal_odds(self, american_odds: int) -> Decimal:
         """Convert American odds to decimal odds."""
         try:
-            if american_odds > 0:
-                return Decimal(str((american_odds / 100) + 1))
-            else:
-                return Decimal(str((100 / abs(american_odds)) + 1))
+            return Decimal(str(odds_math.american_to_decimal(american_odds)))
         except (ZeroDivisionError, InvalidOperation):
             return Decimal("2.0")  # Default to even odds
 
@@ -20,6 +20,7 @@ from pydantic import BaseModel, Field
 from ...core.config import get_settings
 from ...core.logging import LogComponent, get_logger
 from ...data.database.connection import get_connection
+from .raw_storage import PAYLOAD_COMPRESSED_COLUMN, decode_raw_payload
 from .zone_interface import (
     DataRecord,
     ProcessingResult,
@@ -298,6 +299,64 @@ class DataPipelineOrchestrator:
             execution.errors.append(str(e))
             return await self._complete_execution(execution)
 
+    async def run_streaming_staging_pipeline(
+        self,
+        execution_metadata: dict[str, Any] | None = None,
+        **stream_kwargs: Any,
+    ) -> PipelineExecution:
+        """
+        Stream unprocessed raw rows into the STAGING zone.
+
+        Unlike run_single_zone_pipeline, records are not loaded up front: the
+        staging processor reads raw rows through a server-side cursor and
+        marks them processed as their staging records are stored.
+
+        Args:
+            execution_metadata: Additional execution metadata
+            **stream_kwargs: Passed to the staging processor's stream_raw_to_staging
+
+        Returns:
+            PipelineExecution with streaming stage metrics
+        """
+        execution = PipelineExecution(
+            pipeline_mode=PipelineMode.RAW_TO_STAGING,
+            current_stage=PipelineStage.STAGING_PROCESSING,
+            metadata={**(execution_metadata or {}), "streaming": True},
+        )
+
+        try:
+            self.active_executions[execution.execution_id] = execution
+
+            zone = self.zones.get(ZoneType.STAGING)
+            if zone is None or not hasattr(zone, "stream_raw_to_staging"):
+                raise ValueError("STAGING zone does not support streaming")
+
+            logger.info(
+                f"Starting streaming staging execution {execution.execution_id}"
+            )
+            result = await zone.stream_raw_to_staging(**stream_kwargs)
+
+            execution.metrics.zone_metrics[ZoneType.STAGING] = {
+                "status": ProcessingStatus.COMPLETED,
+                "records_processed": result.records_read,
+                "records_successful": result.records_stored,
+                "records_failed": result.errors,
+                "processing_time": result.elapsed_seconds,
+                "streaming": result.to_dict(),
+            }
+            await self._update_pipeline_metrics(execution)
+            execution.status = self._determine_execution_status(execution)
+
+            return await self._complete_execution(execution)
+
+        except Exception as e:
+            logger.error(
+                f"Streaming staging execution {execution.execution_id} failed: {e}"
+            )
+            execution.status = ProcessingStatus.FAILED
+            execution.errors.append(str(e))
+            return await self._complete_execution(execution)
+
     async def _process_zone(
         self, zone_type: ZoneType, records: list[DataRecord]
     ) -> ProcessingResult:
@@ -437,7 +496,10 @@ class DataPipelineOrchestrator:
             
             for row in rows:
                 # Handle both raw_data and raw_odds fields for Action Network compatibility
-                raw_data_field = row.get("raw_data") or row.get("raw_odds")
+                if row.get(PAYLOAD_COMPRESSED_COLUMN) is not None:
+                    raw_data_field = decode_raw_payload(row, "raw_odds")
+                else:
+                    raw_data_field = row.get("raw_data") or row.get("raw_odds")
                 
                 # Parse JSON string to dictionary for multi-bet type processing
                 if raw_data_field and isinstance(raw_data_field, str):
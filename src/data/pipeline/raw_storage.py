@@ -0,0 +1,441 @@
+"""
+RAW Zone Storage Engine
+
+Bulk, deduplicated writer for raw_data tables.
+
+- Payloads are serialized once in canonical form and content-hashed.
+- A record whose payload is byte-identical to the latest stored payload for
+  the same key (e.g. game + sportsbook) is skipped, so repeated collections
+  of unchanged odds no longer add rows or dead tuples.
+- Rows are bulk-loaded with COPY; upsert tables go through a temporary
+  staging table so ON CONFLICT semantics are preserved. Rows in one batch
+  that share a conflict key are collapsed to the last one first, since
+  ON CONFLICT DO UPDATE cannot update the same row twice in one statement.
+- Large payloads can optionally be stored brotli-compressed in a BYTEA column;
+  decode_raw_payload() gives readers a transparent path back to the JSON.
+
+Reference: sql/migrations/104_raw_zone_payload_dedup.sql
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import brotli
+
+from ...core.logging import LogComponent, get_logger
+
+logger = get_logger(__name__, LogComponent.CORE)
+
+BROTLI_ENCODING = "br"
+
+PAYLOAD_HASH_COLUMN = "payload_hash"
+PAYLOAD_ENCODING_COLUMN = "payload_encoding"
+PAYLOAD_COMPRESSED_COLUMN = "payload_compressed"
+
+
+@dataclass(frozen=True)
+class RawTableSpec:
+    """Column layout of a raw_data table written by the RAW zone."""
+
+    table: str
+    payload_column: str
+    columns: tuple[str, ...]
+    key_columns: tuple[str, ...]
+    # Upsert target and the columns refreshed on conflict; append-only if empty
+    conflict_columns: tuple[str, ...] = ()
+    update_columns: tuple[str, ...] = ()
+
+    @property
+    def schema_name(self) -> str:
+        return self.table.split(".", 1)[0]
+
+    @property
+    def table_name(self) -> str:
+        return self.table.split(".", 1)[1]
+
+    @property
+    def on_conflict(self) -> str | None:
+        if not self.conflict_columns:
+            return None
+        updates = [
+            *self.update_columns,
+            PAYLOAD_HASH_COLUMN,
+            PAYLOAD_ENCODING_COLUMN,
+            PAYLOAD_COMPRESSED_COLUMN,
+        ]
+        assignments = ", ".join(f"{column} = EXCLUDED.{column}" for column in updates)
+        return (
+            f"ON CONFLICT ({', '.join(self.conflict_columns)}) "
+            f"DO UPDATE SET {assignments}"
+        )
+
+    @property
+    def storage_columns(self) -> tuple[str, ...]:
+        return (
+            *self.columns,
+            PAYLOAD_HASH_COLUMN,
+            PAYLOAD_ENCODING_COLUMN,
+            PAYLOAD_COMPRESSED_COLUMN,
+        )
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """A serialized raw payload ready for storage."""
+
+    text: str | None
+    payload_hash: str
+    encoding: str | None
+    compressed: bytes | None
+    size: int
+
+    @property
+    def stored_size(self) -> int:
+        return len(self.compressed) if self.compressed is not None else self.size
+
+
+@dataclass
+class RawWriteStats:
+    """Outcome of a bulk raw-zone write."""
+
+    received: int = 0
+    written: int = 0
+    duplicates: int = 0
+    superseded: int = 0  # replaced by a later row with the same conflict key
+    compressed: int = 0
+    payload_bytes: int = 0
+    stored_bytes: int = 0
+
+    def merge(self, other: "RawWriteStats") -> None:
+        self.received += other.received
+        self.written += other.written
+        self.duplicates += other.duplicates
+        self.superseded += other.superseded
+        self.compressed += other.compressed
+        self.payload_bytes += other.payload_bytes
+        self.stored_bytes += other.stored_bytes
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "received": self.received,
+            "written": self.written,
+            "duplicates": self.duplicates,
+            "superseded": self.superseded,
+            "compressed": self.compressed,
+            "payload_bytes": self.payload_bytes,
+            "stored_bytes": self.stored_bytes,
+        }
+
+
+# Source-specific raw tables, keyed the way the RAW zone processors route records
+RAW_TABLE_SPECS: dict[str, RawTableSpec] = {
+    "action_network_games": RawTableSpec(
+        table="raw_data.action_network_games",
+        payload_column="raw_response",
+        columns=(
+            "external_game_id",
+            "raw_response",
+            "endpoint_url",
+            "response_status",
+            "collected_at",
+            "game_date",
+        ),
+        key_columns=("external_game_id",),
+        conflict_columns=("external_game_id",),
+        update_columns=(
+            "raw_response",
+            "endpoint_url",
+            "response_status",
+            "collected_at",
+            "game_date",
+        ),
+    ),
+    "action_network_odds": RawTableSpec(
+        table="raw_data.action_network_odds",
+        payload_column="raw_odds",
+        columns=("external_game_id", "sportsbook_key", "raw_odds", "collected_at"),
+        key_columns=("external_game_id", "sportsbook_key"),
+        conflict_columns=("external_game_id", "sportsbook_key", "collected_at"),
+        update_columns=("raw_odds",),
+    ),
+    "action_network_history": RawTableSpec(
+        table="raw_data.action_network_history",
+        payload_column="raw_history",
+        columns=("external_game_id", "raw_history", "collected_at"),
+        key_columns=("external_game_id",),
+        conflict_columns=("external_game_id", "collected_at"),
+        update_columns=("raw_history",),
+    ),
+    "sbd_betting_splits": RawTableSpec(
+        table="raw_data.sbd_betting_splits",
+        payload_column="raw_response",
+        columns=("external_matchup_id", "raw_response", "api_endpoint", "collected_at"),
+        key_columns=("external_matchup_id",),
+        conflict_columns=("external_matchup_id", "collected_at"),
+        update_columns=("raw_response",),
+    ),
+    "vsin_data": RawTableSpec(
+        table="raw_data.vsin_data",
+        payload_column="raw_response",
+        columns=("external_id", "raw_response", "collected_at", "created_at"),
+        key_columns=("external_id",),
+        conflict_columns=("external_id", "collected_at"),
+        update_columns=("raw_response",),
+    ),
+    "mlb_stats_api_games": RawTableSpec(
+        table="raw_data.mlb_stats_api_games",
+        payload_column="raw_response",
+        columns=(
+            "external_game_id",
+            "game_pk",
+            "raw_response",
+            "endpoint_url",
+            "response_status",
+            "game_date",
+            "season",
+            "season_type",
+            "home_team",
+            "away_team",
+            "game_datetime",
+            "venue_id",
+            "venue_name",
+            "game_status",
+            "collected_at",
+            "created_at",
+        ),
+        key_columns=("external_game_id",),
+        conflict_columns=("external_game_id",),
+        update_columns=("raw_response", "game_status", "collected_at"),
+    ),
+}
+
+
+def canonical_payload(raw_data: Any) -> bytes:
+    """Serialize a payload deterministically so equal content hashes equally."""
+    return json.dumps(
+        raw_data, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def payload_hash(payload: bytes) -> str:
+    """Content hash of a canonical payload."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def decode_raw_payload(row: Mapping[str, Any], payload_column: str) -> Any:
+    """
+    Return the JSON payload of a raw_data row, decompressing when needed.
+
+    Rows written without compression keep their payload in ``payload_column``
+    and are returned unchanged (JSON strings are parsed).
+    """
+    compressed = row.get(PAYLOAD_COMPRESSED_COLUMN)
+    if compressed is not None:
+        encoding = row.get(PAYLOAD_ENCODING_COLUMN)
+        if encoding != BROTLI_ENCODING:
+            raise ValueError(f"Unsupported raw payload encoding: {encoding}")
+        return json.loads(brotli.decompress(bytes(compressed)))
+
+    payload = row.get(payload_column)
+    if isinstance(payload, str | bytes):
+        return json.loads(payload)
+    return payload
+
+
+class RawZoneWriter:
+    """
+    Bulk writer for raw_data tables with content-hash deduplication.
+
+    The latest payload hash per (table, key) is kept in a bounded LRU and
+    backfilled from the database for keys not seen by this process, so
+    deduplication holds across restarts and multiple collectors.
+    """
+
+    def __init__(
+        self,
+        compression: str | None = None,
+        compression_threshold: int = 16_384,
+        hash_cache_size: int = 100_000,
+    ):
+        if compression not in (None, BROTLI_ENCODING):
+            raise ValueError(f"Unsupported raw payload compression: {compression}")
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.hash_cache_size = hash_cache_size
+        self._latest_hashes: OrderedDict[tuple, str] = OrderedDict()
+
+    def encode(self, raw_data: Any) -> EncodedPayload:
+        """Serialize, hash and (above the threshold) compress a payload."""
+        if raw_data is None:
+            return EncodedPayload(None, payload_hash(b""), None, None, 0)
+
+        payload = canonical_payload(raw_data)
+        digest = payload_hash(payload)
+        if self.compression and len(payload) >= self.compression_threshold:
+            return EncodedPayload(
+                text=None,
+                payload_hash=digest,
+                encoding=self.compression,
+                compressed=brotli.compress(payload, quality=5),
+                size=len(payload),
+            )
+        return EncodedPayload(
+            text=payload.decode("utf-8"),
+            payload_hash=digest,
+            encoding=None,
+            compressed=None,
+            size=len(payload),
+        )
+
+    async def write(
+        self, connection, spec: RawTableSpec, rows: list[dict[str, Any]]
+    ) -> RawWriteStats:
+        """
+        Write rows to ``spec.table``, skipping unchanged payloads.
+
+        Args:
+            connection: asyncpg connection
+            spec: Target table layout
+            rows: Column -> value mappings; the payload column holds the
+                unserialized payload
+
+        Returns:
+            RawWriteStats for the batch
+        """
+        stats = RawWriteStats(received=len(rows))
+        if not rows:
+            return stats
+
+        encoded = [self.encode(row[spec.payload_column]) for row in rows]
+        keys = [self._key(spec, row) for row in rows]
+        latest = await self._latest_hashes_for(connection, spec, keys)
+
+        staged: dict[Any, tuple[tuple, EncodedPayload]] = {}
+        written_hashes: dict[tuple, str] = {}
+        for position, (row, key, payload) in enumerate(
+            zip(rows, keys, encoded, strict=True)
+        ):
+            if latest.get(key) == payload.payload_hash:
+                stats.duplicates += 1
+                continue
+            latest[key] = payload.payload_hash
+            written_hashes[key] = payload.payload_hash
+
+            values = dict(row)
+            values[spec.payload_column] = payload.text
+            record = (
+                *(values[column] for column in spec.columns),
+                payload.payload_hash,
+                payload.encoding,
+                payload.compressed,
+            )
+            # Last row per conflict key wins; NULLs never conflict in Postgres
+            conflict_key = tuple(values[column] for column in spec.conflict_columns)
+            if not conflict_key or None in conflict_key:
+                conflict_key = position
+            elif staged.pop(conflict_key, None) is not None:
+                stats.superseded += 1
+            staged[conflict_key] = (record, payload)
+
+        records = []
+        for record, payload in staged.values():
+            records.append(record)
+            stats.payload_bytes += payload.size
+            stats.stored_bytes += payload.stored_size
+            stats.compressed += payload.compressed is not None
+
+        if records:
+            async with connection.transaction():
+                await self._copy(connection, spec, records)
+            stats.written = len(records)
+            for key, digest in written_hashes.items():
+                self._remember(key, digest)
+
+        logger.info(
+            f"Raw write to {spec.table}: {stats.written} written, "
+            f"{stats.duplicates} unchanged payloads skipped, "
+            f"{stats.superseded} superseded within the batch, "
+            f"{stats.compressed} compressed"
+        )
+        return stats
+
+    async def _copy(self, connection, spec: RawTableSpec, records: list[tuple]) -> None:
+        columns = list(spec.storage_columns)
+        if not spec.on_conflict:
+            await connection.copy_records_to_table(
+                spec.table_name,
+                records=records,
+                columns=columns,
+                schema_name=spec.schema_name,
+            )
+            return
+
+        staging_table = f"_raw_copy_{spec.table_name}"
+        await connection.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging_table} "
+            f"(LIKE {spec.table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+        await connection.copy_records_to_table(
+            staging_table, records=records, columns=columns
+        )
+        column_list = ", ".join(columns)
+        await connection.execute(
+            f"INSERT INTO {spec.table} ({column_list}) "
+            f"SELECT {column_list} FROM {staging_table} {spec.on_conflict}"
+        )
+
+    async def _latest_hashes_for(
+        self, connection, spec: RawTableSpec, keys: list[tuple]
+    ) -> dict[tuple, str]:
+        latest: dict[tuple, str] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            digest = self._latest_hashes.get(key)
+            if digest is not None:
+                self._latest_hashes.move_to_end(key)
+                latest[key] = digest
+            else:
+                missing.append(key)
+
+        if missing:
+            key_list = ", ".join(spec.key_columns)
+            unnest_args = ", ".join(
+                f"${i + 1}::text[]" for i in range(len(spec.key_columns))
+            )
+            rows = await connection.fetch(
+                f"""
+                SELECT DISTINCT ON ({key_list}) {key_list}, {PAYLOAD_HASH_COLUMN}
+                FROM {spec.table}
+                WHERE ({key_list}) IN (SELECT * FROM unnest({unnest_args}))
+                ORDER BY {key_list}, collected_at DESC
+                """,
+                *([key[i + 1] for key in missing] for i in range(len(spec.key_columns))),
+            )
+            for row in rows:
+                if row[PAYLOAD_HASH_COLUMN] is None:
+                    continue
+                key = self._key(spec, row)
+                latest[key] = row[PAYLOAD_HASH_COLUMN]
+                self._remember(key, row[PAYLOAD_HASH_COLUMN])
+
+        return latest
+
+    @staticmethod
+    def _key(spec: RawTableSpec, row: Mapping[str, Any]) -> tuple:
+        return (
+            spec.table,
+            *(
+                None if row[column] is None else str(row[column])
+                for column in spec.key_columns
+            ),
+        )
+
+    def _remember(self, key: tuple, digest: str) -> None:
+        self._latest_hashes[key] = digest
+        self._latest_hashes.move_to_end(key)
+        while len(self._latest_hashes) > self.hash_cache_size:
+            self._latest_hashes.popitem(last=False)
@@ -11,8 +11,11 @@ import json
 from datetime import datetime, timezone
 from typing import Any
 
+import polars as pl
+
 from ...core.logging import LogComponent, get_logger
 from .base_processor import BaseZoneProcessor
+from .raw_storage import RAW_TABLE_SPECS, RawWriteStats, RawZoneWriter
 from .zone_interface import (
     DataRecord,
     ProcessingStatus,
@@ -64,6 +67,11 @@ class RawZoneProcessor(BaseZoneProcessor):
             "totals_raw": "raw_data.totals_raw",
             "line_movements_raw": "raw_data.line_movements_raw",
         }
+        self.raw_writer = RawZoneWriter(
+            compression=config.raw_payload_compression,
+            compression_threshold=config.raw_compression_threshold_bytes,
+        )
+        self.write_stats = RawWriteStats()
 
     async def process_record(self, record: DataRecord, **kwargs) -> DataRecord | None:
         """
@@ -243,128 +251,104 @@ class RawZoneProcessor(BaseZoneProcessor):
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert Action Network game records."""
-        query = """
-        INSERT INTO raw_data.action_network_games 
-        (external_game_id, raw_response, endpoint_url, response_status, collected_at, game_date)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        ON CONFLICT (external_game_id) DO UPDATE SET
-            raw_response = EXCLUDED.raw_response,
-            endpoint_url = EXCLUDED.endpoint_url,
-            response_status = EXCLUDED.response_status,
-            collected_at = EXCLUDED.collected_at,
-            game_date = EXCLUDED.game_date
-        """
-
+        rows = []
         for record in records:
             # Ensure we have valid data to satisfy the constraint
-            raw_response = json.dumps(record.raw_data) if record.raw_data else None
-            if not raw_response:
+            if not record.raw_data:
                 logger.warning(f"Skipping record {record.external_id} due to missing raw_data")
                 continue
-                
-            await connection.execute(
-                query,
-                record.external_id,
-                raw_response,
-                getattr(record, "endpoint_url", None),
-                getattr(record, "response_status", None),
-                record.processed_at or datetime.now(timezone.utc),
-                getattr(record, "game_date", None),
+
+            rows.append(
+                {
+                    "external_game_id": record.external_id,
+                    "raw_response": record.raw_data,
+                    "endpoint_url": getattr(record, "endpoint_url", None),
+                    "response_status": getattr(record, "response_status", None),
+                    "collected_at": record.processed_at or datetime.now(timezone.utc),
+                    "game_date": getattr(record, "game_date", None),
+                }
             )
 
+        await self._write_raw_rows(connection, "action_network_games", rows)
+
     # Source-specific insert methods only - no generic tables
     async def _insert_sbd_betting_splits(
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert SBD betting splits records."""
-        query = """
-        INSERT INTO raw_data.sbd_betting_splits 
-        (external_matchup_id, raw_response, api_endpoint, collected_at)
-        VALUES ($1, $2, $3, $4)
-        """
-
-        for record in records:
-            await connection.execute(
-                query,
-                record.external_id,
-                json.dumps(record.raw_data) if record.raw_data else None,
-                getattr(record, "api_endpoint", None),
-                record.processed_at or datetime.now(timezone.utc),
-            )
+        rows = [
+            {
+                "external_matchup_id": record.external_id,
+                "raw_response": record.raw_data,
+                "api_endpoint": getattr(record, "api_endpoint", None),
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "sbd_betting_splits", rows)
 
     async def _insert_action_network_odds(
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert Action Network odds records."""
-        query = """
-        INSERT INTO raw_data.action_network_odds 
-        (external_game_id, sportsbook_key, raw_odds, collected_at)
-        VALUES ($1, $2, $3, $4)
-        """
-
-        for record in records:
-            await connection.execute(
-                query,
-                record.external_id,
-                getattr(record, "sportsbook_key", "unknown"),
-                json.dumps(record.raw_data) if record.raw_data else "{}",
-                record.processed_at or datetime.now(timezone.utc),
-            )
+        rows = [
+            {
+                "external_game_id": record.external_id,
+                "sportsbook_key": getattr(record, "sportsbook_key", "unknown"),
+                "raw_odds": record.raw_data or {},
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "action_network_odds", rows)
 
     async def _insert_vsin_data(self, connection, records: list[DataRecord]) -> None:
         """Insert VSIN data records."""
-        query = """
-        INSERT INTO raw_data.vsin_data 
-        (external_id, raw_response, collected_at, created_at)
-        VALUES ($1, $2, $3, $4)
-        """
-
-        for record in records:
-            await connection.execute(
-                query,
-                record.external_id,
-                json.dumps(record.raw_data) if record.raw_data else "{}",
-                record.processed_at or datetime.now(timezone.utc),
-                record.created_at or datetime.now(timezone.utc),
-            )
+        rows = [
+            {
+                "external_id": record.external_id,
+                "raw_response": record.raw_data or {},
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+                "created_at": record.created_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "vsin_data", rows)
 
     async def _insert_mlb_stats_api(
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert MLB Stats API records."""
-        query = """
-        INSERT INTO raw_data.mlb_stats_api_games 
-        (external_game_id, game_pk, raw_response, endpoint_url, response_status, 
-         game_date, season, season_type, home_team, away_team, game_datetime, 
-         venue_id, venue_name, game_status, collected_at, created_at)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
-        ON CONFLICT (external_game_id) DO UPDATE SET
-            raw_response = EXCLUDED.raw_response,
-            game_status = EXCLUDED.game_status,
-            collected_at = EXCLUDED.collected_at
-        """
-
-        for record in records:
-            await connection.execute(
-                query,
-                record.external_id,
-                getattr(record, "game_pk", None),
-                json.dumps(record.raw_data) if record.raw_data else "{}",
-                getattr(record, "endpoint_url", None),
-                getattr(record, "response_status", 200),
-                getattr(record, "game_date", None)
+        rows = [
+            {
+                "external_game_id": record.external_id,
+                "game_pk": getattr(record, "game_pk", None),
+                "raw_response": record.raw_data or {},
+                "endpoint_url": getattr(record, "endpoint_url", None),
+                "response_status": getattr(record, "response_status", 200),
+                "game_date": getattr(record, "game_date", None)
                 or datetime.now(timezone.utc).date(),  # Default to today's date
-                getattr(record, "season", None),
-                getattr(record, "season_type", None),
-                getattr(record, "home_team", None),
-                getattr(record, "away_team", None),
-                getattr(record, "game_datetime", None),
-                getattr(record, "venue_id", None),
-                getattr(record, "venue_name", None),
-                getattr(record, "game_status", None),
-                record.processed_at or datetime.now(timezone.utc),
-                record.created_at or datetime.now(timezone.utc),
-            )
+                "season": getattr(record, "season", None),
+                "season_type": getattr(record, "season_type", None),
+                "home_team": getattr(record, "home_team", None),
+                "away_team": getattr(record, "away_team", None),
+                "game_datetime": getattr(record, "game_datetime", None),
+                "venue_id": getattr(record, "venue_id", None),
+                "venue_name": getattr(record, "venue_name", None),
+                "game_status": getattr(record, "game_status", None),
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+                "created_at": record.created_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "mlb_stats_api_games", rows)
+
+    async def _write_raw_rows(
+        self, connection, table_key: str, rows: list[dict[str, Any]]
+    ) -> None:
+        """Bulk-write rows through the deduplicating raw writer."""
+        stats = await self.raw_writer.write(connection, RAW_TABLE_SPECS[table_key], rows)
+        self.write_stats.merge(stats)
 
     async def validate_record_custom(self, record: DataRecord) -> bool:
         """
@@ -403,6 +387,25 @@ class RawZoneProcessor(BaseZoneProcessor):
             record.validation_errors.append(f"Validation exception: {e}")
             return False
 
+    async def validate_batch_custom(
+        self, frame: pl.DataFrame, records: list[DataRecord], valid: list[bool]
+    ) -> list[bool]:
+        """
+        RAW zone batch validation.
+
+        The external_id/raw_data presence check is already part of the base
+        batch mask, so only string payloads need their JSON parsed here.
+        """
+        for index, record in enumerate(records):
+            if valid[index] and isinstance(record.raw_data, str):
+                try:
+                    json.loads(record.raw_data)
+                except json.JSONDecodeError:
+                    record.validation_errors = record.validation_errors or []
+                    record.validation_errors.append("Invalid JSON in raw_data")
+                    valid[index] = False
+        return valid
+
     async def promote_to_next_zone(
         self, records: list[DataRecord]
     ) -> "ProcessingResult":
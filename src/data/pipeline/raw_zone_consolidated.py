@@ -19,6 +19,7 @@ from typing import Any
 
 from ...core.logging import LogComponent, get_logger
 from .base_processor import BaseZoneProcessor
+from .raw_storage import RAW_TABLE_SPECS, RawWriteStats, RawZoneWriter
 from .zone_interface import (
     DataRecord,
     ProcessingResult,
@@ -66,6 +67,11 @@ class RawZoneConsolidatedProcessor(BaseZoneProcessor):
     def __init__(self, config: ZoneConfig):
         super().__init__(config)
         self.table_mappings = self._get_table_mappings()
+        self.raw_writer = RawZoneWriter(
+            compression=config.raw_payload_compression,
+            compression_threshold=config.raw_compression_threshold_bytes,
+        )
+        self.write_stats = RawWriteStats()
 
     def _get_table_mappings(self) -> dict[str, str]:
         """Get source-specific table mappings."""
@@ -351,154 +357,117 @@ class RawZoneConsolidatedProcessor(BaseZoneProcessor):
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert Action Network game records."""
-        query = """
-        INSERT INTO raw_data.action_network_games 
-        (external_game_id, raw_response, endpoint_url, response_status, collected_at, game_date)
-        VALUES ($1, $2, $3, $4, $5, $6)
-        ON CONFLICT (external_game_id) DO UPDATE SET
-            raw_response = EXCLUDED.raw_response,
-            endpoint_url = EXCLUDED.endpoint_url,
-            response_status = EXCLUDED.response_status,
-            collected_at = EXCLUDED.collected_at,
-            game_date = EXCLUDED.game_date
-        """
-
+        rows = []
         for record in records:
             # Ensure we have valid data to satisfy the constraint
-            raw_response = json.dumps(record.raw_data) if record.raw_data else None
-            if not raw_response:
+            if not record.raw_data:
                 logger.warning(f"Skipping record {record.external_id} due to missing raw_data")
                 continue
-                
-            await connection.execute(
-                query,
-                record.external_id,
-                raw_response,
-                getattr(record, "endpoint_url", None),
-                getattr(record, "response_status", None),
-                record.processed_at or datetime.now(timezone.utc),
-                getattr(record, "game_date", None),
+
+            rows.append(
+                {
+                    "external_game_id": record.external_id,
+                    "raw_response": record.raw_data,
+                    "endpoint_url": getattr(record, "endpoint_url", None),
+                    "response_status": getattr(record, "response_status", None),
+                    "collected_at": record.processed_at or datetime.now(timezone.utc),
+                    "game_date": getattr(record, "game_date", None),
+                }
             )
 
+        await self._write_raw_rows(connection, "action_network_games", rows)
+
     async def _insert_action_network_odds(
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert Action Network odds records."""
-        query = """
-        INSERT INTO raw_data.action_network_odds 
-        (external_game_id, sportsbook_key, raw_odds, collected_at)
-        VALUES ($1, $2, $3, $4)
-        ON CONFLICT (external_game_id, sportsbook_key, collected_at) DO UPDATE SET
-            raw_odds = EXCLUDED.raw_odds
-        """
-
-        for record in records:
-            await connection.execute(
-                query,
-                getattr(record, "game_external_id", record.external_id),
-                getattr(record, "sportsbook_key", "unknown"),
-                json.dumps(record.raw_data) if record.raw_data else "{}",
-                record.processed_at or datetime.now(timezone.utc),
-            )
+        rows = [
+            {
+                "external_game_id": getattr(record, "game_external_id", record.external_id),
+                "sportsbook_key": getattr(record, "sportsbook_key", "unknown"),
+                "raw_odds": record.raw_data or {},
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "action_network_odds", rows)
 
     async def _insert_action_network_history(
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert Action Network history records."""
-        query = """
-        INSERT INTO raw_data.action_network_history 
-        (external_game_id, raw_history, collected_at)
-        VALUES ($1, $2, $3)
-        ON CONFLICT (external_game_id, collected_at) DO UPDATE SET
-            raw_history = EXCLUDED.raw_history
-        """
-
-        for record in records:
-            await connection.execute(
-                query,
-                getattr(record, "game_external_id", record.external_id),
-                json.dumps(record.raw_data) if record.raw_data else "{}",
-                record.processed_at or datetime.now(timezone.utc),
-            )
+        rows = [
+            {
+                "external_game_id": getattr(record, "game_external_id", record.external_id),
+                "raw_history": record.raw_data or {},
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "action_network_history", rows)
 
     async def _insert_sbd_betting_splits(
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert SBD betting splits records."""
-        query = """
-        INSERT INTO raw_data.sbd_betting_splits 
-        (external_matchup_id, raw_response, api_endpoint, collected_at)
-        VALUES ($1, $2, $3, $4)
-        ON CONFLICT (external_matchup_id, collected_at) DO UPDATE SET
-            raw_response = EXCLUDED.raw_response
-        """
-
-        for record in records:
-            await connection.execute(
-                query,
-                getattr(record, "game_external_id", record.external_id),
-                json.dumps(record.raw_data) if record.raw_data else None,
-                getattr(record, "api_endpoint", None),
-                record.processed_at or datetime.now(timezone.utc),
-            )
+        rows = [
+            {
+                "external_matchup_id": getattr(record, "game_external_id", record.external_id),
+                "raw_response": record.raw_data,
+                "api_endpoint": getattr(record, "api_endpoint", None),
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "sbd_betting_splits", rows)
 
     async def _insert_vsin_data(self, connection, records: list[DataRecord]) -> None:
         """Insert VSIN data records."""
-        query = """
-        INSERT INTO raw_data.vsin_data 
-        (external_id, raw_response, collected_at, created_at)
-        VALUES ($1, $2, $3, $4)
-        ON CONFLICT (external_id, collected_at) DO UPDATE SET
-            raw_response = EXCLUDED.raw_response
-        """
-
-        for record in records:
-            await connection.execute(
-                query,
-                record.external_id,
-                json.dumps(record.raw_data) if record.raw_data else "{}",
-                record.processed_at or datetime.now(timezone.utc),
-                record.created_at or datetime.now(timezone.utc),
-            )
+        rows = [
+            {
+                "external_id": record.external_id,
+                "raw_response": record.raw_data or {},
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+                "created_at": record.created_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "vsin_data", rows)
 
     async def _insert_mlb_stats_api_games(
         self, connection, records: list[DataRecord]
     ) -> None:
         """Insert MLB Stats API game records."""
-        query = """
-        INSERT INTO raw_data.mlb_stats_api_games 
-        (external_game_id, game_pk, raw_response, endpoint_url, response_status, 
-         game_date, season, season_type, home_team, away_team, game_datetime, 
-         venue_id, venue_name, game_status, collected_at, created_at)
-        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16)
-        ON CONFLICT (external_game_id) DO UPDATE SET
-            raw_response = EXCLUDED.raw_response,
-            game_status = EXCLUDED.game_status,
-            collected_at = EXCLUDED.collected_at
-        """
+        rows = [
+            {
+                "external_game_id": record.external_id,
+                "game_pk": getattr(record, "game_pk", None),
+                "raw_response": record.raw_data or {},
+                "endpoint_url": getattr(record, "endpoint_url", None),
+                "response_status": getattr(record, "response_status", 200),
+                "game_date": getattr(record, "game_date", None),
+                "season": getattr(record, "season", None),
+                "season_type": getattr(record, "season_type", None),
+                "home_team": getattr(record, "home_team", None),
+                "away_team": getattr(record, "away_team", None),
+                "game_datetime": getattr(record, "game_datetime", None),
+                "venue_id": getattr(record, "venue_id", None),
+                "venue_name": getattr(record, "venue_name", None),
+                "game_status": getattr(record, "game_status", None),
+                "collected_at": record.processed_at or datetime.now(timezone.utc),
+                "created_at": record.created_at or datetime.now(timezone.utc),
+            }
+            for record in records
+        ]
+        await self._write_raw_rows(connection, "mlb_stats_api_games", rows)
 
-        for record in records:
-            await connection.execute(
-                query,
-                record.external_id,
-                getattr(record, "game_pk", None),
-                json.dumps(record.raw_data) if record.raw_data else "{}",
-                getattr(record, "endpoint_url", None),
-                getattr(record, "response_status", 200),
-                getattr(record, "game_date", None),
-                getattr(record, "season", None),
-                getattr(record, "season_type", None),
-                getattr(record, "home_team", None),
-                getattr(record, "away_team", None),
-                getattr(record, "game_datetime", None),
-                getattr(record, "venue_id", None),
-                getattr(record, "venue_name", None),
-                getattr(record, "game_status", None),
-                record.processed_at or datetime.now(timezone.utc),
-                record.created_at or datetime.now(timezone.utc),
-            )
+    async def _write_raw_rows(
+        self, connection, table_key: str, rows: list[dict[str, Any]]
+    ) -> None:
+        """Bulk-write rows through the deduplicating raw writer."""
+        stats = await self.raw_writer.write(connection, RAW_TABLE_SPECS[table_key], rows)
+        self.write_stats.merge(stats)
 
-    # Convenience methods for direct collection integration
     async def ingest_action_network_games(
         self,
         games_data: list[dict[str, Any]],
@@ -22,6 +22,13 @@ from ...services.mlb_stats_api_game_resolution_service import (
     MLBStatsAPIGameResolutionService,
 )
 from .base_processor import BaseZoneProcessor
+from .raw_storage import decode_raw_payload
+from .streaming import (
+    PipelineStage,
+    StreamingPipeline,
+    StreamingResult,
+    stream_query_rows,
+)
 from .zone_interface import (
     DataRecord,
     ProcessingResult,
@@ -150,7 +157,8 @@ class SBDStagingProcessor(BaseZoneProcessor):
             # Query unprocessed raw records
             async with db_connection.get_async_connection() as connection:
                 query = """
-                    SELECT id, external_matchup_id, raw_response, collected_at
+                    SELECT id, external_matchup_id, raw_response, payload_encoding,
+                           payload_compressed, collected_at
                     FROM raw_data.sbd_betting_splits 
                     WHERE processed_at IS NULL
                     ORDER BY collected_at DESC
@@ -217,6 +225,109 @@ class SBDStagingProcessor(BaseZoneProcessor):
                 errors=[str(e)],
             )
 
+    async def stream_sbd_raw_records(
+        self,
+        chunk_size: int = 200,
+        flush_interval: float = 5.0,
+        queue_size: int = 500,
+        resolver_workers: int = 4,
+        fetch_size: int = 500,
+    ) -> StreamingResult:
+        """
+        Stream unprocessed SBD raw records into staging in constant memory.
+
+        Rows are read with a server-side cursor, parsed and resolved to MLB
+        game IDs in bounded concurrent stages, and written (with their
+        processed_at marker) one chunk per transaction. Records that fail to
+        parse or store are left unprocessed for a later run.
+
+        Returns:
+            StreamingResult with per-stage throughput metrics
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        query = """
+            SELECT id, external_matchup_id, raw_response, payload_encoding,
+                   payload_compressed, collected_at
+            FROM raw_data.sbd_betting_splits
+            WHERE processed_at IS NULL
+            ORDER BY collected_at DESC
+        """
+
+        async def parse(raw_record) -> tuple[int, SBDGameRecord, SBDBettingSplitRecord]:
+            raw_response = decode_raw_payload(raw_record, "raw_response")
+
+            game_record = self._extract_game_data(raw_response)
+            betting_record = self._extract_betting_split_data(raw_response)
+            if not game_record or not betting_record:
+                raise ValueError(
+                    f"Failed to extract data from record {raw_record['id']}"
+                )
+            return raw_record["id"], game_record, betting_record
+
+        async def resolve(parsed):
+            raw_id, game_record, betting_record = parsed
+            mlb_game_id = await self._resolve_mlb_game_id(game_record)
+            if mlb_game_id:
+                game_record.mlb_stats_api_game_id = mlb_game_id
+            return raw_id, game_record, betting_record
+
+        async def store(chunk) -> int:
+            from ...data.database.connection import get_connection
+
+            stored_ids = []
+            async with get_connection() as connection:
+                async with connection.transaction():
+                    for raw_id, game_record, betting_record in chunk:
+                        try:
+                            async with connection.transaction():
+                                game_id = await self._get_or_create_game(
+                                    connection, game_record
+                                )
+                                betting_record.game_id = game_id
+                                await self._store_betting_split(
+                                    connection, betting_record
+                                )
+
+                                sharp_signal = self._detect_sharp_action_signal(
+                                    betting_record
+                                )
+                                if sharp_signal:
+                                    sharp_signal.game_id = game_id
+                                    await self._store_sharp_action_signal(
+                                        connection, sharp_signal
+                                    )
+                            stored_ids.append(raw_id)
+                        except Exception as e:
+                            logger.error(f"Error processing SBD record {raw_id}: {e}")
+
+                    await connection.execute(
+                        """
+                        UPDATE raw_data.sbd_betting_splits
+                        SET processed_at = $1
+                        WHERE id = ANY($2)
+                        """,
+                        datetime.now(timezone.utc),
+                        stored_ids,
+                    )
+            return len(stored_ids)
+
+        pipeline = StreamingPipeline(
+            source=stream_query_rows(query, fetch_size=fetch_size),
+            stages=[
+                PipelineStage("parse", parse),
+                PipelineStage("resolve_mlb_game_id", resolve, workers=resolver_workers),
+            ],
+            sink=store,
+            chunk_size=chunk_size,
+            flush_interval=flush_interval,
+            queue_size=queue_size,
+        )
+        result = await pipeline.run()
+        logger.info(f"SBD streaming run: {result.to_dict()}")
+        return result
+
     async def _process_sbd_batch(
         self, db_connection, raw_records: list[dict[str, Any]]
     ) -> ProcessingResult:
@@ -231,9 +342,9 @@ class SBDStagingProcessor(BaseZoneProcessor):
                     for raw_record in raw_records:
                         try:
                             # Parse JSON response
-                            raw_response = raw_record["raw_response"]
-                            if isinstance(raw_response, str):
-                                raw_response = json.loads(raw_response)
+                            raw_response = decode_raw_payload(
+                                raw_record, "raw_response"
+                            )
 
                             # Extract game data and betting data
                             game_record = self._extract_game_data(raw_response)
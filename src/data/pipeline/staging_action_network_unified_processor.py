@@ -15,7 +15,6 @@ Key Features:
 """
 
 import asyncio
-import json
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
@@ -32,6 +31,7 @@ from ...services.mlb_stats_api_game_resolution_service import (
     DataSource,
     MLBStatsAPIGameResolutionService,
 )
+from .raw_storage import decode_raw_payload
 
 logger = get_logger(__name__, LogComponent.CORE)
 
@@ -194,7 +194,8 @@ class ActionNetworkUnifiedStagingProcessor:
             # Get unprocessed raw odds
             raw_odds = await conn.fetch(
                 """
-                SELECT id, external_game_id, sportsbook_key, raw_odds, collected_at
+                SELECT id, external_game_id, sportsbook_key, raw_odds,
+                       payload_encoding, payload_compressed, collected_at
                 FROM raw_data.action_network_odds 
                 WHERE id NOT IN (
                     SELECT raw_data_id FROM staging.action_network_odds_historical
@@ -230,7 +231,8 @@ class ActionNetworkUnifiedStagingProcessor:
             # Get unprocessed raw history
             raw_history = await conn.fetch(
                 """
-                SELECT id, external_game_id, raw_history, collected_at
+                SELECT id, external_game_id, raw_history,
+                       payload_encoding, payload_compressed, collected_at
                 FROM raw_data.action_network_history 
                 WHERE id NOT IN (
                     SELECT DISTINCT raw_data_id 
@@ -315,11 +317,7 @@ class ActionNetworkUnifiedStagingProcessor:
         records = []
 
         try:
-            raw_odds_data = raw_odds["raw_odds"]
-            if isinstance(raw_odds_data, str):
-                odds_data = json.loads(raw_odds_data)
-            else:
-                odds_data = raw_odds_data
+            odds_data = decode_raw_payload(raw_odds, "raw_odds")
 
             external_game_id = raw_odds["external_game_id"]
             sportsbook_key = raw_odds["sportsbook_key"]
@@ -370,11 +368,7 @@ class ActionNetworkUnifiedStagingProcessor:
         records = []
 
         try:
-            raw_history_data = raw_history["raw_history"]
-            if isinstance(raw_history_data, str):
-                history_data = json.loads(raw_history_data)
-            else:
-                history_data = raw_history_data
+            history_data = decode_raw_payload(raw_history, "raw_history")
 
             external_game_id = raw_history["external_game_id"]
             collection_time = raw_history["collected_at"]
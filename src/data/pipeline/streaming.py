@@ -0,0 +1,347 @@
+"""
+Streaming Pipeline
+
+Bounded-memory streaming mode for RAW -> STAGING reprocessing.
+
+Raw rows are read through a server-side cursor, passed through async
+transform stages connected by bounded queues, and flushed to the sink in
+size- or time-based chunks. A slow stage fills its inbound queue which in
+turn blocks upstream producers (and ultimately the cursor), so memory stays
+proportional to the queue sizes rather than the size of the raw zone.
+
+Reference: docs/SYSTEM_DESIGN_ANALYSIS.md
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ...core.logging import LogComponent, get_logger
+from ...data.database.connection import get_connection
+from .raw_storage import PAYLOAD_COMPRESSED_COLUMN, decode_raw_payload
+from .zone_interface import DataRecord
+
+logger = get_logger(__name__, LogComponent.CORE)
+
+_END = object()
+
+
+@dataclass
+class StageMetrics:
+    """Throughput metrics for a single pipeline stage."""
+
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    errors: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items emitted per second of wall-clock time."""
+        elapsed = self.elapsed_seconds
+        return self.items_out / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "batches": self.batches,
+            "busy_seconds": round(self.busy_seconds, 4),
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+            "throughput_per_second": round(self.throughput, 2),
+        }
+
+
+@dataclass
+class PipelineStage:
+    """
+    A transform stage in a streaming pipeline.
+
+    Item stages call ``func(item)`` and forward the result (``None`` drops the
+    item). Batch stages (``batch_size`` set) call ``func(items)`` with up to
+    ``batch_size`` items and forward each element of the returned list.
+    """
+
+    name: str
+    func: Callable[[Any], Awaitable[Any]]
+    workers: int = 1
+    batch_size: int | None = None
+
+
+@dataclass
+class StreamingResult:
+    """Outcome of a streaming pipeline run."""
+
+    stages: list[StageMetrics] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def records_read(self) -> int:
+        return self.stages[0].items_out if self.stages else 0
+
+    @property
+    def records_stored(self) -> int:
+        return self.stages[-1].items_out if self.stages else 0
+
+    @property
+    def errors(self) -> int:
+        return sum(stage.errors for stage in self.stages)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "records_read": self.records_read,
+            "records_stored": self.records_stored,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+
+class StreamingPipeline:
+    """
+    Source -> stages -> sink pipeline over bounded asyncio queues.
+
+    Per-item failures inside a stage are counted and logged, and the item is
+    dropped. Failures in the source or the sink abort the run, since they mean
+    rows can no longer be read or persisted.
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterable[Any],
+        stages: list[PipelineStage],
+        sink: Callable[[list[Any]], Awaitable[Any]],
+        chunk_size: int = 500,
+        flush_interval: float = 5.0,
+        queue_size: int = 1000,
+    ):
+        if chunk_size <= 0 or queue_size <= 0:
+            raise ValueError("chunk_size and queue_size must be positive")
+        self.source = source
+        self.stages = stages
+        self.sink = sink
+        self.chunk_size = chunk_size
+        self.flush_interval = flush_interval
+        self.queue_size = queue_size
+        self.metrics = [
+            StageMetrics("source"),
+            *(StageMetrics(stage.name) for stage in stages),
+            StageMetrics("sink"),
+        ]
+
+    async def run(self) -> StreamingResult:
+        """Run the pipeline until the source is exhausted."""
+        start = time.perf_counter()
+        queues = [
+            asyncio.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)
+        ]
+
+        tasks = [asyncio.create_task(self._run_source(queues[0]))]
+        for index, stage in enumerate(self.stages):
+            workers = max(stage.workers, 1)
+            remaining = [workers]
+            for _ in range(workers):
+                tasks.append(
+                    asyncio.create_task(
+                        self._run_stage(
+                            stage,
+                            self.metrics[index + 1],
+                            queues[index],
+                            queues[index + 1],
+                            remaining,
+                        )
+                    )
+                )
+        tasks.append(asyncio.create_task(self._run_sink(queues[-1])))
+
+        try:
+            done, pending = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION
+            )
+            failed = [task for task in done if task.exception() is not None]
+            if failed:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                raise failed[0].exception()
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        result = StreamingResult(
+            stages=self.metrics, elapsed_seconds=time.perf_counter() - start
+        )
+        logger.info(
+            f"Streaming pipeline completed: {result.records_read} read, "
+            f"{result.records_stored} stored, {result.errors} errors "
+            f"in {result.elapsed_seconds:.2f}s"
+        )
+        return result
+
+    async def _run_source(self, outbound: asyncio.Queue) -> None:
+        metrics = self.metrics[0]
+        metrics.started_at = time.perf_counter()
+        iterator = self.source.__aiter__()
+        try:
+            async for item in iterator:
+                metrics.items_in += 1
+                await outbound.put(item)
+                metrics.items_out += 1
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            metrics.finished_at = time.perf_counter()
+        await outbound.put(_END)
+
+    async def _run_stage(
+        self,
+        stage: PipelineStage,
+        metrics: StageMetrics,
+        inbound: asyncio.Queue,
+        outbound: asyncio.Queue,
+        remaining: list[int],
+    ) -> None:
+        if metrics.started_at is None:
+            metrics.started_at = time.perf_counter()
+
+        ended = False
+        while not ended:
+            if stage.batch_size:
+                items, ended = await self._gather(inbound, stage.batch_size)
+            else:
+                item = await inbound.get()
+                ended = item is _END
+                items = [] if ended else [item]
+
+            if not items:
+                continue
+
+            metrics.items_in += len(items)
+            metrics.batches += 1
+            started = time.perf_counter()
+            try:
+                if stage.batch_size:
+                    outputs = list(await stage.func(items) or [])
+                else:
+                    output = await stage.func(items[0])
+                    outputs = [] if output is None else [output]
+            except Exception as e:
+                metrics.errors += len(items)
+                logger.error(f"Streaming stage {stage.name} failed: {e}")
+                outputs = []
+            metrics.busy_seconds += time.perf_counter() - started
+
+            for output in outputs:
+                await outbound.put(output)
+            metrics.items_out += len(outputs)
+
+        # Let sibling workers see the end marker; the last one forwards it
+        remaining[0] -= 1
+        if remaining[0] > 0:
+            await inbound.put(_END)
+        else:
+            metrics.finished_at = time.perf_counter()
+            await outbound.put(_END)
+
+    async def _run_sink(self, inbound: asyncio.Queue) -> None:
+        metrics = self.metrics[-1]
+        metrics.started_at = time.perf_counter()
+        ended = False
+        while not ended:
+            chunk, ended = await self._gather(inbound, self.chunk_size)
+            if not chunk:
+                continue
+            metrics.items_in += len(chunk)
+            metrics.batches += 1
+            started = time.perf_counter()
+            stored = await self.sink(chunk)
+            metrics.busy_seconds += time.perf_counter() - started
+            metrics.items_out += len(chunk) if stored is None else int(stored)
+        metrics.finished_at = time.perf_counter()
+
+    async def _gather(
+        self, inbound: asyncio.Queue, size: int
+    ) -> tuple[list[Any], bool]:
+        """Collect up to ``size`` items, flushing early after ``flush_interval``."""
+        first = await inbound.get()
+        if first is _END:
+            return [], True
+
+        items = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(items) < size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(inbound.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _END:
+                return items, True
+            items.append(item)
+        return items, False
+
+
+async def stream_query_rows(
+    query: str, *args: Any, fetch_size: int = 500
+) -> AsyncIterator[Any]:
+    """
+    Stream rows for ``query`` through a server-side cursor.
+
+    Rows are prefetched ``fetch_size`` at a time, so only one prefetch window
+    is held in memory regardless of the result size. The cursor keeps its own
+    connection and read transaction open; writes must use other connections.
+    """
+    async with get_connection() as connection:
+        async with connection.transaction():
+            async for row in connection.cursor(query, *args, prefetch=fetch_size):
+                yield row
+
+
+def raw_row_to_record(row: Any, source: str = "action_network") -> DataRecord:
+    """Convert a raw_data table row into a DataRecord for staging processors."""
+    if row.get(PAYLOAD_COMPRESSED_COLUMN) is not None:
+        raw_data_field = decode_raw_payload(row, "raw_odds")
+    else:
+        raw_data_field = row.get("raw_data") or row.get("raw_odds")
+    if raw_data_field and isinstance(raw_data_field, str):
+        try:
+            raw_data_field = json.loads(raw_data_field)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning(f"Failed to parse raw_data JSON for record {row.get('id')}: {e}")
+            raw_data_field = None
+
+    # Store sportsbook_key in raw_data for processor access
+    if raw_data_field and isinstance(raw_data_field, dict):
+        sportsbook_key = row.get("sportsbook_key")
+        if sportsbook_key:
+            raw_data_field["_sportsbook_key"] = sportsbook_key
+
+    return DataRecord(
+        id=row.get("id"),
+        external_id=row.get("external_id") or row.get("external_game_id"),
+        source=row.get("source") or source,
+        raw_data=raw_data_field,
+        collected_at=row.get("collected_at"),
+        processed_at=row.get("processed_at"),
+        created_at=row.get("created_at"),
+    )
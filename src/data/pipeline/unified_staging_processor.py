@@ -15,16 +15,20 @@ This addresses all 7 critical issues identified in DATA_MODEL_IMPROVEMENTS.md:
 Reference: docs/DATA_MODEL_IMPROVEMENTS.md
 """
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, List, Optional
 
+import polars as pl
+
 from ...core.logging import LogComponent, get_logger
 from ...core.sportsbook_utils import resolve_sportsbook_info_static as resolve_sportsbook_info, SportsbookResolutionError
 from ...core.team_utils import populate_team_names, TeamResolutionError, validate_team_names, normalize_team_name
 from .team_mappings import get_team_mapping
 from .base_processor import BaseZoneProcessor
+from .streaming import PipelineStage, StreamingPipeline, StreamingResult, raw_row_to_record, stream_query_rows
 from .zone_interface import (
     DataRecord,
     ProcessingResult,
@@ -81,6 +85,28 @@ class UnifiedStagingRecord(DataRecord):
     collected_at: datetime | None = None
 
 
+# Fields a complete unified record carries, and its odds fields
+COMPLETENESS_FIELDS = (
+    'external_game_id', 'sportsbook_name', 'home_team', 'away_team',
+    'data_source', 'market_type'
+)
+ODDS_FIELDS = (
+    'home_moneyline_odds', 'away_moneyline_odds',
+    'home_spread_odds', 'away_spread_odds',
+    'over_odds', 'under_odds'
+)
+
+
+def _truthy(column: pl.Series) -> pl.Series:
+    """Vectorized Python truthiness for optional scalar columns."""
+    if column.dtype == pl.Null:
+        return pl.Series(column.name, [False] * len(column))
+    if column.dtype == pl.Boolean:
+        return column.fill_null(False)
+    empty = "" if column.dtype == pl.Utf8 else 0
+    return (column.is_not_null() & (column != empty)).fill_null(False)
+
+
 class UnifiedStagingProcessor(BaseZoneProcessor):
     """
     Unified staging processor that implements the improved data model.
@@ -94,6 +120,14 @@ class UnifiedStagingProcessor(BaseZoneProcessor):
     - Single unified table design
     """
     
+    BATCH_FIELDS = (
+        *BaseZoneProcessor.BATCH_FIELDS,
+        *COMPLETENESS_FIELDS,
+        *ODDS_FIELDS,
+        'spread_line',
+        'total_line',
+    )
+
     def __init__(self, config: ZoneConfig):
         super().__init__(config)
         self.consolidation_cache = {}
@@ -173,6 +207,127 @@ class UnifiedStagingProcessor(BaseZoneProcessor):
             logger.error(f"Error in batch consolidation: {e}")
             return []
     
+    async def stream_raw_to_staging(
+        self,
+        query: Optional[str] = None,
+        *query_args: Any,
+        chunk_size: int = 500,
+        flush_interval: float = 5.0,
+        queue_size: int = 1000,
+        workers: int = 4,
+        fetch_size: int = 500,
+        **kwargs,
+    ) -> StreamingResult:
+        """
+        Process raw records into staging in constant memory.
+
+        Raw rows are read through a server-side cursor and pass through
+        bounded stages (game pre-resolution, unified transformation) before
+        being consolidated and flushed to staging in chunks. The default query
+        orders rows by game and sportsbook so consolidation groups stay
+        contiguous; the trailing group of each chunk is carried into the next
+        flush so it is never split across chunks. Raw rows are marked
+        processed only once the staging record they fed has been stored.
+
+        Args:
+            query: Raw zone query (defaults to unprocessed raw_data.action_network_odds rows)
+            *query_args: Query parameters
+            chunk_size: Maximum records per staging flush
+            flush_interval: Seconds before a partial chunk is flushed
+            queue_size: Bound on each inter-stage queue
+            workers: Concurrent record transformations per chunk
+            fetch_size: Cursor prefetch window
+
+        Returns:
+            StreamingResult with per-stage throughput metrics
+        """
+        query = query or """
+            SELECT * FROM raw_data.action_network_odds
+            WHERE processed_at IS NULL
+            ORDER BY external_game_id, sportsbook_key, collected_at
+        """
+        pending: List[UnifiedStagingRecord] = []
+        # (consolidation key, raw table, raw id) of the rows behind ``pending``
+        pending_sources: List[tuple] = []
+
+        def group_key(record: UnifiedStagingRecord) -> tuple:
+            return (record.external_game_id, record.sportsbook_external_id)
+
+        async def resolve_games(records: List[DataRecord]) -> List[DataRecord]:
+            await self._batch_resolve_game_ids(records)
+            return records
+
+        semaphore = asyncio.Semaphore(max(workers, 1))
+
+        async def transform_one(record: DataRecord) -> DataRecord | None:
+            async with semaphore:
+                return await self.process_record(record, **kwargs)
+
+        async def transform(records: List[DataRecord]) -> List[DataRecord]:
+            # gather preserves order, keeping consolidation groups contiguous
+            processed = await asyncio.gather(*(transform_one(r) for r in records))
+            return [record for record in processed if record]
+
+        async def flush(records: List[UnifiedStagingRecord]) -> int:
+            sources = pending_sources + [
+                (group_key(r), r.raw_data_table, r.raw_data_id) for r in records
+            ]
+            consolidated = await self._consolidate_bet_records(pending + records)
+            pending.clear()
+            pending_sources.clear()
+            if consolidated:
+                last = consolidated.pop()
+                pending.append(last)
+                carried = [s for s in sources if s[0] == group_key(last)]
+                pending_sources.extend(carried)
+                sources = [s for s in sources if s[0] != group_key(last)]
+            await self.store_unified_records(consolidated)
+            await self._mark_raw_processed(sources)
+            return len(consolidated)
+
+        pipeline = StreamingPipeline(
+            source=(
+                raw_row_to_record(row)
+                async for row in stream_query_rows(query, *query_args, fetch_size=fetch_size)
+            ),
+            stages=[
+                PipelineStage("resolve_games", resolve_games, batch_size=chunk_size),
+                PipelineStage("transform", transform, batch_size=chunk_size),
+            ],
+            sink=flush,
+            chunk_size=chunk_size,
+            flush_interval=flush_interval,
+            queue_size=queue_size,
+        )
+        result = await pipeline.run()
+
+        if pending:
+            await self.store_unified_records(pending)
+            await self._mark_raw_processed(pending_sources)
+            result.stages[-1].items_out += len(pending)
+
+        logger.info(f"Streaming staging run: {result.to_dict()}")
+        return result
+
+    async def _mark_raw_processed(self, sources: List[tuple]) -> None:
+        """Set processed_at on the raw rows behind stored staging records."""
+        ids_by_table: Dict[str, List[int]] = {}
+        for _, table, raw_id in sources:
+            if table and raw_id is not None:
+                ids_by_table.setdefault(table, []).append(raw_id)
+        if not ids_by_table:
+            return
+
+        from ...data.database.connection import get_connection
+
+        async with get_connection() as connection:
+            for table, raw_ids in ids_by_table.items():
+                await connection.execute(
+                    f"UPDATE {table} SET processed_at = $1 WHERE id = ANY($2)",
+                    datetime.now(timezone.utc),
+                    raw_ids,
+                )
+
     async def process_record_multi_bet_types(self, record: DataRecord, **kwargs) -> List[DataRecord]:
         """
         Process a single RAW record into multiple unified staging records.
@@ -537,13 +692,8 @@ class UnifiedStagingProcessor(BaseZoneProcessor):
     
     async def _calculate_completeness_score(self, record: UnifiedStagingRecord) -> float:
         """Calculate data completeness score."""
-        required_fields = [
-            'external_game_id', 'sportsbook_name', 'home_team', 'away_team',
-            'data_source', 'market_type'
-        ]
-        
-        completed_fields = sum(1 for field in required_fields if getattr(record, field))
-        return completed_fields / len(required_fields)
+        completed_fields = sum(1 for field in COMPLETENESS_FIELDS if getattr(record, field))
+        return completed_fields / len(COMPLETENESS_FIELDS)
     
     async def _calculate_accuracy_score(self, record: UnifiedStagingRecord) -> float:
         """Calculate data accuracy score."""
@@ -558,13 +708,7 @@ class UnifiedStagingProcessor(BaseZoneProcessor):
             accuracy_score -= 0.3
             
         # Check odds reasonableness
-        all_odds = [
-            record.home_moneyline_odds, record.away_moneyline_odds,
-            record.home_spread_odds, record.away_spread_odds,
-            record.over_odds, record.under_odds
-        ]
-        
-        for odds in all_odds:
+        for odds in (getattr(record, field) for field in ODDS_FIELDS):
             if odds and (odds < -5000 or odds > 5000):
                 accuracy_score -= 0.1
                 break
@@ -588,6 +732,69 @@ class UnifiedStagingProcessor(BaseZoneProcessor):
         
         return max(0.0, consistency_score)
     
+    async def score_batch(
+        self,
+        frame: pl.DataFrame,
+        records: List[DataRecord],
+        errors: List[str] | None = None,
+    ) -> List[float | None]:
+        """
+        Columnar completeness, accuracy and consistency scores.
+
+        Mirrors the per-record _calculate_*_score methods. Only unified records
+        carry these fields, so any other batch takes the per-record path.
+        """
+        if not records or not all(isinstance(r, UnifiedStagingRecord) for r in records):
+            return await super().score_batch(frame, records, errors=errors)
+
+        truthy = {field: _truthy(frame[field]) for field in (*COMPLETENESS_FIELDS, *ODDS_FIELDS)}
+
+        completeness = sum(
+            truthy[field].cast(pl.Float64) for field in COMPLETENESS_FIELDS
+        ) / len(COMPLETENESS_FIELDS)
+
+        # validate_team_names once per distinct matchup
+        team_checks: Dict[tuple, bool] = {}
+        for record in records:
+            pair = (record.home_team or '', record.away_team or '')
+            if pair not in team_checks:
+                team_checks[pair] = validate_team_names(*pair)
+        valid_teams = pl.Series([
+            team_checks[(record.home_team or '', record.away_team or '')]
+            for record in records
+        ])
+        unknown_book = truthy['sportsbook_name'] & (
+            frame['sportsbook_name'].cast(pl.Utf8).str.to_lowercase()
+            .str.contains('unknown', literal=True).fill_null(False)
+        )
+        odds_out_of_range = pl.Series([False] * len(records))
+        for field in ODDS_FIELDS:
+            if frame[field].dtype != pl.Null:
+                odds_out_of_range |= (
+                    (frame[field] < -5000) | (frame[field] > 5000)
+                ).fill_null(False)
+        accuracy = (
+            1.0
+            - unknown_book.cast(pl.Float64) * 0.2
+            - (~valid_teams).cast(pl.Float64) * 0.3
+            - odds_out_of_range.cast(pl.Float64) * 0.1
+        ).clip(lower_bound=0.0)
+
+        market = frame['market_type'].cast(pl.Utf8)
+        has_spread_line = _truthy(frame['spread_line'])
+        has_total_line = _truthy(frame['total_line'])
+        inconsistent = (
+            ((market == 'moneyline')
+             & ~(truthy['home_moneyline_odds'] | truthy['away_moneyline_odds']))
+            | ((market == 'spread')
+               & (~has_spread_line | ~(truthy['home_spread_odds'] | truthy['away_spread_odds'])))
+            | ((market == 'total')
+               & (~has_total_line | ~(truthy['over_odds'] | truthy['under_odds'])))
+        ).fill_null(False)
+        consistency = 1.0 - inconsistent.cast(pl.Float64) * 0.3
+
+        return ((completeness + accuracy + consistency) / 3.0).to_list()
+    
     async def _validate_unified_record(self, record: UnifiedStagingRecord):
         """Final validation of unified record."""
         validation_errors = []
@@ -753,6 +960,17 @@ class UnifiedStagingProcessor(BaseZoneProcessor):
         except Exception as e:
             logger.error(f"Error storing unified records in batch: {e}")
             raise
+
+        self._scan_cross_book_opportunities(records)
+
+    def _scan_cross_book_opportunities(self, records: List[UnifiedStagingRecord]) -> None:
+        """Feed stored quotes to the cross-book scanner; scanning never fails the store."""
+        try:
+            from ...services.analytics.cross_book_scanner import get_cross_book_scanner
+
+            get_cross_book_scanner().ingest(records)
+        except Exception as e:
+            logger.warning(f"Cross-book scan failed: {e}")
     
     def _convert_date_string(self, date_str: Optional[str]) -> Optional[datetime.date]:
         """Convert string date to date object for PostgreSQL."""
@@ -58,6 +58,9 @@ class ZoneConfig(BaseModel):
     timeout_seconds: int = Field(default=300, gt=0)
     validation_enabled: bool = True
     auto_promotion: bool = True
+    # RAW zone payload storage ("br" stores large payloads brotli-compressed)
+    raw_payload_compression: str | None = None
+    raw_compression_threshold_bytes: int = Field(default=16_384, gt=0)
 
 
 class DataRecord(BaseModel):
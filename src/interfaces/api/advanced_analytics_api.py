@@ -24,6 +24,7 @@ import numpy as np
 import polars as pl
 
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ...core.config import get_settings
@@ -33,13 +34,19 @@ from ...data.database.connection import get_database_connection
 from ...data.models.unified.betting_analysis import BettingAnalysis, BettingSignalType
 from ...data.models.unified.movement_analysis import GameMovementAnalysis, LineMovementDetail
 from ...services.monitoring.prometheus_metrics_service import get_metrics_service
+from ...services.analytics.analysis_result_cache import get_analysis_result_cache
 from ...services.analytics.statistical_analysis_service import get_statistical_analysis_service
+from .streaming_export import DEFAULT_CHUNK_SIZE, EXPORT_MEDIA_TYPES, stream_export
 
 # Initialize components
 settings = get_settings()
 logger = get_contextual_logger(__name__, LogComponent.API_CLIENT)
 metrics_service = get_metrics_service()
 stats_service = get_statistical_analysis_service()
+analysis_cache = get_analysis_result_cache()
+
+# Cache filter value standing in for a defaulted "last 30 days" window start
+DEFAULT_ATTRIBUTION_WINDOW = "default_30d"
 
 # Create router for advanced analytics endpoints
 analytics_router = APIRouter(prefix="/api/analytics", tags=["Advanced Analytics"])
@@ -141,9 +148,15 @@ class FilterOptions(BaseModel):
 async def get_line_movement_chart_data(
     game_id: int,
     market_type: str = Query("moneyline", regex="^(moneyline|spread|total)$"),
-    side: Optional[str] = Query(None, regex="^(home|away|over|under)$")
+    side: Optional[str] = Query(None, regex="^(home|away|over|under)$"),
+    resolution: str = Query("5m", regex="^(raw|5m|1h)$")
 ):
-    """Get interactive line movement chart data for a specific game."""
+    """
+    Get interactive line movement chart data for a specific game.
+
+    The default 5m/1h resolutions read OHLC buckets from
+    curated.line_movement_rollups; ``raw`` returns every history row.
+    """
     try:
         async with get_database_connection() as db:
             # Get game information
@@ -157,52 +170,86 @@ async def get_line_movement_chart_data(
                 raise HTTPException(status_code=404, detail="Game not found")
             
             # Get line movement history
-            movement_query = """
-                SELECT 
-                    lmh.line_timestamp,
-                    s.display_name as sportsbook_name,
-                    lmh.odds,
-                    lmh.line_value,
-                    lmh.side,
-                    lmh.bet_type
-                FROM curated.line_movement_history lmh
-                JOIN curated.sportsbooks s ON lmh.sportsbook_id = s.id
-                WHERE lmh.game_id = $1 
-                  AND lmh.bet_type = $2
-                  AND ($3 IS NULL OR lmh.side = $3)
-                ORDER BY lmh.line_timestamp ASC
-            """
-            
-            movements = await db.fetch(movement_query, game_id, market_type, side)
+            if resolution == "raw":
+                movement_query = """
+                    SELECT 
+                        lmh.line_timestamp,
+                        s.display_name as sportsbook_name,
+                        lmh.odds,
+                        lmh.line_value,
+                        lmh.side,
+                        lmh.bet_type
+                    FROM curated.line_movement_history lmh
+                    JOIN curated.sportsbooks s ON lmh.sportsbook_id = s.id
+                    WHERE lmh.game_id = $1 
+                      AND lmh.bet_type = $2
+                      AND ($3::text IS NULL OR lmh.side = $3)
+                    ORDER BY lmh.line_timestamp ASC
+                """
+                movements = await db.fetch(movement_query, game_id, market_type, side)
+            else:
+                movement_query = """
+                    SELECT 
+                        r.bucket_start,
+                        s.display_name as sportsbook_name,
+                        r.side,
+                        r.open_odds,
+                        r.high_odds,
+                        r.low_odds,
+                        r.close_odds,
+                        r.open_line,
+                        r.close_line,
+                        r.observations
+                    FROM curated.line_movement_rollups r
+                    JOIN curated.sportsbooks s ON r.sportsbook_id = s.id
+                    WHERE r.bucket_width = $4
+                      AND r.game_id = $1 
+                      AND r.bet_type = $2
+                      AND ($3::text IS NULL OR r.side = $3)
+                    ORDER BY r.bucket_start ASC
+                """
+                movements = await db.fetch(movement_query, game_id, market_type, side, resolution)
             
             # Process data for chart visualization
             sportsbook_data = {}
             timestamps = set()
+            opening_by_book = {}
+            total_movements = 0
             
             for movement in movements:
                 book_name = movement['sportsbook_name']
-                timestamp = movement['line_timestamp']
-                timestamps.add(timestamp)
                 
-                if book_name not in sportsbook_data:
-                    sportsbook_data[book_name] = []
+                if resolution == "raw":
+                    data_point = {
+                        'timestamp': movement['line_timestamp'],
+                        'odds': movement['odds'],
+                        'line_value': float(movement['line_value']) if movement['line_value'] else None,
+                        'side': movement['side']
+                    }
+                    opening_by_book.setdefault(book_name, movement['odds'])
+                    total_movements += 1
+                else:
+                    # Buckets plot at their close; OHLC is kept for candlestick views
+                    data_point = {
+                        'timestamp': movement['bucket_start'],
+                        'odds': movement['close_odds'],
+                        'line_value': float(movement['close_line']) if movement['close_line'] else None,
+                        'side': movement['side'],
+                        'open_odds': movement['open_odds'],
+                        'high_odds': movement['high_odds'],
+                        'low_odds': movement['low_odds'],
+                        'open_line_value': float(movement['open_line']) if movement['open_line'] else None,
+                        'observations': movement['observations']
+                    }
+                    opening_by_book.setdefault(book_name, movement['open_odds'])
+                    total_movements += movement['observations']
                 
-                data_point = {
-                    'timestamp': timestamp,
-                    'odds': movement['odds'],
-                    'line_value': float(movement['line_value']) if movement['line_value'] else None,
-                    'side': movement['side']
-                }
-                sportsbook_data[book_name].append(data_point)
+                timestamps.add(data_point['timestamp'])
+                sportsbook_data.setdefault(book_name, []).append(data_point)
             
             # Calculate statistical summaries
-            opening_odds = []
-            closing_odds = []
-            
-            for book_data in sportsbook_data.values():
-                if book_data:
-                    opening_odds.append(book_data[0]['odds'])
-                    closing_odds.append(book_data[-1]['odds'])
+            opening_odds = list(opening_by_book.values())
+            closing_odds = [book_data[-1]['odds'] for book_data in sportsbook_data.values() if book_data]
             
             opening_range = {
                 'min': min(opening_odds) if opening_odds else 0,
@@ -217,7 +264,8 @@ async def get_line_movement_chart_data(
             }
             
             movement_summary = {
-                'total_movements': len(movements),
+                'resolution': resolution,
+                'total_movements': total_movements,
                 'books_tracked': len(sportsbook_data),
                 'time_span_hours': (max(timestamps) - min(timestamps)).total_seconds() / 3600 if timestamps else 0,
                 'average_opening': mean(opening_odds) if opening_odds else 0,
@@ -280,88 +328,102 @@ async def perform_statistical_analysis(
     filters: FilterOptions,
     analysis_type: str = Query("correlation", regex="^(correlation|regression|distribution|performance)$")
 ):
-    """Perform advanced statistical analysis on betting data."""
+    """
+    Perform advanced statistical analysis on betting data.
+
+    Results are cached per filter set and invalidated when rows land inside
+    the filtered window (see _statistical_window_watermark).
+    """
     try:
         async with get_database_connection() as db:
-            # Build query based on filters
-            base_query = """
-                SELECT 
-                    ba.game_id,
-                    ba.analysis_timestamp,
-                    ba.market_type,
-                    ba.confidence_score,
-                    ba.recommendation,
-                    ba.signal_strength,
-                    ba.primary_signal,
-                    gc.home_team,
-                    gc.away_team,
-                    gc.game_datetime,
-                    lms.odds_movement,
-                    lms.line_movement,
-                    lms.total_movements
-                FROM curated.betting_analysis ba
-                JOIN curated.games_complete gc ON ba.game_id = gc.id
-                LEFT JOIN curated.line_movement_summary lms ON (
-                    ba.game_id = lms.game_id AND 
-                    ba.market_type = lms.bet_type
-                )
-                WHERE 1=1
-            """
-            
+            # Build filter clause based on filters
+            where_clause = ""
             params = []
-            param_count = 0
             
-            # Apply filters
             if filters.start_date:
-                param_count += 1
-                base_query += f" AND ba.analysis_timestamp >= ${param_count}"
                 params.append(filters.start_date)
+                where_clause += f" AND ba.analysis_timestamp >= ${len(params)}"
                 
             if filters.end_date:
-                param_count += 1
-                base_query += f" AND ba.analysis_timestamp <= ${param_count}"
                 params.append(filters.end_date)
+                where_clause += f" AND ba.analysis_timestamp <= ${len(params)}"
                 
             if filters.confidence_threshold:
-                param_count += 1
-                base_query += f" AND ba.confidence_score >= ${param_count}"
                 params.append(filters.confidence_threshold)
-                
-            base_query += " ORDER BY ba.analysis_timestamp ASC"
-            
-            results = await db.fetch(base_query, *params)
+                where_clause += f" AND ba.confidence_score >= ${len(params)}"
             
-            if not results:
-                return StatisticalAnalysis(
+            async def compute_analysis() -> Dict[str, Any]:
+                base_query = """
+                    SELECT 
+                        ba.game_id,
+                        ba.analysis_timestamp,
+                        ba.market_type,
+                        ba.confidence_score,
+                        ba.recommendation,
+                        ba.signal_strength,
+                        ba.primary_signal,
+                        gc.home_team,
+                        gc.away_team,
+                        gc.game_datetime,
+                        lms.odds_movement,
+                        lms.line_movement,
+                        lms.total_movements
+                    FROM curated.betting_analysis ba
+                    JOIN curated.games_complete gc ON ba.game_id = gc.id
+                    LEFT JOIN curated.line_movement_rollup_summary lms ON (
+                        ba.game_id = lms.game_id AND 
+                        ba.market_type = lms.bet_type
+                    )
+                    WHERE 1=1
+                """ + where_clause + " ORDER BY ba.analysis_timestamp ASC"
+                
+                results = await db.fetch(base_query, *params)
+                
+                if not results:
+                    return StatisticalAnalysis(
+                        analysis_type=analysis_type,
+                        timeframe=f"{filters.start_date} to {filters.end_date}",
+                        sample_size=0
+                    ).model_dump(mode="json")
+                
+                # Convert to DataFrame for analysis - memory optimized approach
+                # Use record batches to avoid creating intermediate dictionaries list
+                df = pl.from_records(results)
+                
+                analysis_result = StatisticalAnalysis(
                     analysis_type=analysis_type,
                     timeframe=f"{filters.start_date} to {filters.end_date}",
-                    sample_size=0
+                    sample_size=len(df)
                 )
-            
-            # Convert to DataFrame for analysis - memory optimized approach
-            # Use record batches to avoid creating intermediate dictionaries list
-            df = pl.from_records(results)
-            
-            analysis_result = StatisticalAnalysis(
-                analysis_type=analysis_type,
-                timeframe=f"{filters.start_date} to {filters.end_date}",
-                sample_size=len(df)
-            )
-            
-            # Perform specific analysis based on type
-            if analysis_type == "correlation":
-                analysis_result.correlations = await _perform_correlation_analysis(df)
-            elif analysis_type == "regression":
-                analysis_result.regression_results = await _perform_regression_analysis(df)
-            elif analysis_type == "distribution":
-                analysis_result.distribution_stats = await _perform_distribution_analysis(df)
-            elif analysis_type == "performance":
-                analysis_result.performance_attribution = await _perform_performance_analysis(df)
                 
-            # Calculate confidence intervals for key metrics
-            analysis_result.confidence_intervals = await _calculate_confidence_intervals(df)
+                # Perform specific analysis based on type
+                if analysis_type == "correlation":
+                    analysis_result.correlations = await _perform_correlation_analysis(df)
+                elif analysis_type == "regression":
+                    analysis_result.regression_results = await _perform_regression_analysis(df)
+                elif analysis_type == "distribution":
+                    analysis_result.distribution_stats = await _perform_distribution_analysis(df)
+                elif analysis_type == "performance":
+                    analysis_result.performance_attribution = await _perform_performance_analysis(df)
+                    
+                # Calculate confidence intervals for key metrics
+                analysis_result.confidence_intervals = await _calculate_confidence_intervals(df)
+                
+                return analysis_result.model_dump(mode="json")
             
-            return analysis_result
+            watermark = await _statistical_window_watermark(db, where_clause, params)
+            cached = await analysis_cache.get_or_compute(
+                "statistical_analysis",
+                {
+                    "analysis_type": analysis_type,
+                    "start_date": filters.start_date,
+                    "end_date": filters.end_date,
+                    "confidence_threshold": filters.confidence_threshold
+                },
+                watermark,
+                compute_analysis
+            )
+            return StatisticalAnalysis(**cached)
             
     except Exception as e:
         handled_error = handle_exception(e, component="advanced_analytics", operation="statistical_analysis")
@@ -369,179 +431,231 @@ async def perform_statistical_analysis(
         raise HTTPException(status_code=500, detail=handled_error.user_message)
 
 
+async def _statistical_window_watermark(db, where_clause: str, params: List[Any]) -> Dict[str, Any]:
+    """
+    Describe the data inside a statistical analysis window.
+
+    Changes whenever an analysis row is added to the window or the line
+    movement rollups of one of its games are refreshed; index lookups only,
+    so it is cheap compared with the analysis it guards.
+    """
+    watermark_query = """
+        WITH analysis_window AS (
+            SELECT ba.game_id, ba.analysis_timestamp
+            FROM curated.betting_analysis ba
+            JOIN curated.games_complete gc ON ba.game_id = gc.id
+            WHERE 1=1
+    """ + where_clause + """
+        )
+        SELECT
+            (SELECT COUNT(*) FROM analysis_window) AS row_count,
+            (SELECT MAX(analysis_timestamp) FROM analysis_window) AS latest_analysis,
+            (
+                SELECT MAX(r.refreshed_at)
+                FROM curated.line_movement_rollups r
+                WHERE r.bucket_width = '1h'
+                  AND r.game_id IN (SELECT game_id FROM analysis_window)
+            ) AS movements_refreshed_at
+    """
+    row = await db.fetchrow(watermark_query, *params)
+    return dict(row) if row else {}
+
+
 @analytics_router.get("/performance-attribution", response_model=PerformanceAttribution)
 async def get_performance_attribution(
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     strategy_filter: Optional[List[str]] = Query(None)
 ):
-    """Get detailed performance attribution analysis."""
+    """
+    Get detailed performance attribution analysis.
+
+    Results are cached per date window and invalidated when analyses,
+    completed games or outcomes land inside it.
+    """
     try:
         async with get_database_connection() as db:
-            # Default to last 30 days if no dates provided
-            if not start_date:
-                start_date = datetime.now(timezone.utc) - timedelta(days=30)
+            # Default to last 30 days if no dates provided. Defaulted bounds are
+            # cached under sentinels rather than the moving timestamps, so
+            # repeated dashboard views share a key until the watermark changes
+            window_filters = {
+                "start_date": start_date or DEFAULT_ATTRIBUTION_WINDOW,
+                "end_date": end_date or "now",
+                "strategy_filter": strategy_filter
+            }
             if not end_date:
                 end_date = datetime.now(timezone.utc)
+            if not start_date:
+                start_date = end_date - timedelta(days=30)
                 
-            # Get opportunity performance data with proper outcome tracking
-            perf_query = """
-                SELECT 
-                    ba.analysis_id,
-                    ba.game_id,
-                    ba.analysis_timestamp,
-                    ba.primary_signal,
-                    ba.signal_strength,
-                    ba.confidence_score,
-                    ba.recommendation,
-                    ba.market_type,
-                    gc.game_datetime,
-                    gc.home_team,
-                    gc.away_team,
-                    EXTRACT(HOUR FROM ba.analysis_timestamp) as analysis_hour,
-                    EXTRACT(DOW FROM ba.analysis_timestamp) as day_of_week,
-                    -- Real outcome tracking using proper game outcomes and strategy results
-                    COALESCE(
-                        -- Check strategy results first (most accurate)
-                        CASE 
-                            WHEN sr.outcome = 'WIN' THEN true
-                            WHEN sr.outcome IN ('LOSS', 'PUSH', 'VOID') THEN false
-                            ELSE NULL
-                        END,
-                        -- Fallback to game outcome analysis based on recommendation
-                        CASE 
-                            -- Spread bets
-                            WHEN ba.market_type = 'spread' AND ba.recommendation LIKE '%home%' AND go.home_cover_spread = true THEN true
-                            WHEN ba.market_type = 'spread' AND ba.recommendation LIKE '%away%' AND go.home_cover_spread = false THEN true
-                            WHEN ba.market_type = 'spread' AND go.home_cover_spread IS NOT NULL THEN false
-                            -- Total bets
-                            WHEN ba.market_type = 'total' AND ba.recommendation LIKE '%over%' AND go.over = true THEN true
-                            WHEN ba.market_type = 'total' AND ba.recommendation LIKE '%under%' AND go.over = false THEN true
-                            WHEN ba.market_type = 'total' AND go.over IS NOT NULL THEN false
-                            -- Moneyline bets
-                            WHEN ba.market_type = 'moneyline' AND ba.recommendation LIKE '%home%' AND go.home_win = true THEN true
-                            WHEN ba.market_type = 'moneyline' AND ba.recommendation LIKE '%away%' AND go.home_win = false THEN true
-                            WHEN ba.market_type = 'moneyline' AND go.home_win IS NOT NULL THEN false
-                            -- No outcome data available
-                            ELSE NULL
-                        END
-                    ) as was_successful
-                FROM curated.betting_analysis ba
-                JOIN curated.games_complete gc ON ba.game_id = gc.id
-                LEFT JOIN curated.game_outcomes go ON ba.game_id = go.game_id
-                LEFT JOIN analysis.strategy_results sr ON (
-                    ba.game_id = sr.game_id::INTEGER AND
-                    ba.market_type = sr.bet_type AND
-                    ba.analysis_timestamp <= sr.bet_placed_at AND
-                    sr.status = 'COMPLETED'
-                )
-                WHERE ba.analysis_timestamp BETWEEN $1 AND $2
-                    AND gc.game_datetime < NOW() - INTERVAL '2 hours' -- Only include completed games
-                ORDER BY ba.analysis_timestamp ASC
-            """
+            async def compute_attribution() -> Dict[str, Any]:
+                # Get opportunity performance data with proper outcome tracking
+                perf_query = """
+                    SELECT 
+                        ba.analysis_id,
+                        ba.game_id,
+                        ba.analysis_timestamp,
+                        ba.primary_signal,
+                        ba.signal_strength,
+                        ba.confidence_score,
+                        ba.recommendation,
+                        ba.market_type,
+                        gc.game_datetime,
+                        gc.home_team,
+                        gc.away_team,
+                        EXTRACT(HOUR FROM ba.analysis_timestamp) as analysis_hour,
+                        EXTRACT(DOW FROM ba.analysis_timestamp) as day_of_week,
+                        -- Real outcome tracking using proper game outcomes and strategy results
+                        COALESCE(
+                            -- Check strategy results first (most accurate)
+                            CASE 
+                                WHEN sr.outcome = 'WIN' THEN true
+                                WHEN sr.outcome IN ('LOSS', 'PUSH', 'VOID') THEN false
+                                ELSE NULL
+                            END,
+                            -- Fallback to game outcome analysis based on recommendation
+                            CASE 
+                                -- Spread bets
+                                WHEN ba.market_type = 'spread' AND ba.recommendation LIKE '%home%' AND go.home_cover_spread = true THEN true
+                                WHEN ba.market_type = 'spread' AND ba.recommendation LIKE '%away%' AND go.home_cover_spread = false THEN true
+                                WHEN ba.market_type = 'spread' AND go.home_cover_spread IS NOT NULL THEN false
+                                -- Total bets
+                                WHEN ba.market_type = 'total' AND ba.recommendation LIKE '%over%' AND go.over = true THEN true
+                                WHEN ba.market_type = 'total' AND ba.recommendation LIKE '%under%' AND go.over = false THEN true
+                                WHEN ba.market_type = 'total' AND go.over IS NOT NULL THEN false
+                                -- Moneyline bets
+                                WHEN ba.market_type = 'moneyline' AND ba.recommendation LIKE '%home%' AND go.home_win = true THEN true
+                                WHEN ba.market_type = 'moneyline' AND ba.recommendation LIKE '%away%' AND go.home_win = false THEN true
+                                WHEN ba.market_type = 'moneyline' AND go.home_win IS NOT NULL THEN false
+                                -- No outcome data available
+                                ELSE NULL
+                            END
+                        ) as was_successful
+                    FROM curated.betting_analysis ba
+                    JOIN curated.games_complete gc ON ba.game_id = gc.id
+                    LEFT JOIN curated.game_outcomes go ON ba.game_id = go.game_id
+                    LEFT JOIN analysis.strategy_results sr ON (
+                        ba.game_id = sr.game_id::INTEGER AND
+                        ba.market_type = sr.bet_type AND
+                        ba.analysis_timestamp <= sr.bet_placed_at AND
+                        sr.status = 'COMPLETED'
+                    )
+                    WHERE ba.analysis_timestamp BETWEEN $1 AND $2
+                        AND gc.game_datetime < NOW() - INTERVAL '2 hours' -- Only include completed games
+                    ORDER BY ba.analysis_timestamp ASC
+                """
             
-            results = await db.fetch(perf_query, start_date, end_date)
+                results = await db.fetch(perf_query, start_date, end_date)
             
-            # Calculate success metrics, excluding opportunities without outcome data
-            opportunities_with_outcomes = [r for r in results if r['was_successful'] is not None]
-            total_opportunities = len(opportunities_with_outcomes)
-            successful_opportunities = sum(1 for r in opportunities_with_outcomes if r['was_successful'])
-            success_rate = successful_opportunities / total_opportunities if total_opportunities > 0 else 0.0
+                # Calculate success metrics, excluding opportunities without outcome data
+                opportunities_with_outcomes = [r for r in results if r['was_successful'] is not None]
+                total_opportunities = len(opportunities_with_outcomes)
+                successful_opportunities = sum(1 for r in opportunities_with_outcomes if r['was_successful'])
+                success_rate = successful_opportunities / total_opportunities if total_opportunities > 0 else 0.0
             
-            # Track incomplete data for transparency
-            opportunities_without_outcomes = len(results) - len(opportunities_with_outcomes)
+                # Track incomplete data for transparency
+                opportunities_without_outcomes = len(results) - len(opportunities_with_outcomes)
             
-            # Optimized single-pass analysis for all performance metrics
-            strategy_performance = {}
-            market_performance = {}
-            hourly_performance = {str(hour): {'total': 0, 'successful': 0, 'success_rate': 0.0} for hour in range(24)}
-            day_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-            daily_performance = {day_name: {'total': 0, 'successful': 0, 'success_rate': 0.0} for day_name in day_names}
+                # Optimized single-pass analysis for all performance metrics
+                strategy_performance = {}
+                market_performance = {}
+                hourly_performance = {str(hour): {'total': 0, 'successful': 0, 'success_rate': 0.0} for hour in range(24)}
+                day_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+                daily_performance = {day_name: {'total': 0, 'successful': 0, 'success_rate': 0.0} for day_name in day_names}
             
-            # Single pass through opportunities with outcomes for better performance
-            for result in opportunities_with_outcomes:
-                # Strategy analysis
-                strategy = result['primary_signal'] or 'unknown'
-                if strategy not in strategy_performance:
-                    strategy_performance[strategy] = {
-                        'total': 0, 'successful': 0, 'success_rate': 0.0,
-                        'avg_confidence': 0.0, 'total_confidence': 0.0
-                    }
+                # Single pass through opportunities with outcomes for better performance
+                for result in opportunities_with_outcomes:
+                    # Strategy analysis
+                    strategy = result['primary_signal'] or 'unknown'
+                    if strategy not in strategy_performance:
+                        strategy_performance[strategy] = {
+                            'total': 0, 'successful': 0, 'success_rate': 0.0,
+                            'avg_confidence': 0.0, 'total_confidence': 0.0
+                        }
                 
-                strategy_performance[strategy]['total'] += 1
-                strategy_performance[strategy]['total_confidence'] += result['confidence_score']
+                    strategy_performance[strategy]['total'] += 1
+                    strategy_performance[strategy]['total_confidence'] += result['confidence_score']
                 
-                # Market analysis
-                market = result['market_type']
-                if market not in market_performance:
-                    market_performance[market] = {'total': 0, 'successful': 0, 'success_rate': 0.0}
-                market_performance[market]['total'] += 1
+                    # Market analysis
+                    market = result['market_type']
+                    if market not in market_performance:
+                        market_performance[market] = {'total': 0, 'successful': 0, 'success_rate': 0.0}
+                    market_performance[market]['total'] += 1
                 
-                # Hourly analysis
-                hour = str(result['analysis_hour'])
-                hourly_performance[hour]['total'] += 1
+                    # Hourly analysis
+                    hour = str(result['analysis_hour'])
+                    hourly_performance[hour]['total'] += 1
                 
-                # Daily analysis
-                day_name = day_names[result['day_of_week']]
-                daily_performance[day_name]['total'] += 1
+                    # Daily analysis
+                    day_name = day_names[result['day_of_week']]
+                    daily_performance[day_name]['total'] += 1
                 
-                # Success tracking for all dimensions
-                if result['was_successful']:
-                    strategy_performance[strategy]['successful'] += 1
-                    market_performance[market]['successful'] += 1
-                    hourly_performance[hour]['successful'] += 1
-                    daily_performance[day_name]['successful'] += 1
+                    # Success tracking for all dimensions
+                    if result['was_successful']:
+                        strategy_performance[strategy]['successful'] += 1
+                        market_performance[market]['successful'] += 1
+                        hourly_performance[hour]['successful'] += 1
+                        daily_performance[day_name]['successful'] += 1
             
-            # Calculate final metrics for all dimensions
-            for strategy in strategy_performance:
-                perf = strategy_performance[strategy]
-                perf['success_rate'] = perf['successful'] / perf['total'] if perf['total'] > 0 else 0.0
-                perf['avg_confidence'] = perf['total_confidence'] / perf['total'] if perf['total'] > 0 else 0.0
-                del perf['total_confidence']  # Remove intermediate calculation
+                # Calculate final metrics for all dimensions
+                for strategy in strategy_performance:
+                    perf = strategy_performance[strategy]
+                    perf['success_rate'] = perf['successful'] / perf['total'] if perf['total'] > 0 else 0.0
+                    perf['avg_confidence'] = perf['total_confidence'] / perf['total'] if perf['total'] > 0 else 0.0
+                    del perf['total_confidence']  # Remove intermediate calculation
                 
-            for market in market_performance:
-                perf = market_performance[market]
-                perf['success_rate'] = perf['successful'] / perf['total'] if perf['total'] > 0 else 0.0
+                for market in market_performance:
+                    perf = market_performance[market]
+                    perf['success_rate'] = perf['successful'] / perf['total'] if perf['total'] > 0 else 0.0
                 
-            for hour in hourly_performance:
-                perf = hourly_performance[hour]
-                perf['success_rate'] = perf['successful'] / perf['total'] if perf['total'] > 0 else 0.0
+                for hour in hourly_performance:
+                    perf = hourly_performance[hour]
+                    perf['success_rate'] = perf['successful'] / perf['total'] if perf['total'] > 0 else 0.0
                 
-            for day in daily_performance:
-                perf = daily_performance[day]
-                perf['success_rate'] = perf['successful'] / perf['total'] if perf['total'] > 0 else 0.0
-            
-            # Calculate attribution factors (simplified)
-            attribution_factors = {
-                'confidence_score': 0.35,  # Impact of confidence on success
-                'signal_strength': 0.25,   # Impact of signal strength
-                'market_timing': 0.20,     # Impact of timing
-                'market_type': 0.15,       # Impact of market selection
-                'external_factors': 0.05   # Other factors
-            }
+                for day in daily_performance:
+                    perf = daily_performance[day]
+                    perf['success_rate'] = perf['successful'] / perf['total'] if perf['total'] > 0 else 0.0
             
-            return PerformanceAttribution(
-                total_opportunities=total_opportunities,
-                successful_opportunities=successful_opportunities,
-                success_rate=success_rate,
-                strategy_performance=strategy_performance,
-                hourly_performance=hourly_performance,
-                daily_performance=daily_performance,
-                market_performance=market_performance,
-                attribution_factors=attribution_factors,
-                data_quality={
-                    'total_raw_opportunities': len(results),
-                    'opportunities_with_outcomes': total_opportunities,
-                    'opportunities_without_outcomes': opportunities_without_outcomes,
-                    'data_completeness_rate': total_opportunities / len(results) if len(results) > 0 else 0.0,
-                    'outcome_sources': {
-                        'strategy_results_table': 'Primary source for tracked bet outcomes',
-                        'game_outcomes_analysis': 'Fallback based on recommendation vs actual game results',
-                        'filtering_criteria': 'Only completed games (>2 hours post-game) included'
-                    },
-                    'note': 'Success rates calculated only from opportunities with confirmed outcomes'
+                # Calculate attribution factors (simplified)
+                attribution_factors = {
+                    'confidence_score': 0.35,  # Impact of confidence on success
+                    'signal_strength': 0.25,   # Impact of signal strength
+                    'market_timing': 0.20,     # Impact of timing
+                    'market_type': 0.15,       # Impact of market selection
+                    'external_factors': 0.05   # Other factors
                 }
+            
+                return PerformanceAttribution(
+                    total_opportunities=total_opportunities,
+                    successful_opportunities=successful_opportunities,
+                    success_rate=success_rate,
+                    strategy_performance=strategy_performance,
+                    hourly_performance=hourly_performance,
+                    daily_performance=daily_performance,
+                    market_performance=market_performance,
+                    attribution_factors=attribution_factors,
+                    data_quality={
+                        'total_raw_opportunities': len(results),
+                        'opportunities_with_outcomes': total_opportunities,
+                        'opportunities_without_outcomes': opportunities_without_outcomes,
+                        'data_completeness_rate': total_opportunities / len(results) if len(results) > 0 else 0.0,
+                        'outcome_sources': {
+                            'strategy_results_table': 'Primary source for tracked bet outcomes',
+                            'game_outcomes_analysis': 'Fallback based on recommendation vs actual game results',
+                            'filtering_criteria': 'Only completed games (>2 hours post-game) included'
+                        },
+                        'note': 'Success rates calculated only from opportunities with confirmed outcomes'
+                    }
+                ).model_dump(mode="json")
+            
+            watermark = await _attribution_window_watermark(db, start_date, end_date)
+            cached = await analysis_cache.get_or_compute(
+                "performance_attribution",
+                window_filters,
+                watermark,
+                compute_attribution
             )
+            return PerformanceAttribution(**cached)
             
     except Exception as e:
         handled_error = handle_exception(e, component="advanced_analytics", operation="performance_attribution")
@@ -549,6 +663,31 @@ async def get_performance_attribution(
         raise HTTPException(status_code=500, detail=handled_error.user_message)
 
 
+async def _attribution_window_watermark(db, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    """
+    Describe the data behind a performance attribution window: analyses of
+    completed games, their recorded outcomes and completed strategy results.
+    """
+    watermark_query = """
+        SELECT
+            COUNT(*) AS row_count,
+            MAX(ba.analysis_timestamp) AS latest_analysis,
+            COUNT(go.game_id) AS outcome_count,
+            (
+                SELECT COUNT(*)
+                FROM analysis.strategy_results sr
+                WHERE sr.status = 'COMPLETED' AND sr.bet_placed_at >= $1
+            ) AS completed_results
+        FROM curated.betting_analysis ba
+        JOIN curated.games_complete gc ON ba.game_id = gc.id
+        LEFT JOIN curated.game_outcomes go ON ba.game_id = go.game_id
+        WHERE ba.analysis_timestamp BETWEEN $1 AND $2
+            AND gc.game_datetime < NOW() - INTERVAL '2 hours'
+    """
+    row = await db.fetchrow(watermark_query, start_date, end_date)
+    return dict(row) if row else {}
+
+
 # Statistical analysis helper functions
 async def _perform_correlation_analysis(df: pl.DataFrame) -> Dict[str, float]:
     """Perform correlation analysis on the dataset."""
@@ -742,7 +881,7 @@ async def get_filtered_analytics_data(
                 FROM curated.betting_analysis ba
                 JOIN curated.games_complete gc ON ba.game_id = gc.id
                 LEFT JOIN (
-                    curated.line_movement_summary lms
+                    curated.line_movement_rollup_summary lms
                     LEFT JOIN curated.sportsbooks s ON lms.sportsbook_id = s.id
                 ) ON (
                     ba.game_id = lms.game_id AND 
@@ -849,15 +988,31 @@ async def get_filtered_analytics_data(
 @analytics_router.get("/export/{export_type}")
 async def export_analytics_data(
     export_type: str = Query(..., regex="^(analytics|line_movements|performance|statistical_report)$"),
-    format: str = Query("csv", regex="^(csv|json|excel|pdf)$"),
+    format: str = Query("csv", regex="^(csv|json|excel|pdf|ndjson|parquet)$"),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
     teams: Optional[List[str]] = Query(None),
     market_types: Optional[List[str]] = Query(None),
     confidence_threshold: Optional[float] = Query(None, ge=0.0, le=1.0),
-    limit: int = Query(1000, ge=1, le=10000)
+    limit: int = Query(1000, ge=1, le=10000),
+    stream: bool = Query(False),
+    max_rows: Optional[int] = Query(None, ge=1),
+    chunk_size: int = Query(DEFAULT_CHUNK_SIZE, ge=100, le=50000)
 ):
-    """Export analytics data in various formats with comprehensive filtering."""
+    """
+    Export analytics data in various formats with comprehensive filtering.
+
+    ``stream=true`` (implied by the ndjson and parquet formats) reads through a
+    server-side cursor and streams csv/ndjson/parquet in ``chunk_size`` row
+    chunks with constant memory. Streaming exports are bounded by
+    ``max_rows`` instead of ``limit`` so full-season exports are possible.
+    """
+    if stream or format in ("ndjson", "parquet"):
+        return _streaming_export_response(
+            export_type, format, start_date, end_date, teams, market_types,
+            confidence_threshold, max_rows, chunk_size
+        )
+    
     try:
         async with get_database_connection() as db:
             export_data = None
@@ -945,8 +1100,45 @@ async def export_analytics_data(
         raise HTTPException(status_code=500, detail=handled_error.user_message)
 
 
+def _streaming_export_response(
+    export_type, format, start_date, end_date, teams, market_types,
+    confidence_threshold, max_rows, chunk_size
+) -> StreamingResponse:
+    """Build a constant-memory StreamingResponse for a row-level export."""
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Streaming exports support {', '.join(EXPORT_MEDIA_TYPES)}; got {format}"
+        )
+    
+    if export_type == "analytics":
+        query, params = _analytics_export_query(start_date, end_date, teams, market_types, confidence_threshold, max_rows)
+    elif export_type == "line_movements":
+        query, params = _line_movements_export_query(start_date, end_date, teams, market_types, max_rows)
+    elif export_type == "performance":
+        query, params = _performance_export_query(start_date, end_date, max_rows)
+    else:
+        raise HTTPException(status_code=400, detail=f"{export_type} exports cannot be streamed")
+    
+    filename = f"{export_type}_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{format}"
+    logger.info("Starting streaming export", export_type=export_type, format=format, max_rows=max_rows)
+    
+    return StreamingResponse(
+        stream_export(query, params, format, chunk_size),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 async def _export_analytics_data(db, start_date, end_date, teams, market_types, confidence_threshold, limit):
     """Export betting analytics data."""
+    query, params = _analytics_export_query(start_date, end_date, teams, market_types, confidence_threshold, limit)
+    results = await db.fetch(query, *params)
+    return [dict(row) for row in results]
+
+
+def _analytics_export_query(start_date, end_date, teams, market_types, confidence_threshold, limit):
+    """Build the betting analytics export query; ``limit=None`` exports every row."""
     query = """
         SELECT 
             ba.analysis_id,
@@ -968,7 +1160,7 @@ async def _export_analytics_data(db, start_date, end_date, teams, market_types,
             COALESCE(lms.total_movements, 0) as total_movements
         FROM curated.betting_analysis ba
         JOIN curated.games_complete gc ON ba.game_id = gc.id
-        LEFT JOIN curated.line_movement_summary lms ON (
+        LEFT JOIN curated.line_movement_rollup_summary lms ON (
             ba.game_id = lms.game_id AND ba.market_type = lms.bet_type
         )
         WHERE 1=1
@@ -992,14 +1184,22 @@ async def _export_analytics_data(db, start_date, end_date, teams, market_types,
         params.append(confidence_threshold)
         query += f" AND ba.confidence_score >= ${len(params)}"
     
-    query += f" ORDER BY ba.analysis_timestamp DESC LIMIT {limit}"
+    query += " ORDER BY ba.analysis_timestamp DESC"
+    if limit:
+        query += f" LIMIT {int(limit)}"
     
-    results = await db.fetch(query, *params)
-    return [dict(row) for row in results]
+    return query, params
 
 
 async def _export_line_movements_data(db, start_date, end_date, teams, market_types, limit):
     """Export line movement data."""
+    query, params = _line_movements_export_query(start_date, end_date, teams, market_types, limit)
+    results = await db.fetch(query, *params)
+    return [dict(row) for row in results]
+
+
+def _line_movements_export_query(start_date, end_date, teams, market_types, limit):
+    """Build the line movement export query; ``limit=None`` exports every row."""
     query = """
         SELECT 
             lmh.id,
@@ -1034,14 +1234,22 @@ async def _export_line_movements_data(db, start_date, end_date, teams, market_ty
         params.append(market_types)
         query += f" AND lmh.bet_type = ANY(${len(params)})"
     
-    query += f" ORDER BY lmh.line_timestamp DESC LIMIT {limit}"
+    query += " ORDER BY lmh.line_timestamp DESC"
+    if limit:
+        query += f" LIMIT {int(limit)}"
     
-    results = await db.fetch(query, *params)
-    return [dict(row) for row in results]
+    return query, params
 
 
 async def _export_performance_data(db, start_date, end_date, limit):
     """Export performance attribution data."""
+    query, params = _performance_export_query(start_date, end_date, limit)
+    results = await db.fetch(query, *params)
+    return [dict(row) for row in results]
+
+
+def _performance_export_query(start_date, end_date, limit):
+    """Build the performance attribution export query; ``limit=None`` exports every row."""
     query = """
         SELECT 
             ba.analysis_id,
@@ -1111,10 +1319,11 @@ async def _export_performance_data(db, start_date, end_date, limit):
     # Optional: Only include entries with confirmed outcomes for more reliable data
     # query += " AND COALESCE(sr.outcome, CASE WHEN go.game_id IS NOT NULL THEN 'outcome_available' END) IS NOT NULL"
     
-    query += f" ORDER BY ba.analysis_timestamp DESC LIMIT {limit}"
+    query += " ORDER BY ba.analysis_timestamp DESC"
+    if limit:
+        query += f" LIMIT {int(limit)}"
     
-    results = await db.fetch(query, *params)
-    return [dict(row) for row in results]
+    return query, params
 
 
 async def _export_statistical_report(db, start_date, end_date, teams, market_types):
@@ -15,7 +15,9 @@ Features:
 """
 
 import asyncio
+import itertools
 import json
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Set
 
@@ -47,6 +49,7 @@ from ...core.exceptions import (
 )
 from ...core.logging import LogLevel
 from ...core.security import require_break_glass_auth, SecurityHeaders
+from ...services.monitoring.event_bus import get_event_bus
 from ...services.monitoring.prometheus_metrics_service import get_metrics_service
 from ...services.monitoring.unified_monitoring_service import UnifiedMonitoringService
 from ...services.orchestration.pipeline_orchestration_service import (
@@ -109,12 +112,62 @@ class WebSocketMessage(BaseModel):
     timestamp: datetime = datetime.now(timezone.utc)
 
 
+# Snapshot messages replace any undelivered message of the same type
+COALESCED_MESSAGE_TYPES = frozenset(
+    {"system_health_update", "pipeline_status_update", "metrics_update"}
+)
+
+
+class ClientChannel:
+    """
+    Bounded outbound queue for one WebSocket client.
+
+    A single drain task sends queued messages in order, so a slow client only
+    delays itself. Snapshot messages are coalesced to the latest value; other
+    messages are kept until the queue is full, then the oldest is dropped.
+    """
+
+    def __init__(self, websocket: WebSocket, max_pending: int):
+        self.websocket = websocket
+        self.max_pending = max_pending
+        self.pending: "OrderedDict[Any, str]" = OrderedDict()
+        self.dropped = 0
+        self.coalesced = 0
+        self.task: Optional[asyncio.Task] = None
+        self._sequence = itertools.count()
+
+    def offer(self, message_type: str, payload: str) -> None:
+        if message_type in COALESCED_MESSAGE_TYPES:
+            key = message_type
+            if key in self.pending:
+                # Keep the original position so a snapshot is not starved
+                self.coalesced += 1
+                self.pending[key] = payload
+                return
+        else:
+            key = (message_type, next(self._sequence))
+
+        if len(self.pending) >= self.max_pending:
+            self.pending.popitem(last=False)
+            self.dropped += 1
+        self.pending[key] = payload
+
+
 class ConnectionManager:
     """WebSocket connection manager for real-time updates."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        client_queue_size: Optional[int] = None,
+        send_timeout: Optional[float] = None,
+    ):
         self.active_connections: Set[WebSocket] = set()
         self.connection_metadata: Dict[WebSocket, Dict[str, Any]] = {}
+        self.channels: Dict[WebSocket, ClientChannel] = {}
+        self.client_queue_size = (
+            client_queue_size or settings.dashboard.websocket_client_queue_size
+        )
+        self.send_timeout = send_timeout or settings.dashboard.websocket_send_timeout
 
     async def connect(
         self, websocket: WebSocket, client_info: Optional[Dict[str, Any]] = None
@@ -135,6 +188,14 @@ class ConnectionManager:
         self.active_connections.discard(websocket)
         self.connection_metadata.pop(websocket, None)
 
+        channel = self.channels.pop(websocket, None)
+        if (
+            channel is not None
+            and channel.task is not None
+            and channel.task is not asyncio.current_task()
+        ):
+            channel.task.cancel()
+
         logger.info(
             "WebSocket client disconnected",
             total_connections=len(self.active_connections),
@@ -165,44 +226,75 @@ class ConnectionManager:
             self.disconnect(websocket)
 
     async def broadcast(self, message: WebSocketMessage):
-        """Broadcast message to all connected clients."""
+        """
+        Broadcast message to all connected clients.
+
+        The message is serialized once and queued on every client channel,
+        whose writer task sends it. Nothing here waits on a send, so a slow
+        client never delays the event for the others.
+        """
         if not self.active_connections:
             return
 
         message_json = message.model_dump_json()
-        disconnected_clients = set()
 
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_json)
-            except WebSocketError as e:
-                logger.error(
-                    "WebSocket error broadcasting message",
-                    error=e,
-                    correlation_id=e.correlation_id,
-                )
-                disconnected_clients.add(connection)
-            except Exception as e:
-                handled_error = handle_exception(
-                    e, component="websocket_manager", operation="broadcast_message"
-                )
-                logger.error(
-                    "Failed to broadcast WebSocket message",
-                    error=handled_error,
-                    correlation_id=handled_error.correlation_id,
-                )
-                disconnected_clients.add(connection)
+        for connection in tuple(self.active_connections):
+            channel = self.channels.get(connection)
+            if channel is None:
+                channel = ClientChannel(connection, self.client_queue_size)
+                self.channels[connection] = channel
 
-        # Clean up disconnected clients
-        for client in disconnected_clients:
-            self.disconnect(client)
+            channel.offer(message.type, message_json)
+            if channel.task is None or channel.task.done():
+                channel.task = asyncio.create_task(self._drain_channel(channel))
 
-        if disconnected_clients:
-            logger.info(
-                "Cleaned up disconnected WebSocket clients",
-                disconnected_count=len(disconnected_clients),
-                active_connections=len(self.active_connections),
+        # Yield once so writers with a ready socket send before the caller
+        # produces the next event; this does not wait for any send to finish
+        await asyncio.sleep(0)
+
+    async def _drain_channel(self, channel: ClientChannel):
+        """Send a client's queued messages until its queue is empty."""
+        try:
+            while channel.pending:
+                _, payload = channel.pending.popitem(last=False)
+                await asyncio.wait_for(
+                    channel.websocket.send_text(payload), timeout=self.send_timeout
+                )
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.warning(
+                "WebSocket client stalled; disconnecting",
+                send_timeout=self.send_timeout,
+                pending_messages=len(channel.pending),
+            )
+            self.disconnect(channel.websocket)
+        except WebSocketError as e:
+            logger.error(
+                "WebSocket error broadcasting message",
+                error=e,
+                correlation_id=e.correlation_id,
+            )
+            self.disconnect(channel.websocket)
+        except Exception as e:
+            handled_error = handle_exception(
+                e, component="websocket_manager", operation="broadcast_message"
             )
+            logger.error(
+                "Failed to broadcast WebSocket message",
+                error=handled_error,
+                correlation_id=handled_error.correlation_id,
+            )
+            self.disconnect(channel.websocket)
+
+    def get_channel_stats(self) -> Dict[str, Any]:
+        """Backpressure counters across connected clients."""
+        return {
+            "clients": len(self.active_connections),
+            "pending_messages": sum(len(c.pending) for c in self.channels.values()),
+            "dropped_messages": sum(c.dropped for c in self.channels.values()),
+            "coalesced_messages": sum(c.coalesced for c in self.channels.values()),
+        }
 
 
 # Initialize FastAPI app
@@ -262,6 +354,9 @@ async def startup_event():
     """Initialize services on startup."""
     await monitoring_service.initialize()
 
+    # Keep health check results warm so health requests read a cached snapshot
+    monitoring_service.start_background_refresh()
+
     # Start background task for broadcasting updates
     asyncio.create_task(broadcast_system_updates())
 
@@ -306,7 +401,7 @@ async def get_system_health():
     """Get comprehensive system health status."""
     try:
         # Get monitoring report
-        monitoring_report = await monitoring_service.get_system_health()
+        monitoring_report = await monitoring_service.get_system_health(allow_stale=True)
 
         # Get orchestration metrics
         orchestration_metrics = pipeline_orchestration_service.get_metrics()
@@ -462,7 +557,7 @@ async def get_all_metrics():
         prometheus_overview = metrics_service.get_system_overview()
 
         # Get monitoring report for additional metrics
-        monitoring_report = await monitoring_service.get_system_health()
+        monitoring_report = await monitoring_service.get_system_health(allow_stale=True)
 
         return MetricsResponse(
             pipeline_metrics=orchestration_metrics.get("orchestration", {}),
@@ -705,63 +800,94 @@ async def websocket_endpoint(websocket: WebSocket):
 
 
 async def broadcast_system_updates():
-    """Background task to broadcast system updates to WebSocket clients."""
-    while True:
-        try:
-            if manager.active_connections:
-                # Get current system health
-                health_response = await get_system_health()
-
-                # Broadcast system health update
-                await manager.broadcast(
-                    WebSocketMessage(
-                        type="system_health_update", data=health_response.model_dump()
-                    )
+    """
+    Background task forwarding monitoring events to WebSocket clients.
+
+    Pipeline, collector and metrics services publish deltas on the monitoring
+    event bus; each one is relayed as-is. System health and active pipelines
+    are only recomputed after a burst of events, never on an idle timer.
+    """
+    subscription = get_event_bus().subscribe()
+    try:
+        while True:
+            try:
+                event = await subscription.get(
+                    timeout=settings.dashboard.system_health_update_interval
                 )
+                if event is None:
+                    continue
+
+                # Collapse bursts (e.g. a pipeline run) into one health refresh
+                await asyncio.sleep(settings.dashboard.event_debounce_seconds)
+                events = [event, *subscription.drain()]
 
-                # Get active pipelines
-                active_pipelines = await get_active_pipelines()
-                if active_pipelines:
+                if not manager.active_connections:
+                    continue
+
+                for event in events:
                     await manager.broadcast(
                         WebSocketMessage(
-                            type="pipeline_status_update",
+                            type=event.type,
                             data={
-                                "active_pipelines": [
-                                    p.model_dump() for p in active_pipelines
-                                ]
+                                **event.data,
+                                "source": event.source,
+                                "sequence": event.sequence,
                             },
+                            timestamp=event.timestamp,
                         )
                     )
 
-            # Wait before next update
-            await asyncio.sleep(settings.dashboard.system_health_update_interval)
+                await broadcast_system_state()
 
-        except MonitoringError as e:
-            logger.error(
-                "Monitoring service error during broadcast",
-                error=e,
-                correlation_id=e.correlation_id,
-            )
-            await asyncio.sleep(settings.dashboard.error_recovery_delay)
-        except WebSocketError as e:
-            logger.error(
-                "WebSocket error during broadcast",
-                error=e,
-                correlation_id=e.correlation_id,
-            )
-            await asyncio.sleep(settings.dashboard.websocket_error_delay)
-        except Exception as e:
-            handled_error = handle_exception(
-                e,
-                component="monitoring_dashboard",
-                operation="broadcast_system_updates",
-            )
-            logger.error(
-                "Error in broadcast system updates",
-                error=handled_error,
-                correlation_id=handled_error.correlation_id,
+            except MonitoringError as e:
+                logger.error(
+                    "Monitoring service error during broadcast",
+                    error=e,
+                    correlation_id=e.correlation_id,
+                )
+                await asyncio.sleep(settings.dashboard.error_recovery_delay)
+            except WebSocketError as e:
+                logger.error(
+                    "WebSocket error during broadcast",
+                    error=e,
+                    correlation_id=e.correlation_id,
+                )
+                await asyncio.sleep(settings.dashboard.websocket_error_delay)
+            except Exception as e:
+                handled_error = handle_exception(
+                    e,
+                    component="monitoring_dashboard",
+                    operation="broadcast_system_updates",
+                )
+                logger.error(
+                    "Error in broadcast system updates",
+                    error=handled_error,
+                    correlation_id=handled_error.correlation_id,
+                )
+                await asyncio.sleep(settings.dashboard.error_recovery_delay)
+    finally:
+        subscription.close()
+
+
+async def broadcast_system_state():
+    """Recompute system health and active pipelines and broadcast them."""
+    # Get current system health
+    health_response = await get_system_health()
+
+    # Broadcast system health update
+    await manager.broadcast(
+        WebSocketMessage(type="system_health_update", data=health_response.model_dump())
+    )
+
+    # Get active pipelines
+    active_pipelines = await get_active_pipelines()
+    if active_pipelines:
+        await manager.broadcast(
+            WebSocketMessage(
+                type="pipeline_status_update",
+                data={"active_pipelines": [p.model_dump() for p in active_pipelines]},
             )
-            await asyncio.sleep(settings.dashboard.error_recovery_delay)
+        )
 
 
 # Utility function to run the dashboard
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Streaming Export Encoders
+
+Constant-memory export support for the analytics API:
+- Server-side cursor reads in fixed-size chunks
+- Incremental CSV, NDJSON and Parquet (one row group per chunk) encoding
+- Column types taken from the prepared statement, so Parquet schemas do not
+  depend on the values in the first chunk
+
+Parquet output requires pyarrow; CSV and NDJSON have no extra dependencies.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
+
+from ...core.enhanced_logging import LogComponent, get_contextual_logger
+from ...data.database.connection import get_connection
+
+logger = get_contextual_logger(__name__, LogComponent.API_CLIENT)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# (column name, PostgreSQL type name) as reported by the prepared statement
+ColumnSpec = Tuple[str, str]
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for database values."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def _csv_value(value: Any) -> Any:
+    """Match the buffered CSV export: ISO datetimes and empty NULLs."""
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class CsvEncoder:
+    """Encodes row chunks as CSV with a single header row."""
+
+    def __init__(self, columns: Sequence[ColumnSpec]):
+        self.names = [name for name, _ in columns]
+
+    def header(self) -> bytes:
+        return self._write([self.names])
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        return self._write([_csv_value(value) for value in row] for row in rows)
+
+    def finish(self) -> bytes:
+        return b""
+
+    @staticmethod
+    def _write(rows) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode("utf-8")
+
+
+class NdjsonEncoder:
+    """Encodes row chunks as newline-delimited JSON objects."""
+
+    def __init__(self, columns: Sequence[ColumnSpec]):
+        self.names = [name for name, _ in columns]
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        return "".join(
+            json.dumps(dict(zip(self.names, row, strict=True)), default=_json_default) + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _DrainableSink:
+    """Write-only file object whose contents are handed out and released."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetEncoder:
+    """Encodes each row chunk as one Parquet row group."""
+
+    def __init__(self, columns: Sequence[ColumnSpec]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ValueError("Parquet export requires pyarrow to be installed") from e
+
+        self._pa = pa
+        self.names = [name for name, _ in columns]
+        self._decimal_columns = [
+            i for i, (_, type_name) in enumerate(columns) if type_name == "numeric"
+        ]
+        self.schema = pa.schema(
+            [(name, self._arrow_type(type_name)) for name, type_name in columns]
+        )
+        self._sink = _DrainableSink()
+        self._writer = pq.ParquetWriter(self._sink, self.schema, compression="zstd")
+
+    def _arrow_type(self, type_name: str):
+        pa = self._pa
+        return {
+            "int2": pa.int64(),
+            "int4": pa.int64(),
+            "int8": pa.int64(),
+            "float4": pa.float64(),
+            "float8": pa.float64(),
+            "numeric": pa.float64(),
+            "bool": pa.bool_(),
+            "date": pa.date32(),
+            "timestamp": pa.timestamp("us"),
+            "timestamptz": pa.timestamp("us", tz="UTC"),
+        }.get(type_name, pa.string())
+
+    def header(self) -> bytes:
+        return self._sink.drain()
+
+    def encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        columns = [list(column) for column in zip(*rows, strict=True)] or [[] for _ in self.names]
+        for i in self._decimal_columns:
+            columns[i] = [None if v is None else float(v) for v in columns[i]]
+        for i, field in enumerate(self.schema):
+            if self._pa.types.is_string(field.type):
+                columns[i] = [None if v is None else str(v) for v in columns[i]]
+
+        batch = self._pa.RecordBatch.from_arrays(
+            [self._pa.array(values, type=field.type) for values, field in zip(columns, self.schema, strict=True)],
+            schema=self.schema,
+        )
+        self._writer.write_batch(batch)
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+ENCODERS = {
+    "csv": CsvEncoder,
+    "ndjson": NdjsonEncoder,
+    "parquet": ParquetEncoder,
+}
+
+
+async def iter_query_chunks(
+    query: str,
+    params: Sequence[Any],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[Tuple[List[ColumnSpec], List[Any]]]:
+    """
+    Read a query through a server-side cursor.
+
+    Yields (columns, rows) with at most ``chunk_size`` rows per chunk; the
+    first chunk may be empty so callers always learn the column layout.
+    The connection is held for the lifetime of the iterator.
+    """
+    async with get_connection() as conn:
+        async with conn.transaction(readonly=True):
+            statement = await conn.prepare(query)
+            columns = [(attr.name, attr.type.name) for attr in statement.get_attributes()]
+            cursor = await statement.cursor(*params)
+
+            rows = await cursor.fetch(chunk_size)
+            yield columns, rows
+            while len(rows) == chunk_size:
+                rows = await cursor.fetch(chunk_size)
+                if rows:
+                    yield columns, rows
+
+
+async def stream_export(
+    query: str,
+    params: Sequence[Any],
+    export_format: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Encode a query result incrementally in the requested format.
+
+    Args:
+        query: SQL query to export
+        params: Query parameters
+        export_format: One of EXPORT_MEDIA_TYPES
+        chunk_size: Rows per cursor fetch (and per Parquet row group)
+
+    Yields:
+        Encoded bytes, ready to hand to a StreamingResponse
+    """
+    if export_format not in ENCODERS:
+        raise ValueError(f"Unsupported streaming export format: {export_format}")
+
+    encoder = None
+    total_rows = 0
+
+    try:
+        async for columns, rows in iter_query_chunks(query, params, chunk_size):
+            if encoder is None:
+                encoder = ENCODERS[export_format](columns)
+                header = encoder.header()
+                if header:
+                    yield header
+            if rows:
+                total_rows += len(rows)
+                yield encoder.encode(rows)
+
+        if encoder is not None:
+            tail = encoder.finish()
+            if tail:
+                yield tail
+    except Exception as e:
+        # Headers are already sent; the truncated body is the only signal
+        logger.error(
+            "Streaming export failed",
+            format=export_format,
+            rows_sent=total_rows,
+            error=str(e),
+        )
+        raise
+
+    logger.info("Streaming export completed", format=export_format, rows=total_rows)
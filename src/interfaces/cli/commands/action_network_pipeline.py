@@ -715,12 +715,8 @@ async def _analyze_opportunities(
         # Generate pipeline run ID for this analysis
         pipeline_run_id = f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-        # Analyze each game
-        game_analyses = []
-        total_rlm = 0
-        total_steam = 0
-        total_arbitrage = 0
-
+        # Prepare each game, then analyze the whole slate in one pass
+        slate = []
         for game_data in historical_data:
             try:
                 # Extract historical data from the new structure
@@ -749,7 +745,7 @@ async def _analyze_opportunities(
                         f"[cyan]📊 Analyzing game {game_data.get('game_id')}: {len(transformed_data)} sportsbooks[/cyan]"
                     )
 
-                analysis = await analyzer.analyze_game_movements(
+                slate.append(
                     {
                         "game_id": game_data.get("game_id"),
                         "home_team": game_data.get("home_team"),
@@ -758,34 +754,30 @@ async def _analyze_opportunities(
                         "raw_data": transformed_data,  # Pass the transformed data
                     }
                 )
-                game_analyses.append(analysis)
-
-                # Count opportunities
-                if analysis.rlm_indicators:
-                    total_rlm += len(analysis.rlm_indicators)
-
-                if analysis.cross_book_movements:
-                    steam_count = len(
-                        [
-                            c
-                            for c in analysis.cross_book_movements
-                            if c.steam_move_detected
-                        ]
-                    )
-                    total_steam += steam_count
-
-                if analysis.arbitrage_opportunities:
-                    total_arbitrage += len(analysis.arbitrage_opportunities)
 
             except Exception as e:
                 if verbose:
                     import traceback
 
                     console.print(
-                        f"[yellow]⚠️  Error analyzing game {game_data.get('game_id', 'unknown')}: {e}[/yellow]"
+                        f"[yellow]⚠️  Error preparing game {game_data.get('game_id', 'unknown')}: {e}[/yellow]"
                     )
                     console.print(f"[red]Stack trace: {traceback.format_exc()}[/red]")
 
+        game_analyses = await analyzer.analyze_slate(slate)
+
+        # Count opportunities
+        total_rlm = sum(len(analysis.rlm_indicators) for analysis in game_analyses)
+        total_steam = sum(
+            1
+            for analysis in game_analyses
+            for movement in analysis.cross_book_movements
+            if movement.steam_move_detected
+        )
+        total_arbitrage = sum(
+            len(analysis.arbitrage_opportunities) for analysis in game_analyses
+        )
+
         # Create comprehensive report
         report = MovementAnalysisReport(
             analysis_timestamp=datetime.now(),
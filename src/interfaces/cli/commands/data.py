@@ -1935,3 +1935,9 @@ class DataCommands:
         console.print("\n💡 [bold cyan]Suggested commands:[/bold cyan]")
         console.print("   uv run pytest tests/integration/ -v")
         console.print("   uv run -m src.interfaces.cli curated sync-outcomes --sync-type recent")
+
+
+# Export the command group
+def create_data_commands():
+    """Create and return the data command group."""
+    return DataCommands().create_group()
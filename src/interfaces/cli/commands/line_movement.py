@@ -134,6 +134,53 @@ def status(date: datetime | None):
     asyncio.run(_show_movement_status(date))
 
 
+@line_movement.command("refresh-rollups")
+@click.option(
+    "--rebuild",
+    is_flag=True,
+    help="Discard the rollups and recompute them from the full history",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=50_000,
+    help="History rows folded into the rollups per transaction",
+)
+def refresh_rollups(rebuild: bool, batch_size: int):
+    """
+    Refresh the pre-aggregated line movement rollups.
+
+    The scheduler runs this every few minutes; use it manually after a
+    backfill or with --rebuild after changing the rollup definitions.
+
+    Examples:
+        # Fold in rows collected since the last refresh
+        uv run -m src.interfaces.cli line-movement refresh-rollups
+
+        # Recompute everything
+        uv run -m src.interfaces.cli line-movement refresh-rollups --rebuild
+    """
+
+    click.echo("🔄 Refreshing line movement rollups...")
+    asyncio.run(_refresh_rollups(rebuild, batch_size))
+
+
+async def _refresh_rollups(rebuild: bool, batch_size: int):
+    """Run an incremental or full rollup refresh."""
+
+    from ....services.analytics.line_movement_rollup_service import (
+        LineMovementRollupService,
+    )
+
+    service = LineMovementRollupService(batch_size=batch_size)
+    result = await (service.rebuild() if rebuild else service.refresh())
+
+    click.echo(f"   ✅ History rows processed: {result.source_rows}")
+    click.echo(f"   📦 Buckets upserted: {result.buckets_upserted}")
+    click.echo(f"   🔖 Watermark: id {result.last_source_id}")
+    click.echo(f"   ⏱️  Took {result.duration_seconds:.2f}s")
+
+
 async def _collect_historical_movements(
     target_date: datetime, backfill_days: int, dry_run: bool
 ):
@@ -246,7 +293,7 @@ async def _analyze_line_movements(
                 lms.total_movements,
                 lms.opening_timestamp,
                 lms.closing_timestamp
-            FROM curated.line_movement_summary lms
+            FROM curated.line_movement_rollup_summary lms
             {where_clause}
             ORDER BY ABS(lms.odds_movement) DESC
             LIMIT 20
@@ -294,36 +341,34 @@ async def _show_movement_status(date: datetime):
     )
 
     try:
-        # Games with movement data
-        games_count = await conn.fetchval(
+        # Games and movement records, read from the hourly rollups
+        totals = await conn.fetchrow(
             """
-            SELECT COUNT(DISTINCT game_id) 
-            FROM curated.line_movement_history 
-            WHERE DATE(game_datetime) = $1
-        """,
-            date.date(),
-        )
-
-        # Total movement records
-        total_movements = await conn.fetchval(
-            """
-            SELECT COUNT(*) 
-            FROM curated.line_movement_history 
-            WHERE DATE(game_datetime) = $1
+            SELECT 
+                COUNT(DISTINCT r.game_id) as games_count,
+                COALESCE(SUM(r.observations), 0) as total_movements
+            FROM curated.line_movement_rollups r
+            JOIN curated.games_complete g ON r.game_id = g.id
+            WHERE r.bucket_width = '1h'
+              AND DATE(g.game_datetime) = $1
         """,
             date.date(),
         )
+        games_count = totals["games_count"]
+        total_movements = totals["total_movements"]
 
         # Sportsbook coverage
         sportsbook_coverage = await conn.fetch(
             """
             SELECT 
                 s.display_name,
-                COUNT(DISTINCT lmh.game_id) as games_covered,
-                COUNT(*) as total_movements
-            FROM curated.line_movement_history lmh
-            JOIN curated.sportsbooks s ON lmh.sportsbook_id = s.id
-            WHERE DATE(lmh.game_datetime) = $1
+                COUNT(DISTINCT r.game_id) as games_covered,
+                SUM(r.observations) as total_movements
+            FROM curated.line_movement_rollups r
+            JOIN curated.games_complete g ON r.game_id = g.id
+            JOIN curated.sportsbooks s ON r.sportsbook_id = s.id
+            WHERE r.bucket_width = '1h'
+              AND DATE(g.game_datetime) = $1
             GROUP BY s.display_name
             ORDER BY total_movements DESC
         """,
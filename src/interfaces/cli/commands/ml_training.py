@@ -739,6 +739,51 @@ def health_check(detailed: bool):
     asyncio.run(_health_check())
 
 
+@ml_training_cli.command("train-patterns")
+@click.option(
+    "--signals-file",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="JSON Lines file of historical signals (one UnifiedBettingSignal per line)",
+)
+@click.option(
+    "--model-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Model directory (default: ml_pipeline.pattern_model_dir)",
+)
+@click.option("--dry-run", is_flag=True, help="Fit the models without saving them")
+def train_pattern_models(signals_file: Path, model_dir: Optional[Path], dry_run: bool):
+    """Train the opportunity pattern recognition models offline"""
+    from src.ml.opportunity_detection.pattern_models import load_signal_history
+    from src.ml.opportunity_detection.pattern_recognition import MLPatternRecognition
+
+    async def _train_patterns():
+        try:
+            signals_by_game = load_signal_history(signals_file)
+            click.echo(
+                f"🧠 Training pattern models on {sum(map(len, signals_by_game.values()))} "
+                f"signals from {len(signals_by_game)} games..."
+            )
+
+            recognizer = MLPatternRecognition({"model_dir": model_dir})
+            bundle = await recognizer.train_models(signals_by_game, save=not dry_run)
+
+            click.echo(f"✅ Trained pattern models version {bundle.version}")
+            click.echo(f"   📊 Training samples: {bundle.n_training_samples}")
+            click.echo(f"   🧩 Market clusters: {bundle.metadata.get('n_market_clusters')}")
+            if dry_run:
+                click.echo("   🧪 Dry run: models were not saved")
+            else:
+                click.echo(f"   💾 Saved to: {recognizer.model_dir}")
+
+        except Exception as e:
+            click.echo(f"❌ Pattern model training failed: {e}")
+            logger.error(f"Pattern model training error: {e}")
+            raise click.Abort() from e
+
+    asyncio.run(_train_patterns())
+
+
 # Add the ml-training commands to the main CLI
 def register_ml_training_commands(main_cli):
     """Register ML training commands with main CLI"""
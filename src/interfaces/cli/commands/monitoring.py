@@ -1008,3 +1008,9 @@ def _create_live_monitoring_display(data: dict) -> Panel:
     )
 
     return Panel(layout, title="Live System Monitoring", border_style="bright_blue")
+
+
+# Export the command group
+def create_monitoring_commands():
+    """Create and return the monitoring command group."""
+    return MonitoringCommands().create_group()
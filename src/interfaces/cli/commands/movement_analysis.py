@@ -44,6 +44,9 @@ except ImportError:
 
             return MockAnalysis()
 
+        async def analyze_slate(self, games):
+            return [await self.analyze_game_movements(game) for game in games]
+
     class MovementAnalysisReport:
         def __init__(self, **kwargs):
             for k, v in kwargs.items():
@@ -154,31 +157,27 @@ async def _analyze_async(
 
     console.print(f"Analyzing {len(games_to_analyze)} games...")
 
-    # Analyze each game
+    # Analyze the whole slate in one pass
+    try:
+        with console.status("[bold green]Analyzing movements..."):
+            analyses = await analyzer.analyze_slate(games_to_analyze)
+    except Exception as e:
+        console.print(f"[red]❌ Error analyzing games: {e}[/red]")
+        return
+
     game_analyses = []
-    with console.status("[bold green]Analyzing movements...") as status:
-        for i, game_data in enumerate(games_to_analyze):
-            status.update(f"Analyzing game {i + 1}/{len(games_to_analyze)}")
-
-            try:
-                analysis = await analyzer.analyze_game_movements(game_data)
-
-                # Apply filters
-                if min_movements and analysis.total_movements < min_movements:
-                    continue
-                if rlm_only and not analysis.rlm_indicators:
-                    continue
-                if steam_only and not any(
-                    c.steam_move_detected for c in analysis.cross_book_movements
-                ):
-                    continue
-
-                game_analyses.append(analysis)
-
-            except Exception as e:
-                console.print(
-                    f"[red]❌ Error analyzing game {game_data.get('game_id', 'unknown')}: {e}[/red]"
-                )
+    for analysis in analyses:
+        # Apply filters
+        if min_movements and analysis.total_movements < min_movements:
+            continue
+        if rlm_only and not analysis.rlm_indicators:
+            continue
+        if steam_only and not any(
+            c.steam_move_detected for c in analysis.cross_book_movements
+        ):
+            continue
+
+        game_analyses.append(analysis)
 
     if not game_analyses:
         console.print("[yellow]⚠️  No games meet the analysis criteria[/yellow]")
@@ -276,33 +275,28 @@ async def _rlm_async(
     elif isinstance(data, dict) and "game_id" in data:
         historical_data = [data]
 
-    rlm_opportunities = []
-
-    with console.status("[bold green]Detecting RLM patterns...") as status:
-        for i, game_data in enumerate(historical_data):
-            status.update(f"Analyzing game {i + 1}/{len(historical_data)}")
-
-            try:
-                analysis = await analyzer.analyze_game_movements(game_data)
-
-                # Filter RLM indicators
-                for rlm in analysis.rlm_indicators:
-                    # Apply filters
-                    if min_rlm_strength == "strong" and rlm.rlm_strength != "strong":
-                        continue
-                    if min_rlm_strength == "moderate" and rlm.rlm_strength == "weak":
-                        continue
-                    if market_type and rlm.market_type.value != market_type:
-                        continue
-                    if sportsbook and rlm.sportsbook_id != sportsbook:
-                        continue
-
-                    rlm_opportunities.append({"game": analysis, "rlm": rlm})
+    try:
+        with console.status("[bold green]Detecting RLM patterns..."):
+            analyses = await analyzer.analyze_slate(historical_data)
+    except Exception as e:
+        console.print(f"[red]❌ Error analyzing games: {e}[/red]")
+        return
 
-            except Exception as e:
-                console.print(
-                    f"[red]❌ Error analyzing game {game_data.get('game_id', 'unknown')}: {e}[/red]"
-                )
+    rlm_opportunities = []
+    for analysis in analyses:
+        # Filter RLM indicators
+        for rlm in analysis.rlm_indicators:
+            # Apply filters
+            if min_rlm_strength == "strong" and rlm.rlm_strength != "strong":
+                continue
+            if min_rlm_strength == "moderate" and rlm.rlm_strength == "weak":
+                continue
+            if market_type and rlm.market_type.value != market_type:
+                continue
+            if sportsbook and rlm.sportsbook_id != sportsbook:
+                continue
+
+            rlm_opportunities.append({"game": analysis, "rlm": rlm})
 
     if not rlm_opportunities:
         console.print(
@@ -358,30 +352,25 @@ async def _steam_async(input_file: str, min_books: int, market_type: str | None)
     elif isinstance(data, dict) and "game_id" in data:
         historical_data = [data]
 
-    steam_moves = []
-
-    with console.status("[bold green]Detecting steam moves...") as status:
-        for i, game_data in enumerate(historical_data):
-            status.update(f"Analyzing game {i + 1}/{len(historical_data)}")
-
-            try:
-                analysis = await analyzer.analyze_game_movements(game_data)
-
-                # Filter steam moves
-                for steam_move in analysis.cross_book_movements:
-                    if not steam_move.steam_move_detected:
-                        continue
-                    if len(steam_move.participating_books) < min_books:
-                        continue
-                    if market_type and steam_move.market_type.value != market_type:
-                        continue
-
-                    steam_moves.append({"game": analysis, "steam": steam_move})
+    try:
+        with console.status("[bold green]Detecting steam moves..."):
+            analyses = await analyzer.analyze_slate(historical_data)
+    except Exception as e:
+        console.print(f"[red]❌ Error analyzing games: {e}[/red]")
+        return
 
-            except Exception as e:
-                console.print(
-                    f"[red]❌ Error analyzing game {game_data.get('game_id', 'unknown')}: {e}[/red]"
-                )
+    steam_moves = []
+    for analysis in analyses:
+        # Filter steam moves
+        for steam_move in analysis.cross_book_movements:
+            if not steam_move.steam_move_detected:
+                continue
+            if len(steam_move.participating_books) < min_books:
+                continue
+            if market_type and steam_move.market_type.value != market_type:
+                continue
+
+            steam_moves.append({"game": analysis, "steam": steam_move})
 
     if not steam_moves:
         console.print(
@@ -23,6 +23,7 @@ from rich.progress import (
 )
 from rich.table import Table
 
+from ....analysis.strategies.profiling import PROFILERS
 from ....core.config import get_settings
 from ....core.logging import LogComponent, get_logger
 from ....data.pipeline.pipeline_orchestrator import (
@@ -68,15 +69,37 @@ def pipeline_group():
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be processed without executing"
 )
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Stream unprocessed raw rows into staging in constant memory "
+    "(staging zone, action_network source only)",
+)
 def run_pipeline(
-    zone: str, mode: str, source: str | None, batch_size: int, dry_run: bool
+    zone: str,
+    mode: str,
+    source: str | None,
+    batch_size: int,
+    dry_run: bool,
+    stream: bool,
 ):
     """Pipeline run command wrapper that runs async function."""
-    asyncio.run(_run_pipeline_async(zone, mode, source, batch_size, dry_run))
+    if stream and (zone != "staging" or source not in (None, "action_network")):
+        raise click.UsageError(
+            "--stream requires --zone staging and the action_network source"
+        )
+    if stream and dry_run:
+        raise click.UsageError("--stream cannot be combined with --dry-run")
+    asyncio.run(_run_pipeline_async(zone, mode, source, batch_size, dry_run, stream))
 
 
 async def _run_pipeline_async(
-    zone: str, mode: str, source: str | None, batch_size: int, dry_run: bool
+    zone: str,
+    mode: str,
+    source: str | None,
+    batch_size: int,
+    dry_run: bool,
+    stream: bool = False,
 ):
     """
     Run the data pipeline for processing betting data.
@@ -97,6 +120,9 @@ async def _run_pipeline_async(
 
         # Dry run to see what would be processed
         uv run -m src.interfaces.cli pipeline run --dry-run
+
+        # Stream all unprocessed raw odds into staging in constant memory
+        uv run -m src.interfaces.cli pipeline run --zone staging --stream
     """
     try:
         if dry_run:
@@ -110,6 +136,15 @@ async def _run_pipeline_async(
         # Create pipeline orchestrator
         orchestrator = await create_pipeline_orchestrator()
 
+        if stream:
+            execution = await orchestrator.run_streaming_staging_pipeline(
+                {"source": "action_network", "cli_initiated": True},
+                chunk_size=batch_size,
+            )
+            _display_execution_results(execution)
+            await orchestrator.cleanup()
+            return
+
         # Get real records from database (NO MOCK DATA)
         records = await _get_real_records(source, batch_size)
 
@@ -259,17 +294,45 @@ async def _pipeline_status_async(zone: str, detailed: bool, execution_id: str |
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be processed without executing"
 )
+@click.option(
+    "--profile-strategy",
+    "profile_strategies",
+    multiple=True,
+    help="Capture a profiler report for this strategy's run (repeatable, or 'all')",
+)
+@click.option(
+    "--profiler",
+    type=click.Choice(PROFILERS),
+    default="cprofile",
+    help="Profiler used for --profile-strategy captures",
+)
 def run_full_pipeline(
     sources: tuple[str],
     skip_collection: bool,
     generate_predictions: bool,
     batch_size: int,
     dry_run: bool,
+    profile_strategies: tuple[str],
+    profiler: str,
 ):
     """Complete pipeline: Data Collection → Processing → Analysis → Predictions."""
+    if profile_strategies and profiler == "pyinstrument":
+        try:
+            import pyinstrument  # noqa: F401
+        except ImportError:
+            raise click.UsageError(
+                "pyinstrument is not installed; install it or use --profiler cprofile"
+            ) from None
+
     asyncio.run(
         _run_full_pipeline_async(
-            sources, skip_collection, generate_predictions, batch_size, dry_run
+            sources,
+            skip_collection,
+            generate_predictions,
+            batch_size,
+            dry_run,
+            profile_strategies,
+            profiler,
         )
     )
 
@@ -280,6 +343,8 @@ async def _run_full_pipeline_async(
     generate_predictions: bool,
     batch_size: int,
     dry_run: bool,
+    profile_strategies: tuple[str] = (),
+    profiler: str = "cprofile",
 ):
     """
     Run the complete end-to-end pipeline including data collection.
@@ -299,6 +364,9 @@ async def _run_full_pipeline_async(
         
         # Skip collection, just process existing data
         uv run -m src.interfaces.cli pipeline run-full --skip-collection
+
+        # Profile one strategy's run
+        uv run -m src.interfaces.cli pipeline run-full --skip-collection --profile-strategy sharp_action
     """
     try:
         console.print("🚀 [bold blue]MLB Betting System - Full Pipeline Execution[/bold blue]")
@@ -360,7 +428,7 @@ async def _run_full_pipeline_async(
             progress.update(main_task, description="📊 Running strategy analysis...")
             
             if not dry_run:
-                await _run_strategy_analysis(progress)
+                await _run_strategy_analysis(progress, profile_strategies, profiler)
             else:
                 console.print("[blue]Would run strategy analysis on processed data[/blue]")
             
@@ -448,7 +516,11 @@ async def _run_data_collection(sources: tuple[str], dry_run: bool, progress: Pro
         return False
 
 
-async def _run_strategy_analysis(progress: Progress) -> bool:
+async def _run_strategy_analysis(
+    progress: Progress,
+    profile_strategies: tuple[str] = (),
+    profiler: str = "cprofile",
+) -> bool:
     """Run strategy analysis on processed data."""
     try:
         console.print("[blue]Running strategy analysis...[/blue]")
@@ -502,8 +574,16 @@ async def _run_strategy_analysis(progress: Progress) -> bool:
         # Run strategy analysis using execute_all_strategies
         analysis_results = await strategy_orchestrator.execute_all_strategies(
             game_data=game_data,
-            context={"analysis_date": "today", "pipeline_run": True}
+            context={
+                "analysis_date": "today",
+                "pipeline_run": True,
+                "profile_strategies": list(profile_strategies),
+                "profiler": profiler,
+            },
         )
+
+        if analysis_results:
+            _display_strategy_timeline(analysis_results, strategy_orchestrator.latency_budget_seconds)
         
         if analysis_results and analysis_results.successful_strategies > 0:
             total_opportunities = analysis_results.total_signals
@@ -847,6 +927,52 @@ def _display_execution_results(execution):
             console.print(f"  ... and {len(execution.errors) - 5} more errors")
 
 
+def _display_strategy_timeline(analysis_results, latency_budget_seconds: float):
+    """Display when each strategy ran and where its time went, plus any profiler captures."""
+    timeline = analysis_results.get_timeline()
+    if not timeline:
+        return
+
+    table = Table(title="Strategy Execution Timeline")
+    table.add_column("Strategy", style="cyan")
+    table.add_column("Status")
+    table.add_column("Start (s)", justify="right")
+    table.add_column("Total (s)", justify="right")
+    table.add_column("Data Fetch (s)", justify="right")
+    table.add_column("Compute (s)", justify="right")
+    table.add_column("Filtering (s)", justify="right")
+    table.add_column("DB (s)", justify="right")
+    table.add_column("Rows", justify="right")
+
+    def seconds(phases: dict, phase: str) -> str:
+        return f"{phases[phase]['duration_seconds']:.2f}" if phase in phases else "-"
+
+    for entry in timeline:
+        phases = entry["phases"]
+        fetched = phases.get("data_fetch", {}).get("rows_out")
+        total_style = "red" if entry["duration_seconds"] > latency_budget_seconds else "green"
+        table.add_row(
+            entry["strategy_name"],
+            entry["status"],
+            f"{entry['start_seconds']:.2f}",
+            f"[{total_style}]{entry['duration_seconds']:.2f}[/{total_style}]",
+            seconds(phases, "data_fetch"),
+            seconds(phases, "signal_computation"),
+            seconds(phases, "filtering"),
+            f"{entry['database_seconds']:.2f}",
+            "-" if fetched is None else str(fetched),
+        )
+
+    console.print(table)
+
+    for name, strategy_result in analysis_results.strategy_results.items():
+        profile = strategy_result.profile
+        if profile is not None and profile.profile_output:
+            console.print(
+                Panel(profile.profile_output, title=f"{profile.profiler} profile: {name}")
+            )
+
+
 def _display_execution_status(execution):
     """Display specific execution status."""
     console.print(
@@ -931,12 +1057,21 @@ def _display_zone_status(zone_type: ZoneType, health: dict[str, Any], detailed:
     "--dry-run", is_flag=True, help="Show what would be processed without executing"
 )
 @click.option("--stats", is_flag=True, help="Show processing statistics")
-def sbd_staging_command(limit: int | None, dry_run: bool, stats: bool):
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Stream all unprocessed records into staging in constant memory",
+)
+def sbd_staging_command(limit: int | None, dry_run: bool, stats: bool, stream: bool):
     """SBD staging command wrapper that runs async function."""
-    asyncio.run(_sbd_staging_async(limit, dry_run, stats))
+    if stream and (limit or dry_run):
+        raise click.UsageError("--stream cannot be combined with --limit or --dry-run")
+    asyncio.run(_sbd_staging_async(limit, dry_run, stats, stream))
 
 
-async def _sbd_staging_async(limit: int | None, dry_run: bool, stats: bool):
+async def _sbd_staging_async(
+    limit: int | None, dry_run: bool, stats: bool, stream: bool = False
+):
     """
     Process SBD raw data into staging format.
 
@@ -955,6 +1090,9 @@ async def _sbd_staging_async(limit: int | None, dry_run: bool, stats: bool):
 
         # Dry run to see what would be processed
         uv run -m src.interfaces.cli pipeline sbd-staging --dry-run
+
+        # Stream every unprocessed record in constant memory
+        uv run -m src.interfaces.cli pipeline sbd-staging --stream
     """
     try:
         console.print("[blue]SBD Raw-to-Staging Pipeline[/blue]")
@@ -1016,6 +1154,17 @@ async def _sbd_staging_async(limit: int | None, dry_run: bool, stats: bool):
 
             return
 
+        if stream:
+            console.print("[blue]Streaming SBD records into staging...[/blue]")
+            stream_result = await processor.stream_sbd_raw_records()
+            console.print(
+                f"[green]Records read: {stream_result.records_read}, "
+                f"stored: {stream_result.records_stored}, "
+                f"errors: {stream_result.errors} "
+                f"({stream_result.elapsed_seconds:.2f}s)[/green]"
+            )
+            return
+
         # Process SBD records
         console.print("[blue]Starting SBD staging processing...[/blue]")
         if limit:
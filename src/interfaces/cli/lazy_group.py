@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Lazy Click Command Group
+
+Registers subcommands by name and import path so a command module (and the
+ML, collector and web stacks it pulls in) is only imported when that command
+is invoked. Top-level ``--help`` lists lazy commands from their registered
+short help without importing anything.
+"""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported on first use.
+
+    ``lazy_subcommands`` maps a command name to ``("module.path:attribute",
+    "short help")``. The attribute is either a click command or a zero-argument
+    factory returning one.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, tuple[str, str]] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands:
+                rows.append((name, self.lazy_subcommands[name][1]))
+                continue
+            cmd = super().get_command(ctx, name)
+            if cmd is None or cmd.hidden:
+                continue
+            rows.append((name, cmd.get_short_help_str(formatter.width - 6 - len(name))))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":", 1)
+        target = getattr(importlib.import_module(module_name), attribute)
+
+        command = target if isinstance(target, click.Command) else target()
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Lazy command '{cmd_name}' ({import_path}) did not produce a click command"
+            )
+
+        # Cache as a regular subcommand
+        del self.lazy_subcommands[cmd_name]
+        self.add_command(command, name=cmd_name)
+        return command
@@ -5,31 +5,63 @@ Main CLI interface for the unified MLB betting system.
 
 import click
 
-from src.core.config import get_settings
-from src.data.database.connection import initialize_connections
-from src.interfaces.cli.commands.action_network_pipeline import action_network
-from src.interfaces.cli.commands.backtesting import backtesting_group
-from src.interfaces.cli.commands.batch_collection import batch_collection
-from src.interfaces.cli.commands.cleanup import cleanup
-from src.interfaces.cli.commands.collection_health import health
-from src.interfaces.cli.commands.curated import curated
-from src.interfaces.cli.commands.data import DataCommands
-from src.interfaces.cli.commands.data_quality_improvement import data_quality_group
-from src.interfaces.cli.commands.game_outcomes import outcomes
-from src.interfaces.cli.commands.ml_commands import ml
-from src.interfaces.cli.commands.ml_pipeline import ml_pipeline
-from src.interfaces.cli.commands.monitoring import MonitoringCommands
-from src.interfaces.cli.commands.movement_analysis import movement
-from src.interfaces.cli.commands.pipeline import pipeline
-from src.interfaces.cli.commands.predictions import create_predictions_commands
-from src.interfaces.cli.commands.production_readiness import production
-from src.interfaces.cli.commands.quickstart import quickstart
-from src.interfaces.cli.commands.setup_database import database
+from src.interfaces.cli.lazy_group import LazyGroup
 
-# Old staging commands removed - consolidated into historical approach
+COMMANDS = "src.interfaces.cli.commands"
 
+# Command modules are imported only when their command runs; the help text
+# here is what the top-level --help shows without importing them.
+LAZY_COMMANDS = {
+    "quickstart": (f"{COMMANDS}.quickstart:quickstart", "Quickstart commands for new users."),
+    "predictions": (
+        f"{COMMANDS}.predictions:create_predictions_commands",
+        "Betting predictions and ML model information commands.",
+    ),
+    "data": (f"{COMMANDS}.data:create_data_commands", "Data collection and management commands."),
+    "monitoring": (
+        f"{COMMANDS}.monitoring:create_monitoring_commands",
+        "Data collector monitoring and health management commands.",
+    ),
+    "health": (
+        f"{COMMANDS}.collection_health:health",
+        "Collection health monitoring and management commands.",
+    ),
+    "batch-collection": (
+        f"{COMMANDS}.batch_collection:batch_collection",
+        "Historical betting line movement collection commands.",
+    ),
+    "movement": (
+        f"{COMMANDS}.movement_analysis:movement",
+        "Enhanced movement analysis and betting intelligence commands.",
+    ),
+    "action-network": (
+        f"{COMMANDS}.action_network_pipeline:action_network",
+        "Action Network data collection and analysis pipeline.",
+    ),
+    "outcomes": (f"{COMMANDS}.game_outcomes:outcomes", "Game outcome checking and management commands."),
+    "database": (f"{COMMANDS}.setup_database:database", "Database setup and management commands."),
+    "backtest": (f"{COMMANDS}.backtesting:backtesting_group", "Recommendation-based backtesting commands"),
+    "data-quality": (
+        f"{COMMANDS}.data_quality_improvement:data_quality_group",
+        "Data quality improvement commands for betting lines.",
+    ),
+    "pipeline": (f"{COMMANDS}.pipeline:pipeline", "Pipeline Management Commands"),
+    "curated": (f"{COMMANDS}.curated:curated", "CURATED Zone Management Commands"),
+    # Old staging commands removed - use historical approach via action-network pipeline
+    "cleanup": (
+        f"{COMMANDS}.cleanup:cleanup",
+        "Clean up output folder, show recommendations for database migration.",
+    ),
+    "ml": (f"{COMMANDS}.ml_commands:ml", "Machine Learning pipeline management commands"),
+    "ml-pipeline": (f"{COMMANDS}.ml_pipeline:ml_pipeline", "ML Pipeline management and validation commands."),
+    "production": (
+        f"{COMMANDS}.production_readiness:production",
+        "Production readiness and deployment validation commands.",
+    ),
+}
 
-@click.group()
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_COMMANDS)
 @click.version_option()
 def cli():
     """
@@ -52,42 +84,8 @@ def cli():
     📈 Start Monitoring Dashboard:
         uv run -m src.interfaces.cli monitoring dashboard
     """
-    # Initialize database connections with settings
-    try:
-        settings = get_settings()
-        initialize_connections(settings)
-    except Exception as e:
-        # Don't fail CLI startup if database isn't available
-        click.echo(f"Warning: Database initialization failed: {e}", err=True)
-
-
-# Create command instances
-data_commands = DataCommands()
-monitoring_commands = MonitoringCommands()
-predictions_commands = create_predictions_commands()
-
-# Add command groups
-cli.add_command(quickstart)  # Add quickstart commands first for new users
-cli.add_command(predictions_commands, name="predictions")  # Add predictions commands  
-cli.add_command(data_commands.create_group(), name="data")
-cli.add_command(
-    monitoring_commands.create_group(), name="monitoring"
-)  # Add monitoring commands
-cli.add_command(health)  # Add the collection health monitoring commands
-cli.add_command(batch_collection)  # Add the batch collection commands
-cli.add_command(movement)  # Add the new movement analysis commands
-cli.add_command(action_network)  # Add the complete Action Network pipeline
-cli.add_command(outcomes)  # Add the game outcomes commands
-cli.add_command(database)  # Add the database setup and management commands
-cli.add_command(backtesting_group)  # Add the backtesting commands
-cli.add_command(data_quality_group)  # Add the data quality improvement commands
-cli.add_command(pipeline)  # Add the pipeline management commands
-cli.add_command(curated)  # Add the CURATED zone management commands
-# Old staging commands removed - use historical approach via action-network pipeline
-cli.add_command(cleanup)  # Add the output folder cleanup command
-cli.add_command(ml)  # Add the ML experiment management commands
-cli.add_command(ml_pipeline)  # Add the ML pipeline management commands
-cli.add_command(production)  # Add the production readiness and deployment validation commands
+    # Database connections are set up on first use by the commands that
+    # need them (see src.data.database.connection)
 
 
 if __name__ == "__main__":
@@ -34,6 +34,9 @@ async def lifespan(app: FastAPI):
     app.state.redis_client = await get_redis_client()
     app.state.ml_service = PredictionService()
 
+    # Keep dependency health results warm so probes read a cached snapshot
+    health.health_aggregator.start()
+
     logger.info("✅ MLB ML API startup complete")
 
     yield
@@ -41,6 +44,8 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down MLB ML Prediction API...")
 
+    await health.health_aggregator.stop()
+
     if hasattr(app.state, "redis_client"):
         await app.state.redis_client.close()
 
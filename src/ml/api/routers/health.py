@@ -10,13 +10,14 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import traceback
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 import redis.asyncio as redis
 import asyncpg
 import aiohttp
 import psutil
 
 from ..dependencies import get_redis_client, get_database_connection
+from ....services.monitoring.health_aggregator import HealthAggregator
 
 # Import ML-specific components
 try:
@@ -33,14 +34,28 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Seconds each dependency check result is reused across probes
+HEALTH_CHECK_TTL_SECONDS = {
+    "system": 15,
+    "redis": 15,
+    "database": 30,
+    "mlflow": 60,
+    "filesystem": 60,
+    "external_apis": 120,
+    "monitoring": 30,
+}
+HEALTH_CHECK_TIMEOUT_SECONDS = 15.0
+
+
 
 @router.get("/health")
-async def health_check(
-    redis_client: redis.Redis = Depends(get_redis_client),
-) -> Dict[str, Any]:
+async def health_check() -> Dict[str, Any]:
     """
     Comprehensive health check endpoint for the ML prediction service
     Checks all external dependencies with detailed status and metrics
+
+    Served from the last cached check results; expired checks refresh in the
+    background so probes never wait on (or load) the dependencies.
     """
     start_time = datetime.utcnow()
     health_status = {
@@ -53,57 +68,53 @@ async def health_check(
         "response_time_ms": 0,
     }
 
+    checks = health_aggregator.snapshot() or await health_aggregator.refresh()
+
     # System resource checks
-    try:
-        system_metrics = await _check_system_resources()
+    system_metrics = checks["system"]
+    if system_metrics.get("status") == "healthy":
         health_status["system_metrics"] = system_metrics
-        
+
         # Check if system resources are healthy
         if system_metrics.get("memory_usage_percent", 0) > 90:
             health_status["status"] = "degraded"
         if system_metrics.get("cpu_usage_percent", 0) > 95:
             health_status["status"] = "degraded"
-            
-    except Exception as e:
-        logger.error(f"System metrics check failed: {e}")
-        health_status["checks"]["system"] = {
-            "status": "unhealthy",
-            "message": f"System metrics failed: {str(e)}",
-        }
+    else:
+        health_status["checks"]["system"] = system_metrics
 
     # Redis connection and feature store health check
-    redis_check = await _check_redis_health(redis_client)
+    redis_check = checks["redis"]
     health_status["checks"]["redis"] = redis_check
     if redis_check["status"] != "healthy":
         health_status["status"] = "degraded" if redis_check["status"] == "degraded" else health_status["status"]
 
     # Database connection health check
-    database_check = await _check_database_health()
+    database_check = checks["database"]
     health_status["checks"]["database"] = database_check
     if database_check["status"] != "healthy":
         health_status["status"] = "unhealthy" if database_check["status"] == "unhealthy" else health_status["status"]
 
     # MLflow model registry health check
-    mlflow_check = await _check_mlflow_health()
+    mlflow_check = checks["mlflow"]
     health_status["checks"]["mlflow"] = mlflow_check
     if mlflow_check["status"] != "healthy":
         health_status["status"] = "degraded" if mlflow_check["status"] == "degraded" else health_status["status"]
 
     # File system access health check
-    filesystem_check = await _check_filesystem_health()
+    filesystem_check = checks["filesystem"]
     health_status["checks"]["filesystem"] = filesystem_check
     if filesystem_check["status"] != "healthy":
         health_status["status"] = "degraded"
 
     # External API dependencies health check (if configured)
-    external_apis_check = await _check_external_apis_health()
+    external_apis_check = checks["external_apis"]
     health_status["checks"]["external_apis"] = external_apis_check
     if external_apis_check["status"] != "healthy":
         health_status["status"] = "degraded"
 
     # Monitoring system health check
-    monitoring_check = await _check_monitoring_health()
-    health_status["checks"]["monitoring"] = monitoring_check
+    health_status["checks"]["monitoring"] = checks["monitoring"]
 
     # Calculate total response time
     end_time = datetime.utcnow()
@@ -125,7 +136,8 @@ async def _check_system_resources() -> Dict[str, Any]:
     """Check system resource usage (CPU, Memory, Disk)"""
     try:
         # CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Non-blocking: utilisation since the previous sample
+        cpu_percent = psutil.cpu_percent(interval=None)
         
         # Memory usage
         memory = psutil.virtual_memory()
@@ -573,6 +585,43 @@ async def _check_monitoring_health() -> Dict[str, Any]:
         }
 
 
+async def _check_redis_dependency() -> Dict[str, Any]:
+    """Redis health check using the shared client"""
+    return await _check_redis_health(await get_redis_client())
+
+
+def _failed_health_check(name: str, error: Exception) -> Dict[str, Any]:
+    """Result recorded when a check raises or exceeds its timeout"""
+    if isinstance(error, asyncio.TimeoutError):
+        message = f"{name} check timed out (>{HEALTH_CHECK_TIMEOUT_SECONDS:.0f}s)"
+    else:
+        message = f"{name} check failed: {str(error)}"
+    return {
+        "status": "unhealthy",
+        "message": message,
+        "error_type": type(error).__name__,
+    }
+
+
+health_aggregator = HealthAggregator()
+for _name, _check in {
+    "system": _check_system_resources,
+    "redis": _check_redis_dependency,
+    "database": _check_database_health,
+    "mlflow": _check_mlflow_health,
+    "filesystem": _check_filesystem_health,
+    "external_apis": _check_external_apis_health,
+    "monitoring": _check_monitoring_health,
+}.items():
+    health_aggregator.register(
+        _name,
+        _check,
+        ttl_seconds=HEALTH_CHECK_TTL_SECONDS[_name],
+        timeout_seconds=HEALTH_CHECK_TIMEOUT_SECONDS,
+        on_error=_failed_health_check,
+    )
+
+
 @router.get("/health/detailed")
 async def detailed_health_check() -> Dict[str, Any]:
     """
@@ -581,14 +630,15 @@ async def detailed_health_check() -> Dict[str, Any]:
     """
     start_time = datetime.utcnow()
     
-    # Get all individual health checks
-    system_resources = await _check_system_resources()
-    redis_health = await _check_redis_health(await get_redis_client())
-    database_health = await _check_database_health()
-    mlflow_health = await _check_mlflow_health()
-    filesystem_health = await _check_filesystem_health()
-    external_apis_health = await _check_external_apis_health()
-    monitoring_health = await _check_monitoring_health()
+    # Get all individual health checks (expired ones run concurrently)
+    checks = await health_aggregator.refresh()
+    system_resources = checks["system"]
+    redis_health = checks["redis"]
+    database_health = checks["database"]
+    mlflow_health = checks["mlflow"]
+    filesystem_health = checks["filesystem"]
+    external_apis_health = checks["external_apis"]
+    monitoring_health = checks["monitoring"]
     
     # Configuration status
     config_status = {
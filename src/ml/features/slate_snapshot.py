@@ -0,0 +1,227 @@
+"""
+Slate Feature Snapshot
+Per-slate feature vectors and predictions shared across ML services
+
+Feature vectors are keyed by their cutoff window (game id, cutoff time,
+feature version), so every service asking for the same game before the same
+cutoff gets one extraction. Predictions are keyed by (game id, model).
+
+Within a process the first caller starts the computation in its own task and
+concurrent callers await the same result; later callers reuse it until it expires. Feature vectors are
+also written to the Redis feature store, so other processes (API workers,
+the pre-game workflow's analysis runs) reuse them instead of re-extracting.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .models import FeatureVector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_TTL_SECONDS = 900
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Retrieve a failed computation's exception when every waiter has gone"""
+    if not task.cancelled():
+        task.exception()
+
+
+def _same_cutoff(a: datetime, b: datetime) -> bool:
+    """Compare cutoff times regardless of how the timezone was serialized"""
+    return a.replace(tzinfo=None) == b.replace(tzinfo=None)
+
+
+class SlateSnapshot:
+    """
+    In-process feature and prediction snapshot with an optional Redis tier.
+
+    Cached values are shared between callers and must be treated as
+    read-only. Missing results (None) are never cached, so a game that is not
+    yet predictable is retried on the next request.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_SNAPSHOT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        redis_store=None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.redis_store = redis_store
+
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+
+        self.stats = {
+            "feature_hits": 0,
+            "feature_redis_hits": 0,
+            "feature_extractions": 0,
+            "prediction_hits": 0,
+            "prediction_computations": 0,
+            "shared_inflight": 0,
+        }
+
+    def configure(self, ttl_seconds: Optional[float] = None, redis_store=None) -> None:
+        """Set the TTL and Redis tier once the owning service has initialized"""
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+        if redis_store is not None:
+            self.redis_store = redis_store
+
+    async def get_features(
+        self,
+        game_id: int,
+        cutoff_time: datetime,
+        extract: Callable[[], Awaitable[Optional[FeatureVector]]],
+        feature_version: str = "v2.1",
+    ) -> Optional[FeatureVector]:
+        """
+        Feature vector for a game's cutoff window, extracting it at most once
+
+        Args:
+            game_id: Game to extract features for
+            cutoff_time: Feature cutoff for the game
+            extract: Extraction to run on a miss
+            feature_version: Feature version the vector is built with
+        """
+        key = ("features", game_id, cutoff_time.replace(tzinfo=None).isoformat(), feature_version)
+
+        async def load() -> Optional[FeatureVector]:
+            feature_vector = await self._get_redis_features(game_id, cutoff_time, feature_version)
+            if feature_vector is not None:
+                self.stats["feature_redis_hits"] += 1
+                return feature_vector
+
+            self.stats["feature_extractions"] += 1
+            feature_vector = await extract()
+            if feature_vector is not None and self.redis_store:
+                await self.redis_store.cache_feature_vector(
+                    game_id, feature_vector, ttl=int(self.ttl_seconds)
+                )
+            return feature_vector
+
+        return await self._get_or_compute(key, load, "feature_hits")
+
+    async def get_prediction(
+        self,
+        game_id: int,
+        model_name: Optional[str],
+        compute: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Prediction for a game and model, computing it at most once per window"""
+        key = ("prediction", game_id, model_name)
+
+        async def load() -> Optional[Dict[str, Any]]:
+            self.stats["prediction_computations"] += 1
+            return await compute()
+
+        return await self._get_or_compute(key, load, "prediction_hits")
+
+    def peek_prediction(self, game_id: int, model_name: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Snapshotted prediction, if any, without computing one"""
+        prediction = self._get(("prediction", game_id, model_name))
+        if prediction is not None:
+            self.stats["prediction_hits"] += 1
+        return prediction
+
+    def put_prediction(self, game_id: int, model_name: Optional[str], prediction: Dict[str, Any]) -> None:
+        """Snapshot a prediction loaded elsewhere (e.g. from the database)"""
+        if prediction is not None:
+            self._put(("prediction", game_id, model_name), prediction)
+
+    def invalidate(self, game_id: int) -> int:
+        """Drop every snapshotted feature vector and prediction for a game"""
+        keys = [key for key in self._entries if key[1] == game_id]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._entries), "inflight": len(self._inflight)}
+
+    async def _get_or_compute(
+        self,
+        key: Tuple,
+        compute: Callable[[], Awaitable[Any]],
+        hit_stat: str,
+    ) -> Any:
+        value = self._get(key)
+        if value is not None:
+            self.stats[hit_stat] += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["shared_inflight"] += 1
+        else:
+            task = asyncio.ensure_future(self._compute(key, compute))
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+
+        # The computation runs in its own task, so a caller that is cancelled
+        # stops waiting without cancelling it for the others
+        return await asyncio.shield(task)
+
+    async def _compute(self, key: Tuple, compute: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await compute()
+            if value is not None:
+                self._put(key, value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _get_redis_features(
+        self, game_id: int, cutoff_time: datetime, feature_version: str
+    ) -> Optional[FeatureVector]:
+        if not self.redis_store:
+            return None
+
+        feature_vector = await self.redis_store.get_feature_vector(game_id, feature_version)
+        # The Redis key is per game; only reuse vectors built for this cutoff
+        if feature_vector is None or not _same_cutoff(feature_vector.feature_cutoff_time, cutoff_time):
+            return None
+        return feature_vector
+
+    def _get(self, key: Tuple) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key: Tuple, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+_slate_snapshot: Optional[SlateSnapshot] = None
+
+
+def get_slate_snapshot() -> SlateSnapshot:
+    """Process-wide snapshot shared by prediction serving and opportunity discovery"""
+    global _slate_snapshot
+    if _slate_snapshot is None:
+        _slate_snapshot = SlateSnapshot()
+    return _slate_snapshot
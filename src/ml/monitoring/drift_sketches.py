@@ -0,0 +1,411 @@
+"""
+Feature Drift Sketches
+Mergeable per-feature distribution sketches for drift detection
+
+Each sketch is a fixed-bin histogram plus running moments (count, mean, M2,
+min, max). Bin edges are a single sign-symmetric log grid shared by every
+feature, so sketches from different windows and processes merge by adding
+bin counts. The fine grid is only a storage format: PSI re-bins both sketches
+into a handful of buckets at the baseline's quantiles, so the score keeps its
+conventional scale (0.1 / 0.25) instead of growing with the number of
+sparsely populated grid bins.
+
+Sketches are stored per (model, model version, day) in
+curated.ml_feature_drift_sketches and updated as predictions are stored.
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from itertools import pairwise
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Shared bin grid: |x| < BIN_MIN_MAGNITUDE falls in bin 0, larger magnitudes in
+# BINS_PER_DECADE log-spaced bins per decade up to BIN_MAX_MAGNITUDE (clamped)
+BIN_MIN_MAGNITUDE = 1e-3
+BIN_MAX_MAGNITUDE = 1e6
+BINS_PER_DECADE = 40
+MAX_BIN_INDEX = int(
+    math.log10(BIN_MAX_MAGNITUDE / BIN_MIN_MAGNITUDE) * BINS_PER_DECADE
+)
+
+# Floor for empty bins so PSI stays finite
+PSI_EPSILON = 1e-4
+
+# Buckets PSI is computed over, with edges at the baseline's quantiles
+PSI_BUCKETS = 10
+
+# Feature vectors below this completeness are not tracked
+MIN_FEATURE_COMPLETENESS = 0.7
+
+# Importance values below this are not tracked
+MIN_TRACKED_IMPORTANCE = 0.01
+
+FEATURE_COMPONENTS = [
+    ("temporal", "temporal_features"),
+    ("market", "market_features"),
+    ("team", "team_features"),
+    ("betting_splits", "betting_splits_features"),
+]
+
+
+def bin_index(value: float) -> int:
+    """Index of the shared histogram bin containing value"""
+    magnitude = abs(value)
+    if magnitude < BIN_MIN_MAGNITUDE:
+        return 0
+    index = min(
+        int(math.log10(magnitude / BIN_MIN_MAGNITUDE) * BINS_PER_DECADE) + 1,
+        MAX_BIN_INDEX,
+    )
+    return index if value > 0 else -index
+
+
+def bin_bounds(index: int) -> tuple:
+    """(lower, upper) edges of a histogram bin"""
+    if index == 0:
+        return (-BIN_MIN_MAGNITUDE, BIN_MIN_MAGNITUDE)
+    k = abs(index)
+    inner = BIN_MIN_MAGNITUDE * 10 ** ((k - 1) / BINS_PER_DECADE)
+    outer = BIN_MIN_MAGNITUDE * 10 ** (k / BINS_PER_DECADE)
+    return (inner, outer) if index > 0 else (-outer, -inner)
+
+
+@dataclass
+class FeatureSketch:
+    """Fixed-bin histogram with running moments for one feature"""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    bins: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, value: float) -> None:
+        """Add a single observation (Welford update)"""
+        value = float(value)
+        if not math.isfinite(value):
+            return
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        index = bin_index(value)
+        self.bins[index] = self.bins.get(index, 0) + 1
+
+    def add_many(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "FeatureSketch") -> "FeatureSketch":
+        """Merge another sketch into this one (Chan et al. parallel moments)"""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            self.bins = dict(other.bins)
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        return self
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation"""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+    def cdf(self, x: float) -> float:
+        """Estimated number of observations <= x, uniform within each bin"""
+        total = 0.0
+        for index in sorted(self.bins):
+            count = self.bins[index]
+            lower, upper = bin_bounds(index)
+            lower, upper = max(lower, self.min), min(upper, self.max)
+            if upper <= x:
+                total += count
+            elif lower < x:
+                total += count * (x - lower) / (upper - lower)
+            else:
+                break
+        return total
+
+    def quantile(self, q: float) -> float:
+        """Quantile estimated by interpolating within the containing bin"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for index in sorted(self.bins):
+            count = self.bins[index]
+            if cumulative + count >= target:
+                lower, upper = bin_bounds(index)
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                fraction = (target - cumulative) / count
+                return lower + (upper - lower) * fraction
+            cumulative += count
+        return self.max
+
+    def distribution_stats(self) -> Dict[str, Any]:
+        """Summary statistics in the shape stored with drift results"""
+        return {
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min if self.count else 0.0,
+            "max": self.max if self.count else 0.0,
+            "percentiles": {
+                "25": self.quantile(0.25),
+                "50": self.quantile(0.50),
+                "75": self.quantile(0.75),
+            },
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "bins": {str(index): count for index, count in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FeatureSketch":
+        count = int(data.get("n", 0))
+        return cls(
+            count=count,
+            mean=float(data.get("mean", 0.0)),
+            m2=float(data.get("m2", 0.0)),
+            min=float(data["min"]) if count else math.inf,
+            max=float(data["max"]) if count else -math.inf,
+            bins={int(index): int(c) for index, c in data.get("bins", {}).items()},
+        )
+
+
+def population_stability_index(
+    baseline: FeatureSketch, current: FeatureSketch, buckets: int = PSI_BUCKETS
+) -> float:
+    """PSI over ``buckets`` buckets cut at the baseline sketch's quantiles"""
+    if baseline.count == 0 or current.count == 0:
+        return 0.0
+
+    # Repeated quantiles (point masses) collapse into a single edge
+    edges = sorted({baseline.quantile(i / buckets) for i in range(1, buckets)})
+
+    psi = 0.0
+    for expected, actual in zip(
+        _bucket_fractions(baseline, edges), _bucket_fractions(current, edges), strict=True
+    ):
+        expected = max(expected, PSI_EPSILON)
+        actual = max(actual, PSI_EPSILON)
+        psi += (actual - expected) * math.log(actual / expected)
+    return psi
+
+
+def _bucket_fractions(sketch: FeatureSketch, edges: list) -> list:
+    """Share of a sketch's observations between consecutive edges"""
+    cumulative = [0.0] + [sketch.cdf(edge) for edge in edges] + [float(sketch.count)]
+    return [(upper - lower) / sketch.count for lower, upper in pairwise(cumulative)]
+
+
+def merge_sketch_sets(
+    target: Dict[str, FeatureSketch], source: Dict[str, FeatureSketch]
+) -> Dict[str, FeatureSketch]:
+    """Merge per-feature sketches from source into target"""
+    for feature_name, sketch in source.items():
+        target.setdefault(feature_name, FeatureSketch()).merge(sketch)
+    return target
+
+
+def extract_feature_values(
+    feature_vector: Any,
+    feature_importance: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    """
+    Numeric values tracked for drift from a feature vector
+
+    Feature values are keyed ``<feature_type>_<feature_name>``; importance
+    values are keyed by the model's feature name. Returns an empty dict for
+    vectors below the completeness threshold.
+    """
+    completeness = getattr(feature_vector, "feature_completeness_score", None)
+    if completeness is not None and float(completeness) < MIN_FEATURE_COMPLETENESS:
+        return {}
+
+    values = {}
+    for feature_name, importance in (feature_importance or {}).items():
+        if (
+            isinstance(importance, (int, float))
+            and importance >= MIN_TRACKED_IMPORTANCE
+        ):
+            values[feature_name] = float(importance)
+
+    for feature_type, attribute in FEATURE_COMPONENTS:
+        component = getattr(feature_vector, attribute, None)
+        if component is None:
+            continue
+        # JSON mode matches what is persisted in curated.ml_feature_vectors
+        features = (
+            component.model_dump(mode="json")
+            if hasattr(component, "model_dump")
+            else component
+        )
+        for feature_name, value in features.items():
+            if isinstance(value, (int, float)) and math.isfinite(value):
+                values[f"{feature_type}_{feature_name}"] = float(value)
+
+    return values
+
+
+class FeatureSketchStore:
+    """Persistence for per-(model, version, day) feature sketches"""
+
+    table = "curated.ml_feature_drift_sketches"
+
+    async def record(
+        self,
+        conn,
+        model_name: str,
+        model_version: str,
+        feature_values: Dict[str, float],
+        observed_at: Optional[datetime] = None,
+    ) -> None:
+        """Fold one observation of every feature into its daily sketch"""
+        if not feature_values:
+            return
+
+        window_start = (observed_at or datetime.utcnow()).date()
+        updates = {}
+        for feature_name, value in feature_values.items():
+            sketch = FeatureSketch()
+            sketch.add(value)
+            updates[feature_name] = sketch
+
+        await self.merge(conn, model_name, model_version, window_start, updates)
+
+    async def merge(
+        self,
+        conn,
+        model_name: str,
+        model_version: str,
+        window_start: date,
+        sketches: Dict[str, FeatureSketch],
+    ) -> None:
+        """Merge sketches into the stored row for a window (caller owns the transaction)"""
+        await conn.execute(
+            f"""
+            INSERT INTO {self.table} (model_name, model_version, window_start)
+            VALUES ($1, $2, $3)
+            ON CONFLICT (model_name, model_version, window_start) DO NOTHING
+            """,
+            model_name,
+            model_version,
+            window_start,
+        )
+        row = await conn.fetchrow(
+            f"""
+            SELECT sketches FROM {self.table}
+            WHERE model_name = $1 AND model_version = $2 AND window_start = $3
+            FOR UPDATE
+            """,
+            model_name,
+            model_version,
+            window_start,
+        )
+
+        stored = self._decode(row["sketches"] if row else None)
+        merged = merge_sketch_sets(stored, sketches)
+        await self._write(conn, model_name, model_version, window_start, merged)
+
+    async def replace(
+        self,
+        conn,
+        model_name: str,
+        model_version: str,
+        window_start: date,
+        sketches: Dict[str, FeatureSketch],
+    ) -> None:
+        """Overwrite the stored sketches for a window"""
+        await self._write(conn, model_name, model_version, window_start, sketches)
+
+    async def load(
+        self,
+        conn,
+        model_name: str,
+        start: date,
+        end: date,
+        model_version: Optional[str] = None,
+    ) -> Dict[str, FeatureSketch]:
+        """Merged sketches for windows in [start, end)"""
+        version_clause = "AND model_version = $4" if model_version else ""
+        params = [model_name, start, end]
+        if model_version:
+            params.append(model_version)
+
+        rows = await conn.fetch(
+            f"""
+            SELECT sketches FROM {self.table}
+            WHERE model_name = $1
+            AND window_start >= $2 AND window_start < $3
+            {version_clause}
+            """,
+            *params,
+        )
+
+        merged: Dict[str, FeatureSketch] = {}
+        for row in rows:
+            merge_sketch_sets(merged, self._decode(row["sketches"]))
+        return merged
+
+    async def _write(
+        self,
+        conn,
+        model_name: str,
+        model_version: str,
+        window_start: date,
+        sketches: Dict[str, FeatureSketch],
+    ) -> None:
+        payload = json.dumps(
+            {name: sketch.to_dict() for name, sketch in sketches.items()}
+        )
+        sample_count = max((s.count for s in sketches.values()), default=0)
+        await conn.execute(
+            f"""
+            INSERT INTO {self.table} (
+                model_name, model_version, window_start, sketches, sample_count, updated_at
+            ) VALUES ($1, $2, $3, $4::jsonb, $5, NOW())
+            ON CONFLICT (model_name, model_version, window_start)
+            DO UPDATE SET
+                sketches = EXCLUDED.sketches,
+                sample_count = EXCLUDED.sample_count,
+                updated_at = NOW()
+            """,
+            model_name,
+            model_version,
+            window_start,
+            payload,
+            sample_count,
+        )
+
+    @staticmethod
+    def _decode(raw: Any) -> Dict[str, FeatureSketch]:
+        if not raw:
+            return {}
+        data = json.loads(raw) if isinstance(raw, str) else raw
+        return {name: FeatureSketch.from_dict(sketch) for name, sketch in data.items()}
@@ -17,16 +17,18 @@ Part of Issue #59: AI-Powered Betting Opportunity Discovery
 
 import asyncio
 import logging
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import re
 
 from src.ml.opportunity_detection.opportunity_scoring_engine import OpportunityScore, OpportunityTier, RiskProfile, ScoringFactors
 from src.ml.opportunity_detection.pattern_recognition import DetectedPattern, PatternType, PatternConfidence
+from src.ml.opportunity_detection.explanation_templates import get_explanation_templates
 from src.analysis.models.unified_models import UnifiedBettingSignal, SignalType, ConfidenceLevel
-from src.core.logging import get_logger
+from src.core.logging import get_logger, LogComponent
 
 
 class ExplanationStyle(str, Enum):
@@ -86,6 +88,31 @@ class UserProfile:
     mobile_user: bool = False
 
 
+# Headline, summary and recommendation are always built: discovery results and
+# the CLI display them regardless of format
+CORE_SECTIONS = frozenset({'headline', 'summary', 'recommendation'})
+
+# Sections each output format renders
+FORMAT_SECTIONS: Dict[ExplanationFormat, FrozenSet[str]] = {
+    ExplanationFormat.PARAGRAPH: CORE_SECTIONS | {
+        'detailed_reasoning', 'key_factors', 'confidence_explanation',
+        'risk_assessment', 'stake_guidance', 'timing_advice'
+    },
+    ExplanationFormat.BULLET_POINTS: CORE_SECTIONS | {
+        'key_factors', 'confidence_explanation', 'risk_assessment', 'stake_guidance'
+    },
+    ExplanationFormat.STRUCTURED: CORE_SECTIONS | {
+        'confidence_explanation', 'risk_assessment', 'stake_guidance', 'timing_advice'
+    },
+    ExplanationFormat.NARRATIVE: CORE_SECTIONS | {
+        'detailed_reasoning', 'confidence_explanation', 'risk_assessment'
+    },
+}
+
+# Added for users who asked for technical detail
+TECHNICAL_SECTIONS = frozenset({'technical_analysis', 'statistical_basis', 'model_insights'})
+
+
 class NaturalLanguageExplanationEngine:
     """
     Natural Language Explanation Engine
@@ -103,11 +130,18 @@ class NaturalLanguageExplanationEngine:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the explanation engine"""
         self.config = config or {}
-        self.logger = get_logger(__name__)
+        self.logger = get_logger(__name__, LogComponent.ANALYSIS)
         
         # Language templates and patterns
         self._load_language_templates()
-        
+        self.section_templates = get_explanation_templates()
+
+        # Rendered explanations keyed by (opportunity fingerprint, user profile, format)
+        self.cache_size = self.config.get('explanation_cache_size', 4096)
+        self._explanation_cache: "OrderedDict[tuple, Tuple[ExplanationComponents, str, Dict[str, Any]]]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         # Explanation parameters
         self.max_paragraph_length = self.config.get('max_paragraph_length', 150)
         self.max_bullet_points = self.config.get('max_bullet_points', 5)
@@ -137,25 +171,38 @@ class NaturalLanguageExplanationEngine:
             user_profile: User profile for personalization
             
         Returns:
-            Dictionary with explanation components and formatted text
+            Dictionary with explanation components and formatted text.
+            Components are shared with other callers for the same
+            opportunity and profile and must be treated as read-only.
         """
         try:
             if not user_profile:
                 user_profile = UserProfile()  # Use defaults
-            
-            self.logger.info(f"Generating explanation for opportunity {opportunity.opportunity_id}")
-            
-            # Build explanation components
-            components = await self._build_explanation_components(
-                opportunity, detected_patterns, signals, user_profile
+
+            cache_key = (
+                self._opportunity_fingerprint(opportunity, detected_patterns, signals),
+                self._profile_key(user_profile),
+                ExplanationFormat(user_profile.preferred_format).value
             )
-            
-            # Format explanation based on user preferences
-            formatted_explanation = await self._format_explanation(components, user_profile)
-            
-            # Generate metadata
-            metadata = self._generate_explanation_metadata(opportunity, components, user_profile)
-            
+            cached = self._get_cached_explanation(cache_key)
+
+            if cached:
+                components, formatted_explanation, metadata = cached
+            else:
+                # Build only the components the requested format renders
+                components = self._build_explanation_components(
+                    opportunity, detected_patterns, signals, user_profile,
+                    sections=self._sections_for_profile(user_profile)
+                )
+
+                # Format explanation based on user preferences
+                formatted_explanation = self._format_explanation(components, user_profile)
+
+                # Generate metadata
+                metadata = self._generate_explanation_metadata(opportunity, components, user_profile)
+
+                self._cache_explanation(cache_key, (components, formatted_explanation, metadata))
+
             result = {
                 'explanation_id': f"exp_{opportunity.opportunity_id}_{int(datetime.utcnow().timestamp())}",
                 'opportunity_id': opportunity.opportunity_id,
@@ -166,7 +213,10 @@ class NaturalLanguageExplanationEngine:
                 'user_profile': user_profile
             }
             
-            self.logger.info(f"Generated explanation for {opportunity.opportunity_id} in {user_profile.experience_level} style")
+            self.logger.debug(
+                f"Generated explanation for {opportunity.opportunity_id} in {user_profile.experience_level} style "
+                f"({'cached' if cached else 'rendered'})"
+            )
             return result
             
         except Exception as e:
@@ -192,100 +242,123 @@ class NaturalLanguageExplanationEngine:
         """
         try:
             self.logger.info(f"Generating batch explanations for {len(opportunities)} opportunities")
-            
-            # Generate explanations in parallel
-            tasks = []
+            hits_before = self.cache_hits
+
+            # Rendering is synchronous and cached, so run sequentially rather than
+            # scheduling a task per opportunity
+            results = []
             for opportunity in opportunities:
                 game_patterns = patterns_by_game.get(opportunity.game_id, []) if patterns_by_game else None
                 game_signals = signals_by_game.get(opportunity.game_id, []) if signals_by_game else None
-                
-                task = self.generate_opportunity_explanation(
-                    opportunity, game_patterns, game_signals, user_profile
-                )
-                tasks.append(task)
-            
-            # Execute with reasonable concurrency
-            batch_size = 5
-            results = []
-            
-            for i in range(0, len(tasks), batch_size):
-                batch_tasks = tasks[i:i + batch_size]
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        self.logger.error(f"Batch explanation error: {result}")
-                    else:
-                        results.append(result)
-            
-            self.logger.info(f"Generated {len(results)} explanations successfully")
+
+                try:
+                    results.append(await self.generate_opportunity_explanation(
+                        opportunity, game_patterns, game_signals, user_profile
+                    ))
+                except Exception as e:
+                    self.logger.error(f"Batch explanation error: {e}")
+
+            self.logger.info(
+                f"Generated {len(results)} explanations successfully "
+                f"({self.cache_hits - hits_before} from cache)"
+            )
             return results
             
         except Exception as e:
             self.logger.error(f"Error generating batch explanations: {e}", exc_info=True)
             return []
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Explanation cache size and hit counts"""
+        total = self.cache_hits + self.cache_misses
+        return {
+            'entries': len(self._explanation_cache),
+            'max_entries': self.cache_size,
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'hit_rate': self.cache_hits / total if total else 0.0
+        }
+
     # Private methods for building explanations
-    
-    async def _build_explanation_components(self,
-                                          opportunity: OpportunityScore,
-                                          detected_patterns: Optional[List[DetectedPattern]],
-                                          signals: Optional[List[UnifiedBettingSignal]],
-                                          user_profile: UserProfile) -> ExplanationComponents:
-        """Build all components of the explanation"""
+
+    def _build_explanation_components(self,
+                                      opportunity: OpportunityScore,
+                                      detected_patterns: Optional[List[DetectedPattern]],
+                                      signals: Optional[List[UnifiedBettingSignal]],
+                                      user_profile: UserProfile,
+                                      sections: Optional[FrozenSet[str]] = None) -> ExplanationComponents:
+        """Build the requested components of the explanation (all when sections is None)"""
         try:
             components = ExplanationComponents()
-            
-            # 1. Generate headline
-            components.headline = self._generate_headline(opportunity, user_profile)
-            
-            # 2. Create summary
-            components.summary = self._generate_summary(opportunity, user_profile)
-            
-            # 3. Explain key factors
-            components.key_factors = self._explain_key_factors(
-                opportunity.scoring_factors, opportunity.factor_weights, user_profile
-            )
-            
-            # 4. Detailed reasoning
-            components.detailed_reasoning = self._generate_detailed_reasoning(
-                opportunity, detected_patterns, signals, user_profile
-            )
-            
-            # 5. Risk assessment
-            components.risk_assessment = self._generate_risk_assessment(opportunity, user_profile)
-            
-            # 6. Confidence explanation
-            components.confidence_explanation = self._explain_confidence(opportunity, user_profile)
-            
-            # 7. Market context
-            components.market_context = self._generate_market_context(
-                opportunity, detected_patterns, user_profile
-            )
-            
-            # 8. Recommendation and guidance
-            components.recommendation = self._generate_recommendation(opportunity, user_profile)
-            components.stake_guidance = self._generate_stake_guidance(opportunity, user_profile)
-            components.timing_advice = self._generate_timing_advice(opportunity, user_profile)
-            
-            # 9. Technical details (for advanced users)
-            if user_profile.technical_interest or user_profile.experience_level in [ExplanationStyle.ADVANCED, ExplanationStyle.PROFESSIONAL]:
+
+            def wanted(section: str) -> bool:
+                return sections is None or section in sections
+
+            # 1. Headline, summary and key factors
+            if wanted('headline'):
+                components.headline = self._generate_headline(opportunity, user_profile)
+            if wanted('summary'):
+                components.summary = self._generate_summary(opportunity, user_profile)
+            if wanted('key_factors'):
+                components.key_factors = self._explain_key_factors(
+                    opportunity.scoring_factors, opportunity.factor_weights, user_profile
+                )
+
+            # 2. Detailed reasoning
+            if wanted('detailed_reasoning'):
+                components.detailed_reasoning = self._generate_detailed_reasoning(
+                    opportunity, detected_patterns, signals, user_profile
+                )
+
+            # 3. Risk and confidence
+            if wanted('risk_assessment'):
+                components.risk_assessment = self._generate_risk_assessment(opportunity, user_profile)
+            if wanted('confidence_explanation'):
+                components.confidence_explanation = self._explain_confidence(opportunity, user_profile)
+
+            # 4. Recommendation and guidance
+            if wanted('recommendation'):
+                components.recommendation = self._generate_recommendation(opportunity, user_profile)
+            if wanted('stake_guidance'):
+                components.stake_guidance = self._generate_stake_guidance(opportunity, user_profile)
+            if wanted('timing_advice'):
+                components.timing_advice = self._generate_timing_advice(opportunity, user_profile)
+
+            # 5. Technical details (for advanced users)
+            if wanted('technical_analysis'):
                 components.technical_analysis = self._generate_technical_analysis(
                     opportunity, detected_patterns, user_profile
                 )
+            if wanted('statistical_basis'):
                 components.statistical_basis = self._generate_statistical_basis(opportunity, user_profile)
+            if wanted('model_insights'):
                 components.model_insights = self._generate_model_insights(opportunity, user_profile)
-            
-            # 10. Warnings and limitations
+
+            # 6. Warnings and limitations are always attached
             components.risk_warnings = self._generate_risk_warnings(opportunity, user_profile)
             components.limitations = self._generate_limitations(opportunity, user_profile)
-            
+
             return components
-            
+
         except Exception as e:
             self.logger.error(f"Error building explanation components: {e}", exc_info=True)
             return ExplanationComponents()
-    
+
+    def _sections_for_profile(self, user_profile: UserProfile) -> FrozenSet[str]:
+        """Components needed to render the user's preferred format"""
+        sections = FORMAT_SECTIONS.get(
+            ExplanationFormat(user_profile.preferred_format), FORMAT_SECTIONS[ExplanationFormat.PARAGRAPH]
+        )
+        if user_profile.technical_interest or user_profile.experience_level in [ExplanationStyle.ADVANCED, ExplanationStyle.PROFESSIONAL]:
+            sections = sections | TECHNICAL_SECTIONS
+        return sections
+
+    def _render(self, template_name: str, user_profile: UserProfile,
+                style: Optional[ExplanationStyle] = None, **context: Any) -> str:
+        """Render a compiled section template in the user's style (or an override)"""
+        style = ExplanationStyle(style or user_profile.experience_level).value
+        return getattr(self.section_templates, template_name)(style=style, **context)
+
     def _generate_headline(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Generate attention-grabbing headline"""
         try:
@@ -295,7 +368,7 @@ class NaturalLanguageExplanationEngine:
                 OpportunityTier.STANDARD: "Solid",
                 OpportunityTier.LOW_GRADE: "Moderate"
             }
-            
+
             confidence_descriptors = {
                 ConfidenceLevel.VERY_HIGH: "High-Confidence",
                 ConfidenceLevel.HIGH: "Strong",
@@ -303,10 +376,7 @@ class NaturalLanguageExplanationEngine:
                 ConfidenceLevel.LOW: "Speculative",
                 ConfidenceLevel.VERY_LOW: "Low-Confidence"
             }
-            
-            tier_adj = tier_adjectives.get(opportunity.tier, "")
-            conf_desc = confidence_descriptors.get(opportunity.confidence_level, "")
-            
+
             # Get game context if available
             game_context = ""
             if hasattr(opportunity, 'market_data') and opportunity.market_data:
@@ -314,58 +384,42 @@ class NaturalLanguageExplanationEngine:
                 away_team = opportunity.market_data.get('away_team', '')
                 if home_team and away_team:
                     game_context = f" - {away_team} @ {home_team}"
-            
-            if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                return f"{tier_adj} Betting Opportunity{game_context}"
-            elif user_profile.experience_level == ExplanationStyle.PROFESSIONAL:
-                return f"{tier_adj} {conf_desc} Opportunity (Score: {opportunity.composite_score:.1f}){game_context}"
-            else:
-                return f"{tier_adj} {conf_desc} Betting Opportunity{game_context}"
-                
+
+            return self._render(
+                'headline', user_profile,
+                tier_adj=tier_adjectives.get(opportunity.tier, ""),
+                conf_desc=confidence_descriptors.get(opportunity.confidence_level, ""),
+                score=opportunity.composite_score,
+                game_context=game_context
+            )
+
         except Exception as e:
             self.logger.error(f"Error generating headline: {e}")
             return "Betting Opportunity Identified"
-    
+
     def _generate_summary(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Generate concise summary of the opportunity"""
         try:
-            # Base summary components
-            score_desc = self._score_to_description(opportunity.composite_score)
-            ev_desc = self._ev_to_description(opportunity.expected_value)
-            
-            if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                summary = (f"This {score_desc} betting opportunity has a composite score of "
-                          f"{opportunity.composite_score:.1f} out of 100. {ev_desc}")
-            
-            elif user_profile.experience_level == ExplanationStyle.MOBILE_BRIEF:
-                summary = (f"{score_desc.capitalize()} opportunity (Score: {opportunity.composite_score:.1f}, "
-                          f"EV: {opportunity.expected_value:+.2%})")
-            
-            elif user_profile.experience_level == ExplanationStyle.PROFESSIONAL:
-                summary = (f"Composite Score: {opportunity.composite_score:.1f} | "
-                          f"Tier: {opportunity.tier.value} | "
-                          f"EV: {opportunity.expected_value:+.2%} | "
-                          f"Kelly: {opportunity.kelly_fraction:.3f}")
-            
-            else:  # INTERMEDIATE or ADVANCED
-                summary = (f"This {score_desc} opportunity scores {opportunity.composite_score:.1f}/100 "
-                          f"with an expected value of {opportunity.expected_value:+.2%}. "
-                          f"The analysis suggests a {opportunity.kelly_fraction:.1%} Kelly fraction for optimal sizing.")
-            
-            return summary
-            
+            return self._render(
+                'summary', user_profile,
+                score_desc=self._score_to_description(opportunity.composite_score),
+                ev_desc=self._ev_to_description(opportunity.expected_value),
+                score=opportunity.composite_score,
+                ev=opportunity.expected_value,
+                kelly=opportunity.kelly_fraction,
+                tier=OpportunityTier(opportunity.tier).value
+            )
+
         except Exception as e:
             self.logger.error(f"Error generating summary: {e}")
             return "Betting opportunity identified through multi-factor analysis."
-    
+
     def _explain_key_factors(self,
                            scoring_factors: ScoringFactors,
                            factor_weights: Dict[str, float],
                            user_profile: UserProfile) -> List[str]:
         """Explain the key contributing factors"""
         try:
-            factor_explanations = []
-            
             # Get factor scores and sort by weighted contribution
             factors_list = [
                 ('Strategy Performance', scoring_factors.strategy_performance, factor_weights.get('strategy_performance', 0)),
@@ -376,89 +430,32 @@ class NaturalLanguageExplanationEngine:
                 ('Timing Factor', scoring_factors.timing_factor, factor_weights.get('timing_factor', 0)),
                 ('Value Potential', scoring_factors.value_potential, factor_weights.get('value_potential', 0)),
             ]
-            
+
             # Sort by weighted contribution
             factors_list.sort(key=lambda x: x[1] * x[2], reverse=True)
-            
+
             # Take top factors based on user preference
             max_factors = 3 if user_profile.brevity_preference else 5
-            top_factors = factors_list[:max_factors]
-            
-            for factor_name, score, weight in top_factors:
-                explanation = self._explain_individual_factor(factor_name, score, weight, user_profile)
-                if explanation:
-                    factor_explanations.append(explanation)
-            
-            return factor_explanations
-            
+            top_factors = [
+                {
+                    'name': factor_name,
+                    'score': score,
+                    'weight': weight,
+                    'strength': self._score_to_strength_description(score)
+                }
+                for factor_name, score, weight in factors_list[:max_factors]
+            ]
+
+            # Mobile users get the concise format
+            style = ExplanationStyle.PROFESSIONAL if user_profile.mobile_user else user_profile.experience_level
+
+            rendered = self._render('key_factors', user_profile, style=style, factors=top_factors)
+            return [line for line in rendered.split("\n") if line]
+
         except Exception as e:
             self.logger.error(f"Error explaining key factors: {e}")
             return ["Multiple factors contribute to this opportunity assessment."]
-    
-    def _explain_individual_factor(self,
-                                 factor_name: str,
-                                 score: float,
-                                 weight: float,
-                                 user_profile: UserProfile) -> str:
-        """Explain an individual scoring factor"""
-        try:
-            strength_desc = self._score_to_strength_description(score)
-            
-            factor_explanations = {
-                'Strategy Performance': {
-                    'beginner': f"{strength_desc} historical success rate for similar strategies",
-                    'intermediate': f"{strength_desc} strategy performance based on historical data ({score:.1f}/100)",
-                    'advanced': f"Strategy performance factor: {score:.1f}/100 (weight: {weight:.1%})",
-                    'professional': f"Strategy: {score:.1f} (wt: {weight:.1%})"
-                },
-                'ML Confidence': {
-                    'beginner': f"{strength_desc} machine learning prediction confidence",
-                    'intermediate': f"{strength_desc} ML model confidence in the prediction ({score:.1f}/100)",
-                    'advanced': f"ML confidence factor: {score:.1f}/100 based on model consensus (weight: {weight:.1%})",
-                    'professional': f"ML: {score:.1f} (wt: {weight:.1%})"
-                },
-                'Market Efficiency': {
-                    'beginner': f"{strength_desc} market conditions for finding value",
-                    'intermediate': f"{strength_desc} market inefficiency signals ({score:.1f}/100)",
-                    'advanced': f"Market efficiency assessment: {score:.1f}/100 indicating opportunity presence (weight: {weight:.1%})",
-                    'professional': f"Market: {score:.1f} (wt: {weight:.1%})"
-                },
-                'Data Quality': {
-                    'beginner': f"{strength_desc} data completeness and reliability",
-                    'intermediate': f"{strength_desc} quality of underlying data ({score:.1f}/100)",
-                    'advanced': f"Data quality score: {score:.1f}/100 reflecting completeness and freshness (weight: {weight:.1%})",
-                    'professional': f"Data: {score:.1f} (wt: {weight:.1%})"
-                },
-                'Consensus Strength': {
-                    'beginner': f"{strength_desc} agreement across different strategies",
-                    'intermediate': f"{strength_desc} consensus among multiple analysis methods ({score:.1f}/100)",
-                    'advanced': f"Cross-strategy consensus: {score:.1f}/100 indicating signal alignment (weight: {weight:.1%})",
-                    'professional': f"Consensus: {score:.1f} (wt: {weight:.1%})"
-                },
-                'Timing Factor': {
-                    'beginner': f"{strength_desc} timing for this type of bet",
-                    'intermediate': f"{strength_desc} timing characteristics ({score:.1f}/100)",
-                    'advanced': f"Timing factor: {score:.1f}/100 based on time-to-game analysis (weight: {weight:.1%})",
-                    'professional': f"Timing: {score:.1f} (wt: {weight:.1%})"
-                },
-                'Value Potential': {
-                    'beginner': f"{strength_desc} potential profit opportunity",
-                    'intermediate': f"{strength_desc} expected value potential ({score:.1f}/100)",
-                    'advanced': f"Value assessment: {score:.1f}/100 based on EV calculations (weight: {weight:.1%})",
-                    'professional': f"Value: {score:.1f} (wt: {weight:.1%})"
-                }
-            }
-            
-            style_key = user_profile.experience_level.value
-            if user_profile.mobile_user and style_key not in ['professional']:
-                style_key = 'professional'  # Use concise format for mobile
-            
-            return factor_explanations.get(factor_name, {}).get(style_key, f"{factor_name}: {strength_desc}")
-            
-        except Exception as e:
-            self.logger.error(f"Error explaining factor {factor_name}: {e}")
-            return f"{factor_name}: {self._score_to_strength_description(score)}"
-    
+
     def _generate_detailed_reasoning(self,
                                    opportunity: OpportunityScore,
                                    detected_patterns: Optional[List[DetectedPattern]],
@@ -466,140 +463,73 @@ class NaturalLanguageExplanationEngine:
                                    user_profile: UserProfile) -> str:
         """Generate detailed reasoning explanation"""
         try:
-            reasoning_parts = []
-            
-            # Start with overall assessment
-            if opportunity.composite_score >= 80:
-                reasoning_parts.append("The analysis identifies this as an exceptional opportunity with multiple strong supporting factors.")
-            elif opportunity.composite_score >= 65:
-                reasoning_parts.append("This represents a high-quality betting opportunity with solid analytical support.")
-            elif opportunity.composite_score >= 50:
-                reasoning_parts.append("The analysis suggests a reasonable opportunity with moderate supporting evidence.")
-            else:
-                reasoning_parts.append("This is a lower-grade opportunity that requires careful consideration.")
-            
-            # Include pattern analysis if available
-            if detected_patterns and len(detected_patterns) > 0:
-                pattern_desc = self._describe_patterns(detected_patterns, user_profile)
-                if pattern_desc:
-                    reasoning_parts.append(pattern_desc)
-            
-            # Include signal analysis if available
-            if signals and len(signals) > 0:
-                signal_desc = self._describe_signals(signals, user_profile)
-                if signal_desc:
-                    reasoning_parts.append(signal_desc)
-            
-            # Add specific factor reasoning
-            factors_reasoning = self._generate_factors_reasoning(opportunity, user_profile)
-            if factors_reasoning:
-                reasoning_parts.append(factors_reasoning)
-            
-            return " ".join(reasoning_parts)
-            
+            strong_factors, weak_factors = self._factor_strengths(opportunity)
+            return self._render(
+                'detailed_reasoning', user_profile,
+                score=opportunity.composite_score,
+                pattern_groups=self._pattern_groups(detected_patterns),
+                signals=self._signal_summary(signals),
+                strong_factors=strong_factors,
+                weak_factors=weak_factors,
+                brevity=user_profile.brevity_preference
+            )
+
         except Exception as e:
             self.logger.error(f"Error generating detailed reasoning: {e}")
             return "The opportunity is identified through comprehensive multi-factor analysis of market conditions and historical patterns."
-    
+
     def _generate_risk_assessment(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Generate risk assessment explanation"""
         try:
             # Determine risk level based on multiple factors
             risk_indicators = []
-            
+
             # Confidence-based risk
             if opportunity.confidence_level in [ConfidenceLevel.LOW, ConfidenceLevel.VERY_LOW]:
                 risk_indicators.append("low prediction confidence")
-            
+
             # EV-based risk
             if opportunity.expected_value < 0.01:
                 risk_indicators.append("minimal expected value")
-            
+
             # Kelly fraction risk
             if opportunity.kelly_fraction > 0.1:
                 risk_indicators.append("high optimal bet size")
             elif opportunity.kelly_fraction < 0.01:
                 risk_indicators.append("very small optimal bet size")
-            
-            # Tier-based assessment
-            if opportunity.tier == OpportunityTier.LOW_GRADE:
-                risk_level = "Higher"
-                risk_desc = "This lower-tier opportunity carries increased uncertainty."
-            elif opportunity.tier == OpportunityTier.PREMIUM:
-                risk_level = "Lower" 
-                risk_desc = "This premium opportunity shows strong analytical support, reducing risk."
-            else:
-                risk_level = "Moderate"
-                risk_desc = "This opportunity carries typical betting risks."
-            
-            if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                return f"{risk_level} risk. {risk_desc} Remember that all sports betting involves risk of loss."
-            elif user_profile.experience_level == ExplanationStyle.MOBILE_BRIEF:
-                return f"{risk_level} risk ({opportunity.kelly_fraction:.1%} Kelly)"
-            else:
-                risk_details = f" Key considerations: {', '.join(risk_indicators)}." if risk_indicators else ""
-                return f"Risk Assessment: {risk_level}. {risk_desc}{risk_details}"
-                
+
+            return self._render(
+                'risk_assessment', user_profile,
+                tier=OpportunityTier(opportunity.tier).value,
+                kelly=opportunity.kelly_fraction,
+                indicators=risk_indicators
+            )
+
         except Exception as e:
             self.logger.error(f"Error generating risk assessment: {e}")
             return "Standard betting risk applies - never bet more than you can afford to lose."
-    
+
     def _explain_confidence(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Explain confidence level and what it means"""
         try:
-            confidence_explanations = {
-                ConfidenceLevel.VERY_HIGH: {
-                    'description': 'Very High',
-                    'meaning': 'multiple strong indicators align with high certainty',
-                    'percentage': '90%+'
-                },
-                ConfidenceLevel.HIGH: {
-                    'description': 'High', 
-                    'meaning': 'strong supporting evidence with good consensus',
-                    'percentage': '75-89%'
-                },
-                ConfidenceLevel.MEDIUM: {
-                    'description': 'Medium',
-                    'meaning': 'reasonable support but some uncertainty remains',
-                    'percentage': '50-74%'
-                },
-                ConfidenceLevel.LOW: {
-                    'description': 'Low',
-                    'meaning': 'limited supporting evidence',
-                    'percentage': '25-49%'
-                },
-                ConfidenceLevel.VERY_LOW: {
-                    'description': 'Very Low',
-                    'meaning': 'minimal supporting evidence',
-                    'percentage': '<25%'
-                }
-            }
-            
-            conf_info = confidence_explanations.get(opportunity.confidence_level, {})
-            
-            if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                return (f"Confidence Level: {conf_info.get('description', 'Unknown')}. "
-                       f"This means {conf_info.get('meaning', 'the analysis has mixed results')}.")
-            elif user_profile.experience_level == ExplanationStyle.MOBILE_BRIEF:
-                return f"{conf_info.get('description', 'Unknown')} confidence"
-            else:
-                return (f"Analysis Confidence: {conf_info.get('description', 'Unknown')} "
-                       f"({conf_info.get('percentage', 'N/A')}) - "
-                       f"{conf_info.get('meaning', 'mixed analytical results')}.")
-                
+            return self._render(
+                'confidence_explanation', user_profile,
+                confidence=getattr(opportunity.confidence_level, 'value', opportunity.confidence_level)
+            )
+
         except Exception as e:
             self.logger.error(f"Error explaining confidence: {e}")
             return "Confidence level reflects the strength of analytical support for this opportunity."
-    
+
     # Additional helper methods
-    
+
     def _load_language_templates(self):
         """Load language templates and patterns"""
         # In a production system, these would be loaded from configuration files
         self.templates = {
             'risk_warnings': [
                 "Sports betting involves risk of financial loss",
-                "Past performance does not guarantee future results", 
+                "Past performance does not guarantee future results",
                 "Only bet what you can afford to lose",
                 "Gambling can be addictive - seek help if needed"
             ],
@@ -610,7 +540,7 @@ class NaturalLanguageExplanationEngine:
                 "External factors may affect outcomes"
             ]
         }
-    
+
     def _score_to_description(self, score: float) -> str:
         """Convert numerical score to descriptive text"""
         if score >= 85:
@@ -623,7 +553,7 @@ class NaturalLanguageExplanationEngine:
             return "modest"
         else:
             return "limited"
-    
+
     def _score_to_strength_description(self, score: float) -> str:
         """Convert score to strength description"""
         if score >= 80:
@@ -636,7 +566,7 @@ class NaturalLanguageExplanationEngine:
             return "Weak"
         else:
             return "Very weak"
-    
+
     def _ev_to_description(self, ev: float) -> str:
         """Convert expected value to descriptive text"""
         if ev >= 0.05:
@@ -647,415 +577,248 @@ class NaturalLanguageExplanationEngine:
             return "This shows modest profit potential."
         else:
             return "This suggests limited profit potential."
-    
-    def _describe_patterns(self, patterns: List[DetectedPattern], user_profile: UserProfile) -> str:
-        """Describe detected patterns in natural language"""
-        try:
-            if not patterns:
-                return ""
-            
-            # Group patterns by type
-            pattern_groups = {}
-            for pattern in patterns:
-                pattern_type = pattern.pattern_type
-                if pattern_type not in pattern_groups:
-                    pattern_groups[pattern_type] = []
-                pattern_groups[pattern_type].append(pattern)
-            
-            descriptions = []
-            
-            for pattern_type, pattern_list in pattern_groups.items():
-                if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                    desc = self._get_beginner_pattern_description(pattern_type, len(pattern_list))
-                elif user_profile.experience_level == ExplanationStyle.PROFESSIONAL:
-                    desc = f"{pattern_type.value}: {len(pattern_list)} detected"
-                else:
-                    desc = self._get_standard_pattern_description(pattern_type, pattern_list)
-                
-                descriptions.append(desc)
-            
-            if user_profile.brevity_preference:
-                return f"Patterns detected: {', '.join(descriptions[:2])}."
-            else:
-                return f"Pattern analysis reveals: {', '.join(descriptions)}."
-                
-        except Exception as e:
-            self.logger.error(f"Error describing patterns: {e}")
-            return "Multiple market patterns support this opportunity."
-    
-    def _describe_signals(self, signals: List[UnifiedBettingSignal], user_profile: UserProfile) -> str:
-        """Describe betting signals in natural language"""
-        try:
-            if not signals:
-                return ""
-            
-            signal_count = len(signals)
-            signal_types = list(set(s.signal_type.value for s in signals))
-            avg_confidence = sum(s.confidence_score for s in signals) / signal_count
-            
-            # Check for consensus
-            sides = [s.recommended_side for s in signals]
-            consensus_side = max(set(sides), key=sides.count) if sides else "unknown"
-            consensus_strength = sides.count(consensus_side) / len(sides) if sides else 0
-            
-            if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                if consensus_strength >= 0.8:
-                    return f"Strong agreement across {signal_count} different analysis methods favoring {consensus_side}."
-                else:
-                    return f"Mixed signals from {signal_count} analysis methods require careful consideration."
-            
-            elif user_profile.experience_level == ExplanationStyle.PROFESSIONAL:
-                return f"Signals: {signal_count} ({', '.join(signal_types[:3])}), consensus: {consensus_strength:.1%}"
-            
-            else:
-                consensus_desc = "strong" if consensus_strength >= 0.8 else "moderate" if consensus_strength >= 0.6 else "weak"
-                return (f"Analysis incorporates {signal_count} signals including {', '.join(signal_types[:3])}, "
-                       f"showing {consensus_desc} consensus for {consensus_side} with average confidence of {avg_confidence:.1%}.")
-                
-        except Exception as e:
-            self.logger.error(f"Error describing signals: {e}")
-            return f"Analysis based on {len(signals)} different betting signals."
-    
-    def _get_beginner_pattern_description(self, pattern_type: PatternType, count: int) -> str:
-        """Get beginner-friendly pattern descriptions"""
-        descriptions = {
-            PatternType.LINE_MOVEMENT_ANOMALY: f"unusual line movement patterns ({count})",
-            PatternType.SHARP_MONEY_INFLUX: f"professional money indicators ({count})", 
-            PatternType.PUBLIC_FADE_SETUP: f"contrarian betting opportunities ({count})",
-            PatternType.STEAM_MOVE_PATTERN: f"rapid market movements ({count})",
-            PatternType.REVERSE_LINE_MOVEMENT: f"line movement against public betting ({count})"
-        }
-        return descriptions.get(pattern_type, f"{pattern_type.value} patterns ({count})")
-    
-    def _get_standard_pattern_description(self, pattern_type: PatternType, pattern_list: List[DetectedPattern]) -> str:
-        """Get standard pattern descriptions"""
-        count = len(pattern_list)
-        avg_confidence = sum(p.confidence_score for p in pattern_list) / count
-        
-        base_descriptions = {
-            PatternType.LINE_MOVEMENT_ANOMALY: f"line movement anomalies",
-            PatternType.SHARP_MONEY_INFLUX: f"sharp money patterns",
-            PatternType.PUBLIC_FADE_SETUP: f"public fade setups",
-            PatternType.STEAM_MOVE_PATTERN: f"steam move patterns",
-            PatternType.REVERSE_LINE_MOVEMENT: f"reverse line movement"
+
+    def _pattern_groups(self, patterns: Optional[List[DetectedPattern]]) -> List[Dict[str, Any]]:
+        """Detected patterns grouped by type, in first-seen order"""
+        groups: Dict[str, List[float]] = {}
+        for pattern in patterns or []:
+            pattern_type = PatternType(pattern.pattern_type).value
+            groups.setdefault(pattern_type, []).append(pattern.confidence_score)
+
+        return [
+            {
+                'type': pattern_type,
+                'count': len(confidences),
+                'avg_confidence': sum(confidences) / len(confidences)
+            }
+            for pattern_type, confidences in groups.items()
+        ]
+
+    def _signal_summary(self, signals: Optional[List[UnifiedBettingSignal]]) -> Optional[Dict[str, Any]]:
+        """Signal count, types and side consensus for the reasoning section"""
+        if not signals:
+            return None
+
+        signal_count = len(signals)
+        side_counts = Counter(s.recommended_side for s in signals)
+        consensus_side, consensus_count = side_counts.most_common(1)[0]
+
+        return {
+            'count': signal_count,
+            'types': sorted({getattr(s.signal_type, 'value', s.signal_type) for s in signals}),
+            'avg_confidence': sum(s.confidence_score for s in signals) / signal_count,
+            'side': consensus_side,
+            'consensus': consensus_count / signal_count
         }
-        
-        base = base_descriptions.get(pattern_type, pattern_type.value)
-        return f"{count} {base} (avg confidence: {avg_confidence:.1%})"
-    
-    def _generate_factors_reasoning(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
-        """Generate reasoning based on scoring factors"""
-        try:
-            factors = opportunity.scoring_factors
-            
-            # Identify strongest factors
-            strong_factors = []
-            if factors.strategy_performance >= 70:
-                strong_factors.append("strong historical strategy performance")
-            if factors.ml_confidence >= 70:
-                strong_factors.append("high ML prediction confidence")
-            if factors.consensus_strength >= 70:
-                strong_factors.append("strong cross-method consensus")
-            if factors.timing_factor >= 70:
-                strong_factors.append("favorable timing characteristics")
-            
-            # Identify weak factors as risks
-            weak_factors = []
-            if factors.data_quality < 50:
-                weak_factors.append("limited data quality")
-            if factors.market_efficiency < 40:
-                weak_factors.append("efficient market conditions")
-            
-            reasoning_parts = []
-            
-            if strong_factors:
-                if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                    reasoning_parts.append(f"The opportunity is supported by {', '.join(strong_factors)}.")
-                else:
-                    reasoning_parts.append(f"Key strengths include {', '.join(strong_factors)}.")
-            
-            if weak_factors and user_profile.experience_level != ExplanationStyle.MOBILE_BRIEF:
-                reasoning_parts.append(f"Consider {', '.join(weak_factors)} as limiting factors.")
-            
-            return " ".join(reasoning_parts)
-            
-        except Exception as e:
-            self.logger.error(f"Error generating factors reasoning: {e}")
-            return ""
-    
+
+    def _factor_strengths(self, opportunity: OpportunityScore) -> Tuple[List[str], List[str]]:
+        """Strong and weak scoring factors, described for the reasoning section"""
+        factors = opportunity.scoring_factors
+
+        # Identify strongest factors
+        strong_factors = []
+        if factors.strategy_performance >= 70:
+            strong_factors.append("strong historical strategy performance")
+        if factors.ml_confidence >= 70:
+            strong_factors.append("high ML prediction confidence")
+        if factors.consensus_strength >= 70:
+            strong_factors.append("strong cross-method consensus")
+        if factors.timing_factor >= 70:
+            strong_factors.append("favorable timing characteristics")
+
+        # Identify weak factors as risks
+        weak_factors = []
+        if factors.data_quality < 50:
+            weak_factors.append("limited data quality")
+        if factors.market_efficiency < 40:
+            weak_factors.append("efficient market conditions")
+
+        return strong_factors, weak_factors
+
     def _generate_recommendation(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Generate betting recommendation"""
         try:
-            if opportunity.tier == OpportunityTier.PREMIUM:
-                if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                    return "This is a high-quality opportunity worth strong consideration for experienced bettors."
-                else:
-                    return "Strong recommendation - consider standard position sizing."
-            
-            elif opportunity.tier == OpportunityTier.HIGH_VALUE:
-                return "Good opportunity - consider moderate position sizing based on your bankroll management strategy."
-            
-            elif opportunity.tier == OpportunityTier.STANDARD:
-                return "Reasonable opportunity - suitable for small to moderate position sizes."
-            
-            else:  # LOW_GRADE
-                return "Proceed with caution - consider only small position sizes or skip this opportunity."
-                
+            return self._render('recommendation', user_profile, tier=OpportunityTier(opportunity.tier).value)
+
         except Exception as e:
             self.logger.error(f"Error generating recommendation: {e}")
             return "Assess based on your risk tolerance and bankroll management strategy."
-    
+
     def _generate_stake_guidance(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Generate stake sizing guidance"""
         try:
-            kelly = opportunity.kelly_fraction
             risk_profile_multiplier = {
                 RiskProfile.CONSERVATIVE: 0.5,
                 RiskProfile.MODERATE: 0.75,
                 RiskProfile.AGGRESSIVE: 1.0
             }.get(opportunity.risk_profile, 0.75)
-            
-            suggested_kelly = kelly * risk_profile_multiplier
-            
-            if user_profile.experience_level == ExplanationStyle.BEGINNER:
-                if suggested_kelly >= 0.05:
-                    return "Consider a larger portion of your betting bankroll for this opportunity."
-                elif suggested_kelly >= 0.02:
-                    return "Suitable for a moderate portion of your betting bankroll."
-                else:
-                    return "Consider only a small portion of your betting bankroll."
-            
-            elif user_profile.experience_level == ExplanationStyle.PROFESSIONAL:
-                return f"Suggested Kelly: {suggested_kelly:.2%} (risk-adjusted)"
-            
-            else:
-                if suggested_kelly >= 0.05:
-                    return f"Kelly Criterion suggests {suggested_kelly:.1%} of bankroll (higher confidence opportunity)."
-                else:
-                    return f"Kelly Criterion suggests {suggested_kelly:.1%} of bankroll (conservative sizing recommended)."
-                    
+
+            return self._render(
+                'stake_guidance', user_profile,
+                kelly=opportunity.kelly_fraction * risk_profile_multiplier
+            )
+
         except Exception as e:
             self.logger.error(f"Error generating stake guidance: {e}")
             return "Follow your established bankroll management rules."
-    
+
     def _generate_timing_advice(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Generate timing advice"""
         try:
-            if hasattr(opportunity, 'time_to_game'):
-                minutes = opportunity.time_to_game
-            else:
-                minutes = 240  # Default assumption
-            
-            if minutes <= 60:
-                return "Close to game time - act quickly if interested, but be aware of limited reaction time."
-            elif minutes <= 240:
-                return "Good timing window - allows for additional research while maintaining value."
-            elif minutes <= 1440:  # Same day
-                return "Reasonable timing - monitor for any late developments that might affect the opportunity."
-            else:
-                return "Early opportunity - consider monitoring for line movement and additional information."
-                
+            # Default assumption when the opportunity carries no time to game
+            minutes = getattr(opportunity, 'time_to_game', 240)
+            return self._render('timing_advice', user_profile, minutes=minutes)
+
         except Exception as e:
             self.logger.error(f"Error generating timing advice: {e}")
             return "Consider timing in relation to your betting strategy."
-    
-    def _generate_technical_analysis(self, 
+
+    def _generate_technical_analysis(self,
                                    opportunity: OpportunityScore,
                                    detected_patterns: Optional[List[DetectedPattern]],
                                    user_profile: UserProfile) -> str:
         """Generate technical analysis for advanced users"""
         try:
-            technical_parts = []
-            
-            # Scoring breakdown
-            factors = opportunity.scoring_factors
-            weights = opportunity.factor_weights
-            
-            technical_parts.append(
-                f"Scoring Breakdown: "
-                f"Strategy({factors.strategy_performance:.1f}×{weights.get('strategy_performance', 0):.2f}) + "
-                f"ML({factors.ml_confidence:.1f}×{weights.get('ml_confidence', 0):.2f}) + "
-                f"Market({factors.market_efficiency:.1f}×{weights.get('market_efficiency', 0):.2f}) + "
-                f"Consensus({factors.consensus_strength:.1f}×{weights.get('consensus_strength', 0):.2f})"
-            )
-            
-            # Pattern analysis
-            if detected_patterns:
-                pattern_summary = f"Patterns: {len(detected_patterns)} detected, "
-                high_conf_patterns = sum(1 for p in detected_patterns if p.confidence_score > 0.7)
-                pattern_summary += f"{high_conf_patterns} high-confidence"
-                technical_parts.append(pattern_summary)
-            
-            # Risk metrics
-            technical_parts.append(
-                f"Risk Metrics: EV={opportunity.expected_value:+.3f}, "
-                f"Kelly={opportunity.kelly_fraction:.3f}, "
-                f"Confidence={opportunity.confidence_level.value}"
+            return self._render(
+                'technical_analysis', user_profile,
+                factors=opportunity.scoring_factors,
+                weights=opportunity.factor_weights,
+                pattern_count=len(detected_patterns or []),
+                high_confidence_patterns=sum(1 for p in detected_patterns or [] if p.confidence_score > 0.7),
+                ev=opportunity.expected_value,
+                kelly=opportunity.kelly_fraction,
+                confidence=getattr(opportunity.confidence_level, 'value', opportunity.confidence_level)
             )
-            
-            return " | ".join(technical_parts)
-            
+
         except Exception as e:
             self.logger.error(f"Error generating technical analysis: {e}")
             return "Technical details available upon request."
-    
+
     def _generate_statistical_basis(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Generate statistical basis explanation"""
         # This would be expanded with actual statistical data in production
-        return ("Statistical analysis based on multi-factor scoring algorithm with "
-                f"{len(opportunity.factor_weights)} weighted factors and "
-                f"confidence intervals derived from historical performance data.")
-    
+        return self._render('statistical_basis', user_profile, factor_count=len(opportunity.factor_weights))
+
     def _generate_model_insights(self, opportunity: OpportunityScore, user_profile: UserProfile) -> str:
         """Generate ML model insights"""
         try:
-            ml_data = opportunity.ml_predictions
-            if not ml_data:
-                return "No ML model data available for this opportunity."
-            
-            insights = []
-            if 'home_ml_confidence' in ml_data:
-                insights.append(f"ML Home Win Confidence: {ml_data['home_ml_confidence']:.1%}")
-            if 'total_over_confidence' in ml_data:
-                insights.append(f"ML Total Over Confidence: {ml_data['total_over_confidence']:.1%}")
-            
-            return " | ".join(insights) if insights else "ML model insights not available."
-            
+            return self._render('model_insights', user_profile, ml_data=opportunity.ml_predictions or {})
+
         except Exception as e:
             self.logger.error(f"Error generating model insights: {e}")
             return "ML model insights not available."
-    
+
     def _generate_risk_warnings(self, opportunity: OpportunityScore, user_profile: UserProfile) -> List[str]:
         """Generate appropriate risk warnings"""
         warnings = []
-        
+
         # Always include basic warning
         warnings.append("Sports betting involves risk of financial loss")
-        
+
         # Specific warnings based on opportunity characteristics
         if opportunity.confidence_level in [ConfidenceLevel.LOW, ConfidenceLevel.VERY_LOW]:
             warnings.append("Low confidence analysis - higher uncertainty")
-        
+
         if opportunity.expected_value < 0.01:
             warnings.append("Limited expected value - minimal profit potential")
-        
+
         if opportunity.kelly_fraction > 0.1:
             warnings.append("High suggested bet size - use extreme caution")
-        
+
         # Risk profile specific warnings
         if opportunity.risk_profile == RiskProfile.AGGRESSIVE:
             warnings.append("Aggressive risk profile - only for experienced bettors")
-        
+
         return warnings[:3]  # Limit to 3 warnings to avoid overwhelming
-    
+
     def _generate_limitations(self, opportunity: OpportunityScore, user_profile: UserProfile) -> List[str]:
         """Generate analysis limitations"""
         limitations = ["Analysis based on historical data and current market conditions"]
-        
+
         if not opportunity.ml_predictions:
             limitations.append("No ML model predictions available")
-        
+
         if hasattr(opportunity, 'data_quality_score') and opportunity.data_quality_score < 0.8:
             limitations.append("Limited data quality may affect accuracy")
-        
+
         limitations.append("Market conditions can change rapidly")
-        
+
         return limitations[:2]  # Keep it concise
-    
-    async def _format_explanation(self, components: ExplanationComponents, user_profile: UserProfile) -> str:
+
+    def _format_explanation(self, components: ExplanationComponents, user_profile: UserProfile) -> str:
         """Format explanation based on user preferences"""
         try:
-            if user_profile.preferred_format == ExplanationFormat.BULLET_POINTS:
-                return self._format_as_bullets(components, user_profile)
-            elif user_profile.preferred_format == ExplanationFormat.STRUCTURED:
-                return self._format_as_structured(components, user_profile)
-            elif user_profile.preferred_format == ExplanationFormat.NARRATIVE:
-                return self._format_as_narrative(components, user_profile)
-            else:  # PARAGRAPH
-                return self._format_as_paragraphs(components, user_profile)
-                
+            explanation_format = ExplanationFormat(user_profile.preferred_format)
+            return self._render(f"format_{explanation_format.value}", user_profile, c=components)
+
         except Exception as e:
             self.logger.error(f"Error formatting explanation: {e}")
-            return self._format_as_paragraphs(components, user_profile)
-    
-    def _format_as_bullets(self, components: ExplanationComponents, user_profile: UserProfile) -> str:
-        """Format as bullet points"""
-        bullets = []
-        
-        bullets.append(f"• {components.headline}")
-        bullets.append(f"• {components.summary}")
-        
-        if components.key_factors:
-            bullets.append("• Key Factors:")
-            for factor in components.key_factors[:3]:  # Limit for readability
-                bullets.append(f"  - {factor}")
-        
-        bullets.append(f"• {components.confidence_explanation}")
-        bullets.append(f"• {components.risk_assessment}")
-        bullets.append(f"• {components.recommendation}")
-        
-        if user_profile.experience_level != ExplanationStyle.BEGINNER:
-            bullets.append(f"• {components.stake_guidance}")
-        
-        return "\n".join(bullets)
-    
-    def _format_as_paragraphs(self, components: ExplanationComponents, user_profile: UserProfile) -> str:
-        """Format as flowing paragraphs"""
-        paragraphs = []
-        
-        # Opening paragraph
-        paragraphs.append(f"{components.headline}. {components.summary}")
-        
-        # Analysis paragraph
-        if components.detailed_reasoning:
-            paragraphs.append(components.detailed_reasoning)
-        
-        # Key factors
-        if components.key_factors:
-            factors_text = "Key supporting factors include: " + "; ".join(components.key_factors[:4]) + "."
-            paragraphs.append(factors_text)
-        
-        # Risk and confidence
-        risk_conf_para = f"{components.confidence_explanation} {components.risk_assessment}"
-        paragraphs.append(risk_conf_para)
-        
-        # Recommendations
-        rec_para = f"{components.recommendation}"
-        if user_profile.experience_level != ExplanationStyle.BEGINNER:
-            rec_para += f" {components.stake_guidance}"
-        paragraphs.append(rec_para)
-        
-        # Timing
-        if components.timing_advice:
-            paragraphs.append(components.timing_advice)
-        
-        return "\n\n".join(paragraphs)
-    
-    def _format_as_structured(self, components: ExplanationComponents, user_profile: UserProfile) -> str:
-        """Format as structured data"""
-        # This would return a JSON-like structure in production
-        return f"""
-OPPORTUNITY: {components.headline}
-SUMMARY: {components.summary}
-CONFIDENCE: {components.confidence_explanation}
-RISK: {components.risk_assessment}
-RECOMMENDATION: {components.recommendation}
-STAKE: {components.stake_guidance}
-TIMING: {components.timing_advice}
-"""
-    
-    def _format_as_narrative(self, components: ExplanationComponents, user_profile: UserProfile) -> str:
-        """Format as narrative story"""
-        narrative_parts = [
-            f"Here's what our analysis reveals about this betting opportunity: {components.summary}",
-            components.detailed_reasoning,
-            f"Looking at the confidence level, {components.confidence_explanation.lower()}",
-            f"From a risk perspective, {components.risk_assessment.lower()}",
-            f"Our recommendation: {components.recommendation.lower()}",
-        ]
-        
-        return " ".join(filter(None, narrative_parts))
-    
+            return self._render("format_paragraph", user_profile, c=components)
+
+    # Explanation cache
+
+    def _opportunity_fingerprint(self,
+                                 opportunity: OpportunityScore,
+                                 detected_patterns: Optional[List[DetectedPattern]],
+                                 signals: Optional[List[UnifiedBettingSignal]]) -> tuple:
+        """Every opportunity input that can change the rendered explanation"""
+        market_data = opportunity.market_data or {}
+        ml_predictions = opportunity.ml_predictions or {}
+
+        return (
+            opportunity.composite_score,
+            getattr(opportunity.tier, 'value', opportunity.tier),
+            getattr(opportunity.confidence_level, 'value', opportunity.confidence_level),
+            opportunity.expected_value,
+            opportunity.kelly_fraction,
+            getattr(opportunity.risk_profile, 'value', opportunity.risk_profile),
+            tuple(vars(opportunity.scoring_factors).values()),
+            tuple(sorted(opportunity.factor_weights.items())),
+            bool(ml_predictions),
+            repr(ml_predictions.get('home_ml_confidence')),
+            repr(ml_predictions.get('total_over_confidence')),
+            str(market_data.get('home_team', '')),
+            str(market_data.get('away_team', '')),
+            getattr(opportunity, 'time_to_game', None),
+            getattr(opportunity, 'data_quality_score', None),
+            tuple(
+                (getattr(p.pattern_type, 'value', p.pattern_type), p.confidence_score)
+                for p in detected_patterns or []
+            ),
+            tuple(
+                (getattr(s.signal_type, 'value', s.signal_type), s.recommended_side, s.confidence_score)
+                for s in signals or []
+            ),
+        )
+
+    @staticmethod
+    def _profile_key(user_profile: UserProfile) -> tuple:
+        return (
+            ExplanationStyle(user_profile.experience_level).value,
+            RiskProfile(user_profile.risk_tolerance).value,
+            user_profile.technical_interest,
+            user_profile.brevity_preference,
+            user_profile.mobile_user,
+        )
+
+    def _get_cached_explanation(self, key: tuple) -> Optional[Tuple[ExplanationComponents, str, Dict[str, Any]]]:
+        entry = self._explanation_cache.get(key)
+        if entry is None:
+            self.cache_misses += 1
+            return None
+        self._explanation_cache.move_to_end(key)
+        self.cache_hits += 1
+        return entry
+
+    def _cache_explanation(self, key: tuple, entry: Tuple[ExplanationComponents, str, Dict[str, Any]]) -> None:
+        if self.cache_size <= 0:
+            return
+        self._explanation_cache[key] = entry
+        self._explanation_cache.move_to_end(key)
+        while len(self._explanation_cache) > self.cache_size:
+            self._explanation_cache.popitem(last=False)
+
+
     def _generate_explanation_metadata(self, 
                                      opportunity: OpportunityScore,
                                      components: ExplanationComponents,
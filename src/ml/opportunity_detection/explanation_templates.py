@@ -0,0 +1,460 @@
+"""
+Explanation Templates
+
+Jinja2 templates for NaturalLanguageExplanationEngine sections and output
+formats. Templates are compiled once per process; the engine only computes
+the small context each section needs and renders it.
+
+Every template is compiled as a macro taking ``style`` (an ExplanationStyle
+value) plus the parameters listed in TEMPLATE_PARAMETERS. Format templates
+receive the explanation components as ``c``.
+
+Part of Issue #59: AI-Powered Betting Opportunity Discovery
+"""
+
+from functools import lru_cache
+from typing import Any, Dict
+
+from jinja2 import Environment, StrictUndefined
+from jinja2.environment import TemplateModule
+
+# Phrasing for each scoring factor by style. Advanced lines read
+# "<advanced>: <score>/100<advanced_detail> (weight: <weight>)".
+FACTOR_PHRASES: Dict[str, Dict[str, str]] = {
+    'Strategy Performance': {
+        'beginner': "historical success rate for similar strategies",
+        'intermediate': "strategy performance based on historical data",
+        'advanced': "Strategy performance factor",
+        'advanced_detail': "",
+        'short': "Strategy",
+    },
+    'ML Confidence': {
+        'beginner': "machine learning prediction confidence",
+        'intermediate': "ML model confidence in the prediction",
+        'advanced': "ML confidence factor",
+        'advanced_detail': " based on model consensus",
+        'short': "ML",
+    },
+    'Market Efficiency': {
+        'beginner': "market conditions for finding value",
+        'intermediate': "market inefficiency signals",
+        'advanced': "Market efficiency assessment",
+        'advanced_detail': " indicating opportunity presence",
+        'short': "Market",
+    },
+    'Data Quality': {
+        'beginner': "data completeness and reliability",
+        'intermediate': "quality of underlying data",
+        'advanced': "Data quality score",
+        'advanced_detail': " reflecting completeness and freshness",
+        'short': "Data",
+    },
+    'Consensus Strength': {
+        'beginner': "agreement across different strategies",
+        'intermediate': "consensus among multiple analysis methods",
+        'advanced': "Cross-strategy consensus",
+        'advanced_detail': " indicating signal alignment",
+        'short': "Consensus",
+    },
+    'Timing Factor': {
+        'beginner': "timing for this type of bet",
+        'intermediate': "timing characteristics",
+        'advanced': "Timing factor",
+        'advanced_detail': " based on time-to-game analysis",
+        'short': "Timing",
+    },
+    'Value Potential': {
+        'beginner': "potential profit opportunity",
+        'intermediate': "expected value potential",
+        'advanced': "Value assessment",
+        'advanced_detail': " based on EV calculations",
+        'short': "Value",
+    },
+}
+
+BEGINNER_PATTERN_LABELS = {
+    'line_movement_anomaly': "unusual line movement patterns",
+    'sharp_money_influx': "professional money indicators",
+    'public_fade_setup': "contrarian betting opportunities",
+    'steam_move_pattern': "rapid market movements",
+    'reverse_line_movement': "line movement against public betting",
+}
+
+STANDARD_PATTERN_LABELS = {
+    'line_movement_anomaly': "line movement anomalies",
+    'sharp_money_influx': "sharp money patterns",
+    'public_fade_setup': "public fade setups",
+    'steam_move_pattern': "steam move patterns",
+    'reverse_line_movement': "reverse line movement",
+}
+
+CONFIDENCE_DESCRIPTIONS = {
+    'very_high': {
+        'description': 'Very High',
+        'meaning': 'multiple strong indicators align with high certainty',
+        'percentage': '90%+',
+    },
+    'high': {
+        'description': 'High',
+        'meaning': 'strong supporting evidence with good consensus',
+        'percentage': '75-89%',
+    },
+    'medium': {
+        'description': 'Medium',
+        'meaning': 'reasonable support but some uncertainty remains',
+        'percentage': '50-74%',
+    },
+    'low': {
+        'description': 'Low',
+        'meaning': 'limited supporting evidence',
+        'percentage': '25-49%',
+    },
+    'very_low': {
+        'description': 'Very Low',
+        'meaning': 'minimal supporting evidence',
+        'percentage': '<25%',
+    },
+}
+
+
+TEMPLATE_SOURCES: Dict[str, str] = {
+    'headline': (
+        "{%- if style == 'beginner' -%}"
+        "{{ tier_adj }} Betting Opportunity{{ game_context }}"
+        "{%- elif style == 'professional' -%}"
+        "{{ tier_adj }} {{ conf_desc }} Opportunity (Score: {{ score|fmt('.1f') }}){{ game_context }}"
+        "{%- else -%}"
+        "{{ tier_adj }} {{ conf_desc }} Betting Opportunity{{ game_context }}"
+        "{%- endif -%}"
+    ),
+
+    'summary': (
+        "{%- if style == 'beginner' -%}"
+        "This {{ score_desc }} betting opportunity has a composite score of "
+        "{{ score|fmt('.1f') }} out of 100. {{ ev_desc }}"
+        "{%- elif style == 'mobile_brief' -%}"
+        "{{ score_desc|capitalize }} opportunity (Score: {{ score|fmt('.1f') }}, "
+        "EV: {{ ev|fmt('+.2%') }})"
+        "{%- elif style == 'professional' -%}"
+        "Composite Score: {{ score|fmt('.1f') }} | Tier: {{ tier }} | "
+        "EV: {{ ev|fmt('+.2%') }} | Kelly: {{ kelly|fmt('.3f') }}"
+        "{%- else -%}"
+        "This {{ score_desc }} opportunity scores {{ score|fmt('.1f') }}/100 "
+        "with an expected value of {{ ev|fmt('+.2%') }}. "
+        "The analysis suggests a {{ kelly|fmt('.1%') }} Kelly fraction for optimal sizing."
+        "{%- endif -%}"
+    ),
+
+    # One factor per line
+    'key_factors': (
+        "{%- for f in factors -%}"
+        "{%- set p = phrases[f.name] -%}"
+        "{%- if style == 'beginner' -%}"
+        "{{ f.strength }} {{ p.beginner }}"
+        "{%- elif style == 'intermediate' -%}"
+        "{{ f.strength }} {{ p.intermediate }} ({{ f.score|fmt('.1f') }}/100)"
+        "{%- elif style == 'advanced' -%}"
+        "{{ p.advanced }}: {{ f.score|fmt('.1f') }}/100{{ p.advanced_detail }} "
+        "(weight: {{ f.weight|fmt('.1%') }})"
+        "{%- elif style == 'professional' -%}"
+        "{{ p.short }}: {{ f.score|fmt('.1f') }} (wt: {{ f.weight|fmt('.1%') }})"
+        "{%- else -%}"
+        "{{ f.name }}: {{ f.strength }}"
+        "{%- endif -%}"
+        "{{ '\n' if not loop.last }}"
+        "{%- endfor -%}"
+    ),
+
+    'detailed_reasoning': (
+        "{%- if score >= 80 -%}"
+        "{%- set parts = ['The analysis identifies this as an exceptional opportunity with multiple strong supporting factors.'] -%}"
+        "{%- elif score >= 65 -%}"
+        "{%- set parts = ['This represents a high-quality betting opportunity with solid analytical support.'] -%}"
+        "{%- elif score >= 50 -%}"
+        "{%- set parts = ['The analysis suggests a reasonable opportunity with moderate supporting evidence.'] -%}"
+        "{%- else -%}"
+        "{%- set parts = ['This is a lower-grade opportunity that requires careful consideration.'] -%}"
+        "{%- endif -%}"
+
+        "{%- if pattern_groups -%}"
+        "{%- set descriptions = [] -%}"
+        "{%- for g in pattern_groups -%}"
+        "{%- if style == 'beginner' -%}"
+        "{%- set d = (beginner_labels.get(g.type) or g.type ~ ' patterns') ~ ' (' ~ g.count ~ ')' -%}"
+        "{%- elif style == 'professional' -%}"
+        "{%- set d = g.type ~ ': ' ~ g.count ~ ' detected' -%}"
+        "{%- else -%}"
+        "{%- set d = g.count ~ ' ' ~ (standard_labels.get(g.type) or g.type) ~ "
+        "' (avg confidence: ' ~ g.avg_confidence|fmt('.1%') ~ ')' -%}"
+        "{%- endif -%}"
+        "{%- do descriptions.append(d) -%}"
+        "{%- endfor -%}"
+        "{%- if brevity -%}"
+        "{%- set parts = parts + ['Patterns detected: ' ~ descriptions[:2]|join(', ') ~ '.'] -%}"
+        "{%- else -%}"
+        "{%- set parts = parts + ['Pattern analysis reveals: ' ~ descriptions|join(', ') ~ '.'] -%}"
+        "{%- endif -%}"
+        "{%- endif -%}"
+
+        "{%- if signals -%}"
+        "{%- if style == 'beginner' -%}"
+        "{%- if signals.consensus >= 0.8 -%}"
+        "{%- set s = 'Strong agreement across ' ~ signals.count ~ ' different analysis methods favoring ' ~ signals.side ~ '.' -%}"
+        "{%- else -%}"
+        "{%- set s = 'Mixed signals from ' ~ signals.count ~ ' analysis methods require careful consideration.' -%}"
+        "{%- endif -%}"
+        "{%- elif style == 'professional' -%}"
+        "{%- set s = 'Signals: ' ~ signals.count ~ ' (' ~ signals.types[:3]|join(', ') ~ '), consensus: ' ~ signals.consensus|fmt('.1%') -%}"
+        "{%- else -%}"
+        "{%- set consensus_desc = 'strong' if signals.consensus >= 0.8 else 'moderate' if signals.consensus >= 0.6 else 'weak' -%}"
+        "{%- set s = 'Analysis incorporates ' ~ signals.count ~ ' signals including ' ~ signals.types[:3]|join(', ') ~ ', '"
+        " ~ 'showing ' ~ consensus_desc ~ ' consensus for ' ~ signals.side ~ ' with average confidence of ' ~ signals.avg_confidence|fmt('.1%') ~ '.' -%}"
+        "{%- endif -%}"
+        "{%- set parts = parts + [s] -%}"
+        "{%- endif -%}"
+
+        "{%- set factor_parts = [] -%}"
+        "{%- if strong_factors -%}"
+        "{%- if style == 'beginner' -%}"
+        "{%- set factor_parts = factor_parts + ['The opportunity is supported by ' ~ strong_factors|join(', ') ~ '.'] -%}"
+        "{%- else -%}"
+        "{%- set factor_parts = factor_parts + ['Key strengths include ' ~ strong_factors|join(', ') ~ '.'] -%}"
+        "{%- endif -%}"
+        "{%- endif -%}"
+        "{%- if weak_factors and style != 'mobile_brief' -%}"
+        "{%- set factor_parts = factor_parts + ['Consider ' ~ weak_factors|join(', ') ~ ' as limiting factors.'] -%}"
+        "{%- endif -%}"
+        "{%- if factor_parts -%}"
+        "{%- set parts = parts + [factor_parts|join(' ')] -%}"
+        "{%- endif -%}"
+
+        "{{ parts|join(' ') }}"
+    ),
+
+    'risk_assessment': (
+        "{%- if tier == 'low_grade' -%}"
+        "{%- set level, description = 'Higher', 'This lower-tier opportunity carries increased uncertainty.' -%}"
+        "{%- elif tier == 'premium' -%}"
+        "{%- set level, description = 'Lower', 'This premium opportunity shows strong analytical support, reducing risk.' -%}"
+        "{%- else -%}"
+        "{%- set level, description = 'Moderate', 'This opportunity carries typical betting risks.' -%}"
+        "{%- endif -%}"
+        "{%- if style == 'beginner' -%}"
+        "{{ level }} risk. {{ description }} Remember that all sports betting involves risk of loss."
+        "{%- elif style == 'mobile_brief' -%}"
+        "{{ level }} risk ({{ kelly|fmt('.1%') }} Kelly)"
+        "{%- else -%}"
+        "Risk Assessment: {{ level }}. {{ description }}"
+        "{%- if indicators %} Key considerations: {{ indicators|join(', ') }}.{% endif -%}"
+        "{%- endif -%}"
+    ),
+
+    'confidence_explanation': (
+        "{%- set info = confidence_descriptions.get(confidence, {}) -%}"
+        "{%- if style == 'beginner' -%}"
+        "Confidence Level: {{ info.get('description', 'Unknown') }}. "
+        "This means {{ info.get('meaning', 'the analysis has mixed results') }}."
+        "{%- elif style == 'mobile_brief' -%}"
+        "{{ info.get('description', 'Unknown') }} confidence"
+        "{%- else -%}"
+        "Analysis Confidence: {{ info.get('description', 'Unknown') }} "
+        "({{ info.get('percentage', 'N/A') }}) - "
+        "{{ info.get('meaning', 'mixed analytical results') }}."
+        "{%- endif -%}"
+    ),
+
+    'recommendation': (
+        "{%- if tier == 'premium' -%}"
+        "{%- if style == 'beginner' -%}"
+        "This is a high-quality opportunity worth strong consideration for experienced bettors."
+        "{%- else -%}"
+        "Strong recommendation - consider standard position sizing."
+        "{%- endif -%}"
+        "{%- elif tier == 'high_value' -%}"
+        "Good opportunity - consider moderate position sizing based on your bankroll management strategy."
+        "{%- elif tier == 'standard' -%}"
+        "Reasonable opportunity - suitable for small to moderate position sizes."
+        "{%- else -%}"
+        "Proceed with caution - consider only small position sizes or skip this opportunity."
+        "{%- endif -%}"
+    ),
+
+    'stake_guidance': (
+        "{%- if style == 'beginner' -%}"
+        "{%- if kelly >= 0.05 -%}"
+        "Consider a larger portion of your betting bankroll for this opportunity."
+        "{%- elif kelly >= 0.02 -%}"
+        "Suitable for a moderate portion of your betting bankroll."
+        "{%- else -%}"
+        "Consider only a small portion of your betting bankroll."
+        "{%- endif -%}"
+        "{%- elif style == 'professional' -%}"
+        "Suggested Kelly: {{ kelly|fmt('.2%') }} (risk-adjusted)"
+        "{%- elif kelly >= 0.05 -%}"
+        "Kelly Criterion suggests {{ kelly|fmt('.1%') }} of bankroll (higher confidence opportunity)."
+        "{%- else -%}"
+        "Kelly Criterion suggests {{ kelly|fmt('.1%') }} of bankroll (conservative sizing recommended)."
+        "{%- endif -%}"
+    ),
+
+    'timing_advice': (
+        "{%- if minutes <= 60 -%}"
+        "Close to game time - act quickly if interested, but be aware of limited reaction time."
+        "{%- elif minutes <= 240 -%}"
+        "Good timing window - allows for additional research while maintaining value."
+        "{%- elif minutes <= 1440 -%}"
+        "Reasonable timing - monitor for any late developments that might affect the opportunity."
+        "{%- else -%}"
+        "Early opportunity - consider monitoring for line movement and additional information."
+        "{%- endif -%}"
+    ),
+
+    'technical_analysis': (
+        "Scoring Breakdown: "
+        "Strategy({{ factors.strategy_performance|fmt('.1f') }}×{{ weights.get('strategy_performance', 0)|fmt('.2f') }}) + "
+        "ML({{ factors.ml_confidence|fmt('.1f') }}×{{ weights.get('ml_confidence', 0)|fmt('.2f') }}) + "
+        "Market({{ factors.market_efficiency|fmt('.1f') }}×{{ weights.get('market_efficiency', 0)|fmt('.2f') }}) + "
+        "Consensus({{ factors.consensus_strength|fmt('.1f') }}×{{ weights.get('consensus_strength', 0)|fmt('.2f') }})"
+        "{%- if pattern_count %} | Patterns: {{ pattern_count }} detected, "
+        "{{ high_confidence_patterns }} high-confidence{% endif %}"
+        " | Risk Metrics: EV={{ ev|fmt('+.3f') }}, Kelly={{ kelly|fmt('.3f') }}, Confidence={{ confidence }}"
+    ),
+
+    'statistical_basis': (
+        "Statistical analysis based on multi-factor scoring algorithm with "
+        "{{ factor_count }} weighted factors and "
+        "confidence intervals derived from historical performance data."
+    ),
+
+    'model_insights': (
+        "{%- if not ml_data -%}"
+        "No ML model data available for this opportunity."
+        "{%- else -%}"
+        "{%- set insights = [] -%}"
+        "{%- if 'home_ml_confidence' in ml_data -%}"
+        "{%- set insights = insights + ['ML Home Win Confidence: ' ~ ml_data['home_ml_confidence']|fmt('.1%')] -%}"
+        "{%- endif -%}"
+        "{%- if 'total_over_confidence' in ml_data -%}"
+        "{%- set insights = insights + ['ML Total Over Confidence: ' ~ ml_data['total_over_confidence']|fmt('.1%')] -%}"
+        "{%- endif -%}"
+        "{{ insights|join(' | ') if insights else 'ML model insights not available.' }}"
+        "{%- endif -%}"
+    ),
+
+    # Output formats
+    'format_bullet_points': (
+        "• {{ c.headline }}\n"
+        "• {{ c.summary }}\n"
+        "{%- if c.key_factors %}\n• Key Factors:"
+        "{%- for factor in c.key_factors[:3] %}\n  - {{ factor }}{% endfor %}"
+        "{%- endif %}\n"
+        "• {{ c.confidence_explanation }}\n"
+        "• {{ c.risk_assessment }}\n"
+        "• {{ c.recommendation }}"
+        "{%- if style != 'beginner' %}\n• {{ c.stake_guidance }}{% endif -%}"
+    ),
+
+    'format_paragraph': (
+        "{%- set paragraphs = [c.headline ~ '. ' ~ c.summary] -%}"
+        "{%- if c.detailed_reasoning -%}"
+        "{%- set paragraphs = paragraphs + [c.detailed_reasoning] -%}"
+        "{%- endif -%}"
+        "{%- if c.key_factors -%}"
+        "{%- set paragraphs = paragraphs + ['Key supporting factors include: ' ~ c.key_factors[:4]|join('; ') ~ '.'] -%}"
+        "{%- endif -%}"
+        "{%- set paragraphs = paragraphs + [c.confidence_explanation ~ ' ' ~ c.risk_assessment] -%}"
+        "{%- if style != 'beginner' -%}"
+        "{%- set paragraphs = paragraphs + [c.recommendation ~ ' ' ~ c.stake_guidance] -%}"
+        "{%- else -%}"
+        "{%- set paragraphs = paragraphs + [c.recommendation] -%}"
+        "{%- endif -%}"
+        "{%- if c.timing_advice -%}"
+        "{%- set paragraphs = paragraphs + [c.timing_advice] -%}"
+        "{%- endif -%}"
+        "{{ paragraphs|join('\n\n') }}"
+    ),
+
+    'format_structured': (
+        "\n"
+        "OPPORTUNITY: {{ c.headline }}\n"
+        "SUMMARY: {{ c.summary }}\n"
+        "CONFIDENCE: {{ c.confidence_explanation }}\n"
+        "RISK: {{ c.risk_assessment }}\n"
+        "RECOMMENDATION: {{ c.recommendation }}\n"
+        "STAKE: {{ c.stake_guidance }}\n"
+        "TIMING: {{ c.timing_advice }}\n"
+    ),
+
+    'format_narrative': (
+        "{%- set parts = [\"Here's what our analysis reveals about this betting opportunity: \" ~ c.summary] -%}"
+        "{%- if c.detailed_reasoning -%}"
+        "{%- set parts = parts + [c.detailed_reasoning] -%}"
+        "{%- endif -%}"
+        "{%- set parts = parts + ["
+        "'Looking at the confidence level, ' ~ c.confidence_explanation|lower, "
+        "'From a risk perspective, ' ~ c.risk_assessment|lower, "
+        "'Our recommendation: ' ~ c.recommendation|lower] -%}"
+        "{{ parts|join(' ') }}"
+    ),
+}
+
+# Macro parameters for each template; every macro also takes ``style``
+TEMPLATE_PARAMETERS: Dict[str, str] = {
+    'headline': "tier_adj, conf_desc, score, game_context",
+    'summary': "score_desc, ev_desc, score, ev, kelly, tier",
+    'key_factors': "factors",
+    'detailed_reasoning': "score, pattern_groups, signals, strong_factors, weak_factors, brevity",
+    'risk_assessment': "tier, kelly, indicators",
+    'confidence_explanation': "confidence",
+    'recommendation': "tier",
+    'stake_guidance': "kelly",
+    'timing_advice': "minutes",
+    'technical_analysis': "factors, weights, pattern_count, high_confidence_patterns, ev, kelly, confidence",
+    'statistical_basis': "factor_count",
+    'model_insights': "ml_data",
+    'format_bullet_points': "c",
+    'format_paragraph': "c",
+    'format_structured': "c",
+    'format_narrative': "c",
+}
+
+# Constants every template can reference
+TEMPLATE_GLOBALS: Dict[str, Any] = {
+    'phrases': FACTOR_PHRASES,
+    'beginner_labels': BEGINNER_PATTERN_LABELS,
+    'standard_labels': STANDARD_PATTERN_LABELS,
+    'confidence_descriptions': CONFIDENCE_DESCRIPTIONS,
+}
+
+
+def _format_value(value: Any, spec: str) -> str:
+    """Python format-spec filter, e.g. ``{{ ev|fmt('+.2%') }}``"""
+    return format(value, spec)
+
+
+def _macro_source() -> str:
+    """All templates as macros of a single template"""
+    return "".join(
+        f"{{% macro {name}(style, {TEMPLATE_PARAMETERS[name]}) %}}{body}{{% endmacro %}}"
+        for name, body in TEMPLATE_SOURCES.items()
+    )
+
+
+@lru_cache(maxsize=1)
+def get_explanation_templates() -> TemplateModule:
+    """
+    Compiled explanation templates (built once per process)
+
+    Each template is exposed as a macro, e.g.
+    ``get_explanation_templates().summary(style='beginner', ...)``. Calling a
+    macro skips the per-render context setup of ``Template.render``.
+    """
+    environment = Environment(
+        undefined=StrictUndefined,
+        autoescape=False,
+        keep_trailing_newline=True,
+        extensions=['jinja2.ext.do'],
+    )
+    environment.filters['fmt'] = _format_value
+    environment.globals.update(TEMPLATE_GLOBALS)
+    return environment.from_string(_macro_source()).module
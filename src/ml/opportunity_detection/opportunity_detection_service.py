@@ -33,7 +33,7 @@ from src.ml.opportunity_detection.explanation_engine import (
 from src.ml.services.prediction_service import PredictionService
 from src.analysis.models.unified_models import UnifiedBettingSignal, SignalType
 from src.core.config import get_settings
-from src.core.logging import get_logger
+from src.core.logging import get_logger, LogComponent
 
 
 @dataclass
@@ -89,7 +89,7 @@ class OpportunityDetectionService:
         """
         self.prediction_service = prediction_service
         self.config = config or {}
-        self.logger = get_logger(__name__)
+        self.logger = get_logger(__name__, LogComponent.ANALYSIS)
         
         # Initialize component engines
         self.scoring_engine = OpportunityScoringEngine(
@@ -112,6 +112,10 @@ class OpportunityDetectionService:
         self.pattern_detection_enabled = self.config.get('pattern_detection_enabled', True)
         self.explanation_generation_enabled = self.config.get('explanation_generation_enabled', True)
         
+        # Load the offline-trained pattern models once
+        if self.pattern_detection_enabled:
+            self.pattern_recognition.load_models()
+        
         # Performance tracking
         self.performance_metrics = {
             'opportunities_discovered': 0,
@@ -126,8 +130,7 @@ class OpportunityDetectionService:
         self._opportunity_cache: Dict[str, OpportunityDiscoveryResult] = {}
         self._cache_timestamps: Dict[str, datetime] = {}
         
-        self.logger.info("OpportunityDetectionService initialized with config keys: %s", 
-                        list(self.config.keys()))
+        self.logger.info(f"OpportunityDetectionService initialized with config keys: {list(self.config.keys())}")
     
     async def discover_opportunities(self,
                                    signals_by_game: Dict[str, List[UnifiedBettingSignal]],
@@ -160,6 +163,21 @@ class OpportunityDetectionService:
             opportunities = []
             cache_hits = 0
             
+            # Detect patterns for every game that needs fresh analysis in one
+            # model inference pass
+            patterns_by_game = {}
+            if self.pattern_detection_enabled:
+                games_to_analyze = {
+                    game_id: signals for game_id, signals in signals_by_game.items()
+                    if signals and (
+                        force_refresh or self._get_cached_opportunity(game_id, user_profile, start_time) is None
+                    )
+                }
+                if games_to_analyze:
+                    patterns_by_game = await self.pattern_recognition.detect_patterns_batch(
+                        games_to_analyze, market_data or {}
+                    )
+            
             # Process games in batches for performance
             batch_size = 10
             game_ids = list(signals_by_game.keys())
@@ -173,7 +191,8 @@ class OpportunityDetectionService:
                     game_market_data = market_data.get(game_id, {}) if market_data else {}
                     
                     task = self._discover_single_opportunity(
-                        game_id, signals, user_profile, game_market_data, force_refresh
+                        game_id, signals, user_profile, game_market_data, force_refresh,
+                        precomputed_patterns=patterns_by_game.get(game_id)
                     )
                     batch_tasks.append(task)
                 
@@ -434,19 +453,17 @@ class OpportunityDetectionService:
                                          market_data: Dict[str, Any],
                                          force_refresh: bool = False,
                                          include_patterns: bool = True,
-                                         include_explanation: bool = True) -> Optional[OpportunityDiscoveryResult]:
+                                         include_explanation: bool = True,
+                                         precomputed_patterns: Optional[List[DetectedPattern]] = None) -> Optional[OpportunityDiscoveryResult]:
         """Discover opportunity for a single game"""
         try:
             start_time = datetime.utcnow()
             
             # Check cache first (unless force refresh)
-            cache_key = f"{game_id}_{user_profile.experience_level}_{user_profile.risk_tolerance}"
-            if not force_refresh and cache_key in self._opportunity_cache:
-                cached_result = self._opportunity_cache[cache_key]
-                cache_timestamp = self._cache_timestamps[cache_key]
-                
-                # Check if cache is still valid
-                if (start_time - cache_timestamp).total_seconds() < (self.cache_ttl_hours * 3600):
+            cache_key = self._opportunity_cache_key(game_id, user_profile)
+            if not force_refresh:
+                cached_result = self._get_cached_opportunity(game_id, user_profile, start_time)
+                if cached_result is not None:
                     cached_result.cache_hit = True
                     return cached_result
             
@@ -467,7 +484,10 @@ class OpportunityDetectionService:
             
             # 2. Detect patterns (if enabled)
             detected_patterns = []
-            if include_patterns and self.pattern_detection_enabled:
+            if include_patterns and self.pattern_detection_enabled and precomputed_patterns is not None:
+                detected_patterns = precomputed_patterns
+                self.performance_metrics['patterns_detected'] += len(detected_patterns)
+            elif include_patterns and self.pattern_detection_enabled:
                 try:
                     detected_patterns = await self.pattern_recognition.detect_patterns(
                         signals=signals,
@@ -492,10 +512,11 @@ class OpportunityDetectionService:
                 except Exception as e:
                     self.logger.error(f"Explanation generation failed for {game_id}: {e}")
             
-            # 4. Get ML predictions context
-            ml_predictions = {}
+            # 4. Get ML predictions context (reusing the prediction the score was built from)
+            ml_predictions = opportunity_score.ml_predictions or {}
             try:
-                ml_predictions = await self.prediction_service.get_cached_prediction(game_id) or {}
+                if not ml_predictions:
+                    ml_predictions = await self.prediction_service.get_cached_prediction(game_id) or {}
             except Exception as e:
                 self.logger.error(f"Failed to get ML predictions for {game_id}: {e}")
             
@@ -526,6 +547,23 @@ class OpportunityDetectionService:
             self.logger.error(f"Error discovering opportunity for game {game_id}: {e}", exc_info=True)
             return None
     
+    def _opportunity_cache_key(self, game_id: str, user_profile: UserProfile) -> str:
+        return f"{game_id}_{user_profile.experience_level}_{user_profile.risk_tolerance}"
+    
+    def _get_cached_opportunity(self,
+                                game_id: str,
+                                user_profile: UserProfile,
+                                now: datetime) -> Optional[OpportunityDiscoveryResult]:
+        """Cached result for a game if it is still within the cache TTL"""
+        cache_key = self._opportunity_cache_key(game_id, user_profile)
+        if cache_key not in self._opportunity_cache:
+            return None
+        
+        # Check if cache is still valid
+        if (now - self._cache_timestamps[cache_key]).total_seconds() < (self.cache_ttl_hours * 3600):
+            return self._opportunity_cache[cache_key]
+        return None
+    
     def _update_performance_metrics(self,
                                   opportunities_count: int,
                                   cache_hits: int,
@@ -594,6 +632,6 @@ async def create_opportunity_detection_service(config: Optional[Dict[str, Any]]
         return service
         
     except Exception as e:
-        logger = get_logger(__name__)
+        logger = get_logger(__name__, LogComponent.ANALYSIS)
         logger.error(f"Error creating opportunity detection service: {e}", exc_info=True)
         raise
\ No newline at end of file
@@ -28,6 +28,8 @@ from pydantic import BaseModel, Field
 
 from src.analysis.models.unified_models import UnifiedBettingSignal, ConfidenceLevel, SignalType
 from src.ml.services.prediction_service import PredictionService
+from src.ml.database.connection_pool import get_database_connection
+from src.core import odds_math
 from src.core.config import get_settings
 from src.core.logging import get_logger, LogComponent
 
@@ -146,7 +148,7 @@ class OpportunityScoringEngine:
         self._performance_cache = {}
         self._cache_expiry = {}
         
-        self.logger.info("OpportunityScoringEngine initialized with weights: %s", self.factor_weights)
+        self.logger.info(f"OpportunityScoringEngine initialized with weights: {self.factor_weights}")
     
     async def score_opportunity(self, 
                                signals: List[UnifiedBettingSignal],
@@ -176,8 +178,9 @@ class OpportunityScoringEngine:
             # 1. Strategy Performance Analysis
             factors.strategy_performance = await self._calculate_strategy_performance(signals)
             
-            # 2. ML Prediction Integration
-            factors.ml_confidence = await self._calculate_ml_confidence(game_id, signals)
+            # 2. ML Prediction Integration (the same prediction is kept for context)
+            ml_predictions = await self._get_ml_predictions(game_id)
+            factors.ml_confidence = self._ml_confidence_from_prediction(ml_predictions)
             
             # 3. Market Condition Assessment
             factors.market_efficiency = await self._calculate_market_efficiency(signals)
@@ -211,9 +214,6 @@ class OpportunityScoringEngine:
             expected_value = await self._calculate_expected_value(signals, factors)
             kelly_fraction = self._calculate_kelly_fraction(expected_value, signals, user_risk_profile)
             
-            # Get ML predictions for context
-            ml_predictions = await self._get_ml_predictions(game_id)
-            
             # Create opportunity score
             opportunity_score = OpportunityScore(
                 opportunity_id=f"opp_{game_id}_{int(datetime.utcnow().timestamp())}",
@@ -261,24 +261,10 @@ class OpportunityScoringEngine:
         try:
             self.logger.info(f"Scoring opportunities for {len(signals_by_game)} games")
             
-            # Score opportunities in parallel
-            tasks = []
-            for game_id, signals in signals_by_game.items():
-                task = self.score_opportunity(signals, game_id, user_risk_profile)
-                tasks.append(task)
-            
-            # Execute with reasonable concurrency limit
-            results = []
-            batch_size = 5
-            for i in range(0, len(tasks), batch_size):
-                batch_tasks = tasks[i:i + batch_size]
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        self.logger.error(f"Batch scoring error: {result}")
-                    elif result is not None and result.composite_score >= min_score:
-                        results.append(result)
+            # Score the whole slate in a single vectorized pass
+            results = await self.score_opportunities_batch(
+                signals_by_game, user_risk_profile, min_score
+            )
             
             # Sort by composite score (descending)
             results.sort(key=lambda x: x.composite_score, reverse=True)
@@ -335,6 +321,100 @@ class OpportunityScoringEngine:
             self.logger.error(f"Error getting top opportunities: {e}", exc_info=True)
             return []
     
+    async def score_opportunities_batch(self,
+                                        signals_by_game: Dict[str, List[UnifiedBettingSignal]],
+                                        user_risk_profile: RiskProfile = RiskProfile.MODERATE,
+                                        min_score: float = 0.0,
+                                        ml_predictions: Optional[Dict[str, Optional[Dict[str, Any]]]] = None) -> List[OpportunityScore]:
+        """
+        Score many games in one pass
+
+        Builds one signal table for all games, computes every scoring factor
+        as a column operation grouped by game and preloads the performance of
+        every referenced strategy in a single query. Produces the same scores
+        as score_opportunity for each game.
+
+        Args:
+            signals_by_game: Dictionary mapping game IDs to their signals
+            user_risk_profile: User's risk tolerance
+            min_score: Minimum score threshold for inclusion
+            ml_predictions: Predictions by game ID; fetched from the prediction
+                service when omitted (pass them in to re-score history offline)
+
+        Returns:
+            List of opportunity scores sorted by composite score (descending)
+        """
+        try:
+            games = [(game_id, signals) for game_id, signals in signals_by_game.items() if signals]
+            if not games:
+                return []
+
+            game_ids = [game_id for game_id, _ in games]
+            table = self._build_signal_table(games)
+
+            performance = await self._load_strategy_performance(set(table['strategy']))
+            table['performance'] = np.array(
+                [performance[name] for name in table['strategy']], dtype=float
+            )
+
+            if ml_predictions is None:
+                ml_predictions = await self._get_ml_predictions_batch(game_ids)
+            ml_confidence = np.array(
+                [self._ml_confidence_from_prediction(ml_predictions.get(game_id)) for game_id in game_ids],
+                dtype=float
+            )
+
+            columns = self._calculate_batch_factors(table, len(games), ml_confidence, user_risk_profile)
+
+            scored_at = datetime.utcnow()
+            results = []
+            for i, (game_id, signals) in enumerate(games):
+                final_score = float(columns['final_score'][i])
+                if final_score < min_score:
+                    continue
+
+                factors = ScoringFactors(
+                    strategy_performance=float(columns['strategy_performance'][i]),
+                    ml_confidence=float(ml_confidence[i]),
+                    market_efficiency=float(columns['market_efficiency'][i]),
+                    data_quality=float(columns['data_quality'][i]),
+                    consensus_strength=float(columns['consensus_strength'][i]),
+                    timing_factor=float(columns['timing_factor'][i]),
+                    value_potential=float(columns['value_potential'][i]),
+                    risk_adjustment=float(columns['risk_adjustment'][i]),
+                )
+
+                results.append(OpportunityScore(
+                    opportunity_id=f"opp_{game_id}_{int(scored_at.timestamp())}",
+                    game_id=game_id,
+                    signal_type=self._get_primary_signal_type(signals),
+                    composite_score=final_score,
+                    tier=self._determine_tier(final_score),
+                    confidence_level=self._determine_confidence_level(final_score, factors),
+                    expected_value=float(columns['expected_value'][i]),
+                    kelly_fraction=float(columns['kelly_fraction'][i]),
+                    risk_profile=user_risk_profile,
+                    scoring_factors=factors,
+                    factor_weights=self.factor_weights,
+                    contributing_signals=[s.signal_id for s in signals],
+                    ml_predictions=ml_predictions.get(game_id) or {},
+                    explanation_summary=self._generate_explanation_summary(factors, signals, final_score),
+                    scored_at=scored_at,
+                ))
+
+            results.sort(key=lambda x: x.composite_score, reverse=True)
+
+            self.logger.info(
+                f"Batch scored {len(games)} games with {len(table['game'])} signals: "
+                f"{len(results)} opportunities (min_score={min_score})"
+            )
+
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Error in batch opportunity scoring: {e}", exc_info=True)
+            return []
+
     # Private scoring methods
     
     async def _calculate_strategy_performance(self, signals: List[UnifiedBettingSignal]) -> float:
@@ -348,7 +428,7 @@ class OpportunityScoringEngine:
             
             for signal in signals:
                 # Get cached performance or calculate
-                performance = await self._get_strategy_performance(signal.signal_type.value)
+                performance = await self._get_strategy_performance(self._strategy_name(signal))
                 weight = signal.confidence_score * signal.signal_strength
                 
                 weighted_performance += performance * weight
@@ -363,36 +443,28 @@ class OpportunityScoringEngine:
             self.logger.error(f"Error calculating strategy performance: {e}")
             return 50.0
     
-    async def _calculate_ml_confidence(self, game_id: str, signals: List[UnifiedBettingSignal]) -> float:
-        """Calculate ML prediction confidence score (0-100)"""
-        try:
-            # Get ML predictions for the game
-            ml_prediction = await self.prediction_service.get_prediction(game_id, include_explanation=False)
-            
-            if not ml_prediction:
-                return 25.0  # Low confidence without ML data
-            
-            # Extract confidence scores from ML predictions
-            confidences = []
-            
-            # Check different prediction types
-            for field in ['home_ml_confidence', 'total_over_confidence', 'total_runs_confidence']:
-                if field in ml_prediction and ml_prediction[field] is not None:
-                    confidences.append(ml_prediction[field])
-            
-            if not confidences:
-                return 25.0
-            
-            # Calculate weighted average confidence
-            avg_confidence = sum(confidences) / len(confidences)
-            
-            # Convert to 0-100 scale
-            return min(100.0, avg_confidence * 100)
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating ML confidence: {e}")
+    def _ml_confidence_from_prediction(self, ml_prediction: Optional[Dict[str, Any]]) -> float:
+        """Convert an ML prediction into a confidence score (0-100)"""
+        if not ml_prediction:
+            return 25.0  # Low confidence without ML data
+
+        # Extract confidence scores from ML predictions
+        confidences = []
+
+        # Check different prediction types
+        for confidence_field in ['home_ml_confidence', 'total_over_confidence', 'total_runs_confidence']:
+            if confidence_field in ml_prediction and ml_prediction[confidence_field] is not None:
+                confidences.append(ml_prediction[confidence_field])
+
+        if not confidences:
             return 25.0
-    
+
+        # Calculate weighted average confidence
+        avg_confidence = sum(confidences) / len(confidences)
+
+        # Convert to 0-100 scale
+        return min(100.0, avg_confidence * 100)
+
     async def _calculate_market_efficiency(self, signals: List[UnifiedBettingSignal]) -> float:
         """Assess market efficiency based on signal dispersion (0-100)"""
         try:
@@ -649,16 +721,9 @@ class OpportunityScoringEngine:
             estimated_evs = []
             for signal in signals:
                 if signal.odds and signal.confidence_score:
-                    # Convert American odds to decimal
+                    # Positive odds are net odds here; negative odds are American
                     decimal_odds = signal.odds + 1 if signal.odds > 0 else (-100 / signal.odds) + 1
-                    implied_prob = 1 / decimal_odds
-                    
-                    # Simple EV calculation
-                    win_prob = signal.confidence_score
-                    payout = decimal_odds - 1
-                    
-                    ev = (win_prob * payout) - ((1 - win_prob) * 1)
-                    estimated_evs.append(ev)
+                    estimated_evs.append(odds_math.expected_value(signal.confidence_score, decimal_odds))
             
             if estimated_evs:
                 return sum(estimated_evs) / len(estimated_evs)
@@ -691,19 +756,12 @@ class OpportunityScoringEngine:
             # Convert to decimal odds
             decimal_odds = avg_odds + 1 if avg_odds > 0 else (-100 / avg_odds) + 1
             
-            # Kelly formula: (bp - q) / b
-            b = decimal_odds - 1  # Net odds
-            p = avg_confidence     # Win probability
-            q = 1 - p             # Loss probability
-            
-            kelly_fraction = (b * p - q) / b
-            
             # Apply risk profile limits
             profile_config = self.risk_profiles[risk_profile.value]
             max_kelly = profile_config['max_kelly']
             
             # Conservative Kelly (reduce by half for safety)
-            conservative_kelly = kelly_fraction * 0.5
+            conservative_kelly = odds_math.kelly_fraction(avg_confidence, decimal_odds) * 0.5
             
             return max(0.0, min(conservative_kelly, max_kelly))
             
@@ -712,9 +770,9 @@ class OpportunityScoringEngine:
             return 0.0
     
     async def _get_ml_predictions(self, game_id: str) -> Optional[Dict[str, Any]]:
-        """Get ML predictions for context"""
+        """Get the ML prediction used for confidence scoring and context"""
         try:
-            return await self.prediction_service.get_cached_prediction(game_id)
+            return await self.prediction_service.get_prediction(game_id, include_explanation=False)
         except Exception as e:
             self.logger.error(f"Error getting ML predictions for {game_id}: {e}")
             return None
@@ -791,49 +849,252 @@ class OpportunityScoringEngine:
             self.logger.error(f"Error generating explanation: {e}")
             return "Opportunity scored based on multiple factors - see detailed breakdown for specifics."
     
+    # Batch scoring helpers
+
+    def _build_signal_table(self, games: List[Tuple[str, List[UnifiedBettingSignal]]]) -> Dict[str, Any]:
+        """Flatten the signals of all games into column arrays keyed by game index"""
+        now = datetime.utcnow()
+        rows = [(index, signal) for index, (_, signals) in enumerate(games) for signal in signals]
+
+        def column(getter) -> np.ndarray:
+            return np.array([getter(signal) for _, signal in rows], dtype=float)
+
+        def age_hours(signal) -> float:
+            created_at = getattr(signal, 'created_at', None)
+            return (now - created_at).total_seconds() / 3600 if created_at else np.nan
+
+        # Consensus groups: one id per distinct (game, recommended side)
+        side_keys = [(index, signal.recommended_side) for index, signal in rows]
+        side_ids = {}
+        side_group = np.array([side_ids.setdefault(key, len(side_ids)) for key in side_keys], dtype=int)
+        side_game = np.array([index for index, _ in side_ids], dtype=int)
+
+        return {
+            'game': np.array([index for index, _ in rows], dtype=int),
+            'strategy': [self._strategy_name(signal) for _, signal in rows],
+            'strength': column(lambda s: s.signal_strength),
+            'confidence': column(lambda s: s.confidence_score),
+            'quality': column(lambda s: s.quality_score),
+            'validated': np.array([bool(signal.validation_passed) for _, signal in rows]),
+            'age_hours': column(age_hours),
+            'minutes_to_game': column(lambda s: s.minutes_to_game),
+            'expected_value': column(lambda s: np.nan if s.expected_value is None else s.expected_value),
+            'odds': column(lambda s: np.nan if s.odds is None else s.odds),
+            'side_group': side_group,
+            'side_game': side_game,
+        }
+
+    def _calculate_batch_factors(self,
+                                 table: Dict[str, Any],
+                                 num_games: int,
+                                 ml_confidence: np.ndarray,
+                                 risk_profile: RiskProfile) -> Dict[str, np.ndarray]:
+        """Vectorized equivalents of the per-game factor calculations"""
+        game = table['game']
+        strength = table['strength']
+        confidence = table['confidence']
+        odds = table['odds']
+        expected_value = table['expected_value']
+
+        def per_game(values) -> np.ndarray:
+            return np.bincount(game, weights=values, minlength=num_games)
+
+        def ratio(numerator, denominator) -> np.ndarray:
+            return np.divide(numerator, denominator, out=np.zeros(num_games), where=denominator != 0)
+
+        count = per_game(np.ones_like(strength))
+        weight = confidence * strength
+        total_weight = per_game(weight)
+
+        # 1. Strategy performance
+        strategy_performance = np.where(
+            total_weight == 0, 50.0,
+            np.minimum(100.0, ratio(per_game(table['performance'] * weight), total_weight))
+        )
+
+        # 3. Market efficiency from signal strength dispersion
+        mean_strength = per_game(strength) / count
+        variance = np.maximum(per_game(strength ** 2) / count - mean_strength ** 2, 0.0)
+        market_efficiency = np.where(
+            count < 2, 60.0, np.minimum(100.0, variance / (mean_strength + 0.01) * 200)
+        )
+
+        # 4. Data quality
+        quality = table['quality'] * 100 * np.where(table['validated'], 1.1, 0.8)
+        age_hours = table['age_hours']
+        freshness = np.where(
+            np.isnan(age_hours), 1.0, np.maximum(0.5, 1.0 - np.nan_to_num(age_hours) / 24)
+        )
+        data_quality = per_game(np.minimum(100.0, quality * freshness)) / count
+
+        # 5. Consensus strength
+        side_group = table['side_group']
+        side_game = table['side_game']
+        num_sides = np.bincount(side_game, minlength=num_games)
+        side_weight = np.bincount(side_group, weights=weight, minlength=len(side_game))
+        max_side_weight = np.zeros(num_games)
+        np.maximum.at(max_side_weight, side_game, side_weight)
+        high_confidence = per_game((confidence > 0.7).astype(float))
+        consensus_strength = np.where(
+            count < 2, 30.0,
+            np.where(
+                num_sides == 1,
+                90.0 + np.minimum(10.0, high_confidence * 2),
+                np.where(total_weight > 0, ratio(max_side_weight, total_weight) * 80, 40.0)
+            )
+        )
+        consensus_strength = np.minimum(100.0, consensus_strength)
+
+        # 6. Timing factor from average minutes to game
+        avg_minutes = per_game(table['minutes_to_game']) / count
+        timing_factor = np.select(
+            [avg_minutes <= limit for limit in (60, 120, 240, 480, 1440, 2880)],
+            [95.0, 85.0, 75.0, 65.0, 55.0, 45.0],
+            default=35.0
+        )
+
+        # 7. Value potential
+        has_ev = ~np.isnan(expected_value)
+        has_odds = ~np.isnan(odds) & (odds != 0) & (confidence != 0)
+        safe_odds = np.where(has_odds, odds, 1.0)
+        implied_prob = np.where(safe_odds > 0, 1 / safe_odds, 0.5)
+        estimated_value = (confidence - implied_prob) * strength
+        value_included = has_ev | has_odds
+        value = np.where(has_ev, np.nan_to_num(expected_value), estimated_value)
+        value_count = per_game(value_included.astype(float))
+        avg_value = ratio(per_game(np.where(value_included, value, 0.0)), value_count)
+        value_potential = np.where(
+            value_count == 0, 40.0, np.clip((avg_value + 0.1) * 250, 0.0, 100.0)
+        )
+
+        # Composite and risk-adjusted score
+        composite = np.clip(
+            strategy_performance * self.factor_weights['strategy_performance'] +
+            ml_confidence * self.factor_weights['ml_confidence'] +
+            market_efficiency * self.factor_weights['market_efficiency'] +
+            data_quality * self.factor_weights['data_quality'] +
+            consensus_strength * self.factor_weights['consensus_strength'] +
+            timing_factor * self.factor_weights['timing_factor'] +
+            value_potential * self.factor_weights['value_potential'],
+            0.0, 100.0
+        )
+
+        profile_config = self.risk_profiles[risk_profile.value]
+        avg_confidence = per_game(confidence) / count
+        mixed_penalty = {RiskProfile.CONSERVATIVE: 0.7, RiskProfile.MODERATE: 0.85}.get(risk_profile, 1.0)
+        risk_adjustment = (
+            np.where(avg_confidence < profile_config['min_confidence'], 0.8, 1.0) *
+            np.where(num_sides > 1, mixed_penalty, 1.0)
+        )
+        final_score = composite * risk_adjustment
+
+        # Expected value: signal EVs, else estimates from odds, else from strategy performance
+        ev_count = per_game(has_ev.astype(float))
+        decimal_odds = np.where(safe_odds > 0, safe_odds + 1, -100 / safe_odds + 1)
+        estimated_ev = odds_math.expected_value_array(confidence, decimal_odds)
+        estimate_count = per_game(has_odds.astype(float))
+        opportunity_ev = np.where(
+            ev_count > 0,
+            ratio(per_game(np.where(has_ev, np.nan_to_num(expected_value), 0.0)), ev_count),
+            np.where(
+                estimate_count > 0,
+                ratio(per_game(np.where(has_odds, estimated_ev, 0.0)), estimate_count),
+                (strategy_performance / 100 - 0.5) * 0.1
+            )
+        )
+
+        # Half Kelly on average positive odds, capped by the risk profile
+        positive_odds = ~np.isnan(odds) & (odds > 0)
+        positive_count = per_game(positive_odds.astype(float))
+        avg_odds = ratio(per_game(np.where(positive_odds, odds, 0.0)), positive_count)
+        net_odds = np.where(positive_count > 0, avg_odds, 1.0)
+        kelly = odds_math.kelly_fraction_array(avg_confidence, net_odds + 1)
+        kelly_fraction = np.where(
+            (opportunity_ev > 0) & (positive_count > 0),
+            np.clip(kelly * 0.5, 0.0, profile_config['max_kelly']),
+            0.0
+        )
+
+        return {
+            'strategy_performance': strategy_performance,
+            'market_efficiency': market_efficiency,
+            'data_quality': data_quality,
+            'consensus_strength': consensus_strength,
+            'timing_factor': timing_factor,
+            'value_potential': value_potential,
+            'risk_adjustment': risk_adjustment,
+            'final_score': final_score,
+            'expected_value': opportunity_ev,
+            'kelly_fraction': kelly_fraction,
+        }
+
+    async def _get_ml_predictions_batch(self, game_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Fetch ML predictions for many games with bounded concurrency"""
+        semaphore = asyncio.Semaphore(self.config.get('ml_prediction_concurrency', 10))
+
+        async def fetch(game_id: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self.prediction_service.get_prediction(game_id, include_explanation=False)
+                except Exception as e:
+                    self.logger.error(f"Error getting ML prediction for {game_id}: {e}")
+                    return None
+
+        predictions = await asyncio.gather(*(fetch(game_id) for game_id in game_ids))
+        return dict(zip(game_ids, predictions, strict=True))
+
+    @staticmethod
+    def _strategy_name(signal: UnifiedBettingSignal) -> str:
+        """Strategy name for a signal (signal types may be stored as enum values)"""
+        return getattr(signal.signal_type, 'value', signal.signal_type)
+
     async def _get_strategy_performance(self, strategy_name: str) -> float:
         """Get cached strategy performance or calculate from database"""
         try:
-            # Check cache first
-            cache_key = f"performance_{strategy_name}"
-            if (cache_key in self._performance_cache and 
-                cache_key in self._cache_expiry and
-                datetime.utcnow() < self._cache_expiry[cache_key]):
-                return self._performance_cache[cache_key]
-            
-            # Get database connection and query strategy performance
+            performance = await self._load_strategy_performance([strategy_name])
+            return performance[strategy_name]
+
+        except Exception as e:
+            self.logger.error(f"Error getting strategy performance for {strategy_name}: {e}")
+            return 55.0  # Default neutral performance
+
+    async def _load_strategy_performance(self, strategy_names) -> Dict[str, float]:
+        """Get performance for several strategies, querying all uncached ones at once"""
+        now = datetime.utcnow()
+        missing = [
+            name for name in set(strategy_names)
+            if not (f"performance_{name}" in self._performance_cache and
+                    f"performance_{name}" in self._cache_expiry and
+                    now < self._cache_expiry[f"performance_{name}"])
+        ]
+
+        if missing:
+            rows_by_strategy = {}
             try:
-                import asyncpg
-                from src.core.config import get_settings
-                
-                config = get_settings()
-                db_config = config.database
-                
-                conn = await asyncpg.connect(
-                    host=db_config.host,
-                    port=db_config.port,
-                    user=db_config.user,
-                    password=db_config.password,
-                    database=db_config.database
-                )
-                
                 # Query historical strategy performance
                 performance_query = """
                     SELECT 
+                        bs.strategy_name,
                         AVG(CASE WHEN outcome = 'WIN' THEN 1.0 ELSE 0.0 END) * 100 as win_rate,
                         COUNT(*) as total_bets,
                         COALESCE(AVG(CASE WHEN outcome = 'WIN' THEN profit ELSE -stake END), 0) as avg_profit
                     FROM analysis.strategy_results sr
                     JOIN analysis.betting_strategies bs ON sr.strategy_id = bs.strategy_id
-                    WHERE bs.strategy_name = $1
+                    WHERE bs.strategy_name = ANY($1::text[])
                       AND sr.created_at >= NOW() - INTERVAL '6 months'
                       AND sr.status = 'COMPLETED'
                     GROUP BY bs.strategy_name
                 """
                 
-                result = await conn.fetchrow(performance_query, strategy_name)
-                await conn.close()
+                async with get_database_connection() as conn:
+                    rows = await conn.fetch(performance_query, missing)
+                rows_by_strategy = {row['strategy_name']: row for row in rows}
                 
+            except Exception as db_error:
+                self.logger.warning(f"Database query failed for strategies {missing}: {db_error}")
+
+            for strategy_name in missing:
+                result = rows_by_strategy.get(strategy_name)
                 if result and result['total_bets'] >= 10:  # Minimum sample size
                     # Weight win rate more heavily, but consider profitability
                     win_rate = float(result['win_rate'])
@@ -849,20 +1110,11 @@ class OpportunityScoringEngine:
                     performance = self._get_fallback_performance(strategy_name)
                     self.logger.info(f"Using fallback performance for {strategy_name}: {performance:.1f}% (insufficient data)")
                 
-            except Exception as db_error:
-                self.logger.warning(f"Database query failed for strategy {strategy_name}: {db_error}")
-                # Fallback to estimated performance
-                performance = self._get_fallback_performance(strategy_name)
-            
-            # Cache the result
-            self._performance_cache[cache_key] = performance
-            self._cache_expiry[cache_key] = datetime.utcnow() + timedelta(hours=4)
-            
-            return performance
-            
-        except Exception as e:
-            self.logger.error(f"Error getting strategy performance for {strategy_name}: {e}")
-            return 55.0  # Default neutral performance
+                # Cache the result
+                self._performance_cache[f"performance_{strategy_name}"] = performance
+                self._cache_expiry[f"performance_{strategy_name}"] = now + timedelta(hours=4)
+
+        return {name: self._performance_cache[f"performance_{name}"] for name in strategy_names}
     
     def _get_fallback_performance(self, strategy_name: str) -> float:
         """Get fallback performance estimates when database data is insufficient"""
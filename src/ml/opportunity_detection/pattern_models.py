@@ -0,0 +1,198 @@
+"""
+Pattern Recognition Models
+
+Offline-trained anomaly and market clustering models for MLPatternRecognition.
+
+Models are fitted on historical signal feature matrices, versioned and
+persisted with joblib, and loaded once when the service starts. Online
+detection only calls ``transform``, ``decision_function`` and ``predict``,
+so results are reproducible across requests and carry no fitting cost.
+
+Layout of the model directory:
+- ``pattern_models_<version>.joblib``: a PatternModelBundle
+- ``latest.json``: manifest naming the current version
+
+The directory defaults to ``ml_pipeline.pattern_model_dir``. Models are
+trained with ``ml-training train-patterns`` from a JSON Lines export of
+historical signals (see ``load_signal_history``).
+
+Part of Issue #59: AI-Powered Betting Opportunity Discovery
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import joblib
+import numpy as np
+from sklearn.cluster import KMeans
+from sklearn.ensemble import IsolationForest
+from sklearn.preprocessing import StandardScaler
+
+from src.analysis.models.unified_models import UnifiedBettingSignal
+from src.core.config import get_settings
+from src.core.logging import LogComponent, get_logger
+
+MANIFEST_FILENAME = "latest.json"
+
+logger = get_logger("ml.pattern_models", LogComponent.ANALYSIS)
+
+
+def default_pattern_model_dir() -> Path:
+    """Configured model directory (ml_pipeline.pattern_model_dir)"""
+    return Path(get_settings().ml_pipeline.pattern_model_dir)
+
+
+@dataclass
+class PatternModelBundle:
+    """Fitted scaler, anomaly detector and market clusterer with metadata"""
+    version: str
+    trained_at: datetime
+    feature_count: int
+    n_training_samples: int
+    scaler: StandardScaler
+    anomaly_detector: IsolationForest
+    clusterer: KMeans
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def filename(self) -> str:
+        return f"pattern_models_{self.version}.joblib"
+
+    def is_compatible(self, feature_matrix: np.ndarray) -> bool:
+        """Whether a feature matrix matches the schema the models were trained on"""
+        return feature_matrix.ndim == 2 and feature_matrix.shape[1] == self.feature_count
+
+
+def fit_pattern_models(feature_matrix: np.ndarray,
+                       config: Optional[Dict[str, Any]] = None) -> PatternModelBundle:
+    """
+    Fit the scaler, anomaly detector and clusterer on historical features
+
+    Args:
+        feature_matrix: Stacked signal feature rows from historical games
+        config: Optional overrides (anomaly_contamination, anomaly_estimators,
+            n_market_clusters, random_state)
+
+    Returns:
+        Fitted, not yet persisted, model bundle
+    """
+    config = config or {}
+    n_samples = feature_matrix.shape[0]
+    if n_samples < 2:
+        raise ValueError(f"Need at least 2 historical signals to fit pattern models, got {n_samples}")
+
+    random_state = config.get('random_state', 42)
+    n_clusters = min(config.get('n_market_clusters', 8), n_samples)
+
+    scaler = StandardScaler().fit(feature_matrix)
+    scaled = scaler.transform(feature_matrix)
+
+    anomaly_detector = IsolationForest(
+        contamination=config.get('anomaly_contamination', 0.1),
+        n_estimators=config.get('anomaly_estimators', 100),
+        random_state=random_state
+    ).fit(feature_matrix)
+
+    clusterer = KMeans(n_clusters=n_clusters, n_init=10, random_state=random_state).fit(scaled)
+
+    trained_at = datetime.utcnow()
+    return PatternModelBundle(
+        version=trained_at.strftime("%Y%m%d%H%M%S"),
+        trained_at=trained_at,
+        feature_count=feature_matrix.shape[1],
+        n_training_samples=n_samples,
+        scaler=scaler,
+        anomaly_detector=anomaly_detector,
+        clusterer=clusterer,
+        metadata={
+            'n_market_clusters': n_clusters,
+            'cluster_sizes': np.bincount(clusterer.labels_, minlength=n_clusters).tolist(),
+            'anomaly_contamination': anomaly_detector.contamination,
+            'random_state': random_state,
+        }
+    )
+
+
+def save_pattern_models(bundle: PatternModelBundle,
+                        model_dir: Optional[Path] = None) -> Path:
+    """Persist a bundle and point the manifest at its version"""
+    model_dir = Path(model_dir or default_pattern_model_dir())
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    model_path = model_dir / bundle.filename
+    joblib.dump(bundle, model_path)
+
+    manifest = {
+        'version': bundle.version,
+        'file': bundle.filename,
+        'trained_at': bundle.trained_at.isoformat(),
+        'feature_count': bundle.feature_count,
+        'n_training_samples': bundle.n_training_samples,
+        'metadata': bundle.metadata,
+    }
+    # Write then rename so readers never see a partial manifest
+    tmp_path = model_dir / f".{MANIFEST_FILENAME}.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    tmp_path.replace(model_dir / MANIFEST_FILENAME)
+
+    logger.info(
+        f"Saved pattern models version {bundle.version} to {model_path} "
+        f"({bundle.n_training_samples} training samples)"
+    )
+    return model_path
+
+
+def load_pattern_models(model_dir: Optional[Path] = None,
+                        version: Optional[str] = None) -> Optional[PatternModelBundle]:
+    """
+    Load a persisted bundle (the manifest's version unless one is given)
+
+    Returns:
+        The bundle, or None when no trained models are available
+    """
+    model_dir = Path(model_dir or default_pattern_model_dir())
+
+    if version is None:
+        manifest_path = model_dir / MANIFEST_FILENAME
+        if not manifest_path.exists():
+            logger.warning(f"No trained pattern models found in {model_dir}")
+            return None
+        version = json.loads(manifest_path.read_text())['version']
+
+    model_path = model_dir / f"pattern_models_{version}.joblib"
+    if not model_path.exists():
+        logger.warning(f"Pattern model version {version} not found in {model_dir}")
+        return None
+
+    bundle = joblib.load(model_path)
+    logger.info(
+        f"Loaded pattern models version {bundle.version} "
+        f"(trained {bundle.trained_at.isoformat()}, {bundle.n_training_samples} samples)"
+    )
+    return bundle
+
+
+def load_signal_history(path: Path) -> Dict[str, List[UnifiedBettingSignal]]:
+    """
+    Read historical signals for offline training, grouped by game
+
+    Args:
+        path: JSON Lines file with one serialized UnifiedBettingSignal per line
+
+    Returns:
+        Signals keyed by game ID, in file order
+    """
+    signals_by_game: Dict[str, List[UnifiedBettingSignal]] = {}
+    with Path(path).open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                signal = UnifiedBettingSignal.model_validate_json(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: invalid signal record: {e}") from e
+            signals_by_game.setdefault(signal.game_id, []).append(signal)
+    return signals_by_game
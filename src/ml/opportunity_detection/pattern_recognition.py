@@ -22,13 +22,11 @@ from typing import Any, Dict, List, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
 import warnings
+from pathlib import Path
 warnings.filterwarnings('ignore', category=FutureWarning)
 
 import numpy as np
 import polars as pl
-from sklearn.cluster import KMeans, DBSCAN
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import IsolationForest
 from sklearn.decomposition import PCA
 from sklearn.metrics.pairwise import cosine_similarity
 from scipy import stats
@@ -37,6 +35,13 @@ import joblib
 
 from src.analysis.models.unified_models import UnifiedBettingSignal, SignalType
 from src.core.logging import get_logger, LogComponent
+from src.ml.opportunity_detection.pattern_models import (
+    PatternModelBundle,
+    default_pattern_model_dir,
+    fit_pattern_models,
+    load_pattern_models,
+    save_pattern_models,
+)
 
 
 class PatternType(str, Enum):
@@ -110,14 +115,12 @@ class MLPatternRecognition:
         self.config = config or {}
         self.logger = get_logger("ml.pattern_recognition", LogComponent.ANALYSIS)
         
-        # ML models (will be trained/loaded)
-        self.anomaly_detector = None
-        self.market_clusterer = None
-        self.scaler = StandardScaler()
+        # Offline-trained anomaly and clustering models (see load_models)
+        self.model_dir = Path(self.config.get('model_dir') or default_pattern_model_dir())
+        self.models: Optional[PatternModelBundle] = None
         
         # Pattern recognition parameters
         self.anomaly_threshold = self.config.get('anomaly_threshold', -0.1)
-        self.cluster_eps = self.config.get('cluster_eps', 0.5)
         self.min_cluster_samples = self.config.get('min_cluster_samples', 3)
         self.historical_lookback_days = self.config.get('historical_lookback_days', 30)
         
@@ -139,6 +142,69 @@ class MLPatternRecognition:
         config_summary = {k: v for k, v in self.config.items() if k != 'feature_weights'}
         self.logger.info(f"MLPatternRecognition initialized with config: {config_summary}")
     
+    def load_models(self, version: Optional[str] = None) -> bool:
+        """
+        Load the persisted anomaly and clustering models
+        
+        Called once at service start. Without trained models, anomaly and
+        cluster patterns are skipped; the rule-based detectors still run.
+        
+        Args:
+            version: Specific model version (latest when omitted)
+            
+        Returns:
+            True if models were loaded
+        """
+        try:
+            self.models = load_pattern_models(self.model_dir, version)
+        except Exception as e:
+            self.logger.error(f"Failed to load pattern models from {self.model_dir}: {e}", exc_info=True)
+            self.models = None
+        return self.models is not None
+    
+    async def train_models(self,
+                           signals_by_game: Dict[str, List[UnifiedBettingSignal]],
+                           market_data_by_game: Optional[Dict[str, Dict[str, Any]]] = None,
+                           save: bool = True) -> PatternModelBundle:
+        """
+        Offline training job: fit anomaly and clustering models on historical signals
+        
+        Args:
+            signals_by_game: Historical signals keyed by game ID
+            market_data_by_game: Market context per game (optional)
+            save: Persist the new version and make it the latest
+            
+        Returns:
+            The fitted model bundle, which also becomes the active models
+        """
+        market_data_by_game = market_data_by_game or {}
+        matrices = []
+        for game_id, signals in signals_by_game.items():
+            if not signals:
+                continue
+            feature_matrix = await self._extract_pattern_features(
+                signals, market_data_by_game.get(game_id, {})
+            )
+            if feature_matrix.ndim == 2 and feature_matrix.shape[0] > 0:
+                matrices.append(feature_matrix)
+        
+        if not matrices:
+            raise ValueError("No historical signal features to train pattern models on")
+        
+        training_matrix = np.vstack(matrices)
+        bundle = fit_pattern_models(training_matrix, self.config.get('training', {}))
+        bundle.metadata['n_training_games'] = len(matrices)
+        
+        if save:
+            save_pattern_models(bundle, self.model_dir)
+        
+        self.models = bundle
+        self.logger.info(
+            f"Trained pattern models version {bundle.version} on {training_matrix.shape[0]} signals "
+            f"from {len(matrices)} games"
+        )
+        return bundle
+    
     async def detect_patterns(self, 
                             signals: List[UnifiedBettingSignal],
                             game_id: str,
@@ -154,33 +220,116 @@ class MLPatternRecognition:
         Returns:
             List of detected patterns with confidence scores
         """
+        if not signals:
+            self.logger.warning(f"No signals provided for pattern detection in game {game_id}")
+            return []
+        
+        patterns_by_game = await self.detect_patterns_batch(
+            {game_id: signals}, {game_id: market_data or {}}
+        )
+        return patterns_by_game.get(game_id, [])
+    
+    async def detect_patterns_batch(self,
+                                    signals_by_game: Dict[str, List[UnifiedBettingSignal]],
+                                    market_data_by_game: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, List[DetectedPattern]]:
+        """
+        Detect patterns for many games with one model inference pass
+        
+        Feature rows of all games are stacked so the anomaly detector and
+        clusterer each run once; results are then split back per game.
+        
+        Args:
+            signals_by_game: Betting signals keyed by game ID
+            market_data_by_game: Market context per game (optional)
+            
+        Returns:
+            Ranked patterns keyed by game ID
+        """
+        market_data_by_game = market_data_by_game or {}
+        results: Dict[str, List[DetectedPattern]] = {}
+        
         try:
-            if not signals:
-                self.logger.warning(f"No signals provided for pattern detection in game {game_id}")
-                return []
+            # Extract features per game
+            games = []
+            for game_id, signals in signals_by_game.items():
+                if not signals:
+                    results[game_id] = []
+                    continue
+                feature_matrix = await self._extract_pattern_features(
+                    signals, market_data_by_game.get(game_id, {})
+                )
+                if feature_matrix.ndim != 2 or feature_matrix.shape[0] == 0:
+                    self.logger.warning(f"No features extracted for game {game_id}")
+                    results[game_id] = []
+                    continue
+                games.append((game_id, signals, feature_matrix))
             
-            self.logger.info(f"Detecting patterns for game {game_id} with {len(signals)} signals")
+            if not games:
+                return results
             
-            # Extract features from signals
-            feature_matrix = await self._extract_pattern_features(signals, market_data or {})
+            # Single inference pass across all games
+            model_outputs = self._run_models(np.vstack([matrix for _, _, matrix in games]))
             
-            if feature_matrix.shape[0] == 0:
-                self.logger.warning(f"No features extracted for game {game_id}")
-                return []
+            offset = 0
+            for game_id, signals, feature_matrix in games:
+                rows = slice(offset, offset + feature_matrix.shape[0])
+                offset = rows.stop
+                game_outputs = (
+                    {name: values[rows] for name, values in model_outputs.items()}
+                    if model_outputs else None
+                )
+                results[game_id] = await self._detect_game_patterns(
+                    game_id, signals, feature_matrix, game_outputs
+                )
             
-            patterns = []
+            return results
             
-            # 1. Anomaly detection
-            anomaly_patterns = await self._detect_anomaly_patterns(
-                feature_matrix, signals, game_id
+        except Exception as e:
+            self.logger.error(f"Error detecting patterns for {len(signals_by_game)} games: {e}", exc_info=True)
+            return {game_id: results.get(game_id, []) for game_id in signals_by_game}
+    
+    def _run_models(self, feature_matrix: np.ndarray) -> Optional[Dict[str, np.ndarray]]:
+        """Score stacked feature rows with the pre-trained models"""
+        if self.models is None:
+            return None
+        
+        if not self.models.is_compatible(feature_matrix):
+            self.logger.error(
+                f"Pattern models version {self.models.version} expect {self.models.feature_count} "
+                f"features, got {feature_matrix.shape[1]}; retrain the models"
             )
-            patterns.extend(anomaly_patterns)
+            return None
+        
+        scaled_features = self.models.scaler.transform(feature_matrix)
+        return {
+            'anomaly_scores': self.models.anomaly_detector.decision_function(feature_matrix),
+            'anomaly_labels': self.models.anomaly_detector.predict(feature_matrix),
+            'scaled_features': scaled_features,
+            'cluster_labels': self.models.clusterer.predict(scaled_features),
+        }
+    
+    async def _detect_game_patterns(self,
+                                    game_id: str,
+                                    signals: List[UnifiedBettingSignal],
+                                    feature_matrix: np.ndarray,
+                                    model_outputs: Optional[Dict[str, np.ndarray]]) -> List[DetectedPattern]:
+        """Run every detector for one game and rank the combined patterns"""
+        try:
+            self.logger.info(f"Detecting patterns for game {game_id} with {len(signals)} signals")
+            
+            patterns = []
             
+            # 1. Anomaly detection
             # 2. Clustering analysis
-            cluster_patterns = await self._detect_cluster_patterns(
-                feature_matrix, signals, game_id
-            )
-            patterns.extend(cluster_patterns)
+            if model_outputs is not None:
+                patterns.extend(await self._detect_anomaly_patterns(
+                    feature_matrix, signals, game_id,
+                    model_outputs['anomaly_scores'], model_outputs['anomaly_labels']
+                ))
+                patterns.extend(await self._detect_cluster_patterns(
+                    feature_matrix, signals, game_id,
+                    model_outputs['scaled_features'], model_outputs['cluster_labels']
+                ))
             
             # 3. Time series pattern detection
             temporal_patterns = await self._detect_temporal_patterns(
@@ -234,10 +383,10 @@ class MLPatternRecognition:
                     len(signal.book_sources) if signal.book_sources else 0,
                 ])
                 
-                # Signal type encoding (one-hot)
+                # Signal type encoding (one-hot); signals may carry the enum value
                 signal_type_features = [0] * len(SignalType)
-                if hasattr(SignalType, signal.signal_type.value.upper()):
-                    type_index = list(SignalType).index(signal.signal_type)
+                if signal.signal_type in SignalType._value2member_map_:
+                    type_index = list(SignalType).index(SignalType(signal.signal_type))
                     signal_type_features[type_index] = 1
                 signal_features.extend(signal_type_features)
                 
@@ -288,30 +437,11 @@ class MLPatternRecognition:
     async def _detect_anomaly_patterns(self, 
                                      feature_matrix: np.ndarray,
                                      signals: List[UnifiedBettingSignal],
-                                     game_id: str) -> List[DetectedPattern]:
-        """Detect anomalous patterns using isolation forest"""
+                                     game_id: str,
+                                     anomaly_scores: np.ndarray,
+                                     anomaly_labels: np.ndarray) -> List[DetectedPattern]:
+        """Turn pre-trained isolation forest scores for a game's signals into patterns"""
         try:
-            if feature_matrix.shape[0] < 2:
-                return []
-            
-            # Initialize anomaly detector if needed
-            if self.anomaly_detector is None:
-                self.anomaly_detector = IsolationForest(
-                    contamination=0.1,
-                    random_state=42,
-                    n_estimators=100
-                )
-                
-                # For single-sample scenarios, we need to create a baseline
-                # In production, this would be trained on historical data
-                baseline_features = self._create_baseline_features(feature_matrix)
-                extended_matrix = np.vstack([feature_matrix, baseline_features])
-                self.anomaly_detector.fit(extended_matrix)
-            
-            # Detect anomalies
-            anomaly_scores = self.anomaly_detector.decision_function(feature_matrix)
-            anomaly_labels = self.anomaly_detector.predict(feature_matrix)
-            
             patterns = []
             
             for i, (score, label, signal) in enumerate(zip(anomaly_scores, anomaly_labels, signals)):
@@ -351,30 +481,19 @@ class MLPatternRecognition:
     async def _detect_cluster_patterns(self, 
                                      feature_matrix: np.ndarray,
                                      signals: List[UnifiedBettingSignal],
-                                     game_id: str) -> List[DetectedPattern]:
-        """Detect clustering patterns in market behavior"""
+                                     game_id: str,
+                                     normalized_features: np.ndarray,
+                                     cluster_labels: np.ndarray) -> List[DetectedPattern]:
+        """Group a game's signals by their pre-trained market cluster"""
         try:
-            if feature_matrix.shape[0] < 3:  # Need at least 3 points for clustering
-                return []
-            
-            # Normalize features
-            normalized_features = self.scaler.fit_transform(feature_matrix)
-            
-            # Apply DBSCAN clustering
-            clusterer = DBSCAN(eps=self.cluster_eps, min_samples=self.min_cluster_samples)
-            cluster_labels = clusterer.fit_predict(normalized_features)
-            
             patterns = []
             unique_clusters = set(cluster_labels)
             
             for cluster_id in unique_clusters:
-                if cluster_id == -1:  # Noise points
-                    continue
-                
                 cluster_mask = cluster_labels == cluster_id
                 cluster_signals = [s for i, s in enumerate(signals) if cluster_mask[i]]
                 
-                if len(cluster_signals) < 2:
+                if len(cluster_signals) < max(2, self.min_cluster_samples):
                     continue
                 
                 # Analyze cluster characteristics
@@ -582,25 +701,6 @@ class MLPatternRecognition:
         
         return features
     
-    def _create_baseline_features(self, feature_matrix: np.ndarray) -> np.ndarray:
-        """Create baseline feature patterns for anomaly detection training"""
-        # Create synthetic "normal" patterns based on the input data
-        num_features = feature_matrix.shape[1]
-        baseline_size = max(10, feature_matrix.shape[0] * 5)  # At least 10 baseline samples
-        
-        # Generate normal patterns around the mean with reasonable variation
-        mean_features = np.mean(feature_matrix, axis=0)
-        std_features = np.std(feature_matrix, axis=0)
-        
-        # Create baseline by adding small random variations to the mean
-        baseline_features = np.random.normal(
-            loc=mean_features,
-            scale=std_features * 0.5,  # Smaller variation for "normal" patterns
-            size=(baseline_size, num_features)
-        )
-        
-        return baseline_features
-    
     def _classify_anomaly_pattern(self, signal: UnifiedBettingSignal, anomaly_score: float) -> PatternType:
         """Classify the type of anomaly pattern based on signal characteristics"""
         # Simple classification logic - in production this would be more sophisticated
@@ -835,7 +935,7 @@ class MLPatternRecognition:
                                     cluster_signals: List[UnifiedBettingSignal]) -> str:
         """Generate description for cluster pattern"""
         signal_count = len(cluster_signals)
-        signal_types = list(set(s.signal_type.value for s in cluster_signals))
+        signal_types = list(set(SignalType(s.signal_type).value for s in cluster_signals))
         
         return f"Cluster of {signal_count} similar signals ({', '.join(signal_types)}) indicating {pattern_type.value}"
     
@@ -845,7 +945,7 @@ class MLPatternRecognition:
         """Extract key indicators for anomaly pattern"""
         indicators = []
         
-        indicators.append(f"Signal type: {signal.signal_type.value}")
+        indicators.append(f"Signal type: {SignalType(signal.signal_type).value}")
         indicators.append(f"Confidence: {signal.confidence_score:.2f}")
         indicators.append(f"Strength: {signal.signal_strength:.2f}")
         indicators.append(f"Time to game: {signal.minutes_to_game} minutes")
@@ -1,13 +1,18 @@
 """
 Feature Drift Detection Service
 Monitors feature importance changes and distribution drift over time
+
+Distributions come from incrementally maintained per-day feature sketches
+(see ..monitoring.drift_sketches), so a drift cycle merges and compares
+sketches instead of re-reading feature vectors.
 """
 
 import logging
 import asyncio
 from typing import Dict, Any, List, Optional, Tuple, Union
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass
+from types import SimpleNamespace
 import json
 import numpy as np
 from scipy import stats
@@ -15,6 +20,15 @@ from collections import defaultdict
 
 from ...core.config import get_settings
 from ..database.connection_pool import get_database_connection, get_db_transaction
+from ..monitoring.drift_sketches import (
+    FEATURE_COMPONENTS,
+    MIN_FEATURE_COMPLETENESS,
+    MIN_TRACKED_IMPORTANCE,
+    FeatureSketch,
+    FeatureSketchStore,
+    extract_feature_values,
+    population_stability_index,
+)
 from .mlflow_integration import mlflow_service
 
 logger = logging.getLogger(__name__)
@@ -48,6 +62,7 @@ class DriftBaseline:
     distribution_stats: Dict[str, Any]
     sample_size: int
     created_at: datetime
+    sketch: Optional[FeatureSketch] = None
 
 
 class FeatureDriftDetectionService:
@@ -64,7 +79,9 @@ class FeatureDriftDetectionService:
             "distribution_drift": 0.1,  # KS test p-value threshold
             "psi_threshold": 0.2,  # Population Stability Index threshold
             "min_sample_size": 100,  # Minimum sample size for reliable drift detection
-            "importance_threshold": 0.01,  # Minimum importance to monitor
+            "min_current_sample_size": 200,  # Below this, PSI sampling noise nears psi_threshold
+            "importance_threshold": MIN_TRACKED_IMPORTANCE,  # Minimum importance to monitor
+            "baseline_days": 30,  # Days of sketches before the current window
         }
 
         # Baseline cache
@@ -72,6 +89,8 @@ class FeatureDriftDetectionService:
         self._last_cache_update = None
         self.cache_ttl = timedelta(hours=6)
 
+        self.sketch_store = FeatureSketchStore()
+
     async def detect_feature_drift(
         self, model_name: str, model_version: str = None, lookback_days: int = 7
     ) -> List[FeatureDriftResult]:
@@ -89,7 +108,7 @@ class FeatureDriftDetectionService:
         try:
             # Get baseline feature importance
             baseline_features = await self._get_baseline_feature_importance(
-                model_name, model_version
+                model_name, model_version, lookback_days
             )
 
             if not baseline_features:
@@ -138,12 +157,12 @@ class FeatureDriftDetectionService:
             return []
 
     async def _get_baseline_feature_importance(
-        self, model_name: str, model_version: str = None
+        self, model_name: str, model_version: str = None, lookback_days: int = 7
     ) -> Dict[str, DriftBaseline]:
-        """Get baseline feature importance from historical data"""
+        """Get baseline feature distributions from the sketches preceding the current window"""
         try:
             # Check cache first
-            cache_key = f"{model_name}_{model_version or 'latest'}"
+            cache_key = f"{model_name}_{model_version or 'latest'}_{lookback_days}"
             if (
                 cache_key in self._baseline_cache
                 and self._last_cache_update
@@ -151,94 +170,25 @@ class FeatureDriftDetectionService:
             ):
                 return self._baseline_cache[cache_key]
 
+            current_start, _ = self._current_window(lookback_days)
+            baseline_start = current_start - timedelta(
+                days=self.thresholds["baseline_days"]
+            )
+
             async with get_database_connection() as conn:
-                # Get baseline feature importance from successful predictions
-                # Look at the last 30 days of stable performance
-                version_clause = "AND mp.model_version = $2" if model_version else ""
-                params = [model_name]
-                if model_version:
-                    params.append(model_version)
-
-                query = f"""
-                    SELECT 
-                        fv.temporal_features,
-                        fv.market_features,
-                        fv.team_features,
-                        fv.betting_splits_features,
-                        mp.feature_importance,
-                        fv.created_at,
-                        mp.accuracy,
-                        mp.confidence_score
-                    FROM curated.ml_predictions mp
-                    JOIN curated.ml_feature_vectors fv ON mp.game_id = fv.game_id
-                    WHERE mp.model_name = $1
-                    {version_clause}
-                    AND mp.created_at >= NOW() - INTERVAL '30 days'
-                    AND mp.accuracy >= 0.5  -- Only use successful predictions
-                    AND fv.feature_completeness_score >= 0.7
-                    ORDER BY mp.created_at DESC
-                    LIMIT 1000
-                """
+                sketches = await self.sketch_store.load(
+                    conn, model_name, baseline_start, current_start, model_version
+                )
 
-                rows = await conn.fetch(query, *params)
-
-                if not rows:
-                    return {}
-
-                # Aggregate feature importance across predictions
-                baseline_features = {}
-                feature_values = defaultdict(list)
-
-                for row in rows:
-                    # Extract feature importance if available
-                    if row["feature_importance"]:
-                        importance_data = json.loads(row["feature_importance"])
-                        for feature_name, importance in importance_data.items():
-                            if importance >= self.thresholds["importance_threshold"]:
-                                feature_values[feature_name].append(importance)
-
-                    # Also extract feature values for distribution analysis
-                    for feature_type, features_json in [
-                        ("temporal", row["temporal_features"]),
-                        ("market", row["market_features"]),
-                        ("team", row["team_features"]),
-                        ("betting_splits", row["betting_splits_features"]),
-                    ]:
-                        if features_json:
-                            features = json.loads(features_json)
-                            for feature_name, value in features.items():
-                                if isinstance(value, (int, float)):
-                                    feature_key = f"{feature_type}_{feature_name}"
-                                    feature_values[feature_key].append(value)
-
-                # Create baseline objects
-                for feature_name, values in feature_values.items():
-                    if len(values) >= self.thresholds["min_sample_size"]:
-                        values_array = np.array(values)
-                        baseline_features[feature_name] = DriftBaseline(
-                            feature_name=feature_name,
-                            feature_type=self._determine_feature_type(feature_name),
-                            importance=np.mean(values_array),
-                            distribution_stats={
-                                "mean": float(np.mean(values_array)),
-                                "std": float(np.std(values_array)),
-                                "min": float(np.min(values_array)),
-                                "max": float(np.max(values_array)),
-                                "percentiles": {
-                                    "25": float(np.percentile(values_array, 25)),
-                                    "50": float(np.percentile(values_array, 50)),
-                                    "75": float(np.percentile(values_array, 75)),
-                                },
-                            },
-                            sample_size=len(values),
-                            created_at=datetime.utcnow(),
-                        )
+            baseline_features = self._baselines_from_sketches(
+                sketches, self.thresholds["min_sample_size"]
+            )
 
-                # Update cache
-                self._baseline_cache[cache_key] = baseline_features
-                self._last_cache_update = datetime.utcnow()
+            # Update cache
+            self._baseline_cache[cache_key] = baseline_features
+            self._last_cache_update = datetime.utcnow()
 
-                return baseline_features
+            return baseline_features
 
         except Exception as e:
             logger.error(f"Error getting baseline feature importance: {e}")
@@ -247,93 +197,113 @@ class FeatureDriftDetectionService:
     async def _get_current_feature_importance(
         self, model_name: str, model_version: str = None, lookback_days: int = 7
     ) -> Dict[str, DriftBaseline]:
-        """Get current feature importance from recent data"""
+        """Get current feature distributions from the sketches of the last lookback_days"""
         try:
-            async with get_database_connection() as conn:
-                version_clause = "AND mp.model_version = $3" if model_version else ""
-                params = [model_name, lookback_days]
-                if model_version:
-                    params.append(model_version)
-
-                query = f"""
-                    SELECT 
-                        fv.temporal_features,
-                        fv.market_features,
-                        fv.team_features,
-                        fv.betting_splits_features,
-                        mp.feature_importance,
-                        fv.created_at,
-                        mp.accuracy,
-                        mp.confidence_score
-                    FROM curated.ml_predictions mp
-                    JOIN curated.ml_feature_vectors fv ON mp.game_id = fv.game_id
-                    WHERE mp.model_name = $1
-                    AND mp.created_at >= NOW() - INTERVAL '%s days'
-                    {version_clause}
-                    AND fv.feature_completeness_score >= 0.7
-                    ORDER BY mp.created_at DESC
-                """
+            current_start, current_end = self._current_window(lookback_days)
 
-                rows = await conn.fetch(query, *params)
-
-                if not rows:
-                    return {}
-
-                # Aggregate current feature importance
-                current_features = {}
-                feature_values = defaultdict(list)
-
-                for row in rows:
-                    # Extract feature importance if available
-                    if row["feature_importance"]:
-                        importance_data = json.loads(row["feature_importance"])
-                        for feature_name, importance in importance_data.items():
-                            if importance >= self.thresholds["importance_threshold"]:
-                                feature_values[feature_name].append(importance)
-
-                    # Extract feature values for distribution analysis
-                    for feature_type, features_json in [
-                        ("temporal", row["temporal_features"]),
-                        ("market", row["market_features"]),
-                        ("team", row["team_features"]),
-                        ("betting_splits", row["betting_splits_features"]),
-                    ]:
-                        if features_json:
-                            features = json.loads(features_json)
-                            for feature_name, value in features.items():
-                                if isinstance(value, (int, float)):
-                                    feature_key = f"{feature_type}_{feature_name}"
-                                    feature_values[feature_key].append(value)
-
-                # Create current feature objects
-                for feature_name, values in feature_values.items():
-                    if len(values) >= 10:  # Lower threshold for current data
-                        values_array = np.array(values)
-                        current_features[feature_name] = DriftBaseline(
-                            feature_name=feature_name,
-                            feature_type=self._determine_feature_type(feature_name),
-                            importance=np.mean(values_array),
-                            distribution_stats={
-                                "mean": float(np.mean(values_array)),
-                                "std": float(np.std(values_array)),
-                                "min": float(np.min(values_array)),
-                                "max": float(np.max(values_array)),
-                                "percentiles": {
-                                    "25": float(np.percentile(values_array, 25)),
-                                    "50": float(np.percentile(values_array, 50)),
-                                    "75": float(np.percentile(values_array, 75)),
-                                },
-                            },
-                            sample_size=len(values),
-                            created_at=datetime.utcnow(),
-                        )
+            async with get_database_connection() as conn:
+                sketches = await self.sketch_store.load(
+                    conn, model_name, current_start, current_end, model_version
+                )
 
-                return current_features
+            return self._baselines_from_sketches(
+                sketches, self.thresholds["min_current_sample_size"]
+            )
 
         except Exception as e:
             logger.error(f"Error getting current feature importance: {e}")
             return {}
 
+    def _current_window(self, lookback_days: int) -> Tuple[date, date]:
+        """[start, end) of the current window in sketch days, including today"""
+        end = datetime.utcnow().date() + timedelta(days=1)
+        return end - timedelta(days=lookback_days), end
+
+    def _baselines_from_sketches(
+        self, sketches: Dict[str, FeatureSketch], min_sample_size: int
+    ) -> Dict[str, DriftBaseline]:
+        """Build drift baselines from merged sketches with enough observations"""
+        return {
+            feature_name: DriftBaseline(
+                feature_name=feature_name,
+                feature_type=self._determine_feature_type(feature_name),
+                importance=sketch.mean,
+                distribution_stats=sketch.distribution_stats(),
+                sample_size=sketch.count,
+                created_at=datetime.utcnow(),
+                sketch=sketch,
+            )
+            for feature_name, sketch in sketches.items()
+            if sketch.count >= min_sample_size
+        }
+
+    async def rebuild_feature_sketches(self, model_name: str, days: int = 37) -> int:
+        """
+        Rebuild daily sketches for a model from stored predictions and feature vectors
+
+        One-off full scan for seeding sketches from history; regular updates
+        happen as predictions are stored. Returns the number of rows folded in.
+        """
+        try:
+            query = f"""
+                SELECT
+                    mp.model_version,
+                    mp.created_at::date AS window_start,
+                    mp.feature_importance,
+                    fv.temporal_features,
+                    fv.market_features,
+                    fv.team_features,
+                    fv.betting_splits_features
+                FROM curated.ml_predictions mp
+                JOIN curated.ml_feature_vectors fv ON mp.game_id = fv.game_id
+                WHERE mp.model_name = $1
+                AND mp.created_at >= NOW() - make_interval(days => $2)
+                AND fv.feature_completeness_score >= {MIN_FEATURE_COMPLETENESS}
+            """
+
+            windows = defaultdict(dict)
+            rows_processed = 0
+
+            async with get_db_transaction() as conn:
+                async for row in conn.cursor(query, model_name, days):
+                    vector = SimpleNamespace(
+                        **{
+                            attribute: json.loads(row[attribute])
+                            if row[attribute]
+                            else None
+                            for _, attribute in FEATURE_COMPONENTS
+                        }
+                    )
+                    importance = (
+                        json.loads(row["feature_importance"])
+                        if row["feature_importance"]
+                        else None
+                    )
+                    sketches = windows[
+                        (row["model_version"] or "latest", row["window_start"])
+                    ]
+                    for feature_name, value in extract_feature_values(
+                        vector, importance
+                    ).items():
+                        sketches.setdefault(feature_name, FeatureSketch()).add(value)
+                    rows_processed += 1
+
+                for (model_version, window_start), sketches in windows.items():
+                    await self.sketch_store.replace(
+                        conn, model_name, model_version, window_start, sketches
+                    )
+
+            self._baseline_cache.clear()
+            logger.info(
+                f"Rebuilt {len(windows)} daily sketch windows for {model_name} "
+                f"from {rows_processed} predictions"
+            )
+            return rows_processed
+
+        except Exception as e:
+            logger.error(f"Error rebuilding feature sketches for {model_name}: {e}")
+            return 0
+
     def _determine_feature_type(self, feature_name: str) -> str:
         """Determine feature type from feature name"""
         if feature_name.startswith("temporal_"):
@@ -377,8 +347,16 @@ class FeatureDriftDetectionService:
             std_drift = abs(1.0 - std_ratio)
             drift_scores.append(min(std_drift, 1.0))
 
-            # Method 2: Population Stability Index (PSI) approximation
-            psi_score = self._calculate_psi_approximation(baseline_stats, current_stats)
+            # Method 2: Population Stability Index (PSI) over baseline-quantile
+            # buckets when both sides have sketches
+            if baseline.sketch is not None and current.sketch is not None:
+                psi_score = population_stability_index(baseline.sketch, current.sketch)
+                detection_method = "sketch_comparison"
+            else:
+                psi_score = self._calculate_psi_approximation(
+                    baseline_stats, current_stats
+                )
+                detection_method = "statistical_comparison"
             drift_scores.append(min(psi_score / self.thresholds["psi_threshold"], 1.0))
 
             # Overall drift score (weighted average)
@@ -399,7 +377,7 @@ class FeatureDriftDetectionService:
                 importance_drift=importance_drift,
                 drift_score=drift_score,
                 drift_detected=drift_detected,
-                detection_method="statistical_comparison",
+                detection_method=detection_method,
                 sample_size=current.sample_size,
                 baseline_distribution=baseline.distribution_stats,
                 current_distribution=current.distribution_stats,
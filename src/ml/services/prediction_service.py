@@ -21,8 +21,11 @@ from pydantic import ValidationError
 
 from ..features.feature_pipeline import FeaturePipeline
 from ..features.redis_feature_store import RedisFeatureStore
+from ..features.slate_snapshot import get_slate_snapshot
+from .prediction_writer import PendingPrediction, PredictionWriteBehind
 from ..training.lightgbm_trainer import LightGBMTrainer
-from ..database.connection_pool import get_db_transaction
+from ..monitoring.drift_sketches import FeatureSketchStore
+from ...core import odds_math
 
 try:
     from ...core.config import get_settings
@@ -46,6 +49,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Decimal odds assumed for EV and Kelly when the market price is unknown (+100)
+EVEN_DECIMAL_ODDS = 2.0
+
 
 class PredictionService:
     """Service for handling ML predictions and model management"""
@@ -58,6 +64,9 @@ class PredictionService:
         self.redis_store = None
         self.trainer = None
         self.config = None
+        self.drift_sketch_store = FeatureSketchStore()
+        self.slate_snapshot = get_slate_snapshot()
+        self.prediction_writer = PredictionWriteBehind(self.drift_sketch_store)
         
         # Initialize resource monitoring
         self.resource_monitor = None
@@ -135,6 +144,12 @@ class PredictionService:
             try:
                 ml_config = self.config.ml_pipeline
                 redis_ttl = ml_config.feature_cache_ttl_seconds
+                self.prediction_writer.configure(
+                    batch_size=ml_config.prediction_write_batch_size,
+                    flush_interval=ml_config.prediction_write_flush_seconds,
+                    max_queue_size=ml_config.prediction_write_queue_size,
+                    spool_path=ml_config.prediction_spool_path,
+                )
             except (AttributeError, ImportError):
                 redis_ttl = 900  # Fallback
 
@@ -145,6 +160,11 @@ class PredictionService:
             await self.redis_store.initialize()
             logger.info("✅ Redis feature store initialized")
 
+            # Share extracted features with other services and processes
+            self.slate_snapshot.configure(
+                ttl_seconds=redis_ttl, redis_store=self.redis_store
+            )
+
             # Initialize trainer for model loading
             # LightGBMTrainer creates its own feature_pipeline and redis_store internally
             self.trainer = LightGBMTrainer(
@@ -160,6 +180,9 @@ class PredictionService:
             # Load active models
             await self._load_active_models()
 
+            # Start batched prediction persistence (replays any spooled predictions)
+            self.prediction_writer.start()
+
             logger.info("✅ ML Prediction Service initialized with all components")
 
         except Exception as e:
@@ -245,6 +268,7 @@ class PredictionService:
     async def cleanup(self):
         """Cleanup resources"""
         try:
+            await self.prediction_writer.stop()
             if self.db_pool:
                 await self.db_pool.close()
             logger.info("✅ Prediction service cleaned up")
@@ -286,6 +310,31 @@ class PredictionService:
                 logger.error(f"Invalid game_id format: {game_id}")
                 return None
 
+            if include_explanation:
+                return await self._generate_prediction(
+                    game_id, game_id_int, model_name, include_explanation
+                )
+
+            # Scoring, discovery and API requests for the same game share one computation
+            return await self.slate_snapshot.get_prediction(
+                game_id_int,
+                model_name,
+                lambda: self._generate_prediction(game_id, game_id_int, model_name),
+            )
+
+        except Exception as e:
+            logger.error(f"Prediction error for game {game_id}: {e}", exc_info=True)
+            return None
+
+    async def _generate_prediction(
+        self,
+        game_id: str,
+        game_id_int: int,
+        model_name: Optional[str],
+        include_explanation: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """Load or compute a prediction for a game"""
+        try:
             # 1. Check cache for existing prediction
             cached_prediction = await self._get_cached_prediction_data(
                 game_id_int, model_name
@@ -307,8 +356,13 @@ class PredictionService:
                 return None
 
             # 3. Extract features
-            feature_vector = await self.feature_pipeline.extract_features_for_game(
-                game_id=game_id_int, cutoff_time=cutoff_time
+            feature_vector = await self.slate_snapshot.get_features(
+                game_id_int,
+                cutoff_time,
+                lambda: self.feature_pipeline.extract_features_for_game(
+                    game_id=game_id_int, cutoff_time=cutoff_time
+                ),
+                feature_version=self.feature_pipeline.feature_version,
             )
 
             if not feature_vector:
@@ -390,8 +444,8 @@ class PredictionService:
             # 6. Cache prediction
             await self._cache_prediction(game_id_int, prediction_response)
 
-            # 7. Store in database
-            await self._store_prediction_in_database(
+            # 7. Queue for batched storage in the database
+            self._store_prediction_in_database(
                 game_id_int, prediction_response, feature_vector
             )
 
@@ -647,63 +701,16 @@ class PredictionService:
         except Exception as e:
             logger.error(f"Prediction caching error for game {game_id}: {e}")
 
-    async def _store_prediction_in_database(
+    def _store_prediction_in_database(
         self, game_id: int, prediction_data: Dict[str, Any], feature_vector
     ):
-        """Store prediction in database with proper transaction management"""
+        """Queue a prediction for write-behind storage (and drift sketch updates)"""
         try:
-            async with get_db_transaction() as conn:
-                # Store in ml_predictions table
-                query = """
-                    INSERT INTO curated.ml_predictions (
-                        game_id, feature_vector_id, model_name, model_version,
-                        prediction_target, prediction_value, prediction_probability,
-                        confidence_score, feature_version, created_at
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                    ON CONFLICT (game_id, model_name, prediction_target) 
-                    DO UPDATE SET
-                        prediction_value = EXCLUDED.prediction_value,
-                        prediction_probability = EXCLUDED.prediction_probability,
-                        confidence_score = EXCLUDED.confidence_score,
-                        updated_at = NOW()
-                """
-
-                # Store each prediction target separately
-                for target_key, field_mapping in [
-                    (
-                        "moneyline_home_win",
-                        ("home_ml_probability", "home_ml_binary", "home_ml_confidence"),
-                    ),
-                    (
-                        "total_over_under",
-                        (
-                            "total_over_probability",
-                            "total_over_binary",
-                            "total_over_confidence",
-                        ),
-                    ),
-                ]:
-                    prob_field, binary_field, conf_field = field_mapping
-
-                    if prob_field in prediction_data:
-                        await conn.execute(
-                            query,
-                            game_id,  # game_id
-                            feature_vector.id if hasattr(feature_vector, 'id') else None,  # feature_vector_id
-                            prediction_data.get("model_name", "unknown"),
-                            prediction_data.get("model_version", "1.0"),
-                            target_key,  # prediction_target
-                            prediction_data.get(binary_field),  # prediction_value
-                            prediction_data.get(prob_field),  # prediction_probability
-                            prediction_data.get(conf_field),  # confidence_score
-                            feature_vector.feature_version,
-                            datetime.utcnow(),
-                        )
-
-                logger.info(f"Stored prediction in database for game {game_id}")
-
+            self.prediction_writer.submit(
+                PendingPrediction.from_prediction(game_id, prediction_data, feature_vector)
+            )
         except Exception as e:
-            logger.error(f"Database storage error for game {game_id}: {e}")
+            logger.error(f"Failed to queue prediction storage for game {game_id}: {e}")
 
     async def get_batch_predictions(
         self,
@@ -784,11 +791,16 @@ class PredictionService:
         try:
             game_id_int = int(game_id)
 
-            # First check Redis cache
+            # First check the in-process snapshot, then Redis
+            cached_data = self.slate_snapshot.peek_prediction(game_id_int, model_name)
+            if cached_data:
+                return cached_data
+
             cached_data = await self._get_cached_prediction_data(
                 game_id_int, model_name
             )
             if cached_data:
+                self.slate_snapshot.put_prediction(game_id_int, model_name, cached_data)
                 return cached_data
 
             # If not in cache, check database
@@ -818,6 +830,7 @@ class PredictionService:
 
                     # Cache the result for future requests
                     await self._cache_prediction(game_id_int, prediction_data)
+                    self.slate_snapshot.put_prediction(game_id_int, model_name, prediction_data)
 
                     return prediction_data
 
@@ -1403,6 +1416,8 @@ class PredictionService:
         else:
             stats["resource_allocation"] = {"enabled": False}
 
+        stats["persistence"] = self.prediction_writer.get_stats()
+
         return stats
     
     def _check_confidence_threshold(self, feature_vector, predictions) -> bool:
@@ -1454,13 +1469,8 @@ class PredictionService:
             probability = pred_data["probability"]
             confidence = pred_data.get("confidence", 0.5)
             
-            # Simple EV calculation: (probability * payout) - (1 - probability) * stake
-            # Assuming American odds of +100 for simplicity
-            implied_prob = 0.5  # Market efficiency assumption
-            stake = 1.0
-            payout = 1.0
-            
-            expected_value = (probability * payout) - ((1 - probability) * stake)
+            # Assuming even odds (+100) for simplicity
+            expected_value = odds_math.expected_value(probability, EVEN_DECIMAL_ODDS)
             
             # Adjust for confidence
             adjusted_ev = expected_value * confidence
@@ -1479,16 +1489,8 @@ class PredictionService:
             probability = pred_data["probability"]
             confidence = pred_data.get("confidence", 0.5)
             
-            # Kelly formula: (bp - q) / b
-            # b = odds received (assuming +100 = 1.0)
-            # p = probability of winning
-            # q = probability of losing (1 - p)
-            
-            b = 1.0  # Even odds
-            p = probability
-            q = 1 - probability
-            
-            kelly_fraction = (b * p - q) / b
+            # Assuming even odds (+100) for simplicity
+            kelly_fraction = odds_math.kelly_fraction(probability, EVEN_DECIMAL_ODDS)
             
             # Cap Kelly at reasonable levels and adjust for confidence
             kelly_fraction = max(0, min(kelly_fraction * confidence, 0.25))
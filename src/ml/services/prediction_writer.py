@@ -0,0 +1,399 @@
+"""
+Prediction Write-Behind
+Batched, asynchronous persistence of served predictions
+
+Predictions are queued in-process and written by a background worker, so
+serving a prediction never waits on Postgres. The worker flushes when a batch
+fills or the flush interval elapses, writing the whole batch as a single
+multi-row upsert and folding its feature values into the drift sketches in
+the same transaction.
+
+Batches that cannot be written (Postgres unavailable) and predictions
+submitted while the queue is full are appended to a local JSON-lines spool
+file and replayed by the worker until they are stored.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ...core.config import PROJECT_ROOT
+from ..database.connection_pool import get_db_transaction
+from ..monitoring.drift_sketches import FeatureSketch, extract_feature_values
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_QUEUE_SIZE = 5000
+DEFAULT_RETRY_INTERVAL_SECONDS = 30.0
+DEFAULT_SPOOL_PATH = PROJECT_ROOT / "data" / "spool" / "ml_predictions.jsonl"
+
+PREDICTION_COLUMNS = (
+    "game_id",
+    "feature_vector_id",
+    "model_name",
+    "model_version",
+    "prediction_target",
+    "prediction_value",
+    "prediction_probability",
+    "confidence_score",
+    "feature_version",
+    "created_at",
+)
+
+# Response fields (probability, binary, confidence) stored for each target
+PREDICTION_TARGET_FIELDS = [
+    (
+        "moneyline_home_win",
+        ("home_ml_probability", "home_ml_binary", "home_ml_confidence"),
+    ),
+    (
+        "total_over_under",
+        ("total_over_probability", "total_over_binary", "total_over_confidence"),
+    ),
+]
+
+# Postgres allows at most 32767 bind parameters per statement
+MAX_ROWS_PER_INSERT = 32767 // len(PREDICTION_COLUMNS)
+
+
+@lru_cache(maxsize=64)
+def build_insert_query(row_count: int) -> str:
+    """Multi-row upsert into curated.ml_predictions for row_count rows"""
+    width = len(PREDICTION_COLUMNS)
+    values = ",\n".join(
+        "("
+        + ", ".join(f"${row * width + column + 1}" for column in range(width))
+        + ")"
+        for row in range(row_count)
+    )
+    return f"""
+        INSERT INTO curated.ml_predictions ({", ".join(PREDICTION_COLUMNS)})
+        VALUES {values}
+        ON CONFLICT (game_id, model_name, prediction_target)
+        DO UPDATE SET
+            prediction_value = EXCLUDED.prediction_value,
+            prediction_probability = EXCLUDED.prediction_probability,
+            confidence_score = EXCLUDED.confidence_score,
+            updated_at = NOW()
+    """
+
+
+@dataclass
+class PendingPrediction:
+    """A served prediction waiting to be persisted"""
+
+    game_id: int
+    model_name: str
+    model_version: str
+    rows: List[Tuple] = field(default_factory=list)
+    feature_values: Dict[str, float] = field(default_factory=dict)
+    observed_at: datetime = field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def from_prediction(
+        cls, game_id: int, prediction_data: Dict[str, Any], feature_vector
+    ) -> "PendingPrediction":
+        """Capture the rows and drift observations for a prediction response"""
+        model_name = prediction_data.get("model_name", "unknown")
+        model_version = prediction_data.get("model_version", "1.0")
+        observed_at = datetime.utcnow()
+
+        rows = []
+        for target, (prob_field, binary_field, conf_field) in PREDICTION_TARGET_FIELDS:
+            if prob_field in prediction_data:
+                rows.append(
+                    (
+                        game_id,
+                        getattr(feature_vector, "id", None),
+                        model_name,
+                        model_version,
+                        target,
+                        prediction_data.get(binary_field),
+                        prediction_data.get(prob_field),
+                        prediction_data.get(conf_field),
+                        feature_vector.feature_version,
+                        observed_at,
+                    )
+                )
+
+        feature_importance = {}
+        for explanation in (prediction_data.get("explanation") or {}).values():
+            if isinstance(explanation, dict):
+                feature_importance.update(explanation.get("feature_importance") or {})
+
+        return cls(
+            game_id=game_id,
+            model_name=model_name,
+            model_version=model_version,
+            rows=rows,
+            feature_values=extract_feature_values(feature_vector, feature_importance),
+            observed_at=observed_at,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["rows"] = [list(row[:-1]) + [row[-1].isoformat()] for row in self.rows]
+        data["observed_at"] = self.observed_at.isoformat()
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, line: str) -> "PendingPrediction":
+        data = json.loads(line)
+        data["rows"] = [
+            tuple(row[:-1]) + (datetime.fromisoformat(row[-1]),) for row in data["rows"]
+        ]
+        data["observed_at"] = datetime.fromisoformat(data["observed_at"])
+        return cls(**data)
+
+
+class PredictionWriteBehind:
+    """
+    Bounded write-behind queue for prediction persistence.
+
+    ``submit`` never blocks or raises; the worker started by ``start`` owns
+    all database writes. ``stop`` flushes everything still queued.
+    """
+
+    def __init__(
+        self,
+        drift_sketch_store=None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL_SECONDS,
+        spool_path: Union[str, Path] = DEFAULT_SPOOL_PATH,
+    ):
+        self.drift_sketch_store = drift_sketch_store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.retry_interval = retry_interval
+        self.spool_path = Path(spool_path)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._writing: Optional[asyncio.Future] = None
+        self._next_replay = 0.0
+
+        self.stats = {
+            "submitted": 0,
+            "stored": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "spooled": 0,
+            "replayed": 0,
+        }
+
+    def configure(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        spool_path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """Apply settings loaded after construction (before the worker starts)"""
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        if max_queue_size is not None:
+            self.max_queue_size = max_queue_size
+        if spool_path is not None:
+            self.spool_path = Path(spool_path)
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self) -> None:
+        """Start the background writer on the running event loop"""
+        if self.running:
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the writer after persisting (or spooling) everything queued"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        # A batch already taken off the queue finishes its write
+        if self._writing is not None and not self._writing.done():
+            await self._writing
+        await self.flush()
+
+    def submit(self, pending: PendingPrediction) -> None:
+        """Queue a prediction for persistence, spooling it if the queue is full"""
+        if not pending.rows:
+            return
+
+        self.stats["submitted"] += 1
+        if not self.running:
+            self.start()
+        try:
+            self._queue.put_nowait(pending)
+        except asyncio.QueueFull:
+            self._spool([pending])
+
+    async def flush(self) -> None:
+        """Write everything queued right now"""
+        while self._queue is not None and not self._queue.empty():
+            batch = []
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._write_batch(batch)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": self.running,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            if time.monotonic() >= self._next_replay:
+                await self._replay_spool()
+
+            batch = await self._gather()
+            if batch:
+                self._writing = asyncio.ensure_future(self._write_batch(batch))
+                await asyncio.shield(self._writing)
+
+    async def _gather(self) -> List[PendingPrediction]:
+        """Collect up to batch_size predictions, flushing early after flush_interval"""
+        try:
+            first = await asyncio.wait_for(self._queue.get(), self.retry_interval)
+        except asyncio.TimeoutError:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write_batch(self, batch: List[PendingPrediction]) -> bool:
+        if not batch:
+            return True
+        try:
+            await self._store(batch)
+        except Exception as e:
+            self.stats["failed_batches"] += 1
+            logger.warning(f"Prediction batch write failed, spooling {len(batch)} predictions: {e}")
+            self._spool(batch)
+            self._next_replay = time.monotonic() + self.retry_interval
+            return False
+
+        self.stats["batches"] += 1
+        self.stats["stored"] += len(batch)
+        return True
+
+    async def _store(self, batch: List[PendingPrediction]) -> None:
+        # Later predictions for the same target win; an upsert may not touch a row twice
+        rows = {}
+        for pending in batch:
+            for row in pending.rows:
+                rows[(row[0], row[2], row[4])] = row
+        rows = list(rows.values())
+
+        async with get_db_transaction() as conn:
+            for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+                chunk = rows[start:start + MAX_ROWS_PER_INSERT]
+                await conn.execute(
+                    build_insert_query(len(chunk)),
+                    *[value for row in chunk for value in row],
+                )
+            await self._update_drift_sketches(conn, batch)
+
+        logger.debug(f"Stored {len(rows)} prediction rows for {len(batch)} predictions")
+
+    async def _update_drift_sketches(self, conn, batch: List[PendingPrediction]) -> None:
+        """Merge the batch's feature values into one sketch update per model and day"""
+        if self.drift_sketch_store is None:
+            return
+
+        windows = defaultdict(lambda: defaultdict(FeatureSketch))
+        for pending in batch:
+            window = windows[(pending.model_name, pending.model_version, pending.observed_at.date())]
+            for feature_name, value in pending.feature_values.items():
+                window[feature_name].add(value)
+
+        for (model_name, model_version, window_start), sketches in windows.items():
+            if not sketches:
+                continue
+            try:
+                # Savepoint so a sketch failure never rolls back the predictions
+                async with conn.transaction():
+                    await self.drift_sketch_store.merge(
+                        conn, model_name, model_version, window_start, dict(sketches)
+                    )
+            except Exception as e:
+                logger.warning(f"Drift sketch update failed: {e}")
+
+    def _spool(self, batch: List[PendingPrediction]) -> None:
+        """Append predictions to the spool file, durably"""
+        try:
+            self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spool_path, "a", encoding="utf-8") as spool:
+                spool.writelines(pending.to_json() + "\n" for pending in batch)
+                spool.flush()
+                os.fsync(spool.fileno())
+            self.stats["spooled"] += len(batch)
+        except Exception as e:
+            logger.error(f"Failed to spool {len(batch)} predictions to {self.spool_path}: {e}")
+
+    async def _replay_spool(self) -> None:
+        """Retry spooled predictions, re-spooling whatever still fails"""
+        self._next_replay = time.monotonic() + self.retry_interval
+
+        # Claim the current spool; new failures append to a fresh file meanwhile
+        replaying = self.spool_path.with_name(self.spool_path.name + ".replaying")
+        if not replaying.exists():
+            if not self.spool_path.exists():
+                return
+            os.replace(self.spool_path, replaying)
+
+        pending = []
+        with open(replaying, encoding="utf-8") as spool:
+            for line in spool:
+                if not line.strip():
+                    continue
+                try:
+                    pending.append(PendingPrediction.from_json(line))
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.error(f"Dropping unreadable spooled prediction: {e}")
+
+        if pending:
+            logger.info(f"Replaying {len(pending)} spooled predictions")
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            if await self._write_batch(batch):
+                self.stats["replayed"] += len(batch)
+            else:
+                # _write_batch spooled the failed batch; keep the rest in order behind it
+                self._spool(pending[start + self.batch_size:])
+                break
+
+        os.remove(replaying)
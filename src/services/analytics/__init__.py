@@ -6,8 +6,24 @@ Advanced analytics services for MLB betting system including:
 - Performance attribution modeling
 - Distribution analysis and outlier detection
 - Time series analysis and forecasting
+- Pre-aggregated line movement rollups
+- Watermark-keyed caching of analysis results
+- Cross-book arbitrage and middle scanning of live odds
 """
 
+from .analysis_result_cache import AnalysisResultCache, get_analysis_result_cache
+from .cross_book_scanner import CrossBookOpportunity, CrossBookScanner, get_cross_book_scanner
+from .line_movement_rollup_service import LineMovementRollupService, get_line_movement_rollup_service
 from .statistical_analysis_service import StatisticalAnalysisService, get_statistical_analysis_service
 
-__all__ = ['StatisticalAnalysisService', 'get_statistical_analysis_service']
\ No newline at end of file
+__all__ = [
+    'AnalysisResultCache',
+    'CrossBookOpportunity',
+    'CrossBookScanner',
+    'LineMovementRollupService',
+    'StatisticalAnalysisService',
+    'get_analysis_result_cache',
+    'get_cross_book_scanner',
+    'get_line_movement_rollup_service',
+    'get_statistical_analysis_service',
+]
\ No newline at end of file
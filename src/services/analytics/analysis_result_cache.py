@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Analysis Result Cache
+
+Caches statistical analysis results for the analytics API:
+- Keys are a canonical hash of the operation, its filter set and a data
+  watermark describing the rows inside the filtered window
+- In-process LRU with a TTL, optionally backed by Redis so API workers
+  share results
+
+A new watermark produces a new key, so results only go stale when data
+lands inside the filtered window; superseded entries age out of the LRU.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from ...core.config import get_settings
+from ...core.enhanced_logging import LogComponent, get_contextual_logger
+
+logger = get_contextual_logger(__name__, LogComponent.ANALYSIS)
+
+DEFAULT_NAMESPACE = "analytics:stats"
+
+
+def _canonical(value: Any) -> Any:
+    """Normalize a filter value so equivalent filter sets hash identically."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_canonical(v) for v in value]
+        # Filter lists are sets of values; their order does not change the result
+        return sorted(items, key=lambda v: json.dumps(v, sort_keys=True, default=str))
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if hasattr(value, "model_dump"):
+        return _canonical(value.model_dump())
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for analysis results (numpy scalars, datetimes)."""
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def cache_key(operation: str, filters: Dict[str, Any], watermark: Any) -> str:
+    """Canonical cache key for an operation, filter set and data watermark."""
+    payload = json.dumps(
+        {
+            "operation": operation,
+            "filters": _canonical(filters),
+            "watermark": _canonical(watermark),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnalysisResultCache:
+    """
+    LRU cache for analysis results with an optional Redis tier.
+
+    Results must be JSON-serializable when Redis is enabled. Cached values
+    are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 86400,
+        redis_url: Optional[str] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.redis_url = redis_url
+        self.namespace = namespace
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._redis = None
+        self._redis_failed = False
+
+        self.hits = 0
+        self.misses = 0
+        self.redis_hits = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    async def get_or_compute(
+        self,
+        operation: str,
+        filters: Dict[str, Any],
+        watermark: Any,
+        compute: Callable[[], Union[Any, Awaitable[Any]]],
+    ) -> Any:
+        """
+        Return the cached result for this filter set and watermark, computing
+        it once on a miss. Concurrent misses for the same key share a single
+        computation.
+        """
+        if not self.enabled:
+            return await self._call(compute)
+
+        key = cache_key(operation, filters, watermark)
+
+        cached = self._get_local(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._get_redis(key)
+            if result is not None:
+                self.redis_hits += 1
+            else:
+                self.misses += 1
+                result = await self._call(compute)
+                await self._set_redis(key, result)
+
+            self._set_local(key, result)
+            future.set_result(result)
+            logger.debug("Analysis result cached", operation=operation, key=key[:12])
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve the exception so an unawaited future does not warn
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+            "redis_enabled": bool(self.redis_url) and not self._redis_failed,
+        }
+
+    @staticmethod
+    async def _call(compute):
+        result = compute()
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    def _get_local(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _redis_client(self):
+        if not self.redis_url or self._redis_failed:
+            return None
+        if self._redis is None:
+            try:
+                import redis.asyncio as redis
+
+                self._redis = redis.from_url(self.redis_url)
+            except Exception as e:
+                self._disable_redis(e)
+        return self._redis
+
+    def _disable_redis(self, error: Exception) -> None:
+        # Redis is an optimization; fall back to the in-memory tier for good
+        logger.warning("Analysis result cache Redis tier disabled", error=str(error))
+        self._redis_failed = True
+        self._redis = None
+
+    async def _get_redis(self, key: str) -> Any:
+        client = await self._redis_client()
+        if client is None:
+            return None
+        try:
+            payload = await client.get(f"{self.namespace}:{key}")
+        except Exception as e:
+            self._disable_redis(e)
+            return None
+        return json.loads(payload) if payload else None
+
+    async def _set_redis(self, key: str, value: Any) -> None:
+        client = await self._redis_client()
+        if client is None:
+            return
+        try:
+            await client.set(
+                f"{self.namespace}:{key}",
+                json.dumps(value, default=_json_default),
+                ex=int(self.ttl_seconds),
+            )
+        except Exception as e:
+            self._disable_redis(e)
+
+
+# Singleton instance
+_analysis_result_cache = None
+
+def get_analysis_result_cache() -> AnalysisResultCache:
+    """Get or create the analysis result cache configured from dashboard settings."""
+    global _analysis_result_cache
+    if _analysis_result_cache is None:
+        dashboard = get_settings().dashboard
+        _analysis_result_cache = AnalysisResultCache(
+            max_entries=dashboard.analytics_cache_max_entries,
+            ttl_seconds=dashboard.analytics_cache_ttl_seconds,
+            redis_url=dashboard.analytics_cache_redis_url,
+        )
+    return _analysis_result_cache
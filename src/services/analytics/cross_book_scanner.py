@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+"""
+Cross-Book Scanner
+
+Keeps the latest quote for every (game, market, sportsbook) of the slate in
+dense NumPy arrays, updated as unified staging records land, and scans them
+for cross-book opportunities:
+- Arbitrage: the best-priced pair of books on opposite sides of a market
+  whose combined implied probability is below one
+- Middles: the most generous spread/total line on each side, taken at
+  different books, leaving a band of final scores where both bets win
+
+Each scan is a handful of array reductions over the book axis for every
+touched game at once, so detection costs microseconds per game instead of a
+Python loop over book pairs. New or changed opportunities are published on
+the monitoring event bus with ingest and detection timestamps.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ...core import odds_math
+from ...core.enhanced_logging import LogComponent, get_contextual_logger
+from ..monitoring.event_bus import publish_event
+
+logger = get_contextual_logger(__name__, LogComponent.ANALYSIS)
+
+# Market axis; each market has two sides on the last axis of the odds array
+MARKETS = ("moneyline", "spread", "total")
+MARKET_SIDES = {
+    "moneyline": ("home", "away"),
+    "spread": ("home", "away"),
+    "total": ("over", "under"),
+}
+MONEYLINE, SPREAD, TOTAL = range(len(MARKETS))
+
+OPPORTUNITY_EVENT = "cross_book_opportunity"
+
+DEFAULT_MAX_QUOTE_AGE_SECONDS = 900
+DEFAULT_MIN_ARBITRAGE_MARGIN = 0.0
+DEFAULT_INITIAL_GAMES = 32
+DEFAULT_INITIAL_BOOKS = 16
+
+
+def _utc(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def _quote_time(record: Any, ingested: float) -> float:
+    """Epoch seconds a record's quotes were collected, never after ingest"""
+    collected_at = getattr(record, "collected_at", None)
+    if isinstance(collected_at, datetime):
+        return min(collected_at.timestamp(), ingested)
+    return ingested
+
+
+@dataclass
+class CrossBookOpportunity:
+    """An arbitrage or middle across two sportsbooks."""
+
+    kind: str  # 'arbitrage' | 'middle'
+    game_id: str
+    market_type: str
+    side_a: str
+    book_a: str
+    odds_a: float
+    line_a: Optional[float]
+    side_b: str
+    book_b: str
+    odds_b: float
+    line_b: Optional[float]
+    # 1 - (1/a + 1/b): guaranteed return for arbitrage; for a middle, the
+    # (usually negative) return when the score lands outside the band
+    margin: float
+    middle_width: Optional[float]
+    quoted_at: datetime
+    ingested_at: datetime
+    detected_at: datetime
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return self.kind, self.game_id, self.market_type
+
+    @property
+    def signature(self) -> Tuple:
+        return self.book_a, self.odds_a, self.line_a, self.book_b, self.odds_b, self.line_b
+
+    @property
+    def detection_latency_ms(self) -> float:
+        return (self.detected_at - self.ingested_at).total_seconds() * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "game_id": self.game_id,
+            "market_type": self.market_type,
+            "side_a": self.side_a,
+            "book_a": self.book_a,
+            "odds_a": self.odds_a,
+            "line_a": self.line_a,
+            "side_b": self.side_b,
+            "book_b": self.book_b,
+            "odds_b": self.odds_b,
+            "line_b": self.line_b,
+            "margin": round(self.margin, 6),
+            "middle_width": self.middle_width,
+            "quoted_at": self.quoted_at.isoformat(),
+            "ingested_at": self.ingested_at.isoformat(),
+            "detected_at": self.detected_at.isoformat(),
+            "detection_latency_ms": round(self.detection_latency_ms, 3),
+        }
+
+
+class CrossBookScanner:
+    """
+    Dense latest-quote matrix for the slate with vectorized opportunity scans.
+
+    Arrays are indexed [game, market, book], plus a side axis for odds and
+    quote times.
+    Games and books get a row/column the first time they are seen; the
+    arrays double when full, after first reclaiming games with no fresh
+    quotes. Quotes older than ``max_quote_age_seconds`` are ignored.
+    """
+
+    def __init__(
+        self,
+        max_quote_age_seconds: float = DEFAULT_MAX_QUOTE_AGE_SECONDS,
+        min_arbitrage_margin: float = DEFAULT_MIN_ARBITRAGE_MARGIN,
+        initial_games: int = DEFAULT_INITIAL_GAMES,
+        initial_books: int = DEFAULT_INITIAL_BOOKS,
+    ):
+        self.max_quote_age_seconds = max_quote_age_seconds
+        self.min_arbitrage_margin = min_arbitrage_margin
+
+        self._games: List[Optional[str]] = []
+        self._books: List[str] = []
+        self._game_rows: Dict[str, int] = {}
+        self._book_columns: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+
+        shape = (initial_games, len(MARKETS), initial_books)
+        self._odds = np.full(shape + (2,), np.nan)  # American odds per side
+        self._lines = np.full(shape, np.nan)  # home spread line / total line
+        self._quoted_at = np.full(shape + (2,), np.nan)  # epoch seconds per side
+
+        self._active: Dict[Tuple[str, str, str], CrossBookOpportunity] = {}
+        self.stats = {
+            "quotes_ingested": 0,
+            "scans": 0,
+            "opportunities_published": 0,
+            "last_scan_ms": 0.0,
+            "max_scan_ms": 0.0,
+        }
+
+    def ingest(self, records: Iterable[Any]) -> List[CrossBookOpportunity]:
+        """
+        Apply a batch of quotes and scan the games they touched
+
+        Records are UnifiedStagingRecord-like objects: the game comes from
+        ``mlb_stats_api_game_id`` (falling back to ``external_game_id``), the
+        book from ``sportsbook_name`` (falling back to ``sportsbook_id``), and
+        every market whose fields are present is updated. Quotes are dated
+        by the record's ``collected_at`` (ingest time when absent).
+
+        Returns the opportunities that are new or changed by this batch;
+        they have already been published on the event bus.
+        """
+        ingested = time.time()
+        rows = set()
+
+        for record in records:
+            game_id = getattr(record, "mlb_stats_api_game_id", None) or getattr(
+                record, "external_game_id", None
+            )
+            book = getattr(record, "sportsbook_name", None) or getattr(record, "sportsbook_id", None)
+            if game_id is None or book is None:
+                continue
+
+            row = self._row_for(str(game_id), ingested)
+            column = self._column_for(str(book))
+            updated = self._apply(record, row, column, ingested)
+            if updated:
+                rows.add(row)
+                self.stats["quotes_ingested"] += updated
+
+        if not rows:
+            return []
+        return self.scan(np.fromiter(rows, dtype=np.intp), ingested)
+
+    def scan(
+        self, rows: Optional[np.ndarray] = None, ingested: Optional[float] = None
+    ) -> List[CrossBookOpportunity]:
+        """Scan the given game rows (default: the whole slate) and publish changes"""
+        start = time.perf_counter()
+        now = time.time()
+        if rows is None:
+            rows = np.array(list(self._game_rows.values()), dtype=np.intp)
+        ingested = now if ingested is None else ingested
+
+        found = self._find_arbitrage(rows, now, ingested) + self._find_middles(rows, now, ingested)
+
+        # Opportunities for scanned games that were not found again have closed
+        scanned = {self._games[row] for row in rows}
+        current = {opportunity.key: opportunity for opportunity in found}
+        for key in [key for key in self._active if key[1] in scanned and key not in current]:
+            del self._active[key]
+
+        changed = []
+        for key, opportunity in current.items():
+            previous = self._active.get(key)
+            if previous is not None and previous.signature == opportunity.signature:
+                continue
+            self._active[key] = opportunity
+            changed.append(opportunity)
+            publish_event(OPPORTUNITY_EVENT, opportunity.to_dict(), source="cross_book_scanner")
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.stats["scans"] += 1
+        self.stats["opportunities_published"] += len(changed)
+        self.stats["last_scan_ms"] = elapsed_ms
+        self.stats["max_scan_ms"] = max(self.stats["max_scan_ms"], elapsed_ms)
+
+        if changed:
+            logger.info(
+                "Cross-book opportunities detected",
+                opportunities=len(changed),
+                games_scanned=len(rows),
+                scan_ms=round(elapsed_ms, 3),
+            )
+        return changed
+
+    def get_opportunities(self, kind: Optional[str] = None) -> List[CrossBookOpportunity]:
+        """Currently open opportunities, best margin first"""
+        opportunities = [o for o in self._active.values() if kind is None or o.kind == kind]
+        return sorted(opportunities, key=lambda o: o.margin, reverse=True)
+
+    def remove_game(self, game_id: str) -> bool:
+        """Drop a game's quotes and open opportunities (e.g. once it starts)"""
+        row = self._game_rows.pop(str(game_id), None)
+        if row is None:
+            return False
+        self._clear_row(row)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "games": len(self._game_rows),
+            "books": len(self._books),
+            "open_opportunities": len(self._active),
+        }
+
+    # Matrix maintenance
+
+    def _apply(self, record: Any, row: int, column: int, ingested: float) -> int:
+        """
+        Write a record's markets into the matrix; returns markets updated
+
+        Only the sides present on the record are overwritten, so a record
+        carrying one side keeps the book's last quote for the other, unless
+        the line moved and that quote no longer applies. Records older than
+        the quotes already held for a market are ignored.
+        """
+        quotes = (
+            (MONEYLINE, None, ("home_moneyline_odds", "away_moneyline_odds")),
+            (SPREAD, "spread_line", ("home_spread_odds", "away_spread_odds")),
+            (TOTAL, "total_line", ("over_odds", "under_odds")),
+        )
+        quoted_at = _quote_time(record, ingested)
+        updated = 0
+        for market, line_field, side_fields in quotes:
+            odds = [getattr(record, side_field, None) for side_field in side_fields]
+            line = getattr(record, line_field, None) if line_field else None
+            if all(value is None for value in odds):
+                continue
+            if line_field and line is None:
+                continue
+
+            cell = (row, market, column)
+            if (self._quoted_at[cell] > quoted_at).any():
+                continue
+            if line is not None and float(line) != self._lines[cell]:
+                self._odds[cell] = np.nan
+                self._quoted_at[cell] = np.nan
+                self._lines[cell] = float(line)
+
+            for side, value in enumerate(odds):
+                if value is not None:
+                    self._odds[cell + (side,)] = float(value)
+                    self._quoted_at[cell + (side,)] = quoted_at
+            updated += 1
+        return updated
+
+    def _row_for(self, game_id: str, now: float) -> int:
+        row = self._game_rows.get(game_id)
+        if row is not None:
+            return row
+
+        if not self._free_rows and len(self._games) == self._odds.shape[0]:
+            self._reclaim_stale_rows(now)
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._games[row] = game_id
+        else:
+            if len(self._games) == self._odds.shape[0]:
+                self._grow(games=self._odds.shape[0] * 2)
+            row = len(self._games)
+            self._games.append(game_id)
+        self._game_rows[game_id] = row
+        return row
+
+    def _column_for(self, book: str) -> int:
+        column = self._book_columns.get(book)
+        if column is None:
+            column = len(self._books)
+            if column == self._odds.shape[2]:
+                self._grow(books=self._odds.shape[2] * 2)
+            self._books.append(book)
+            self._book_columns[book] = column
+        return column
+
+    def _grow(self, games: Optional[int] = None, books: Optional[int] = None) -> None:
+        old_games, markets, old_books = self._lines.shape
+        shape = (games or old_games, markets, books or old_books)
+
+        def resized(array: np.ndarray, extra: Tuple[int, ...] = ()) -> np.ndarray:
+            grown = np.full(shape + extra, np.nan)
+            grown[:old_games, :, :old_books] = array
+            return grown
+
+        self._odds = resized(self._odds, (2,))
+        self._lines = resized(self._lines)
+        self._quoted_at = resized(self._quoted_at, (2,))
+
+    def _reclaim_stale_rows(self, now: float) -> None:
+        """Free the rows of games whose every quote has gone stale"""
+        with np.errstate(invalid="ignore"):
+            fresh = (now - self._quoted_at) <= self.max_quote_age_seconds
+        for row in np.flatnonzero(~fresh.any(axis=(1, 2, 3))):
+            game_id = self._games[row]
+            if game_id is not None:
+                del self._game_rows[game_id]
+                self._clear_row(row)
+
+    def _clear_row(self, row: int) -> None:
+        game_id = self._games[row]
+        self._odds[row] = np.nan
+        self._lines[row] = np.nan
+        self._quoted_at[row] = np.nan
+        self._games[row] = None
+        self._free_rows.append(row)
+        for key in [key for key in self._active if key[1] == game_id]:
+            del self._active[key]
+
+    # Scans
+
+    def _fresh_quotes(self, rows: np.ndarray, now: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Decimal odds and quote times [row, market, book, side] and lines, with stale quotes as NaN"""
+        quoted_at = self._quoted_at[rows]
+        with np.errstate(invalid="ignore"):
+            fresh = (now - quoted_at) <= self.max_quote_age_seconds
+        decimal = odds_math.american_to_decimal_array(np.where(fresh, self._odds[rows], np.nan))
+        lines = np.where(fresh.any(axis=-1), self._lines[rows], np.nan)
+        return decimal, lines, np.where(fresh, quoted_at, np.nan)
+
+    def _find_arbitrage(self, rows: np.ndarray, now: float, ingested: float) -> List[CrossBookOpportunity]:
+        """
+        Best-priced book pair per market with a positive guaranteed margin.
+
+        Every (book i on side A, book j on side B) pair of every game is
+        scored in one broadcast. Spread and total pairs only count when the
+        lines leave no score at which both bets lose: home line i >= home
+        line j for spreads, over line i <= under line j for totals.
+        """
+        if not len(rows):
+            return []
+        decimal, lines, quoted_at = self._fresh_quotes(rows, now)
+        books = decimal.shape[2]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            margins = odds_math.arbitrage_margin_matrix(decimal[..., 0], decimal[..., 1])
+            compatible = np.ones(margins.shape, dtype=bool)
+            compatible[:, SPREAD] = lines[:, SPREAD, :, None] >= lines[:, SPREAD, None, :]
+            compatible[:, TOTAL] = lines[:, TOTAL, :, None] <= lines[:, TOTAL, None, :]
+        compatible &= ~np.eye(books, dtype=bool)
+        margins = np.where(compatible & ~np.isnan(margins), margins, -np.inf)
+
+        flat = margins.reshape(margins.shape[0], len(MARKETS), books * books)
+        best = flat.argmax(axis=-1)
+        best_margin = np.take_along_axis(flat, best[..., None], axis=-1)[..., 0]
+        book_a, book_b = np.divmod(best, books)
+
+        opportunities = []
+        for index, market in zip(*np.nonzero(best_margin > self.min_arbitrage_margin), strict=True):
+            opportunities.append(
+                self._opportunity(
+                    "arbitrage", rows[index], market, book_a[index, market], book_b[index, market],
+                    best_margin[index, market], None, quoted_at[index, market], ingested,
+                )
+            )
+        return opportunities
+
+    def _find_middles(self, rows: np.ndarray, now: float, ingested: float) -> List[CrossBookOpportunity]:
+        """
+        Widest spread/total middle per game.
+
+        Side A takes the most generous line for it (highest home spread,
+        lowest total for the over) and side B the most generous for the other
+        side (lowest home spread, highest total for the under), each at the
+        best price among books posting that line. It is a middle when at
+        least one whole-number score falls strictly between the two lines.
+        """
+        if not len(rows):
+            return []
+        decimal, lines, quoted_at = self._fresh_quotes(rows, now)
+
+        opportunities = []
+        for market in (SPREAD, TOTAL):
+            market_lines = lines[:, market]
+            priced = ~np.isnan(market_lines) & ~np.isnan(decimal[:, market]).all(axis=-1)
+            high = np.where(priced, market_lines, -np.inf).max(axis=-1)
+            low = np.where(priced, market_lines, np.inf).min(axis=-1)
+
+            if market == SPREAD:
+                line_a, line_b = high, low
+                lower, upper = -high, -low  # home winning margins both bets cover
+            else:
+                line_a, line_b = low, high
+                lower, upper = low, high  # total runs both bets cover
+
+            book_a = self._best_price_at_line(decimal[:, market, :, 0], market_lines, line_a)
+            book_b = self._best_price_at_line(decimal[:, market, :, 1], market_lines, line_b)
+
+            with np.errstate(invalid="ignore"):
+                scores_between = np.ceil(upper) - np.floor(lower) - 1
+                is_middle = (
+                    np.isfinite(high) & np.isfinite(low) & (scores_between >= 1)
+                    & (book_a >= 0) & (book_b >= 0) & (book_a != book_b)
+                )
+
+            for index in np.flatnonzero(is_middle):
+                a, b = book_a[index], book_b[index]
+                margin = 1 - (1 / decimal[index, market, a, 0] + 1 / decimal[index, market, b, 1])
+                opportunities.append(
+                    self._opportunity(
+                        "middle", rows[index], market, a, b, margin,
+                        float(high[index] - low[index]), quoted_at[index, market], ingested,
+                    )
+                )
+        return opportunities
+
+    @staticmethod
+    def _best_price_at_line(decimal: np.ndarray, lines: np.ndarray, line: np.ndarray) -> np.ndarray:
+        """Book with the best price among those posting ``line``; -1 if none"""
+        candidates = np.where((lines == line[:, None]) & ~np.isnan(decimal), decimal, -np.inf)
+        best = candidates.argmax(axis=-1)
+        has_price = np.isfinite(np.take_along_axis(candidates, best[:, None], axis=-1)[:, 0])
+        return np.where(has_price, best, -1)
+
+    def _opportunity(
+        self,
+        kind: str,
+        row: int,
+        market: int,
+        book_a: int,
+        book_b: int,
+        margin: float,
+        middle_width: Optional[float],
+        quoted_at: np.ndarray,
+        ingested: float,
+    ) -> CrossBookOpportunity:
+        market_type = MARKETS[market]
+        side_a, side_b = MARKET_SIDES[market_type]
+        odds = self._odds[row, market]
+        lines = self._lines[row, market]
+
+        line_a = line_b = None
+        if market == SPREAD:
+            line_a, line_b = float(lines[book_a]), -float(lines[book_b])
+        elif market == TOTAL:
+            line_a, line_b = float(lines[book_a]), float(lines[book_b])
+
+        return CrossBookOpportunity(
+            kind=kind,
+            game_id=self._games[row],
+            market_type=market_type,
+            side_a=side_a,
+            book_a=self._books[book_a],
+            odds_a=float(odds[book_a, 0]),
+            line_a=line_a,
+            side_b=side_b,
+            book_b=self._books[book_b],
+            odds_b=float(odds[book_b, 1]),
+            line_b=line_b,
+            margin=float(margin),
+            middle_width=middle_width,
+            quoted_at=_utc(max(quoted_at[book_a, 0], quoted_at[book_b, 1])),
+            ingested_at=_utc(ingested),
+            detected_at=datetime.now(timezone.utc),
+        )
+
+
+_cross_book_scanner: Optional[CrossBookScanner] = None
+
+
+def get_cross_book_scanner() -> CrossBookScanner:
+    """Process-wide scanner fed by the unified staging processor"""
+    global _cross_book_scanner
+    if _cross_book_scanner is None:
+        _cross_book_scanner = CrossBookScanner()
+    return _cross_book_scanner
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Line Movement Rollup Service
+
+Maintains curated.line_movement_rollups, the pre-aggregated form of
+curated.line_movement_history read by the analytics API and the
+line-movement CLI:
+- 5-minute and hourly buckets per game, sportsbook, market and side
+- Open/high/low/close odds and line values with movement counts
+- Incremental refresh driven by an id watermark on the history table
+
+Only markets that received rows since the watermark are recomputed, so a
+refresh costs the size of the new data rather than the depth of history.
+
+The watermark only sees inserts. line_movement_history has no updated_at
+column and is treated as append-only (one row per observed line); a manual
+UPDATE or DELETE of existing history rows is not picked up until the
+market next receives a new row, or until ``rebuild()`` is run.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from ...core.enhanced_logging import LogComponent, get_contextual_logger
+from ...core.exceptions import AnalyticsError
+from ...data.database.connection import get_connection
+
+logger = get_contextual_logger(__name__, LogComponent.ANALYSIS)
+
+ROLLUP_TABLE = "curated.line_movement_rollups"
+ROLLUP_STATE_TABLE = "curated.line_movement_rollup_state"
+ROLLUP_SOURCE = "line_movement_history"
+
+# Bucket width label -> width in seconds
+ROLLUP_WIDTHS: Dict[str, int] = {"5m": 300, "1h": 3600}
+
+DEFAULT_BATCH_SIZE = 50_000
+
+# Ids below the watermark re-scanned on every batch. Serial ids are assigned
+# at insert but become visible at commit, so a slow writer can land rows
+# just behind the watermark; recomputation is idempotent, so re-reading a
+# small window picks them up at negligible cost.
+DEFAULT_OVERLAP_IDS = 1_000
+
+# Recompute every bucket of each market touched by history rows in ($1, $2].
+# Whole markets are recomputed (not just the new rows' buckets) because late
+# rows can change the previous-observation comparison of later buckets; a
+# market is one game at one book, so this stays small.
+REFRESH_ROLLUPS_SQL = f"""
+    WITH changed AS (
+        SELECT DISTINCT game_id, sportsbook_id, bet_type, side
+        FROM curated.line_movement_history
+        WHERE id > $1 AND id <= $2
+    ),
+    series AS (
+        SELECT
+            h.id,
+            h.game_id,
+            h.sportsbook_id,
+            h.bet_type,
+            h.side,
+            h.line_timestamp,
+            h.odds,
+            h.line_value,
+            ROW_NUMBER() OVER w > 1
+                AND h.odds IS DISTINCT FROM LAG(h.odds) OVER w AS odds_moved,
+            ROW_NUMBER() OVER w > 1
+                AND h.line_value IS DISTINCT FROM LAG(h.line_value) OVER w AS line_moved
+        FROM curated.line_movement_history h
+        JOIN changed c USING (game_id, sportsbook_id, bet_type, side)
+        WINDOW w AS (
+            PARTITION BY h.game_id, h.sportsbook_id, h.bet_type, h.side
+            ORDER BY h.line_timestamp, h.id
+        )
+    ),
+    widths (bucket_width, seconds) AS (
+        VALUES {", ".join(f"('{label}', {seconds})" for label, seconds in ROLLUP_WIDTHS.items())}
+    )
+    INSERT INTO {ROLLUP_TABLE} (
+        bucket_width, game_id, sportsbook_id, bet_type, side, bucket_start,
+        open_odds, high_odds, low_odds, close_odds,
+        open_line, high_line, low_line, close_line,
+        observations, odds_movements, line_movements,
+        first_timestamp, last_timestamp, refreshed_at
+    )
+    SELECT
+        w.bucket_width,
+        s.game_id,
+        s.sportsbook_id,
+        s.bet_type,
+        s.side,
+        TO_TIMESTAMP(FLOOR(EXTRACT(EPOCH FROM s.line_timestamp) / w.seconds) * w.seconds) AS bucket_start,
+        (ARRAY_AGG(s.odds ORDER BY s.line_timestamp, s.id))[1],
+        MAX(s.odds),
+        MIN(s.odds),
+        (ARRAY_AGG(s.odds ORDER BY s.line_timestamp DESC, s.id DESC))[1],
+        (ARRAY_AGG(s.line_value ORDER BY s.line_timestamp, s.id))[1],
+        MAX(s.line_value),
+        MIN(s.line_value),
+        (ARRAY_AGG(s.line_value ORDER BY s.line_timestamp DESC, s.id DESC))[1],
+        COUNT(*),
+        COUNT(*) FILTER (WHERE s.odds_moved),
+        COUNT(*) FILTER (WHERE s.line_moved),
+        MIN(s.line_timestamp),
+        MAX(s.line_timestamp),
+        NOW()
+    FROM series s
+    CROSS JOIN widths w
+    GROUP BY w.bucket_width, w.seconds, s.game_id, s.sportsbook_id, s.bet_type, s.side, 6
+    ON CONFLICT (bucket_width, game_id, sportsbook_id, bet_type, side, bucket_start)
+    DO UPDATE SET
+        open_odds = EXCLUDED.open_odds,
+        high_odds = EXCLUDED.high_odds,
+        low_odds = EXCLUDED.low_odds,
+        close_odds = EXCLUDED.close_odds,
+        open_line = EXCLUDED.open_line,
+        high_line = EXCLUDED.high_line,
+        low_line = EXCLUDED.low_line,
+        close_line = EXCLUDED.close_line,
+        observations = EXCLUDED.observations,
+        odds_movements = EXCLUDED.odds_movements,
+        line_movements = EXCLUDED.line_movements,
+        first_timestamp = EXCLUDED.first_timestamp,
+        last_timestamp = EXCLUDED.last_timestamp,
+        refreshed_at = EXCLUDED.refreshed_at
+"""
+
+_ROW_COUNT = re.compile(r"(\d+)\s*$")
+
+
+def _status_rows(status: Optional[str]) -> int:
+    """Row count from an asyncpg command status such as 'INSERT 0 42'."""
+    match = _ROW_COUNT.search(status or "")
+    return int(match.group(1)) if match else 0
+
+
+@dataclass
+class RollupRefreshResult:
+    """Outcome of a rollup refresh run."""
+
+    batches: int = 0
+    source_rows: int = 0
+    buckets_upserted: int = 0
+    last_source_id: int = 0
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "source_rows": self.source_rows,
+            "buckets_upserted": self.buckets_upserted,
+            "last_source_id": self.last_source_id,
+            "duration_seconds": round(self.duration_seconds, 3),
+        }
+
+
+class LineMovementRollupService:
+    """
+    Incrementally maintains the line movement rollup tables.
+
+    Each batch locks the watermark row, recomputes the markets touched by
+    the next ``batch_size`` history ids and advances the watermark in the
+    same transaction, so concurrent refreshers serialize and a failed batch
+    is simply retried by the next run.
+
+    History rows changed in place are not detected (see the module
+    docstring); run ``rebuild()`` after correcting history by hand.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        overlap_ids: int = DEFAULT_OVERLAP_IDS,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.batch_size = batch_size
+        self.overlap_ids = max(overlap_ids, 0)
+
+    async def refresh(self, max_batches: Optional[int] = None) -> RollupRefreshResult:
+        """
+        Fold history rows added since the last refresh into the rollups.
+
+        Args:
+            max_batches: Stop after this many batches (None drains the backlog)
+
+        Returns:
+            RollupRefreshResult describing the work done
+        """
+        result = RollupRefreshResult()
+        started = time.perf_counter()
+
+        try:
+            async with get_connection() as conn:
+                while max_batches is None or result.batches < max_batches:
+                    if not await self._refresh_batch(conn, result):
+                        break
+        except Exception as e:
+            logger.error("Line movement rollup refresh failed", error=str(e), **result.to_dict())
+            raise AnalyticsError(f"Line movement rollup refresh failed: {e}") from e
+
+        result.duration_seconds = time.perf_counter() - started
+        logger.info("Line movement rollups refreshed", **result.to_dict())
+        return result
+
+    async def rebuild(self) -> RollupRefreshResult:
+        """Discard the rollups and recompute them from the full history."""
+        async with get_connection() as conn:
+            async with conn.transaction():
+                await conn.execute(f"TRUNCATE {ROLLUP_TABLE}")
+                await conn.execute(
+                    f"""
+                    INSERT INTO {ROLLUP_STATE_TABLE} (rollup_name, last_source_id)
+                    VALUES ($1, 0)
+                    ON CONFLICT (rollup_name) DO UPDATE SET last_source_id = 0
+                    """,
+                    ROLLUP_SOURCE,
+                )
+        return await self.refresh()
+
+    async def get_status(self) -> Dict[str, Any]:
+        """Watermark position and how far the rollups lag the history table."""
+        async with get_connection() as conn:
+            row = await conn.fetchrow(
+                f"""
+                SELECT
+                    st.last_source_id,
+                    st.last_refreshed_at,
+                    st.last_refresh_rows,
+                    (SELECT COALESCE(MAX(id), 0) FROM curated.line_movement_history) AS max_source_id
+                FROM {ROLLUP_STATE_TABLE} st
+                WHERE st.rollup_name = $1
+                """,
+                ROLLUP_SOURCE,
+            )
+
+        if row is None:
+            return {"initialized": False}
+
+        return {
+            "initialized": True,
+            "last_source_id": row["last_source_id"],
+            "max_source_id": row["max_source_id"],
+            "pending_ids": max(row["max_source_id"] - row["last_source_id"], 0),
+            "last_refreshed_at": row["last_refreshed_at"],
+            "last_refresh_rows": row["last_refresh_rows"],
+        }
+
+    async def _refresh_batch(self, conn, result: RollupRefreshResult) -> bool:
+        """Refresh one id range; returns False once the watermark is current."""
+        async with conn.transaction():
+            last_id = await conn.fetchval(
+                f"SELECT last_source_id FROM {ROLLUP_STATE_TABLE} WHERE rollup_name = $1 FOR UPDATE",
+                ROLLUP_SOURCE,
+            )
+            if last_id is None:
+                raise AnalyticsError(
+                    f"{ROLLUP_STATE_TABLE} has no '{ROLLUP_SOURCE}' row; "
+                    "apply migration 106_line_movement_rollups.sql"
+                )
+
+            bounds = await conn.fetchrow(
+                """
+                SELECT COUNT(*) AS row_count, MAX(id) AS max_id
+                FROM (
+                    SELECT id
+                    FROM curated.line_movement_history
+                    WHERE id > $1
+                    ORDER BY id
+                    LIMIT $2
+                ) batch
+                """,
+                last_id,
+                self.batch_size,
+            )
+            if not bounds or not bounds["row_count"]:
+                result.last_source_id = last_id
+                return False
+
+            upper_id = bounds["max_id"]
+            status = await conn.execute(
+                REFRESH_ROLLUPS_SQL, max(last_id - self.overlap_ids, 0), upper_id
+            )
+            await conn.execute(
+                f"""
+                UPDATE {ROLLUP_STATE_TABLE}
+                SET last_source_id = $2, last_refreshed_at = $3, last_refresh_rows = $4
+                WHERE rollup_name = $1
+                """,
+                ROLLUP_SOURCE,
+                upper_id,
+                datetime.now(timezone.utc),
+                bounds["row_count"],
+            )
+
+        result.batches += 1
+        result.source_rows += bounds["row_count"]
+        result.buckets_upserted += _status_rows(status)
+        result.last_source_id = upper_id
+        return bounds["row_count"] >= self.batch_size
+
+
+# Singleton instance
+_line_movement_rollup_service = None
+
+def get_line_movement_rollup_service() -> LineMovementRollupService:
+    """Get or create the line movement rollup service instance."""
+    global _line_movement_rollup_service
+    if _line_movement_rollup_service is None:
+        _line_movement_rollup_service = LineMovementRollupService()
+    return _line_movement_rollup_service
@@ -8,6 +8,7 @@ Ensures consistent game identification across VSIN, SBD, Action Network, and oth
 
 import asyncio
 import json
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
@@ -64,6 +65,153 @@ class CrossSourceMatch:
     created_at: datetime = field(default_factory=datetime.now)
 
 
+class GameCandidateIndex:
+    """
+    Blocking index over game candidates with an incremental union-find.
+
+    Candidates are bucketed by a normalized (date, home abbreviation, away
+    abbreviation) key, so similarity is only evaluated inside a block instead
+    of across every candidate. Within a block, candidates from different
+    sources are merged when their start times fall inside the tolerance
+    window; the window keeps doubleheader games apart. Merges are tracked in a
+    union-find that can keep growing as new candidates arrive, which keeps
+    matching a full season close to linear in the number of candidates.
+    """
+
+    def __init__(
+        self,
+        standardize_team_name: Callable[[str], str | None],
+        time_tolerance: timedelta = timedelta(hours=4),
+    ):
+        self.standardize_team_name = standardize_team_name
+        self.time_tolerance = time_tolerance
+
+        self._candidates: list[GameMatchCandidate] = []
+        self._parent: list[int] = []
+        self._size: list[int] = []
+        self._sources: list[set[DataSource]] = []
+        self._members: list[list[int]] = []
+        self._blocks: dict[tuple[date | None, str, str], list[int]] = {}
+        self._positions: dict[tuple[DataSource, str], int] = {}
+        self._team_cache: dict[str, str | None] = {}
+        # Start-time comparisons made while adding candidates
+        self.comparisons = 0
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def _team(self, team_name: str) -> str | None:
+        """Standardize a team name once per distinct spelling."""
+        if team_name not in self._team_cache:
+            self._team_cache[team_name] = self.standardize_team_name(team_name)
+        return self._team_cache[team_name]
+
+    def block_key(
+        self, candidate: GameMatchCandidate
+    ) -> tuple[date | None, str, str] | None:
+        """Normalized (date, home, away) blocking key, or None if unresolvable."""
+        home = self._team(candidate.home_team)
+        away = self._team(candidate.away_team)
+        if not home or not away:
+            return None
+
+        game_date = candidate.game_date
+        if game_date is None and candidate.game_datetime is not None:
+            game_date = candidate.game_datetime.date()
+        return (game_date, home, away)
+
+    def _find(self, position: int) -> int:
+        root = position
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[position] != root:
+            self._parent[position], position = root, self._parent[position]
+        return root
+
+    def _union(self, first: int, second: int) -> None:
+        root_a, root_b = self._find(first), self._find(second)
+        if root_a == root_b:
+            return
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        self._sources[root_a] |= self._sources[root_b]
+        self._members[root_a].extend(self._members[root_b])
+        self._members[root_b] = []
+
+    def within_tolerance(
+        self, candidate1: GameMatchCandidate, candidate2: GameMatchCandidate
+    ) -> bool:
+        """Whether two start times are close enough to be the same game."""
+        if candidate1.game_datetime is None or candidate2.game_datetime is None:
+            return True
+        return (
+            abs(candidate1.game_datetime - candidate2.game_datetime)
+            < self.time_tolerance
+        )
+
+    def add(self, candidate: GameMatchCandidate) -> int:
+        """
+        Add a candidate and merge it with compatible candidates in its block.
+
+        A game carries at most one external ID per source, so two groups are
+        only merged when their source sets do not overlap. Re-adding a
+        (source, external_id) pair returns the existing position.
+
+        Returns:
+            Position of the candidate in the index
+        """
+        identity = (candidate.source, str(candidate.external_id))
+        if identity in self._positions:
+            return self._positions[identity]
+
+        position = len(self._candidates)
+        self._candidates.append(candidate)
+        self._parent.append(position)
+        self._size.append(1)
+        self._sources.append({candidate.source})
+        self._members.append([position])
+        self._positions[identity] = position
+
+        key = self.block_key(candidate)
+        if key is None:
+            return position
+
+        block = self._blocks.setdefault(key, [])
+        for other in block:
+            self.comparisons += 1
+            if not self.within_tolerance(candidate, self._candidates[other]):
+                continue
+            root, other_root = self._find(position), self._find(other)
+            if root == other_root or self._sources[root] & self._sources[other_root]:
+                continue
+            self._union(root, other_root)
+        block.append(position)
+
+        return position
+
+    def add_all(self, candidates: Iterable[GameMatchCandidate]) -> None:
+        """Add candidates in order."""
+        for candidate in candidates:
+            self.add(candidate)
+
+    def group_of(self, candidate: GameMatchCandidate) -> list[GameMatchCandidate]:
+        """Candidates currently merged with the given (already added) candidate."""
+        position = self._positions.get((candidate.source, str(candidate.external_id)))
+        if position is None:
+            return [candidate]
+        members = sorted(self._members[self._find(position)])
+        return [self._candidates[other] for other in members]
+
+    def groups(self) -> list[list[GameMatchCandidate]]:
+        """All groups, ordered by each group's first-added candidate."""
+        grouped: dict[int, list[GameMatchCandidate]] = {}
+        for position, candidate in enumerate(self._candidates):
+            grouped.setdefault(self._find(position), []).append(candidate)
+        return list(grouped.values())
+
+
 class CrossSourceGameMatchingService:
     """
     Service for automated cross-source game matching.
@@ -81,6 +229,7 @@ class CrossSourceGameMatchingService:
         self.mlb_resolution_service = MLBStatsAPIGameResolutionService()
         self.pending_matches = {}  # Cache for pending matches
         self.match_history = {}  # Cache for historical matches
+        self._similarity_index: GameCandidateIndex | None = None
 
     async def initialize(self):
         """Initialize the service."""
@@ -221,6 +370,47 @@ class CrossSourceGameMatchingService:
             )
             return []
 
+    async def match_games_for_range(
+        self, start_date: date, end_date: date
+    ) -> list[CrossSourceMatch]:
+        """
+        Match games across all sources for every date in a range.
+
+        Candidates for all dates share one blocking index, so multi-day
+        backfills grow linearly with the number of candidates.
+
+        Args:
+            start_date: First date to match (inclusive)
+            end_date: Last date to match (inclusive)
+
+        Returns:
+            List of CrossSourceMatch objects
+        """
+        index = self._new_candidate_index()
+        current = start_date
+        while current <= end_date:
+            index.add_all(await self._collect_game_candidates(current))
+            current += timedelta(days=1)
+
+        matches = []
+        for group in index.groups():
+            try:
+                match = await self._match_candidate_group(group)
+                if match:
+                    matches.append(match)
+            except Exception as e:
+                self.logger.error("Error matching candidate group", error=str(e))
+                continue
+
+        for match in matches:
+            await self._store_cross_source_match(match)
+
+        self.logger.info(
+            f"Successfully matched {len(matches)} games from {start_date} to {end_date}",
+            candidates=len(index),
+        )
+        return matches
+
     async def _collect_game_candidates(
         self, target_date: date
     ) -> list[GameMatchCandidate]:
@@ -314,33 +504,17 @@ class CrossSourceGameMatchingService:
             self.logger.error("Error collecting game candidates", error=str(e))
             return []
 
+    def _new_candidate_index(self) -> GameCandidateIndex:
+        """Create a blocking index using the MLB team name standardization."""
+        return GameCandidateIndex(self.mlb_resolution_service.standardize_team_name)
+
     def _group_candidates_by_similarity(
         self, candidates: list[GameMatchCandidate]
     ) -> list[list[GameMatchCandidate]]:
         """Group candidates that likely represent the same game."""
-        groups = []
-        used_candidates = set()
-
-        for i, candidate in enumerate(candidates):
-            if i in used_candidates:
-                continue
-
-            # Start a new group with this candidate
-            group = [candidate]
-            used_candidates.add(i)
-
-            # Find similar candidates
-            for j, other_candidate in enumerate(candidates):
-                if j in used_candidates or i == j:
-                    continue
-
-                if self._candidates_are_similar(candidate, other_candidate):
-                    group.append(other_candidate)
-                    used_candidates.add(j)
-
-            groups.append(group)
-
-        return groups
+        index = self._new_candidate_index()
+        index.add_all(candidates)
+        return index.groups()
 
     def _candidates_are_similar(
         self, candidate1: GameMatchCandidate, candidate2: GameMatchCandidate
@@ -350,40 +524,18 @@ class CrossSourceGameMatchingService:
         if candidate1.source == candidate2.source:
             return False
 
-        # Standardize team names for comparison
-        home1 = self.mlb_resolution_service.standardize_team_name(candidate1.home_team)
-        away1 = self.mlb_resolution_service.standardize_team_name(candidate1.away_team)
-        home2 = self.mlb_resolution_service.standardize_team_name(candidate2.home_team)
-        away2 = self.mlb_resolution_service.standardize_team_name(candidate2.away_team)
+        # Pairwise checks only use the index's keys and team name cache
+        if self._similarity_index is None:
+            self._similarity_index = self._new_candidate_index()
+        index = self._similarity_index
+        key1 = index.block_key(candidate1)
 
-        # Must have valid team names
-        if not all([home1, away1, home2, away2]):
+        # Must have valid team names, and the same date and teams
+        if key1 is None or key1 != index.block_key(candidate2):
             return False
 
-        # Same teams playing
-        if home1 == home2 and away1 == away2:
-            return True
-
-        # Check if game times are close (within 4 hours)
-        if (
-            candidate1.game_datetime
-            and candidate2.game_datetime
-            and abs(
-                (candidate1.game_datetime - candidate2.game_datetime).total_seconds()
-            )
-            < 4 * 3600
-        ):
-            return True
-
-        # Same date and teams
-        if (
-            candidate1.game_date == candidate2.game_date
-            and home1 == home2
-            and away1 == away2
-        ):
-            return True
-
-        return False
+        # Game times must be close (within 4 hours) to separate doubleheaders
+        return index.within_tolerance(candidate1, candidate2)
 
     async def _match_candidate_group(
         self, candidates: list[GameMatchCandidate]
@@ -709,12 +861,46 @@ class CrossSourceGameMatchingService:
                             }
                         )
 
+                    self._add_potential_matches(unmatched_games)
                     return unmatched_games
 
         except Exception as e:
             self.logger.error("Error finding unmatched games", error=str(e))
             return []
 
+    def _add_potential_matches(self, unmatched_games: list[dict[str, Any]]) -> None:
+        """
+        Annotate unmatched games with other unmatched games for the same matchup.
+
+        Each single-source game goes through the blocking index, so games that
+        should have been merged are found without comparing every pair.
+        """
+        index = self._new_candidate_index()
+        candidates = {}
+        for game in unmatched_games:
+            if not game["source"]:
+                continue
+            candidate = GameMatchCandidate(
+                external_id=str(game["external_id"]),
+                source=DataSource(game["source"]),
+                home_team=game["home_team"],
+                away_team=game["away_team"],
+                game_date=game["game_date"],
+                game_datetime=None,
+                metadata={"internal_game_id": game["internal_game_id"]},
+            )
+            index.add(candidate)
+            candidates[game["internal_game_id"]] = candidate
+
+        for game in unmatched_games:
+            candidate = candidates.get(game["internal_game_id"])
+            group = index.group_of(candidate) if candidate else []
+            game["potential_matches"] = [
+                other.metadata["internal_game_id"]
+                for other in group
+                if other is not candidate
+            ]
+
     async def get_matching_statistics(self, days_back: int = 30) -> dict[str, Any]:
         """Get statistics about cross-source matching performance."""
         try:
@@ -21,10 +21,11 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 from ...core.config import get_settings
-from ...core.datetime_utils import prepare_for_postgres
+from ...core.datetime_utils import prepare_for_postgres, safe_game_datetime_parse
 from ...core.logging import LogComponent, get_logger
 from ...core.team_utils import normalize_team_name
 from ...data.database.connection import get_connection
+from ...data.pipeline.raw_storage import decode_raw_payload
 
 logger = get_logger(__name__, LogComponent.CORE)
 
@@ -185,7 +186,7 @@ class EnhancedGamesService:
         """Get staging games that need to be processed to curated zone."""
         
         async with get_connection() as conn:
-            # Get games from staging.betting_odds_unified with game metadata from raw data
+            # Get games from staging.betting_odds_unified that are not yet curated
             query = """
                 WITH staging_games AS (
                     SELECT DISTINCT
@@ -218,73 +219,99 @@ class EnhancedGamesService:
                         sbu.external_game_id, sbu.mlb_stats_api_game_id, 
                         sbu.home_team, sbu.away_team, sbu.data_quality_score, 
                         sbu.created_at, sbu.updated_at
-                ),
-                game_summary AS (
-                    SELECT 
-                        sg.*,
-                        -- Get game metadata from raw data
-                        rd.raw_odds->'game_metadata'->>'game_datetime' as game_datetime_str,
-                        CASE 
-                            WHEN rd.raw_odds->'game_metadata'->>'game_datetime' IS NOT NULL
-                            THEN (rd.raw_odds->'game_metadata'->>'game_datetime')::TIMESTAMPTZ
-                            ELSE (CURRENT_DATE + INTERVAL '19:00')::TIMESTAMPTZ  -- Default fallback
-                        END as game_datetime,
-                        CASE 
-                            WHEN rd.raw_odds->'game_metadata'->>'game_datetime' IS NOT NULL
-                            THEN EXTRACT(YEAR FROM (rd.raw_odds->'game_metadata'->>'game_datetime')::TIMESTAMPTZ)
-                            ELSE EXTRACT(YEAR FROM CURRENT_DATE)
-                        END as season,
-                        CASE 
-                            WHEN rd.raw_odds->'game_metadata'->>'game_datetime' IS NOT NULL
-                            THEN (rd.raw_odds->'game_metadata'->>'game_datetime')::TIMESTAMPTZ::DATE
-                            ELSE CURRENT_DATE
-                        END as game_date
-                    FROM staging_games sg
-                    LEFT JOIN raw_data.action_network_odds rd 
-                        ON sg.external_game_id = rd.external_game_id
-                        AND rd.raw_odds->'game_metadata' IS NOT NULL
-                        AND rd.raw_odds->'game_metadata'->>'game_datetime' IS NOT NULL
-                    WHERE rd.external_game_id IS NOT NULL  -- Only include games with metadata
                 )
                 SELECT 
                     NULL as id,  -- No staging games table ID available
-                    gs.external_game_id,
-                    gs.action_network_game_id,
-                    gs.mlb_stats_api_game_id,
-                    gs.home_team_name,
+                    sg.external_game_id,
+                    sg.action_network_game_id,
+                    sg.mlb_stats_api_game_id,
+                    sg.home_team_name,
                     NULL as home_team_abbr,
-                    gs.home_team_normalized,
-                    gs.away_team_name,
+                    sg.home_team_normalized,
+                    sg.away_team_name,
                     NULL as away_team_abbr,
-                    gs.away_team_normalized,
-                    gs.game_datetime,
-                    gs.game_date,
-                    gs.season,
+                    sg.away_team_normalized,
                     'regular' as game_type,
                     'scheduled' as game_status,
                     -- Use calculated data quality score based on coverage
                     GREATEST(
-                        COALESCE(gs.data_quality_score, 0.0),
-                        LEAST(1.0, (gs.odds_records_count::FLOAT / 50.0) * (gs.sportsbooks_count::FLOAT / 5.0))
+                        COALESCE(sg.data_quality_score, 0.0),
+                        LEAST(1.0, (sg.odds_records_count::FLOAT / 50.0) * (sg.sportsbooks_count::FLOAT / 5.0))
                     ) as data_quality_score,
-                    gs.created_at,
-                    gs.updated_at,
-                    gs.odds_records_count,
-                    gs.sportsbooks_count,
-                    gs.market_types_count
-                FROM game_summary gs
+                    sg.created_at,
+                    sg.updated_at,
+                    sg.odds_records_count,
+                    sg.sportsbooks_count,
+                    sg.market_types_count
+                FROM staging_games sg
                 LEFT JOIN curated.enhanced_games ceg 
-                    ON gs.action_network_game_id = ceg.action_network_game_id
+                    ON sg.action_network_game_id = ceg.action_network_game_id
                 WHERE ceg.action_network_game_id IS NULL  -- Not yet in curated
-                    AND gs.odds_records_count > 0  -- Only include games with odds data
-                ORDER BY gs.game_date DESC, gs.odds_records_count DESC
+                    AND sg.odds_records_count > 0  -- Only include games with odds data
             """ % days_back
             
-            if limit:
-                query += f" LIMIT {limit}"
-            
             rows = await conn.fetch(query)
-            return [dict(row) for row in rows]
+            game_datetimes = await self._get_game_datetimes(
+                conn, list({row["external_game_id"] for row in rows})
+            )
+
+        # Only include games with metadata
+        games = []
+        for row in rows:
+            game_datetime = game_datetimes.get(row["external_game_id"])
+            if game_datetime is None:
+                continue
+            game = dict(row)
+            game["game_datetime"] = game_datetime
+            game["game_date"] = game_datetime.date()
+            game["season"] = game_datetime.year
+            games.append(game)
+
+        games.sort(
+            key=lambda game: (game["game_date"], game["odds_records_count"]),
+            reverse=True,
+        )
+        return games[:limit] if limit else games
+
+    async def _get_game_datetimes(self, conn, external_game_ids: List[str]) -> Dict[str, datetime]:
+        """
+        Read each game's start time from its raw odds game_metadata.
+
+        Compressed raw rows keep their payload out of the JSON column, so the
+        metadata is decoded in Python rather than extracted in SQL.
+        """
+        if not external_game_ids:
+            return {}
+
+        # Prefer the latest row whose JSON carries the metadata; otherwise fall
+        # back to the latest compressed row, which may carry it
+        rows = await conn.fetch(
+            """
+            SELECT DISTINCT ON (external_game_id)
+                external_game_id, raw_odds, payload_encoding, payload_compressed
+            FROM raw_data.action_network_odds
+            WHERE external_game_id = ANY($1::text[])
+                AND (raw_odds->'game_metadata'->>'game_datetime' IS NOT NULL
+                     OR payload_compressed IS NOT NULL)
+            ORDER BY external_game_id,
+                (raw_odds->'game_metadata'->>'game_datetime' IS NOT NULL) DESC,
+                collected_at DESC
+            """,
+            external_game_ids,
+        )
+
+        game_datetimes = {}
+        for row in rows:
+            try:
+                raw_odds = decode_raw_payload(row, "raw_odds")
+            except Exception as e:
+                logger.warning(f"Unreadable raw odds for game {row['external_game_id']}: {e}")
+                continue
+            metadata = (raw_odds or {}).get("game_metadata") or {}
+            game_datetime = safe_game_datetime_parse(metadata.get("game_datetime"))
+            if game_datetime is not None:
+                game_datetimes[row["external_game_id"]] = game_datetime
+        return game_datetimes
     
     async def _enhance_game_data(self, staging_game: Dict[str, Any]) -> EnhancedGameData:
         """Transform staging game data into enhanced game data."""
@@ -20,8 +20,9 @@ General Balls
 
 import asyncio
 import json
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, replace
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
 import aiohttp
@@ -33,6 +34,11 @@ from ..data.database.connection import get_connection
 
 logger = structlog.get_logger(__name__)
 
+# Status codes of completed games: Final and Official
+FINAL_STATUS_CODES = ("F", "O")
+
+EST_TIMEZONE = timezone(timedelta(hours=-5))
+
 
 @dataclass
 class GameOutcome:
@@ -65,9 +71,35 @@ class MLBStatsAPIClient:
 
     BASE_URL = "https://statsapi.mlb.com/api/v1"
 
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: int = 30,
+        cache_dir: Path | str | None = None,
+        max_concurrency: int = 4,
+        cache: bool = True,
+    ):
+        """
+        Args:
+            timeout: Request timeout in seconds
+            cache_dir: Directory for cached final-game schedules; defaults to
+                data_sources.mlb_stats_api_cache_dir
+            max_concurrency: Maximum number of requests in flight
+            cache: False disables the on-disk schedule cache
+        """
         self.timeout = timeout
         self.session: aiohttp.ClientSession | None = None
+        if not cache:
+            self.cache_dir = None
+        else:
+            self.cache_dir = Path(
+                cache_dir or get_settings().data_sources.mlb_stats_api_cache_dir
+            )
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Request accounting for sync results
+        self.requests_made = 0
+        self.cache_hits = 0
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -85,6 +117,10 @@ class MLBStatsAPIClient:
         """
         Get all games for a specific date.
 
+        The schedule is hydrated with linescores, so a single request carries
+        final scores for every game on the date. Dates whose games are all
+        final are served from the on-disk cache.
+
         Args:
             date_str: Date in YYYY-MM-DD format
 
@@ -94,6 +130,11 @@ class MLBStatsAPIClient:
         if not self.session:
             raise DataError("Client session not initialized")
 
+        cached = self._read_cached_schedule(date_str)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
         url = f"{self.BASE_URL}/schedule"
         params = {
             "sportId": 1,  # MLB
@@ -102,23 +143,120 @@ class MLBStatsAPIClient:
         }
 
         try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    dates = data.get("dates", [])
-                    if dates:
-                        return dates[0].get("games", [])
-                    else:
-                        # No games for this date (likely off-season)
-                        return []
-                else:
-                    logger.warning(
-                        "MLB API request failed", status=response.status, date=date_str
-                    )
-                    return []
+            status, data = await self._get_json(url, params)
         except Exception as e:
             logger.error("MLB API request error", error=str(e), date=date_str)
             return []
+        if status != 200:
+            logger.warning("MLB API request failed", status=status, date=date_str)
+            return []
+
+        dates = data.get("dates", [])
+        if not dates:
+            # No games for this date (likely off-season)
+            return []
+
+        games = dates[0].get("games", [])
+        if games and all(self._is_final_schedule_game(game) for game in games):
+            self._write_cached_schedule(date_str, games)
+        return games
+
+    async def get_games_for_dates(
+        self, date_strs: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get games for several dates with bounded concurrency.
+
+        Args:
+            date_strs: Dates in YYYY-MM-DD format
+
+        Returns:
+            Mapping of date to the games scheduled on it, in input order
+        """
+        schedules = await asyncio.gather(
+            *(self.get_games_for_date(date_str) for date_str in date_strs)
+        )
+        return dict(zip(date_strs, schedules, strict=True))
+
+    async def _get_json(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> tuple[int, Any]:
+        """GET a JSON endpoint within the concurrency limit; returns (status, body)."""
+        async with self._semaphore:
+            self.requests_made += 1
+            async with self.session.get(url, params=params) as response:
+                if response.status != 200:
+                    return response.status, None
+                return response.status, await response.json()
+
+    @staticmethod
+    def _is_final_schedule_game(game: dict[str, Any]) -> bool:
+        """Final, official, postponed and cancelled games no longer change."""
+        return game.get("status", {}).get("abstractGameState") == "Final"
+
+    def _schedule_cache_path(self, date_str: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / "schedule" / f"{date_str}.json"
+
+    def _read_cached_schedule(self, date_str: str) -> list[dict[str, Any]] | None:
+        path = self._schedule_cache_path(date_str)
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable schedule cache", path=str(path), error=str(e))
+            return None
+
+    def _write_cached_schedule(self, date_str: str, games: list[dict[str, Any]]) -> None:
+        path = self._schedule_cache_path(date_str)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(games))
+            tmp_path.replace(path)
+        except OSError as e:
+            # The cache is an optimization; a read-only disk must not fail the sync
+            logger.warning("Could not write schedule cache", path=str(path), error=str(e))
+
+    @staticmethod
+    def schedule_game_to_game_data(game: dict[str, Any]) -> dict[str, Any]:
+        """
+        Shape a hydrated schedule game like a /feed/live response.
+
+        Only the fields used for outcome processing are carried over, so the
+        result can go through the same code paths as game details.
+        """
+        teams = game.get("teams", {})
+        linescore = game.get("linescore") or {}
+        linescore_teams = linescore.get("teams", {})
+
+        def runs(side: str) -> int:
+            value = linescore_teams.get(side, {}).get("runs")
+            if value is None:
+                value = teams.get(side, {}).get("score", 0)
+            return value
+
+        return {
+            "gamePk": game.get("gamePk"),
+            "gameData": {
+                "status": game.get("status", {}),
+                "teams": {
+                    side: {"name": teams.get(side, {}).get("team", {}).get("name", "")}
+                    for side in ("home", "away")
+                },
+                "datetime": {"dateTime": game.get("gameDate", "")},
+            },
+            "liveData": {
+                "linescore": {
+                    **linescore,
+                    "teams": {side: {"runs": runs(side)} for side in ("home", "away")},
+                }
+            },
+        }
 
     async def get_game_details(
         self, game_pk: str, schedule_team_info: dict[str, Any] | None = None
@@ -143,30 +281,25 @@ class MLBStatsAPIClient:
         feed_url = f"{self.BASE_URL}/game/{game_pk}/feed/live"
 
         try:
-            async with self.session.get(feed_url) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 404:
-                    # Feed/live not available, try linescore fallback
-                    logger.debug(
-                        "Feed/live endpoint not available, trying linescore fallback",
-                        game_pk=game_pk,
-                    )
-                    return await self._get_game_linescore_fallback(
-                        game_pk, schedule_team_info
-                    )
-                else:
-                    logger.warning(
-                        "Game details request failed",
-                        status=response.status,
-                        game_pk=game_pk,
-                    )
-                    return None
+            status, data = await self._get_json(feed_url)
         except Exception as e:
             logger.error("Game details request error", error=str(e), game_pk=game_pk)
             # Try linescore fallback on any error
             return await self._get_game_linescore_fallback(game_pk, schedule_team_info)
 
+        if status == 200:
+            return data
+        if status == 404:
+            # Feed/live not available, try linescore fallback
+            logger.debug(
+                "Feed/live endpoint not available, trying linescore fallback",
+                game_pk=game_pk,
+            )
+            return await self._get_game_linescore_fallback(game_pk, schedule_team_info)
+
+        logger.warning("Game details request failed", status=status, game_pk=game_pk)
+        return None
+
     async def _get_game_linescore_fallback(
         self, game_pk: str, schedule_team_info: dict[str, Any] | None = None
     ) -> dict[str, Any] | None:
@@ -188,81 +321,71 @@ class MLBStatsAPIClient:
         linescore_url = f"{self.BASE_URL}/game/{game_pk}/linescore"
 
         try:
-            async with self.session.get(linescore_url) as response:
-                if response.status == 200:
-                    linescore_data = await response.json()
-
-                    # Construct a minimal game data structure
-                    # compatible with our existing processing logic
-                    game_data = {
-                        "gameData": {
-                            "status": {
-                                "statusCode": "F",  # Assume Final if linescore exists
-                                "abstractGameState": "Final",
-                            },
-                            "teams": {
-                                "home": {
-                                    "name": schedule_team_info.get("teams", {})
-                                    .get("home", {})
-                                    .get("team", {})
-                                    .get("name", "HOME")
-                                    if schedule_team_info
-                                    else "HOME"
-                                },
-                                "away": {
-                                    "name": schedule_team_info.get("teams", {})
-                                    .get("away", {})
-                                    .get("team", {})
-                                    .get("name", "AWAY")
-                                    if schedule_team_info
-                                    else "AWAY"
-                                },
-                            },
-                            "datetime": {
-                                "dateTime": ""  # Not available in linescore, will use fallback
-                            },
+            status, linescore_data = await self._get_json(linescore_url)
+        except Exception as e:
+            logger.error("Linescore fallback error", error=str(e), game_pk=game_pk)
+            return None
+
+        if status != 200:
+            logger.warning("Linescore fallback failed", status=status, game_pk=game_pk)
+            return None
+
+        # Construct a minimal game data structure
+        # compatible with our existing processing logic
+        game_data = {
+            "gameData": {
+                "status": {
+                    "statusCode": "F",  # Assume Final if linescore exists
+                    "abstractGameState": "Final",
+                },
+                "teams": {
+                    "home": {
+                        "name": schedule_team_info.get("teams", {})
+                        .get("home", {})
+                        .get("team", {})
+                        .get("name", "HOME")
+                        if schedule_team_info
+                        else "HOME"
+                    },
+                    "away": {
+                        "name": schedule_team_info.get("teams", {})
+                        .get("away", {})
+                        .get("team", {})
+                        .get("name", "AWAY")
+                        if schedule_team_info
+                        else "AWAY"
+                    },
+                },
+                "datetime": {
+                    "dateTime": ""  # Not available in linescore, will use fallback
+                },
+            },
+            "liveData": {
+                "linescore": {
+                    "teams": {
+                        "home": {
+                            "runs": linescore_data.get("teams", {})
+                            .get("home", {})
+                            .get("runs", 0)
                         },
-                        "liveData": {
-                            "linescore": {
-                                "teams": {
-                                    "home": {
-                                        "runs": linescore_data.get("teams", {})
-                                        .get("home", {})
-                                        .get("runs", 0)
-                                    },
-                                    "away": {
-                                        "runs": linescore_data.get("teams", {})
-                                        .get("away", {})
-                                        .get("runs", 0)
-                                    },
-                                }
-                            }
+                        "away": {
+                            "runs": linescore_data.get("teams", {})
+                            .get("away", {})
+                            .get("runs", 0)
                         },
                     }
+                }
+            },
+        }
 
-                    logger.info(
-                        "Using linescore fallback for game",
-                        game_pk=game_pk,
-                        home_runs=game_data["liveData"]["linescore"]["teams"]["home"][
-                            "runs"
-                        ],
-                        away_runs=game_data["liveData"]["linescore"]["teams"]["away"][
-                            "runs"
-                        ],
-                    )
+        logger.info(
+            "Using linescore fallback for game",
+            game_pk=game_pk,
+            home_runs=game_data["liveData"]["linescore"]["teams"]["home"]["runs"],
+            away_runs=game_data["liveData"]["linescore"]["teams"]["away"]["runs"],
+        )
 
-                    return game_data
-                else:
-                    logger.warning(
-                        "Linescore fallback failed",
-                        status=response.status,
-                        game_pk=game_pk,
-                    )
-                    return None
-
-        except Exception as e:
-            logger.error("Linescore fallback error", error=str(e), game_pk=game_pk)
-            return None
+        return game_data
 
 
 class GameOutcomeService:
@@ -278,6 +401,9 @@ class GameOutcomeService:
         self.settings = get_settings()
         self.logger = logger.bind(service="GameOutcomeService")
 
+        # Builds the MLB Stats API client used for each sync run
+        self.client_factory = MLBStatsAPIClient
+
         # Team abbreviation mappings
         self.team_mappings = {
             # MLB Stats API team names to our abbreviations
@@ -324,6 +450,8 @@ class GameOutcomeService:
 
         This method is completely independent of other data sources and fetches
         games directly from the MLB Stats API for the specified date range.
+        Each date costs one schedule request (none once cached) and all
+        outcomes are upserted in bulk.
 
         Args:
             date_range: Tuple of (start_date, end_date) in YYYY-MM-DD format
@@ -332,8 +460,6 @@ class GameOutcomeService:
         Returns:
             Dictionary with update results and statistics
         """
-        start_date_str, end_date_str = date_range
-
         self.logger.info(
             "Starting independent MLB outcomes fetch",
             date_range=date_range,
@@ -348,119 +474,66 @@ class GameOutcomeService:
             "errors": [],
             "date_range": date_range,
             "api_games_found": 0,
+            "api_requests": 0,
+            "cache_hits": 0,
         }
 
         try:
-            # Parse date range
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-
-            # Iterate through each date in the range
-            current_date = start_date
-            async with MLBStatsAPIClient() as mlb_client:
-                while current_date <= end_date:
-                    date_str = current_date.strftime("%Y-%m-%d")
-
-                    self.logger.info("Fetching games for date", date=date_str)
-
-                    # Get all MLB games for this date
-                    games_for_date = await mlb_client.get_games_for_date(date_str)
-                    results["api_games_found"] += len(games_for_date)
-
-                    self.logger.info(
-                        "Found games via MLB API",
-                        date=date_str,
-                        count=len(games_for_date),
-                    )
+            date_strs = self._dates_in_range(date_range)
 
-                    # Process each game from the API
-                    for game_data in games_for_date:
-                        results["processed_games"] += 1
-
-                        try:
-                            # Extract game PK (primary key from MLB API)
-                            game_pk = str(game_data.get("gamePk", ""))
-
-                            if not game_pk:
-                                self.logger.warning(
-                                    "Game missing gamePk",
-                                    game_data_keys=list(game_data.keys()),
-                                )
-                                results["skipped_games"] += 1
-                                continue
-
-                            # Check if game is completed
-                            game_status = game_data.get("status", {}).get(
-                                "statusCode", ""
-                            )
+            async with self.client_factory() as mlb_client:
+                schedules = await mlb_client.get_games_for_dates(date_strs)
+                results["api_requests"] = mlb_client.requests_made
+                results["cache_hits"] = mlb_client.cache_hits
 
-                            if game_status not in ["F", "O"]:  # Final or Official
-                                self.logger.debug(
-                                    "Game not completed",
-                                    game_pk=game_pk,
-                                    status=game_status,
-                                )
-                                results["skipped_games"] += 1
-                                continue
-
-                            # Check if outcome already exists (unless force_update)
-                            if not force_update:
-                                existing_outcome = (
-                                    await self._check_existing_outcome_by_mlb_id(
-                                        game_pk
-                                    )
-                                )
-                                if existing_outcome:
-                                    self.logger.debug(
-                                        "Outcome already exists", game_pk=game_pk
-                                    )
-                                    results["skipped_games"] += 1
-                                    continue
-
-                            # Get detailed game information for final outcome
-                            # Pass the schedule team info for fallback scenarios
-                            detailed_game = await mlb_client.get_game_details(
-                                game_pk, game_data
-                            )
-                            if not detailed_game:
-                                self.logger.warning(
-                                    "Could not fetch game details", game_pk=game_pk
-                                )
-                                results["skipped_games"] += 1
-                                continue
-
-                            # Create outcome from API data
-                            outcome = await self._create_outcome_from_api_data(
-                                detailed_game, game_pk, current_date
-                            )
+            # Keep completed games only
+            completed: list[tuple[str, dict[str, Any], date]] = []
+            for date_str, games_for_date in schedules.items():
+                results["api_games_found"] += len(games_for_date)
+                game_date = datetime.strptime(date_str, "%Y-%m-%d").date()
 
-                            if outcome:
-                                await self._store_independent_outcome(outcome)
-                                results["updated_outcomes"] += 1
-                                results["completed_games"] += 1
-
-                                self.logger.info(
-                                    "Stored independent outcome",
-                                    game_pk=game_pk,
-                                    home_team=outcome.home_team,
-                                    away_team=outcome.away_team,
-                                    home_score=outcome.home_score,
-                                    away_score=outcome.away_score,
-                                )
-                            else:
-                                results["skipped_games"] += 1
-
-                        except Exception as e:
-                            error_msg = f"Error processing MLB API game {game_data.get('gamePk', 'unknown')}: {str(e)}"
-                            results["errors"].append(error_msg)
-                            self.logger.error(
-                                "Game processing error",
-                                game_pk=game_data.get("gamePk"),
-                                error=str(e),
-                            )
+                for game_data in games_for_date:
+                    results["processed_games"] += 1
+                    game_pk = str(game_data.get("gamePk", ""))
+                    game_status = game_data.get("status", {}).get("statusCode", "")
+
+                    if not game_pk or game_status not in FINAL_STATUS_CODES:
+                        results["skipped_games"] += 1
+                        continue
+                    completed.append((game_pk, game_data, game_date))
+
+            # Drop games that already have outcomes (unless force_update)
+            if not force_update and completed:
+                existing = await self._get_existing_outcome_mlb_ids(
+                    [game_pk for game_pk, _, _ in completed]
+                )
+                results["skipped_games"] += sum(
+                    1 for game_pk, _, _ in completed if game_pk in existing
+                )
+                completed = [item for item in completed if item[0] not in existing]
+
+            outcomes = []
+            for game_pk, game_data, game_date in completed:
+                try:
+                    outcome = await self._create_outcome_from_api_data(
+                        MLBStatsAPIClient.schedule_game_to_game_data(game_data),
+                        game_pk,
+                        game_date,
+                    )
+                except Exception as e:
+                    error_msg = f"Error processing MLB API game {game_pk}: {str(e)}"
+                    results["errors"].append(error_msg)
+                    continue
 
-                    # Move to next date
-                    current_date += timedelta(days=1)
+                if outcome:
+                    outcomes.append(outcome)
+                else:
+                    results["skipped_games"] += 1
+
+            if outcomes:
+                await self._store_independent_outcomes(outcomes)
+                results["updated_outcomes"] += len(outcomes)
+                results["completed_games"] += len(outcomes)
 
             self.logger.info(
                 "Independent MLB outcomes fetch completed", results=results
@@ -478,6 +551,9 @@ class GameOutcomeService:
         """
         Check for completed games and update outcomes.
 
+        Games are looked up in the hydrated schedule of their date; only
+        games missing from it fall back to a per-game details request.
+
         Args:
             date_range: Optional tuple of (start_date, end_date) in YYYY-MM-DD format
             force_update: If True, update even if outcome already exists
@@ -507,6 +583,8 @@ class GameOutcomeService:
             "skipped_games": 0,
             "errors": [],
             "date_range": date_range,
+            "api_requests": 0,
+            "cache_hits": 0,
         }
 
         try:
@@ -517,48 +595,92 @@ class GameOutcomeService:
 
             self.logger.info("Found games to check", count=len(games_to_check))
 
-            # Process each game
-            async with MLBStatsAPIClient() as mlb_client:
-                for game_info in games_to_check:
-                    results["processed_games"] += 1
-
-                    try:
-                        outcome = await self._check_game_outcome(mlb_client, game_info)
+            valid_games = []
+            for game_info in games_to_check:
+                results["processed_games"] += 1
+                mlb_game_id = game_info["mlb_stats_api_game_id"]
+                if not self._is_valid_mlb_game_id(mlb_game_id):
+                    self.logger.warning(
+                        "Skipping invalid/test game ID",
+                        game_id=mlb_game_id,
+                        db_game_id=game_info.get("id"),
+                    )
+                    results["skipped_games"] += 1
+                    continue
+                valid_games.append(game_info)
 
-                        if outcome:
-                            await self._update_game_outcome(outcome)
-                            results["updated_outcomes"] += 1
-                            results["completed_games"] += 1
+            date_strs = sorted(
+                {self._schedule_date(game_info) for game_info in valid_games}
+            )
+            betting_lines = await self._get_betting_lines_bulk(
+                [game_info["id"] for game_info in valid_games]
+            )
 
-                            self.logger.info(
-                                "Updated game outcome",
-                                game_id=outcome.game_id,
-                                home_team=outcome.home_team,
-                                away_team=outcome.away_team,
-                                home_score=outcome.home_score,
-                                away_score=outcome.away_score,
+            raw_responses = []
+            outcomes = []
+            async with self.client_factory() as mlb_client:
+                schedules = await mlb_client.get_games_for_dates(date_strs)
+                schedule_games = {
+                    str(game.get("gamePk")): game
+                    for games in schedules.values()
+                    for game in games
+                }
+
+                for game_info in valid_games:
+                    mlb_game_id = game_info["mlb_stats_api_game_id"]
+                    try:
+                        schedule_game = schedule_games.get(str(mlb_game_id))
+                        if schedule_game is not None:
+                            game_data = MLBStatsAPIClient.schedule_game_to_game_data(
+                                schedule_game
+                            )
+                            endpoint = (
+                                f"/api/v1/schedule?date={self._schedule_date(game_info)}"
                             )
                         else:
-                            results["skipped_games"] += 1
-                            # More detailed logging for skipped games
-                            self.logger.debug(
-                                "Game skipped",
+                            # Rescheduled or mis-dated game: ask for it directly
+                            game_data = await mlb_client.get_game_details(mlb_game_id)
+                            endpoint = f"/api/v1/game/{mlb_game_id}/feed/live"
+
+                        if not game_data:
+                            self.logger.info(
+                                "Game not found in MLB API - may be invalid ID",
+                                game_id=mlb_game_id,
                                 db_game_id=game_info.get("id"),
-                                mlb_game_id=game_info.get("mlb_stats_api_game_id"),
-                                home_team=game_info.get("home_team"),
-                                away_team=game_info.get("away_team"),
-                                reason="not_completed_or_invalid",
                             )
+                            results["skipped_games"] += 1
+                            continue
 
+                        raw_responses.append((mlb_game_id, game_data, endpoint))
+                        outcome = self._build_outcome(
+                            game_info,
+                            game_data,
+                            betting_lines.get(game_info["id"], {}),
+                        )
                     except Exception as e:
                         error_msg = f"Error processing game {game_info.get('id', 'unknown')}: {str(e)}"
                         results["errors"].append(error_msg)
                         self.logger.error(
                             "Game processing error",
                             game_id=game_info.get("id"),
-                            mlb_game_id=game_info.get("mlb_stats_api_game_id"),
+                            mlb_game_id=mlb_game_id,
                             error=str(e),
                         )
+                        continue
+
+                    if outcome:
+                        outcomes.append(outcome)
+                    else:
+                        results["skipped_games"] += 1
+
+                results["api_requests"] = mlb_client.requests_made
+                results["cache_hits"] = mlb_client.cache_hits
+
+            await self._store_raw_responses(raw_responses)
+            if outcomes:
+                await self._update_game_outcomes(outcomes)
+                results["updated_outcomes"] += len(outcomes)
+                results["completed_games"] += len(outcomes)
 
             self.logger.info("Game outcome check completed", results=results)
             return results
@@ -568,6 +690,24 @@ class GameOutcomeService:
             results["errors"].append(f"Service error: {str(e)}")
             return results
 
+    @staticmethod
+    def _dates_in_range(date_range: tuple[str, str]) -> list[str]:
+        """Expand a (start, end) date range into YYYY-MM-DD strings."""
+        start_date = datetime.strptime(date_range[0], "%Y-%m-%d").date()
+        end_date = datetime.strptime(date_range[1], "%Y-%m-%d").date()
+        return [
+            (start_date + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range((end_date - start_date).days + 1)
+        ]
+
+    @staticmethod
+    def _schedule_date(game_info: dict[str, Any]) -> str:
+        """MLB schedule date (Eastern) for a games_complete row."""
+        game_datetime = game_info["game_datetime"]
+        if game_datetime.tzinfo is not None:
+            game_datetime = game_datetime.astimezone(EST_TIMEZONE)
+        return game_datetime.strftime("%Y-%m-%d")
+
     async def _get_games_needing_outcomes(
         self, date_range: tuple[str, str], force_update: bool
     ) -> list[dict[str, Any]]:
@@ -692,7 +832,7 @@ class GameOutcomeService:
         self, mlb_client: MLBStatsAPIClient, game_info: dict[str, Any]
     ) -> GameOutcome | None:
         """
-        Check if a game is completed and get the outcome.
+        Check if a single game is completed and get the outcome.
 
         Args:
             mlb_client: MLB Stats API client
@@ -731,12 +871,34 @@ class GameOutcomeService:
         # Store raw response before processing
         await self._store_raw_response(mlb_game_id, game_data)
 
+        betting_lines = await self._get_betting_lines(game_info["id"])
+        return self._build_outcome(game_info, game_data, betting_lines)
+
+    def _build_outcome(
+        self,
+        game_info: dict[str, Any],
+        game_data: dict[str, Any],
+        betting_lines: dict[str, Any],
+    ) -> GameOutcome | None:
+        """
+        Build a GameOutcome from game data and the game's latest betting lines.
+
+        Args:
+            game_info: Game information from database
+            game_data: Game details (or a schedule game shaped like them)
+            betting_lines: Latest total and spread lines for the game
+
+        Returns:
+            GameOutcome object if game is completed, None otherwise
+        """
+        mlb_game_id = game_info["mlb_stats_api_game_id"]
+
         # Check if game is completed
         game_state = game_data.get("gameData", {}).get("status", {})
         status_code = game_state.get("statusCode", "")
 
         # Game is completed if status is 'F' (Final) or 'O' (Official)
-        if status_code not in ["F", "O"]:
+        if status_code not in FINAL_STATUS_CODES:
             self.logger.debug(
                 "Game not completed", game_id=mlb_game_id, status=status_code
             )
@@ -763,9 +925,6 @@ class GameOutcomeService:
         home_win = home_score > away_score
         total_score = home_score + away_score
 
-        # Get betting lines for this game to calculate over/under and spread
-        betting_lines = await self._get_betting_lines(game_info["id"])
-
         # Calculate over/under
         over = None
         total_line = None
@@ -791,8 +950,7 @@ class GameOutcomeService:
             game_datetime = datetime.fromisoformat(
                 game_datetime_str.replace("Z", "+00:00")
             )
-            est_timezone = timezone(timedelta(hours=-5))  # EST is UTC-5
-            game_datetime = game_datetime.astimezone(est_timezone)
+            game_datetime = game_datetime.astimezone(EST_TIMEZONE)
         else:
             game_datetime = game_info["game_datetime"]
 
@@ -821,97 +979,111 @@ class GameOutcomeService:
             mlb_game_id: MLB Stats API game PK
             game_data: Complete JSON response from MLB Stats API
         """
-        try:
-            # Extract basic info from response for quick access
-            game_state = game_data.get("gameData", {}).get("status", {})
-            game_status = game_state.get("abstractGameState", "")
+        await self._store_raw_responses(
+            [(mlb_game_id, game_data, f"/api/v1/game/{mlb_game_id}/feed/live")]
+        )
 
-            # Extract team info
-            teams = game_data.get("gameData", {}).get("teams", {})
-            home_team = teams.get("home", {}).get("name", "")
-            away_team = teams.get("away", {}).get("name", "")
+    async def _store_raw_responses(
+        self, responses: list[tuple[str, dict[str, Any], str]]
+    ) -> None:
+        """
+        Store raw MLB Stats API responses in raw_data.mlb_game_outcomes in bulk.
 
-            # Extract game date
-            game_datetime_str = (
-                game_data.get("gameData", {}).get("datetime", {}).get("dateTime", "")
-            )
-            game_date = None
-            if game_datetime_str:
-                try:
-                    game_datetime = datetime.fromisoformat(
-                        game_datetime_str.replace("Z", "+00:00")
-                    )
-                    game_date = game_datetime.date()
-                except ValueError:
-                    pass
-
-            # Extract scores if available
-            linescore = game_data.get("liveData", {}).get("linescore", {})
-            home_score = None
-            away_score = None
-            is_final = False
-
-            if linescore:
-                home_runs = linescore.get("teams", {}).get("home", {}).get("runs")
-                away_runs = linescore.get("teams", {}).get("away", {}).get("runs")
-                if home_runs is not None and away_runs is not None:
-                    home_score = int(home_runs)
-                    away_score = int(away_runs)
-
-            # Check if game is final
-            status_code = game_state.get("statusCode", "")
-            is_final = status_code in ["F", "O"]  # Final or Official
-
-            # Insert raw response
-            query = """
-            INSERT INTO raw_data.mlb_game_outcomes (
-                mlb_game_pk, mlb_stats_api_game_id, api_endpoint, 
-                raw_response, game_date, home_team, away_team, 
-                game_status, home_score, away_score, is_final_game
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
-            )
-            ON CONFLICT (mlb_game_pk, request_timestamp) DO UPDATE SET
-                raw_response = EXCLUDED.raw_response,
-                game_status = EXCLUDED.game_status,
-                home_score = EXCLUDED.home_score,
-                away_score = EXCLUDED.away_score,
-                is_final_game = EXCLUDED.is_final_game,
-                updated_at = NOW()
-            """
+        Args:
+            responses: (mlb_game_id, game_data, api_endpoint) tuples
+        """
+        if not responses:
+            return
 
-            params = [
-                mlb_game_id,  # mlb_game_pk
-                mlb_game_id,  # mlb_stats_api_game_id (same value)
-                f"/api/v1/game/{mlb_game_id}/feed/live",  # api_endpoint
-                json.dumps(game_data),  # raw_response
-                game_date,  # game_date
-                home_team,  # home_team
-                away_team,  # away_team
-                game_status,  # game_status
-                home_score,  # home_score
-                away_score,  # away_score
-                is_final,  # is_final_game
-            ]
+        query = """
+        INSERT INTO raw_data.mlb_game_outcomes (
+            mlb_game_pk, mlb_stats_api_game_id, api_endpoint, 
+            raw_response, game_date, home_team, away_team, 
+            game_status, home_score, away_score, is_final_game
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
+        )
+        ON CONFLICT (mlb_game_pk, request_timestamp) DO UPDATE SET
+            raw_response = EXCLUDED.raw_response,
+            game_status = EXCLUDED.game_status,
+            home_score = EXCLUDED.home_score,
+            away_score = EXCLUDED.away_score,
+            is_final_game = EXCLUDED.is_final_game,
+            updated_at = NOW()
+        """
 
+        try:
             async with get_connection() as conn:
-                await conn.execute(query, *params)
+                await conn.executemany(
+                    query,
+                    [
+                        self._raw_response_params(mlb_game_id, game_data, endpoint)
+                        for mlb_game_id, game_data, endpoint in responses
+                    ],
+                )
 
-            self.logger.debug(
-                "Stored raw MLB response",
-                game_id=mlb_game_id,
-                game_status=game_status,
-                is_final=is_final,
-            )
+            self.logger.debug("Stored raw MLB responses", count=len(responses))
 
         except Exception as e:
             self.logger.error(
-                "Error storing raw MLB response",
-                game_id=mlb_game_id,
+                "Error storing raw MLB responses",
+                count=len(responses),
                 error=str(e),
             )
             # Don't raise - raw storage failure shouldn't block outcome processing
 
+    @staticmethod
+    def _raw_response_params(
+        mlb_game_id: str, game_data: dict[str, Any], endpoint: str
+    ) -> list[Any]:
+        """Extract the quick-access columns stored next to a raw response."""
+        game_state = game_data.get("gameData", {}).get("status", {})
+        game_status = game_state.get("abstractGameState", "")
+
+        # Extract team info
+        teams = game_data.get("gameData", {}).get("teams", {})
+        home_team = teams.get("home", {}).get("name", "")
+        away_team = teams.get("away", {}).get("name", "")
+
+        # Extract game date
+        game_datetime_str = (
+            game_data.get("gameData", {}).get("datetime", {}).get("dateTime", "")
+        )
+        game_date = None
+        if game_datetime_str:
+            try:
+                game_datetime = datetime.fromisoformat(
+                    game_datetime_str.replace("Z", "+00:00")
+                )
+                game_date = game_datetime.date()
+            except ValueError:
+                pass
+
+        # Extract scores if available
+        linescore = game_data.get("liveData", {}).get("linescore", {})
+        home_score = None
+        away_score = None
+        if linescore:
+            home_runs = linescore.get("teams", {}).get("home", {}).get("runs")
+            away_runs = linescore.get("teams", {}).get("away", {}).get("runs")
+            if home_runs is not None and away_runs is not None:
+                home_score = int(home_runs)
+                away_score = int(away_runs)
+
+        return [
+            mlb_game_id,  # mlb_game_pk
+            mlb_game_id,  # mlb_stats_api_game_id (same value)
+            endpoint,  # api_endpoint
+            json.dumps(game_data),  # raw_response
+            game_date,  # game_date
+            home_team,  # home_team
+            away_team,  # away_team
+            game_status,  # game_status
+            home_score,  # home_score
+            away_score,  # away_score
+            game_state.get("statusCode", "") in FINAL_STATUS_CODES,  # is_final_game
+        ]
+
     async def _get_betting_lines(self, game_id: int) -> dict[str, Any]:
         """
         Get the latest betting lines for a game.
@@ -922,43 +1094,62 @@ class GameOutcomeService:
         Returns:
             Dictionary with betting line information
         """
+        lines = await self._get_betting_lines_bulk([game_id])
+        return lines.get(game_id, {})
+
+    async def _get_betting_lines_bulk(
+        self, game_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Get the latest total and spread lines for many games in one query.
+
+        Args:
+            game_ids: Game IDs from curated.games_complete
+
+        Returns:
+            Mapping of game ID to betting line information
+        """
+        if not game_ids:
+            return {}
+
         query = """
         SELECT 
+            g.id,
             t.total_line,
             s.home_spread
         FROM curated.games_complete g
-        LEFT JOIN (
-            SELECT game_id, total_line
-            FROM curated.betting_lines_unified -- NOTE: Add WHERE market_type = 'totals'
-            WHERE game_id = $1
+        LEFT JOIN LATERAL (
+            SELECT total_line
+            FROM curated.betting_lines_unified
+            WHERE game_id = g.id AND market_type = 'totals'
             ORDER BY odds_timestamp DESC
             LIMIT 1
-        ) t ON g.id = t.game_id
-        LEFT JOIN (
-            SELECT game_id, home_spread
-            FROM curated.betting_lines_unified -- NOTE: Add WHERE market_type = 'spread's
-            WHERE game_id = $1
+        ) t ON TRUE
+        LEFT JOIN LATERAL (
+            SELECT home_spread
+            FROM curated.betting_lines_unified
+            WHERE game_id = g.id AND market_type = 'spread'
             ORDER BY odds_timestamp DESC
             LIMIT 1
-        ) s ON g.id = s.game_id
-        WHERE g.id = $1
+        ) s ON TRUE
+        WHERE g.id = ANY($1::int[])
         """
 
         try:
             async with get_connection() as conn:
-                row = await conn.fetchrow(query, game_id)
+                rows = await conn.fetch(query, list(game_ids))
 
-                if row:
-                    return {
+                return {
+                    row["id"]: {
                         "total_line": row["total_line"],
                         "home_spread_line": row["home_spread"],
                     }
-                else:
-                    return {}
+                    for row in rows
+                }
 
         except Exception as e:
             self.logger.error(
-                "Error getting betting lines", game_id=game_id, error=str(e)
+                "Error getting betting lines", game_count=len(game_ids), error=str(e)
             )
             return {}
 
@@ -969,6 +1160,29 @@ class GameOutcomeService:
         Args:
             outcome: GameOutcome object to insert/update
         """
+        await self._update_game_outcomes([outcome])
+
+    async def _update_game_outcomes(self, outcomes: list[GameOutcome]) -> None:
+        """
+        Upsert game outcomes in bulk.
+
+        Args:
+            outcomes: GameOutcome objects to insert/update
+        """
+        try:
+            async with get_connection() as conn:
+                await self._upsert_outcomes(conn, outcomes)
+
+        except Exception as e:
+            self.logger.error(
+                "Error updating game outcomes",
+                game_ids=[outcome.game_id for outcome in outcomes],
+                error=str(e),
+            )
+            raise
+
+    async def _upsert_outcomes(self, conn, outcomes: list[GameOutcome]) -> None:
+        """Upsert outcomes into curated.game_outcomes on an open connection."""
         query = """
         INSERT INTO curated.game_outcomes (
             game_id, home_team, away_team, home_score, away_score,
@@ -991,29 +1205,25 @@ class GameOutcomeService:
             updated_at = NOW()
         """
 
-        params = [
-            outcome.game_id,
-            outcome.home_team,
-            outcome.away_team,
-            outcome.home_score,
-            outcome.away_score,
-            outcome.home_win,
-            outcome.over,
-            outcome.home_cover_spread,
-            outcome.total_line,
-            outcome.home_spread_line,
-            outcome.game_datetime,
-        ]
-
-        try:
-            async with get_connection() as conn:
-                await conn.execute(query, *params)
-
-        except Exception as e:
-            self.logger.error(
-                "Error updating game outcome", game_id=outcome.game_id, error=str(e)
-            )
-            raise
+        await conn.executemany(
+            query,
+            [
+                (
+                    outcome.game_id,
+                    outcome.home_team,
+                    outcome.away_team,
+                    outcome.home_score,
+                    outcome.away_score,
+                    outcome.home_win,
+                    outcome.over,
+                    outcome.home_cover_spread,
+                    outcome.total_line,
+                    outcome.home_spread_line,
+                    outcome.game_datetime,
+                )
+                for outcome in outcomes
+            ],
+        )
 
     async def get_recent_outcomes(self, days: int = 7) -> list[dict[str, Any]]:
         """
@@ -1104,6 +1314,31 @@ class GameOutcomeService:
             )
             return None
 
+    async def _get_existing_outcome_mlb_ids(self, mlb_game_pks: list[str]) -> set[str]:
+        """
+        Return the MLB game PKs among mlb_game_pks that already have outcomes.
+
+        Args:
+            mlb_game_pks: MLB Stats API game PKs
+
+        Returns:
+            Set of game PKs with a stored outcome
+        """
+        query = """
+        SELECT g.mlb_stats_api_game_id
+        FROM curated.game_outcomes go
+        JOIN curated.games_complete g ON go.game_id = g.id
+        WHERE g.mlb_stats_api_game_id = ANY($1::text[])
+        """
+
+        try:
+            async with get_connection() as conn:
+                rows = await conn.fetch(query, list(mlb_game_pks))
+                return {row["mlb_stats_api_game_id"] for row in rows}
+        except Exception as e:
+            self.logger.error("Error checking existing outcomes", error=str(e))
+            return set()
+
     async def _create_outcome_from_api_data(
         self, game_data: dict[str, Any], game_pk: str, game_date: datetime.date
     ) -> GameOutcome | None:
@@ -1157,14 +1392,11 @@ class GameOutcomeService:
                     game_datetime_str.replace("Z", "+00:00")
                 )
                 # Convert to EST
-                est_timezone = timezone(timedelta(hours=-5))
-                game_datetime = game_datetime.astimezone(est_timezone)
+                game_datetime = game_datetime.astimezone(EST_TIMEZONE)
             else:
                 # Use date with default time if no datetime available
                 game_datetime = datetime.combine(game_date, datetime.min.time())
-                game_datetime = game_datetime.replace(
-                    tzinfo=timezone(timedelta(hours=-5))
-                )
+                game_datetime = game_datetime.replace(tzinfo=EST_TIMEZONE)
 
             # Note: We don't have betting lines for over/under and spread calculations
             # in this independent mode, so we'll set them as None
@@ -1196,101 +1428,89 @@ class GameOutcomeService:
         """
         Store an outcome that was fetched independently from MLB Stats API.
 
-        This method handles cases where the game might not exist in our
-        curated.games_complete table, creating a minimal game record if needed.
-
         Args:
             outcome: GameOutcome object to store
         """
+        await self._store_independent_outcomes([outcome])
+
+    async def _store_independent_outcomes(self, outcomes: list[GameOutcome]) -> None:
+        """
+        Store outcomes that were fetched independently from MLB Stats API.
+
+        This method handles cases where games might not exist in our
+        curated.games_complete table, creating minimal game records for them
+        in one statement before upserting all outcomes in bulk.
+
+        Args:
+            outcomes: GameOutcome objects to store
+        """
+        mlb_game_ids = [outcome.mlb_stats_api_game_id for outcome in outcomes]
+
         try:
             async with get_connection() as conn:
-                # First, try to find existing game record
-                game_query = """
-                SELECT id FROM curated.games_complete 
-                WHERE mlb_stats_api_game_id = $1
-                LIMIT 1
-                """
-
-                game_row = await conn.fetchrow(
-                    game_query, outcome.mlb_stats_api_game_id
-                )
-
-                if game_row:
-                    game_id = game_row["id"]
-                    self.logger.debug(
-                        "Found existing game record",
-                        mlb_game_id=outcome.mlb_stats_api_game_id,
-                        game_id=game_id,
-                    )
-                else:
-                    # Create minimal game record
-                    insert_game_query = """
-                    INSERT INTO curated.games_complete (
-                        mlb_stats_api_game_id, home_team, away_team, 
-                        game_datetime, game_date, game_status,
-                        created_at, updated_at
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, 'Final', NOW(), NOW()
-                    ) RETURNING id
-                    """
-
-                    game_id = await conn.fetchval(
-                        insert_game_query,
-                        outcome.mlb_stats_api_game_id,
-                        outcome.home_team,
-                        outcome.away_team,
-                        outcome.game_datetime,
-                        outcome.game_datetime.date(),
+                async with conn.transaction():
+                    # First, find existing game records
+                    rows = await conn.fetch(
+                        """
+                        SELECT id, mlb_stats_api_game_id FROM curated.games_complete 
+                        WHERE mlb_stats_api_game_id = ANY($1::text[])
+                        """,
+                        mlb_game_ids,
                     )
+                    game_ids = {
+                        row["mlb_stats_api_game_id"]: row["id"] for row in rows
+                    }
 
-                    self.logger.info(
-                        "Created new game record",
-                        mlb_game_id=outcome.mlb_stats_api_game_id,
-                        game_id=game_id,
-                    )
+                    # Create minimal game records for the rest
+                    missing = [
+                        outcome
+                        for outcome in outcomes
+                        if outcome.mlb_stats_api_game_id not in game_ids
+                    ]
+                    if missing:
+                        created = await conn.fetch(
+                            """
+                            INSERT INTO curated.games_complete (
+                                mlb_stats_api_game_id, home_team, away_team, 
+                                game_datetime, game_date, game_status,
+                                created_at, updated_at
+                            )
+                            SELECT m.*, 'Final', NOW(), NOW()
+                            FROM unnest(
+                                $1::text[], $2::text[], $3::text[],
+                                $4::timestamptz[], $5::date[]
+                            ) AS m
+                            RETURNING id, mlb_stats_api_game_id
+                            """,
+                            [o.mlb_stats_api_game_id for o in missing],
+                            [o.home_team for o in missing],
+                            [o.away_team for o in missing],
+                            [o.game_datetime for o in missing],
+                            [o.game_datetime.date() for o in missing],
+                        )
+                        game_ids.update(
+                            {row["mlb_stats_api_game_id"]: row["id"] for row in created}
+                        )
+                        self.logger.info(
+                            "Created new game records", count=len(created)
+                        )
 
-                # Now store the outcome
-                outcome_query = """
-                INSERT INTO curated.game_outcomes (
-                    game_id, home_team, away_team, home_score, away_score,
-                    home_win, over, home_cover_spread, total_line, home_spread_line,
-                    game_date, created_at, updated_at
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, NOW(), NOW()
-                )
-                ON CONFLICT (game_id) DO UPDATE SET
-                    home_team = EXCLUDED.home_team,
-                    away_team = EXCLUDED.away_team,
-                    home_score = EXCLUDED.home_score,
-                    away_score = EXCLUDED.away_score,
-                    home_win = EXCLUDED.home_win,
-                    over = EXCLUDED.over,
-                    home_cover_spread = EXCLUDED.home_cover_spread,
-                    total_line = EXCLUDED.total_line,
-                    home_spread_line = EXCLUDED.home_spread_line,
-                    game_date = EXCLUDED.game_date,
-                    updated_at = NOW()
-                """
-
-                await conn.execute(
-                    outcome_query,
-                    game_id,
-                    outcome.home_team,
-                    outcome.away_team,
-                    outcome.home_score,
-                    outcome.away_score,
-                    outcome.home_win,
-                    outcome.over,
-                    outcome.home_cover_spread,
-                    outcome.total_line,
-                    outcome.home_spread_line,
-                    outcome.game_datetime,
-                )
+                    # Now store the outcomes
+                    await self._upsert_outcomes(
+                        conn,
+                        [
+                            replace(
+                                outcome,
+                                game_id=game_ids[outcome.mlb_stats_api_game_id],
+                            )
+                            for outcome in outcomes
+                        ],
+                    )
 
         except Exception as e:
             self.logger.error(
-                "Error storing independent outcome",
-                mlb_game_id=outcome.mlb_stats_api_game_id,
+                "Error storing independent outcomes",
+                mlb_game_ids=mlb_game_ids,
                 error=str(e),
             )
             raise
@@ -18,6 +18,7 @@ import structlog
 from psycopg2.extras import RealDictCursor
 
 from ..core.config import UnifiedSettings
+from ..core.team_utils import resolve_team_abbreviation
 from ..data.collection.base import DataSource
 
 logger = structlog.get_logger(__name__)
@@ -113,10 +114,10 @@ class MLBStatsAPIGameResolutionService:
                 "EAST",
             ),
             # American League Central
-            "CHW": TeamMapping(
+            "CWS": TeamMapping(
                 "Chicago White Sox",
-                "CHW",
-                ["Chicago", "White Sox", "ChiSox", "CWS"],
+                "CWS",
+                ["Chicago", "White Sox", "ChiSox", "CHW"],
                 145,
                 "AL",
                 "CENTRAL",
@@ -354,81 +355,16 @@ class MLBStatsAPIGameResolutionService:
         Returns:
             Standardized team abbreviation or None if not found
         """
-        if not team_name:
-            return None
-
-        # Clean input
-        clean_name = team_name.strip()
-
-        # Direct abbreviation match
-        if clean_name.upper() in self.team_mappings:
-            return clean_name.upper()
-
-        # Search through aliases
-        for abbr, mapping in self.team_mappings.items():
-            if clean_name.lower() in [alias.lower() for alias in mapping.aliases]:
-                return abbr
-
-            # Partial matches
-            if any(alias.lower() in clean_name.lower() for alias in mapping.aliases):
-                return abbr
-
-        # Fuzzy matching for common variations
-        fuzzy_mappings = {
-            "yanks": "NYY",
-            "sox": "BOS",  # Default to Red Sox for 'sox' - context needed for White Sox
-            "mets": "NYM",
-            "cubs": "CHC",
-            "cards": "STL",
-            "nats": "WSH",
-            "jays": "TOR",
-            "rays": "TB",
-            "astros": "HOU",
-            "dodgers": "LAD",
-            "giants": "SF",
-            "padres": "SD",
-            "mariners": "SEA",
-            "angels": "LAA",
-            "rangers": "TEX",
-            "athletics": "OAK",
-            "twins": "MIN",
-            "tigers": "DET",
-            "royals": "KC",
-            "guardians": "CLE",
-            "orioles": "BAL",
-            "phillies": "PHI",
-            "braves": "ATL",
-            "marlins": "MIA",
-            "reds": "CIN",
-            "brewers": "MIL",
-            "pirates": "PIT",
-            "diamondbacks": "ARI",
-            "rockies": "COL",
-        }
+        abbr = resolve_team_abbreviation(team_name)
+        if abbr in self.team_mappings:
+            return abbr
 
-        for keyword, abbr in fuzzy_mappings.items():
-            if keyword in clean_name.lower():
-                return abbr
-
-        self.logger.warning(
-            "Could not standardize team name", 
-            team_name=team_name,
-            attempted_mappings={
-                "direct_match": clean_name.upper() in self.team_mappings,
-                "alias_matches": [
-                    abbr for abbr, mapping in self.team_mappings.items() 
-                    if clean_name.lower() in [alias.lower() for alias in mapping.aliases]
-                ],
-                "partial_matches": [
-                    abbr for abbr, mapping in self.team_mappings.items()
-                    if any(alias.lower() in clean_name.lower() for alias in mapping.aliases)
-                ],
-                "fuzzy_candidates": [
-                    keyword for keyword in ["athletics", "yanks", "sox", "mets"] 
-                    if keyword in clean_name.lower()
-                ]
-            }
-        )
+        if team_name:
+            self.logger.warning(
+                "Could not standardize team name",
+                team_name=team_name,
+                resolved=abbr,
+            )
         return None
 
     def get_team_info(self, team_identifier: str) -> TeamMapping | None:
@@ -17,6 +17,7 @@ from .collector_health_service import (
     HealthMonitoringOrchestrator,
     HealthStatus,
 )
+from .event_bus import MonitoringEvent, MonitoringEventBus, get_event_bus, publish_event
 
 __all__ = [
     "HealthMonitoringOrchestrator",
@@ -24,4 +25,8 @@ __all__ = [
     "HealthStatus",
     "AlertSeverity",
     "CollectorHealthStatus",
+    "MonitoringEvent",
+    "MonitoringEventBus",
+    "get_event_bus",
+    "publish_event",
 ]
@@ -30,6 +30,7 @@ except ImportError:
     # Fallback if repository not available
     UnifiedRepository = None
 from ...data.collection.base import BaseCollector
+from .event_bus import publish_event
 
 logger = get_logger(__name__, LogComponent.MONITORING)
 
@@ -136,6 +137,7 @@ class CollectorHealthMonitor:
         self.consecutive_failures = 0
         self.circuit_breaker = CircuitBreakerState()
         self._max_history_size = config.get("max_history_size", 100)
+        self._last_overall_status: HealthStatus | None = None
 
     async def run_all_checks(self) -> CollectorHealthStatus:
         """Execute all configured health checks for the collector with circuit breaker protection."""
@@ -256,6 +258,26 @@ class CollectorHealthMonitor:
         uptime_pct = self._calculate_uptime_percentage()
         performance_score = self._calculate_performance_score(checks)
 
+        # Publish transitions only; steady-state checks are not news
+        if overall_status != self._last_overall_status:
+            publish_event(
+                "collector_health",
+                {
+                    "collector": getattr(
+                        self.collector.source, "value", self.collector.source
+                    ),
+                    "status": overall_status.value,
+                    "previous_status": self._last_overall_status.value
+                    if self._last_overall_status
+                    else None,
+                    "uptime_percentage": uptime_pct,
+                    "performance_score": performance_score,
+                    "circuit_breaker_state": self.circuit_breaker.state,
+                },
+                source="collector_health",
+            )
+            self._last_overall_status = overall_status
+
         return CollectorHealthStatus(
             collector_name=self.collector.source,
             overall_status=overall_status,
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Monitoring Event Bus
+
+In-process publish/subscribe channel for monitoring deltas. Pipeline,
+collector and metrics services publish small events as state changes; the
+monitoring dashboard subscribes and forwards them to WebSocket clients
+instead of polling and recomputing system state on a timer.
+
+Publishing never blocks and never raises: subscribers have bounded queues
+and lose their oldest events when they fall behind.
+"""
+
+import asyncio
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from ...core.logging import LogComponent, get_logger
+
+logger = get_logger(__name__, LogComponent.MONITORING)
+
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 1000
+
+
+@dataclass
+class MonitoringEvent:
+    """A single state change published on the bus."""
+
+    type: str
+    data: dict[str, Any]
+    source: str
+    sequence: int
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class EventSubscription:
+    """Bounded queue of events for one subscriber."""
+
+    def __init__(self, bus: "MonitoringEventBus", max_size: int, event_filter: Callable | None):
+        self._bus = bus
+        self._queue: asyncio.Queue[MonitoringEvent] = asyncio.Queue(maxsize=max_size)
+        self._filter = event_filter
+        self.dropped = 0
+        try:
+            self.loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self.loop = None
+
+    def offer(self, event: MonitoringEvent) -> None:
+        if self._filter is not None and not self._filter(event):
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float | None = None) -> MonitoringEvent | None:
+        """Next event, or None if ``timeout`` elapses first."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def drain(self) -> list[MonitoringEvent]:
+        """All events queued right now, without waiting."""
+        events = []
+        while not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+
+class MonitoringEventBus:
+    """Fan-out of monitoring events to in-process subscribers."""
+
+    def __init__(self, subscriber_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE):
+        self.subscriber_queue_size = subscriber_queue_size
+        self._subscriptions: set[EventSubscription] = set()
+        self._sequence = itertools.count(1)
+        self.version = 0
+        self.published = 0
+
+    def subscribe(
+        self,
+        max_size: int | None = None,
+        event_filter: Callable[[MonitoringEvent], bool] | None = None,
+    ) -> EventSubscription:
+        subscription = EventSubscription(
+            self, max_size or self.subscriber_queue_size, event_filter
+        )
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def publish(
+        self, event_type: str, data: dict[str, Any] | None = None, source: str = "system"
+    ) -> MonitoringEvent:
+        """
+        Publish a state change.
+
+        Safe to call from synchronous code and from any thread; delivery to
+        subscribers happens on the event loop that owns them.
+        """
+        event = MonitoringEvent(
+            type=event_type,
+            data=data or {},
+            source=source,
+            sequence=next(self._sequence),
+        )
+        self.version = event.sequence
+        self.published += 1
+
+        if self._subscriptions:
+            try:
+                asyncio.get_running_loop()
+                self._deliver(event)
+            except RuntimeError:
+                # Published outside the loop (worker thread or sync code)
+                self._deliver_threadsafe(event)
+
+        return event
+
+    @staticmethod
+    def _offer_all(subscriptions, event: MonitoringEvent) -> None:
+        for subscription in subscriptions:
+            try:
+                subscription.offer(event)
+            except Exception as e:
+                logger.warning("Failed to deliver monitoring event", event_type=event.type, error=str(e))
+
+    def _deliver_threadsafe(self, event: MonitoringEvent) -> None:
+        by_loop: dict[Any, list[EventSubscription]] = {}
+        for subscription in tuple(self._subscriptions):
+            by_loop.setdefault(subscription.loop, []).append(subscription)
+
+        for loop, subscriptions in by_loop.items():
+            if loop is not None and loop.is_running():
+                loop.call_soon_threadsafe(self._offer_all, subscriptions, event)
+            else:
+                self._offer_all(subscriptions, event)
+
+    def _deliver(self, event: MonitoringEvent) -> None:
+        self._offer_all(tuple(self._subscriptions), event)
+
+
+# Global instance
+_event_bus: MonitoringEventBus | None = None
+
+
+def get_event_bus() -> MonitoringEventBus:
+    """Get the process-wide monitoring event bus."""
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = MonitoringEventBus()
+    return _event_bus
+
+
+def publish_event(event_type: str, data: dict[str, Any] | None = None, source: str = "system") -> None:
+    """Publish on the global bus; monitoring must never break the publisher."""
+    try:
+        get_event_bus().publish(event_type, data, source)
+    except Exception as e:
+        logger.debug("Monitoring event not published", event_type=event_type, error=str(e))
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Health Check Aggregator
+
+Runs registered health checks concurrently and caches each result for its
+own TTL so health endpoints stop re-running every check on every probe:
+- Per-check timeouts; a hung dependency yields a failure result instead of
+  stalling the whole report
+- Concurrent refreshes of the same check share a single execution, so probe
+  storms collapse into one round of checks
+- ``snapshot()`` returns the last results without awaiting any check and
+  schedules stale ones in the background
+- An optional background loop keeps results warm between probes
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ...core.logging import LogComponent, get_logger
+
+logger = get_logger(__name__, LogComponent.MONITORING)
+
+
+@dataclass
+class HealthCheckSpec:
+    """A registered health check and its caching policy."""
+
+    name: str
+    check: Callable[[], Awaitable[Any]]
+    ttl_seconds: float
+    timeout_seconds: float
+    on_error: Callable[[str, Exception], Any]
+
+
+@dataclass
+class CachedHealthResult:
+    """Last result of a health check."""
+
+    result: Any
+    checked_at: float = field(default_factory=time.monotonic)
+    duration_ms: float = 0.0
+
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.checked_at
+
+
+class HealthAggregator:
+    """Concurrent, TTL-cached execution of health checks."""
+
+    def __init__(self, refresh_interval_seconds: float = 5.0):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._specs: dict[str, HealthCheckSpec] = {}
+        self._results: dict[str, CachedHealthResult] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._background_task: asyncio.Task | None = None
+        self.executions = 0
+
+    def register(
+        self,
+        name: str,
+        check: Callable[[], Awaitable[Any]],
+        ttl_seconds: float,
+        timeout_seconds: float,
+        on_error: Callable[[str, Exception], Any],
+    ) -> None:
+        """Register a check; ``on_error`` builds the result for a failure or timeout."""
+        self._specs[name] = HealthCheckSpec(
+            name=name,
+            check=check,
+            ttl_seconds=ttl_seconds,
+            timeout_seconds=timeout_seconds,
+            on_error=on_error,
+        )
+
+    @property
+    def check_names(self) -> list[str]:
+        return list(self._specs)
+
+    def is_stale(self, name: str) -> bool:
+        cached = self._results.get(name)
+        return cached is None or cached.age_seconds() >= self._specs[name].ttl_seconds
+
+    async def refresh(
+        self, names: Iterable[str] | None = None, force: bool = False
+    ) -> dict[str, Any]:
+        """
+        Run the checks that are stale (or all of them with ``force``)
+        concurrently and return the current result of every requested check.
+        """
+        names = list(names) if names is not None else self.check_names
+        tasks = [
+            self._ensure_running(name)
+            for name in names
+            if force or self.is_stale(name)
+        ]
+        if tasks:
+            # Shield the shared executions from cancellation of this caller; a
+            # check that was cancelled itself is reported through its result
+            await asyncio.gather(
+                *(asyncio.shield(task) for task in tasks), return_exceptions=True
+            )
+        return {name: self._current_result(name) for name in names}
+
+    def snapshot(self, names: Iterable[str] | None = None) -> dict[str, Any] | None:
+        """
+        Last known results without waiting on any check.
+
+        Stale checks are refreshed in the background. Returns None until every
+        requested check has produced a result at least once.
+        """
+        names = list(names) if names is not None else self.check_names
+        for name in names:
+            if self.is_stale(name):
+                self._ensure_running(name)
+        if any(name not in self._results for name in names):
+            return None
+        return {name: self._results[name].result for name in names}
+
+    def get_cached(self, name: str) -> CachedHealthResult | None:
+        return self._results.get(name)
+
+    def start(self) -> None:
+        """Keep results warm by refreshing stale checks on an interval."""
+        if self._background_task is None or self._background_task.done():
+            self._background_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._background_task is not None:
+            self._background_task.cancel()
+            try:
+                await self._background_task
+            except asyncio.CancelledError:
+                pass
+            self._background_task = None
+
+    def _current_result(self, name: str) -> Any:
+        cached = self._results.get(name)
+        if cached is None:
+            return self._specs[name].on_error(
+                name, RuntimeError("check has not produced a result")
+            )
+        return cached.result
+
+    def _ensure_running(self, name: str) -> asyncio.Task:
+        task = self._inflight.get(name)
+        if task is None or task.done():
+            task = asyncio.create_task(self._run_check(self._specs[name]))
+            self._inflight[name] = task
+        return task
+
+    async def _run_check(self, spec: HealthCheckSpec) -> None:
+        start = time.monotonic()
+        try:
+            result = await asyncio.wait_for(spec.check(), timeout=spec.timeout_seconds)
+        except asyncio.CancelledError:
+            # Record the interruption so callers sharing this run get a result
+            self._record(
+                spec, spec.on_error(spec.name, RuntimeError("check was cancelled")), start
+            )
+            raise
+        except Exception as e:
+            logger.warning(
+                "Health check failed",
+                check=spec.name,
+                error_type=type(e).__name__,
+                error=str(e),
+            )
+            result = spec.on_error(spec.name, e)
+        finally:
+            self._inflight.pop(spec.name, None)
+
+        self._record(spec, result, start)
+
+    def _record(self, spec: HealthCheckSpec, result: Any, start: float) -> None:
+        self.executions += 1
+        self._results[spec.name] = CachedHealthResult(
+            result=result, duration_ms=(time.monotonic() - start) * 1000
+        )
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error("Background health refresh failed", error=str(e))
+            await asyncio.sleep(self.refresh_interval_seconds)
@@ -13,7 +13,7 @@ This addresses Issue #38: System Reliability Issues Prevent Production Use
 
 import asyncio
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -24,6 +24,7 @@ from pydantic import BaseModel
 from ...core.config import get_settings
 from ...core.logging import UnifiedLogger, LogComponent
 from ...data.collection.registry import get_collector_instance
+from .health_aggregator import HealthAggregator
 
 
 @dataclass
@@ -32,6 +33,16 @@ class HealthCheckConfig:
 
     # Cache settings
     cache_ttl_seconds: int = 30
+    # Per-check TTL overrides; checks not listed use cache_ttl_seconds
+    check_ttl_seconds: Dict[str, int] = field(
+        default_factory=lambda: {
+            "configuration": 300,
+            "logging": 300,
+            "cli": 600,
+            "pipeline": 300,
+        }
+    )
+    check_timeout_seconds: int = 30
 
     # Database health check settings
     connection_timeout_seconds: int = 5
@@ -124,6 +135,18 @@ class SystemHealth(BaseModel):
 class HealthCheckService:
     """Comprehensive health check service for all system components."""
 
+    BASE_CHECKS = {
+        "database": "_check_database_health",
+        "data_collection": "_check_data_collection_health",
+        "configuration": "_check_configuration_health",
+        "logging": "_check_logging_health",
+    }
+    DETAILED_CHECKS = {
+        "monitoring": "_check_monitoring_health",
+        "cli": "_check_cli_health",
+        "pipeline": "_check_pipeline_health",
+    }
+
     def __init__(self, config: HealthCheckConfig | None = None):
         self.settings = get_settings()
         self.config = config or HealthCheckConfig()
@@ -144,10 +167,26 @@ class HealthCheckService:
             ),
         )
 
+        # Each check is cached for its own TTL and run with its own timeout
+        self._aggregator = HealthAggregator()
+        for name, method in {**self.BASE_CHECKS, **self.DETAILED_CHECKS}.items():
+            self._aggregator.register(
+                name,
+                # Resolve the method per run so instance-level overrides apply
+                lambda method=method: getattr(self, method)(),
+                ttl_seconds=self.config.check_ttl_seconds.get(
+                    name, self.config.cache_ttl_seconds
+                ),
+                timeout_seconds=self.config.check_timeout_seconds,
+                on_error=self._failed_check_health,
+            )
+
     async def get_system_health(self, include_detailed: bool = False) -> SystemHealth:
         """
         Get comprehensive system health status.
 
+        Checks run concurrently and only when their cached result has expired.
+
         Args:
             include_detailed: Include detailed service diagnostics
 
@@ -156,61 +195,18 @@ class HealthCheckService:
         """
         start_time = time.time()
 
-        # Check cache first
-        if (
-            self._last_health_check
-            and (datetime.now() - self._last_health_check.timestamp).seconds
-            < self.config.cache_ttl_seconds
-        ):
-            return self._last_health_check
+        check_names = list(self.BASE_CHECKS)
+        if include_detailed:
+            check_names += list(self.DETAILED_CHECKS)
 
-        self.logger.info(
-            "Starting comprehensive system health check",
+        self.logger.debug(
+            "Refreshing expired health checks",
             operation="health_check",
             include_detailed=include_detailed,
         )
+        results = await self._aggregator.refresh(check_names)
 
-        # Run all health checks concurrently for better performance
-        base_checks = [
-            self._check_database_health(),
-            self._check_data_collection_health(),
-            self._check_configuration_health(),
-            self._check_logging_health(),
-        ]
-
-        if include_detailed:
-            detailed_checks = [
-                self._check_monitoring_health(),
-                self._check_cli_health(),
-                self._check_pipeline_health(),
-            ]
-            all_checks = base_checks + detailed_checks
-        else:
-            all_checks = base_checks
-
-        # Execute all health checks concurrently
-        services = await asyncio.gather(*all_checks, return_exceptions=True)
-
-        # Handle any exceptions from concurrent execution
-        processed_services = []
-        for i, result in enumerate(services):
-            if isinstance(result, Exception):
-                self.logger.error(f"Health check {i} failed", error=str(result))
-                # Create a failed health check result
-                processed_services.append(
-                    ServiceHealth(
-                        service_name=f"health_check_{i}",
-                        status=HealthStatus.CRITICAL,
-                        response_time=0.0,
-                        error_message=str(result),
-                        last_check=datetime.now(),
-                        metadata={"concurrent_execution_error": True},
-                    )
-                )
-            else:
-                processed_services.append(result)
-
-        services = processed_services
+        services = list(results.values())
 
         # Calculate overall status
         overall_status = self._calculate_overall_status(services)
@@ -245,17 +241,25 @@ class HealthCheckService:
         )
 
         self._last_health_check = system_health
+        return system_health
 
-        self.logger.info(
-            "System health check completed",
-            operation="health_check",
-            overall_status=overall_status.value,
-            response_time_ms=overall_response_time,
-            total_services=len(services),
+    def _failed_check_health(self, name: str, error: Exception) -> ServiceHealth:
+        """Result recorded for a check that raised or exceeded its timeout."""
+        timed_out = isinstance(error, asyncio.TimeoutError)
+        return ServiceHealth(
+            name=name,
+            status=HealthStatus.CRITICAL,
+            message=(
+                f"{name} health check timed out after {self.config.check_timeout_seconds}s"
+                if timed_out
+                else f"{name} health check failed: {error}"
+            ),
+            response_time_ms=self.config.check_timeout_seconds * 1000 if timed_out else 0.0,
+            last_check=datetime.now(),
+            error_count=1,
+            metadata={"error_type": type(error).__name__},
         )
 
-        return system_health
-
     async def _check_database_health(self) -> ServiceHealth:
         """Check database connectivity and performance with connection pooling and circuit breaker."""
         start_time = time.time()
@@ -332,22 +336,27 @@ class HealthCheckService:
                 conn.fetchval("SELECT 1"), timeout=self.config.query_timeout_seconds
             )
 
-            # Get comprehensive database stats in single optimized query
+            # Get database stats in a single catalog-only query. Row counts are
+            # planner estimates (-1 when the table is missing) so the check
+            # never scans the data tables.
             db_stats = await asyncio.wait_for(
                 conn.fetchrow("""
                     SELECT 
                         pg_database_size(current_database()) as db_size,
                         (SELECT count(*) FROM pg_stat_activity WHERE state = 'active') as active_connections,
                         (SELECT setting::int FROM pg_settings WHERE name = 'max_connections') as max_connections,
-                        (SELECT COALESCE(
-                            (SELECT count(*) FROM raw_data.action_network_odds), 0
-                        )) as raw_odds_count,
-                        (SELECT COALESCE(
-                            (SELECT count(*) FROM staging.betting_odds_unified), 0
-                        )) as staging_odds_count,
-                        (SELECT COALESCE(
-                            (SELECT count(*) FROM curated.enhanced_games), 0
-                        )) as curated_games_count
+                        COALESCE((
+                            SELECT GREATEST(reltuples, 0)::bigint FROM pg_class
+                            WHERE oid = to_regclass('raw_data.action_network_odds')
+                        ), -1) as raw_odds_count,
+                        COALESCE((
+                            SELECT GREATEST(reltuples, 0)::bigint FROM pg_class
+                            WHERE oid = to_regclass('staging.betting_odds_unified')
+                        ), -1) as staging_odds_count,
+                        COALESCE((
+                            SELECT GREATEST(reltuples, 0)::bigint FROM pg_class
+                            WHERE oid = to_regclass('curated.enhanced_games')
+                        ), -1) as curated_games_count
                 """),
                 timeout=self.config.query_timeout_seconds,
             )
@@ -392,9 +401,10 @@ class HealthCheckService:
                 "active_connections": db_stats["active_connections"] if db_stats else 0,
                 "max_connections": db_stats["max_connections"] if db_stats else 0,
                 "table_counts": table_stats,
+                "table_counts_estimated": True,
                 "connection_pool_status": "healthy",
                 "circuit_breaker_state": self._db_circuit_breaker.state,
-                "query_optimization": "single_query_used",
+                "query_optimization": "catalog_estimates",
             }
 
             return ServiceHealth(
@@ -8,7 +8,7 @@ to provide comprehensive observability.
 
 Features:
 - Pipeline execution metrics (latency, success rates, error rates)
-- Business metrics (opportunities detected, strategy performance)
+- Business metrics (opportunities detected, strategy performance and phase timings)
 - System health metrics (resource usage, data freshness)
 - SLI/SLO tracking with automatic alerting thresholds
 - Break-glass manual override capabilities
@@ -34,6 +34,7 @@ from prometheus_client import (
 
 from ...core.config import get_settings
 from ...core.logging import LogComponent, get_logger
+from .event_bus import publish_event
 
 logger = get_logger(__name__, LogComponent.MONITORING)
 
@@ -98,6 +99,7 @@ class PrometheusMetricsService:
         # State tracking
         self.start_time = time.time()
         self.pipeline_start_times: dict[str, float] = {}
+        self.last_health_status: str | None = None
 
         self.logger.info("Prometheus metrics service initialized")
 
@@ -211,6 +213,28 @@ class PrometheusMetricsService:
             registry=self.registry,
         )
 
+        strategy_phase_buckets = getattr(
+            self.settings.monitoring,
+            "strategy_phase_duration_buckets",
+            [0.01, 0.05, 0.1, 0.5, 1, 2, 5, 10, 30, 60],
+        )
+
+        self.strategy_phase_duration_seconds = Histogram(
+            "mlb_strategy_phase_duration_seconds",
+            "Strategy processor execution time by phase in seconds",
+            ["strategy", "phase"],
+            buckets=strategy_phase_buckets,
+            registry=self.registry,
+        )
+
+        self.strategy_phase_database_seconds = Histogram(
+            "mlb_strategy_phase_database_seconds",
+            "Database time spent by strategy processors by phase in seconds",
+            ["strategy", "phase"],
+            buckets=strategy_phase_buckets,
+            registry=self.registry,
+        )
+
         self.active_strategies = Gauge(
             "mlb_active_strategies",
             "Number of currently active strategies",
@@ -433,6 +457,11 @@ class PrometheusMetricsService:
             pipeline_id=pipeline_id,
             pipeline_type=pipeline_type,
         )
+        publish_event(
+            "pipeline_update",
+            {"pipeline_id": pipeline_id, "pipeline_type": pipeline_type, "status": "running"},
+            source="metrics",
+        )
 
     def record_pipeline_completion(
         self,
@@ -498,6 +527,18 @@ class PrometheusMetricsService:
             duration_seconds=duration,
             stages_executed=stages_executed,
         )
+        publish_event(
+            "pipeline_update",
+            {
+                "pipeline_id": pipeline_id,
+                "pipeline_type": pipeline_type,
+                "status": status,
+                "duration_seconds": duration,
+                "stages_executed": stages_executed,
+                "error_count": len(errors or []),
+            },
+            source="metrics",
+        )
 
     def record_stage_execution(
         self,
@@ -584,6 +625,12 @@ class PrometheusMetricsService:
             self.logger.error(f"Error recording games processed metric: {e}")
             raise
 
+        publish_event(
+            "collection_update",
+            {"source": source, "date": date, "games_processed": count},
+            source="metrics",
+        )
+
     def record_opportunity_detected(self, strategy: str, confidence_level: str):
         """Record a betting opportunity detection with input validation."""
         # Input validation
@@ -661,6 +708,31 @@ class PrometheusMetricsService:
             self.logger.error(f"Error updating strategy performance metric: {e}")
             raise
 
+    def record_strategy_phase(
+        self, strategy: str, phase: str, duration: float, database_seconds: float = 0.0
+    ):
+        """Record the wall time and database time of one strategy processor phase."""
+        if not strategy or not strategy.strip():
+            raise ValueError("Strategy cannot be empty or None")
+        if not phase or not phase.strip():
+            raise ValueError("Phase cannot be empty or None")
+        if not isinstance(duration, (int, float)) or duration < 0:
+            raise ValueError(f"Duration must be a non-negative number, got: {duration}")
+
+        strategy = strategy.strip()
+        phase = phase.strip()
+
+        try:
+            self.strategy_phase_duration_seconds.labels(
+                strategy=strategy, phase=phase
+            ).observe(duration)
+            self.strategy_phase_database_seconds.labels(
+                strategy=strategy, phase=phase
+            ).observe(max(database_seconds, 0.0))
+        except Exception as e:
+            self.logger.error(f"Error recording strategy phase metric: {e}")
+            raise
+
     def set_active_strategies_count(self, count: int):
         """Set the number of active strategies."""
         self.active_strategies.set(count)
@@ -698,6 +770,12 @@ class PrometheusMetricsService:
             self.logger.error(f"Error updating data freshness metric: {e}")
             raise
 
+        publish_event(
+            "metrics_delta",
+            {"metric": "data_freshness_seconds", "source": source, "value": age_seconds},
+            source="metrics",
+        )
+
     def update_data_quality_score(self, source: str, metric: str, score: float):
         """Update data quality score with input validation."""
         # Input validation
@@ -739,6 +817,12 @@ class PrometheusMetricsService:
             self.logger.error(f"Error updating collection success rate metric: {e}")
             raise
 
+        publish_event(
+            "metrics_delta",
+            {"metric": "collection_success_rate", "source": source, "value": rate},
+            source="metrics",
+        )
+
     def record_database_query(self, query_type: str, duration: float):
         """Record database query execution with input validation."""
         # Input validation
@@ -819,6 +903,10 @@ class PrometheusMetricsService:
         status_mapping = {"healthy": 1, "warning": 2, "critical": 3, "unknown": 0}
         self.system_health_status.set(status_mapping.get(status, 0))
 
+        if status != self.last_health_status:
+            self.last_health_status = status
+            publish_event("system_health", {"status": status}, source="metrics")
+
     # Break-Glass Methods
 
     def record_break_glass_activation(self, procedure_type: str, trigger_reason: str):
@@ -832,6 +920,16 @@ class PrometheusMetricsService:
             procedure_type=procedure_type,
             trigger_reason=trigger_reason,
         )
+        publish_event(
+            "alert",
+            {
+                "level": "warning",
+                "title": "Break-glass procedure activated",
+                "procedure_type": procedure_type,
+                "trigger_reason": trigger_reason,
+            },
+            source="metrics",
+        )
 
     def record_manual_override(self, system_component: str, override_reason: str):
         """Record manual system override."""
@@ -844,6 +942,16 @@ class PrometheusMetricsService:
             system_component=system_component,
             override_reason=override_reason,
         )
+        publish_event(
+            "alert",
+            {
+                "level": "warning",
+                "title": "Manual override activated",
+                "system_component": system_component,
+                "override_reason": override_reason,
+            },
+            source="metrics",
+        )
 
     def record_emergency_execution(self, execution_type: str):
         """Record emergency pipeline execution."""
@@ -31,6 +31,7 @@ import psutil
 from ...core.config import UnifiedSettings
 from ...core.exceptions import AlertException, MonitoringException
 from ...core.logging import LogComponent, get_logger
+from .health_aggregator import HealthAggregator
 
 logger = get_logger(__name__, LogComponent.MONITORING)
 
@@ -144,6 +145,7 @@ class UnifiedMonitoringService:
         self.start_time = datetime.now()
         self.session: aiohttp.ClientSession | None = None
         self.health_checks: dict[str, Any] = {}
+        self.health_aggregator = HealthAggregator()
         self.alerts: list[Alert] = []
 
         # Import legacy services for integration
@@ -226,12 +228,26 @@ class UnifiedMonitoringService:
             },
         }
 
+        # Each check's interval is how long its result is reused
+        for check_name, check_config in self.health_checks.items():
+            self.health_aggregator.register(
+                check_name,
+                lambda check_config=check_config: self._timed_health_check(check_config),
+                ttl_seconds=check_config["interval"],
+                timeout_seconds=check_config["timeout"],
+                on_error=self._failed_health_check,
+            )
+
         logger.info(f"Initialized {len(self.health_checks)} health checks")
 
-    async def get_system_health(self) -> MonitoringReport:
+    async def get_system_health(self, allow_stale: bool = False) -> MonitoringReport:
         """
         Get comprehensive system health report.
 
+        Args:
+            allow_stale: Use the last health check results without waiting
+                and refresh expired checks in the background (for probes)
+
         Returns:
             MonitoringReport with current system status
         """
@@ -240,7 +256,7 @@ class UnifiedMonitoringService:
 
         try:
             # Run all health checks
-            health_checks = await self._run_all_health_checks()
+            health_checks = await self._run_all_health_checks(allow_stale)
 
             # Collect system metrics
             system_metrics = await self._collect_system_metrics()
@@ -268,49 +284,41 @@ class UnifiedMonitoringService:
             logger.error(f"Failed to get system health: {e}")
             raise MonitoringException(f"Health check failed: {e}")
 
-    async def _run_all_health_checks(self) -> list[HealthCheck]:
-        """Run all configured health checks."""
-        health_checks = []
-
-        for check_name, check_config in self.health_checks.items():
-            try:
-                start_time = datetime.now()
-                check_function = check_config["check_function"]
-                timeout = check_config["timeout"]
-
-                # Run health check with timeout
-                result = await asyncio.wait_for(check_function(), timeout=timeout)
-
-                response_time = (datetime.now() - start_time).total_seconds()
-
-                health_check = HealthCheck(
-                    name=check_config["name"],
-                    status=result.get("status", HealthStatus.UNKNOWN),
-                    message=result.get("message", ""),
-                    response_time=response_time,
-                    metadata=result.get("metadata", {}),
-                )
-
-                health_checks.append(health_check)
-
-            except asyncio.TimeoutError:
-                health_checks.append(
-                    HealthCheck(
-                        name=check_config["name"],
-                        status=HealthStatus.CRITICAL,
-                        message=f"Health check timed out after {timeout}s",
-                    )
-                )
-            except Exception as e:
-                health_checks.append(
-                    HealthCheck(
-                        name=check_config["name"],
-                        status=HealthStatus.CRITICAL,
-                        message=f"Health check failed: {e}",
-                    )
-                )
-
-        return health_checks
+    async def _run_all_health_checks(self, allow_stale: bool = False) -> list[HealthCheck]:
+        """Run expired health checks concurrently and return all results."""
+        results = self.health_aggregator.snapshot() if allow_stale else None
+        if results is None:
+            results = await self.health_aggregator.refresh()
+        return list(results.values())
+
+    def start_background_refresh(self) -> None:
+        """Refresh expired checks on an interval so probes never wait on them."""
+        self.health_aggregator.start()
+
+    async def _timed_health_check(self, check_config: dict[str, Any]) -> HealthCheck:
+        start_time = datetime.now()
+        result = await check_config["check_function"]()
+        response_time = (datetime.now() - start_time).total_seconds()
+
+        return HealthCheck(
+            name=check_config["name"],
+            status=result.get("status", HealthStatus.UNKNOWN),
+            message=result.get("message", ""),
+            response_time=response_time,
+            metadata=result.get("metadata", {}),
+        )
+
+    def _failed_health_check(self, check_name: str, error: Exception) -> HealthCheck:
+        check_config = self.health_checks[check_name]
+        if isinstance(error, asyncio.TimeoutError):
+            message = f"Health check timed out after {check_config['timeout']}s"
+        else:
+            message = f"Health check failed: {error}"
+        return HealthCheck(
+            name=check_config["name"],
+            status=HealthStatus.CRITICAL,
+            message=message,
+        )
 
     async def _check_database_health(self) -> dict[str, Any]:
         """Check database connectivity and performance."""
@@ -606,6 +614,8 @@ class UnifiedMonitoringService:
 
     async def cleanup(self):
         """Cleanup resources."""
+        await self.health_aggregator.stop()
+
         if self.session:
             await self.session.close()
 
@@ -4,16 +4,22 @@ Optimized Game Resolution Service
 
 High-performance singleton service for MLB Stats API game ID resolution with intelligent caching.
 Eliminates redundant API calls by implementing batch processing and multi-level caching.
+
+The memory cache is a bounded LRU pre-loaded from staging.game_id_mappings at
+startup, new resolutions are written through to that table, and IDs that fail
+to resolve are negatively cached for a TTL so they are not retried every batch.
 """
 
 import asyncio
+import time
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import structlog
 
 from ..data.collection.base import DataSource
+from ..data.database.connection import get_connection
 from ..services.mlb_stats_api_game_resolution_service import MLBStatsAPIGameResolutionService, GameMatchResult
 
 logger = structlog.get_logger(__name__)
@@ -29,6 +35,91 @@ class GameResolutionRequest:
     source: DataSource = DataSource.ACTION_NETWORK
 
 
+# staging.game_id_mappings column holding each source's external game ID
+SOURCE_ID_COLUMNS: Dict[DataSource, str] = {
+    DataSource.ACTION_NETWORK: "action_network_game_id",
+    DataSource.VSIN: "vsin_game_id",
+    DataSource.SBD: "sbd_game_id",
+}
+
+# Cache keys are (source, external game ID); IDs are only unique per source
+CacheKey = Tuple[str, str]
+
+
+class ResolutionCache:
+    """
+    Bounded LRU of resolved game IDs plus a TTL'd negative cache.
+
+    Positive entries never expire (an external ID always maps to the same MLB
+    game) and are evicted least-recently-used once ``max_size`` is reached.
+    Negative entries remember IDs that failed to resolve until ``negative_ttl``
+    seconds have passed, after which resolution is attempted again. They are
+    kept in expiry order, so expired entries are swept from the front on
+    every insert, and capped at ``max_negative_size`` oldest-first.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 50_000,
+        negative_ttl: float = 1800.0,
+        max_negative_size: Optional[int] = None,
+    ):
+        self.max_size = max_size
+        self.negative_ttl = negative_ttl
+        self.max_negative_size = max_negative_size if max_negative_size is not None else max_size
+        self._entries: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self._negative: "OrderedDict[CacheKey, float]" = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._entries
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: CacheKey, mlb_game_id: str) -> None:
+        self._entries[key] = mlb_game_id
+        self._entries.move_to_end(key)
+        self._negative.pop(key, None)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def is_known_unresolvable(self, key: CacheKey) -> bool:
+        expires_at = self._negative.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._negative[key]
+            return False
+        return True
+
+    def mark_unresolvable(self, key: CacheKey) -> None:
+        now = time.monotonic()
+        # A single TTL keeps insertion order equal to expiry order
+        self._negative[key] = now + self.negative_ttl
+        self._negative.move_to_end(key)
+        while self._negative:
+            oldest, expires_at = next(iter(self._negative.items()))
+            if expires_at > now and len(self._negative) <= self.max_negative_size:
+                break
+            del self._negative[oldest]
+
+    @property
+    def negative_size(self) -> int:
+        return len(self._negative)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._negative.clear()
+
+
 class OptimizedGameResolutionService:
     """
     Singleton service for efficient MLB Stats API game ID resolution.
@@ -43,23 +134,26 @@ class OptimizedGameResolutionService:
     _instance: Optional['OptimizedGameResolutionService'] = None
     _lock = asyncio.Lock()
     
-    def __init__(self):
+    def __init__(self, max_cache_size: int = 50_000, negative_ttl_seconds: float = 1800.0):
         self.logger = logger.bind(component="OptimizedGameResolutionService")
         self._underlying_service: Optional[MLBStatsAPIGameResolutionService] = None
         self._initialized = False
         
         # Multi-level cache
-        self._memory_cache: Dict[str, str] = {}  # external_game_id -> mlb_stats_api_game_id
-        self._session_cache: Dict[str, str] = {}  # temporary cache for current session
-        self._pending_resolutions: Dict[str, asyncio.Future] = {}  # avoid duplicate concurrent requests
+        self._memory_cache = ResolutionCache(max_cache_size, negative_ttl_seconds)  # (source, external_game_id) -> mlb_stats_api_game_id
+        self._session_cache: Dict[CacheKey, str] = {}  # temporary cache for current session
+        self._pending_resolutions: Dict[CacheKey, asyncio.Future] = {}  # avoid duplicate concurrent requests
         
         # Statistics
         self.stats = {
             "cache_hits": 0,
             "cache_misses": 0,
+            "negative_cache_hits": 0,
             "api_calls_avoided": 0,
             "batch_operations": 0,
-            "games_resolved": 0
+            "games_resolved": 0,
+            "database_cache_loaded": 0,
+            "write_through_failures": 0
         }
     
     @classmethod
@@ -97,14 +191,99 @@ class OptimizedGameResolutionService:
     async def _load_database_cache(self):
         """Load existing game ID mappings from database into memory cache."""
         try:
-            # This would query the database for existing mappings
-            # For now, we'll implement a simple version
             self.logger.debug("Loading database cache for game ID mappings")
-            # TODO: Implement database cache loading
-            pass
+            columns = ", ".join(SOURCE_ID_COLUMNS.values())
+            async with get_connection() as conn:
+                # Most recently touched mappings first so the LRU keeps them
+                rows = await conn.fetch(
+                    f"""
+                    SELECT mlb_stats_api_game_id, {columns}
+                    FROM staging.game_id_mappings
+                    WHERE mlb_stats_api_game_id IS NOT NULL
+                    ORDER BY COALESCE(updated_at, created_at) DESC NULLS LAST
+                    LIMIT $1
+                    """,
+                    self._memory_cache.max_size,
+                )
+
+            loaded = 0
+            # Insert oldest first so the newest end up most-recently-used
+            for row in reversed(rows):
+                for source, column in SOURCE_ID_COLUMNS.items():
+                    if row[column]:
+                        self._memory_cache.put(
+                            self._cache_key(str(row[column]), source),
+                            row["mlb_stats_api_game_id"],
+                        )
+                        loaded += 1
+
+            self.stats["database_cache_loaded"] = loaded
+            self.logger.info("Loaded game ID mappings into resolution cache",
+                           mappings=len(rows), cache_entries=len(self._memory_cache))
         except Exception as e:
             self.logger.warning("Failed to load database cache", error=str(e))
-    
+
+    @staticmethod
+    def _cache_key(external_game_id: str, source: DataSource) -> CacheKey:
+        return (source.value, str(external_game_id))
+
+    def _cached_resolution(self, key: CacheKey) -> Tuple[bool, Optional[str]]:
+        """Return (hit, mlb_game_id); a negative-cache hit resolves to None."""
+        mlb_game_id = self._memory_cache.get(key)
+        if mlb_game_id is not None:
+            self.stats["cache_hits"] += 1
+            return True, mlb_game_id
+        if self._memory_cache.is_known_unresolvable(key):
+            self.stats["negative_cache_hits"] += 1
+            return True, None
+        return False, None
+
+    async def _record_resolution(self, key: CacheKey, mlb_game_id: Optional[str],
+                                 request: GameResolutionRequest) -> None:
+        """Cache a resolution outcome and write new mappings through to the database."""
+        if not mlb_game_id:
+            self._memory_cache.mark_unresolvable(key)
+            return
+
+        self._memory_cache.put(key, mlb_game_id)
+        self._session_cache[key] = mlb_game_id
+        self.stats["games_resolved"] += 1
+        await self._write_through(mlb_game_id, request)
+
+    async def _write_through(self, mlb_game_id: str, request: GameResolutionRequest) -> None:
+        """Persist a new resolution to staging.game_id_mappings."""
+        column = SOURCE_ID_COLUMNS.get(request.source)
+        if not column or not (request.home_team and request.away_team and request.game_date):
+            # Mapping rows require teams and date; keep the resolution in memory only
+            return
+
+        try:
+            async with get_connection() as conn:
+                await conn.execute(
+                    f"""
+                    INSERT INTO staging.game_id_mappings (
+                        mlb_stats_api_game_id, {column}, home_team, away_team,
+                        game_date, resolution_confidence, primary_source,
+                        last_verified_at, verification_attempts
+                    ) VALUES ($1, $2, $3, $4, $5, 1.0, $6, NOW(), 0)
+                    ON CONFLICT (mlb_stats_api_game_id) DO UPDATE SET
+                        {column} = COALESCE(staging.game_id_mappings.{column}, EXCLUDED.{column}),
+                        last_verified_at = NOW(),
+                        updated_at = NOW()
+                    """,
+                    mlb_game_id,
+                    str(request.external_game_id),
+                    request.home_team,
+                    request.away_team,
+                    request.game_date,
+                    request.source.value,
+                )
+        except Exception as e:
+            self.stats["write_through_failures"] += 1
+            self.logger.warning("Failed to persist game resolution",
+                              external_game_id=request.external_game_id,
+                              mlb_game_id=mlb_game_id, error=str(e))
+
     async def resolve_game_id(self, external_game_id: str, home_team: str = None, 
                             away_team: str = None, game_date: date = None,
                             source: DataSource = DataSource.ACTION_NETWORK) -> Optional[str]:
@@ -114,35 +293,38 @@ class OptimizedGameResolutionService:
         This method is optimized for individual calls and includes deduplication
         for concurrent requests for the same game.
         """
-        # Check memory cache first
-        if external_game_id in self._memory_cache:
-            self.stats["cache_hits"] += 1
+        key = self._cache_key(external_game_id, source)
+
+        # Check memory cache first (including known-unresolvable IDs)
+        hit, cached = self._cached_resolution(key)
+        if hit:
             self.logger.debug("Cache hit for game ID", external_game_id=external_game_id,
-                            mlb_game_id=self._memory_cache[external_game_id])
-            return self._memory_cache[external_game_id]
+                            mlb_game_id=cached)
+            return cached
         
         # Check if this game is already being resolved
-        if external_game_id in self._pending_resolutions:
+        if key in self._pending_resolutions:
             self.logger.debug("Waiting for concurrent resolution", external_game_id=external_game_id)
             try:
-                return await self._pending_resolutions[external_game_id]
+                return await self._pending_resolutions[key]
             except Exception:
                 # If the pending resolution failed, we'll try again
                 pass
         
         # Create a future for this resolution to prevent duplicates
         future = asyncio.Future()
-        self._pending_resolutions[external_game_id] = future
+        self._pending_resolutions[key] = future
         
         try:
             # Perform the actual resolution
             result = await self._resolve_single_game(external_game_id, home_team, away_team, game_date, source)
             
-            # Cache the result
-            if result:
-                self._memory_cache[external_game_id] = result
-                self._session_cache[external_game_id] = result
-                self.stats["games_resolved"] += 1
+            # Cache the result (negative results expire after the TTL)
+            await self._record_resolution(
+                key,
+                result,
+                GameResolutionRequest(external_game_id, home_team, away_team, game_date, source),
+            )
             
             self.stats["cache_misses"] += 1
             
@@ -155,7 +337,7 @@ class OptimizedGameResolutionService:
             raise
         finally:
             # Clean up the pending resolution
-            self._pending_resolutions.pop(external_game_id, None)
+            self._pending_resolutions.pop(key, None)
     
     async def batch_resolve_games(self, requests: List[GameResolutionRequest]) -> Dict[str, Optional[str]]:
         """
@@ -169,14 +351,15 @@ class OptimizedGameResolutionService:
         self.stats["batch_operations"] += 1
         self.logger.info("Starting batch game resolution", total_requests=len(requests))
         
-        # Phase 1: Group by unique external game IDs
+        # Phase 1: Group by unique (source, external game ID)
         unique_games = {}
         all_game_ids = []
         
         for request in requests:
-            all_game_ids.append(request.external_game_id)
-            if request.external_game_id not in unique_games:
-                unique_games[request.external_game_id] = request
+            key = self._cache_key(request.external_game_id, request.source)
+            all_game_ids.append(key)
+            if key not in unique_games:
+                unique_games[key] = request
         
         self.logger.info("Batch deduplication completed", 
                         total_requests=len(requests),
@@ -187,10 +370,10 @@ class OptimizedGameResolutionService:
         results = {}
         uncached_requests = []
         
-        for external_game_id, request in unique_games.items():
-            if external_game_id in self._memory_cache:
-                results[external_game_id] = self._memory_cache[external_game_id]
-                self.stats["cache_hits"] += 1
+        for key, request in unique_games.items():
+            hit, cached = self._cached_resolution(key)
+            if hit:
+                results[request.external_game_id] = cached
             else:
                 uncached_requests.append(request)
                 self.stats["cache_misses"] += 1
@@ -214,11 +397,11 @@ class OptimizedGameResolutionService:
                     )
                     
                     results[request.external_game_id] = mlb_game_id
-                    
-                    if mlb_game_id:
-                        self._memory_cache[request.external_game_id] = mlb_game_id
-                        self._session_cache[request.external_game_id] = mlb_game_id
-                        self.stats["games_resolved"] += 1
+                    await self._record_resolution(
+                        self._cache_key(request.external_game_id, request.source),
+                        mlb_game_id,
+                        request,
+                    )
                         
                 except Exception as e:
                     self.logger.error("Failed to resolve game", 
@@ -291,6 +474,9 @@ class OptimizedGameResolutionService:
             "total_requests": total_requests,
             "cache_hit_rate": f"{cache_hit_rate:.1f}%",
             "memory_cache_size": len(self._memory_cache),
+            "memory_cache_limit": self._memory_cache.max_size,
+            "memory_cache_evictions": self._memory_cache.evictions,
+            "negative_cache_size": self._memory_cache.negative_size,
             "session_cache_size": len(self._session_cache)
         }
     
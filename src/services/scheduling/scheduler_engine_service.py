@@ -49,6 +49,7 @@ class SchedulerJobType(str, Enum):
     PRE_GAME_WORKFLOW = "pre_game_workflow"
     BACKTESTING_DAILY = "backtesting_daily"
     BACKTESTING_WEEKLY = "backtesting_weekly"
+    LINE_MOVEMENT_ROLLUPS = "line_movement_rollups"
     CUSTOM = "custom"
 
 
@@ -86,6 +87,11 @@ class SchedulerMetrics:
     backtesting_failures: int = 0
     alerts_generated: int = 0
 
+    # Rollup maintenance metrics
+    rollup_refreshes: int = 0
+    rollup_rows_processed: int = 0
+    last_rollup_refresh: datetime | None = None
+
     # General metrics
     total_jobs_executed: int = 0
     active_jobs: int = 0
@@ -117,6 +123,7 @@ class SchedulerConfig:
     # Basic settings
     alert_minutes_before_game: int = 5
     daily_setup_hour: int = 6
+    rollup_refresh_minutes: int = 5
     notifications_enabled: bool = True
 
     # Timezone settings
@@ -446,6 +453,16 @@ class SchedulerEngineService:
         )
         await self.add_job(daily_job)
 
+        # Line movement rollups, refreshed on the 5-minute bucket cadence
+        rollup_job = ScheduledJob(
+            job_id=SchedulerJobType.LINE_MOVEMENT_ROLLUPS,
+            job_type=SchedulerJobType.LINE_MOVEMENT_ROLLUPS,
+            name="Line Movement Rollup Refresh",
+            trigger=CronTrigger(minute=f"*/{self.config.rollup_refresh_minutes}"),
+            handler=self._rollup_refresh_handler,
+        )
+        await self.add_job(rollup_job)
+
     async def _setup_workflow_jobs(self):
         """Setup workflow automation jobs."""
         # Pre-game workflow scheduling will be handled dynamically
@@ -629,6 +646,24 @@ class SchedulerEngineService:
             self.logger.error(f"Daily setup error: {e}")
             raise
 
+    async def _rollup_refresh_handler(self) -> None:
+        """Fold new line movement history into the dashboard rollups."""
+        from ..analytics.line_movement_rollup_service import (
+            get_line_movement_rollup_service,
+        )
+
+        try:
+            result = await get_line_movement_rollup_service().refresh()
+
+            self.metrics.increment("rollup_refreshes")
+            self.metrics.increment("rollup_rows_processed", result.source_rows)
+            self.metrics.update("last_rollup_refresh", datetime.now(timezone.utc))
+
+        except Exception as e:
+            self.logger.error(f"Line movement rollup refresh failed: {e}")
+            self.metrics.increment("errors")
+            # The watermark only advances on success; the next run catches up
+
     async def _daily_backtesting_handler(self) -> None:
         """Handle daily backtesting pipeline."""
         self.logger.info("Starting daily backtesting pipeline")
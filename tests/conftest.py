@@ -14,6 +14,7 @@ from tests.utils.test_config import (
     get_test_config, 
     is_integration_test_enabled,
     is_load_test_enabled,
+    is_benchmark_enabled,
     skip_if_no_integration,
     skip_if_no_load_tests
 )
@@ -35,6 +36,7 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "load: mark test as a load/performance test")
     config.addinivalue_line("markers", "security: mark test as a security test")
     config.addinivalue_line("markers", "slow: mark test as slow running")
+    config.addinivalue_line("markers", "benchmark: mark test as an opt-in timing benchmark")
 
 
 def pytest_collection_modifyitems(config, items):
@@ -53,6 +55,13 @@ def pytest_collection_modifyitems(config, items):
             if "load" in item.keywords:
                 item.add_marker(skip_load)
 
+    # Skip timing benchmarks unless enabled
+    if not is_benchmark_enabled():
+        skip_benchmark = pytest.mark.skip(reason="Benchmarks disabled")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def test_environment() -> Generator[None, None, None]:
@@ -146,6 +146,55 @@ class ActionNetworkFixtures:
         
         return sorted(history, key=lambda x: x["timestamp"])
     
+    @staticmethod
+    def movement_history(
+        books: int = 10, updates_per_side: int = 400, seed: int = 20240730
+    ) -> List[Dict[str, Any]]:
+        """
+        Deterministic line movement corpus shaped like the history endpoint.
+
+        Each book/market/side series is a random walk of American odds and line
+        values with irregular update gaps (seconds to hours) and occasional
+        missing fields, mirroring what a complete-history backfill returns.
+        """
+        import random
+
+        rng = random.Random(seed)
+        base_time = datetime(2024, 7, 30, 12, 0, 0)
+        movements = []
+
+        for book_id in range(books):
+            for market_type, sides in (
+                ("moneyline", ("home", "away")),
+                ("spread", ("home", "away")),
+                ("total", ("over", "under")),
+            ):
+                for side in sides:
+                    odds = rng.choice([-150, -120, -110, 105, 130])
+                    value = None if market_type == "moneyline" else (
+                        -1.5 if market_type == "spread" else 8.5
+                    )
+                    timestamp = base_time
+                    for _ in range(updates_per_side):
+                        timestamp += timedelta(seconds=rng.choice(
+                            [5, 30, 60, 300, 900, 1800, 3700, 7200]
+                        ))
+                        odds += rng.choice([-10, -5, -2, -1, 0, 1, 2, 5, 10])
+                        if -100 < odds < 100:  # wrap through even money
+                            odds = odds + 200 if odds < 0 else odds - 200
+                        if value is not None and rng.random() < 0.1:
+                            value += rng.choice([-0.5, 0.5, -0.25, 0.25])
+                        movements.append({
+                            "book_id": book_id,
+                            "market_type": market_type,
+                            "side": side,
+                            "odds": None if rng.random() < 0.01 else odds,
+                            "value": value,
+                            "updated_at": timestamp.isoformat() + "Z",
+                        })
+
+        return movements
+
     @staticmethod
     def complete_game_data() -> Dict[str, Any]:
         """Complete game data with odds and history."""
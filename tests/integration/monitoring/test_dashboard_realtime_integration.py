@@ -221,6 +221,35 @@ class TestRealtimeBroadcasting:
         assert success_ws in manager.active_connections
         assert failure_ws not in manager.active_connections
 
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_broadcast(self):
+        """A client blocked in send only delays its own queue."""
+        release = asyncio.Event()
+
+        async def blocked_send(payload):
+            await release.wait()
+
+        slow_ws = Mock()
+        slow_ws.send_text = AsyncMock(side_effect=blocked_send)
+        fast_ws = Mock()
+        fast_ws.send_text = AsyncMock()
+        manager.active_connections.update({slow_ws, fast_ws})
+
+        message = WebSocketMessage(type="test", data={"status": "test"})
+        await asyncio.wait_for(manager.broadcast(message), timeout=0.5)
+        await asyncio.wait_for(manager.broadcast(message), timeout=0.5)
+
+        assert fast_ws.send_text.call_count == 2
+        assert slow_ws.send_text.call_count == 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert slow_ws.send_text.call_count == 2
+
+        # Clean up
+        manager.disconnect(slow_ws)
+        manager.disconnect(fast_ws)
+
     @pytest.mark.asyncio
     async def test_broadcast_performance_with_many_connections(self):
         """Test broadcast performance with many concurrent connections."""
@@ -0,0 +1,150 @@
+"""
+Unit tests for the columnar movement engine behind MovementAnalyzer.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.analysis.processors.movement_analyzer import MovementAnalyzer
+from src.analysis.processors.movement_engine import DOWN, UP, MovementFrame
+
+BASE = datetime(2025, 7, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _iso(minutes, micros=""):
+    stamp = (BASE + timedelta(minutes=minutes)).strftime("%Y-%m-%dT%H:%M:%S")
+    return f"{stamp}{micros}Z"
+
+
+def _history(points):
+    return [
+        {"updated_at": _iso(minute, micros), "odds": odds, "value": value}
+        for minute, odds, value, micros in points
+    ]
+
+
+def _game(raw_data, game_id=1):
+    return {
+        "game_id": game_id,
+        "home_team": "NYY",
+        "away_team": "BOS",
+        "game_datetime": "2025-07-01T23:05:00Z",
+        "raw_data": raw_data,
+    }
+
+
+def _steam_game():
+    """Three books moving the home spread down inside one five-minute bucket."""
+    raw_data = {}
+    for book in ("15", "30", "68"):
+        raw_data[book] = {
+            "event": {
+                "spread": [
+                    {
+                        "side": "home",
+                        "history": _history(
+                            [(0, -110, -1.0, ".1"), (1, -115, -1.5, ".123456789"), (2, -120, -2.0, "")]
+                        ),
+                        "bet_info": {"tickets": {"percent": 80}, "money": {"percent": 40}},
+                    }
+                ]
+            }
+        }
+    return _game(raw_data)
+
+
+class TestMovementFrame:
+    def test_history_pairs_become_typed_movements(self):
+        """Consecutive history entries become one row with deltas and codes."""
+        frame = MovementFrame.from_games([_steam_game()], now=BASE)
+
+        movements = frame.movements
+        assert movements.height == 6
+        assert set(movements["direction"].to_list()) == {DOWN}
+        assert movements["movement_amount"].to_list() == pytest.approx([0.5] * 6)
+        # 0.5 points is a MODERATE movement
+        assert set(movements["magnitude"].to_list()) == {1}
+        first = movements.row(0, named=True)
+        assert first["timestamp"] == BASE + timedelta(minutes=1, microseconds=123456)
+
+    def test_cross_book_consensus_and_steam(self):
+        """Three books in one bucket agree on direction and form a steam move."""
+        frame = MovementFrame.from_games([_steam_game()], now=BASE)
+
+        cross_book = frame.cross_book_movements()
+
+        assert cross_book.height == 1
+        row = cross_book.row(0, named=True)
+        assert row["books"] == ["15", "30", "68"]
+        assert row["consensus"] == DOWN
+        assert row["consensus_ratio"] == 1.0
+        assert row["divergent_books"] == []
+        assert row["steam_move"] is True
+
+    def test_rlm_requires_line_against_public(self):
+        """Line moving down while 80% of tickets are on the side is RLM."""
+        frame = MovementFrame.from_games([_steam_game()], now=BASE)
+
+        rlm = frame.reverse_line_movements()
+
+        assert rlm["sportsbook_id"].to_list() == ["15", "30", "68"]
+        assert set(rlm["public_direction"].to_list()) == {UP}
+        assert rlm["line_movement_amount"].to_list() == pytest.approx([1.0] * 3)
+
+    def test_rapid_windows_and_arbitrage(self):
+        """Three moves in ten minutes count as a rapid window; stale odds are ignored."""
+        raw_data = {
+            "15": {
+                "event": {
+                    "moneyline": [
+                        {"history": _history([(0, -110, None, ""), (2, -120, None, ""), (4, -130, None, ""), (6, -140, None, "")])}
+                    ]
+                }
+            },
+            "30": {
+                "event": {
+                    "moneyline": [{"history": _history([(0, -110, None, ""), (30, -105, None, "")])}]
+                }
+            },
+        }
+        frame = MovementFrame.from_games([_game(raw_data)], now=BASE + timedelta(minutes=20))
+
+        rapid = frame.rapid_movements()
+        arbitrage = frame.arbitrage_opportunities()
+
+        assert rapid.rows(named=True) == [
+            {"game": 0, "sportsbook_id": "15", "market_type": "moneyline", "windows": 1}
+        ]
+        assert arbitrage.row(0, named=True)["discrepancy"] == 35
+        assert arbitrage.row(0, named=True)["books"] == ["15", "30"]
+
+
+class TestMovementAnalyzer:
+    @pytest.mark.asyncio
+    async def test_slate_results_are_built_per_game(self):
+        """A slate is analyzed in one pass and split back into game analyses."""
+        analyzer = MovementAnalyzer()
+        games = [_steam_game(), _game({}, game_id=2)]
+
+        analyses = await analyzer.analyze_slate(games)
+
+        assert [a.game_id for a in analyses] == [1, 2]
+        steam, empty = analyses
+        assert len(steam.line_movements) == 6
+        assert steam.spread_summary.total_movements == 6
+        assert steam.spread_summary.dominant_direction == "down"
+        assert len(steam.rlm_indicators) == 3
+        assert steam.cross_book_movements[0].steam_move_detected
+        assert any("STEAM MOVE" in action for action in steam.recommended_actions)
+        assert len(steam.betting_snapshots) == 3
+        assert empty.line_movements == []
+        assert empty.moneyline_summary.total_movements == 0
+
+    @pytest.mark.asyncio
+    async def test_single_game_entry_point(self):
+        """analyze_game_movements keeps returning one GameMovementAnalysis."""
+        analysis = await MovementAnalyzer().analyze_game_movements(_steam_game())
+
+        assert analysis.game_id == 1
+        assert analysis.line_movements[0].direction == "down"
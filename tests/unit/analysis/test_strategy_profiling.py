@@ -0,0 +1,124 @@
+"""
+Unit tests for strategy phase profiling in the StrategyOrchestrator.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.analysis.strategies import profiling
+from src.analysis.strategies.orchestrator import ExecutionStatus, StrategyOrchestrator
+from src.data.database.query_timing import current_query_timer
+
+
+class FakeStrategy:
+    """Processor stand-in that marks its phases the way the real processors do."""
+
+    def __init__(self, rows=3, fetch_seconds=0.0, query_seconds=0.0):
+        self.rows = rows
+        self.fetch_seconds = fetch_seconds
+        self.query_seconds = query_seconds
+
+    async def _fetch(self):
+        await asyncio.sleep(self.fetch_seconds)
+        timer = current_query_timer()
+        if timer is not None and self.query_seconds:
+            timer.record(SimpleNamespace(elapsed=self.query_seconds))
+        return [{"game_id": i} for i in range(self.rows)]
+
+    async def _filter(self, signals):
+        return signals[:1]
+
+    async def process_with_error_handling(self, game_data, context):
+        data = await profiling.run_phase("data_fetch", self._fetch())
+        signals = [row["game_id"] for row in data]
+        return await profiling.run_phase("filtering", self._filter(signals), rows_in=len(signals))
+
+    def get_processor_info(self):
+        return {}
+
+
+class FakeFactory:
+    def __init__(self, strategies):
+        self.strategies = strategies
+
+    def get_loaded_strategies(self):
+        return dict(self.strategies)
+
+    def get_strategy(self, name):
+        return self.strategies.get(name)
+
+
+def _orchestrator(strategies, **config):
+    return StrategyOrchestrator(FakeFactory(strategies), repository=None, config=config)
+
+
+class TestRunPhase:
+    @pytest.mark.asyncio
+    async def test_plain_await_without_active_profile(self):
+        assert await profiling.run_phase("data_fetch", FakeStrategy()._fetch()) == [
+            {"game_id": 0}, {"game_id": 1}, {"game_id": 2}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_phase_keeps_its_time(self):
+        """A phase cut off by a strategy timeout still reports how long it ran."""
+        profile = profiling.StrategyProfile(strategy_name="slow", execution_id="1")
+        with pytest.raises(asyncio.TimeoutError):
+            with profiling.profile_strategy(profile):
+                await asyncio.wait_for(
+                    profiling.run_phase("data_fetch", asyncio.sleep(1)), timeout=0.05
+                )
+
+        assert profile.phases["data_fetch"].duration_seconds >= 0.04
+        assert profile.slowest_phase().phase == "data_fetch"
+
+
+class TestOrchestratorProfiling:
+    @pytest.mark.asyncio
+    async def test_phase_spans_rows_and_database_time(self):
+        orchestrator = _orchestrator({"sharp_action": FakeStrategy(rows=3, query_seconds=0.2)})
+
+        result = await orchestrator.execute_strategies(["sharp_action"], [{}])
+
+        profile = result.strategy_results["sharp_action"].profile
+        phases = profile.phase_breakdown()
+        assert list(phases) == ["data_fetch", "signal_computation", "filtering"]
+        assert phases["data_fetch"].rows_out == 3
+        assert phases["data_fetch"].database.seconds == pytest.approx(0.2)
+        assert phases["signal_computation"].rows_in == 3
+        assert phases["signal_computation"].rows_out == 3
+        assert (phases["filtering"].rows_in, phases["filtering"].rows_out) == (3, 1)
+        assert profile.database_seconds == pytest.approx(0.2)
+        assert profile.profile_output is None
+
+    @pytest.mark.asyncio
+    async def test_timeline_and_latency_budget(self):
+        orchestrator = _orchestrator(
+            {"fast": FakeStrategy(), "slow": FakeStrategy(fetch_seconds=0.05)},
+            strategy_latency_budget_seconds=0.03,
+        )
+
+        result = await orchestrator.execute_strategies(["fast", "slow"], [{}])
+
+        timeline = result.get_timeline()
+        assert [entry["strategy_name"] for entry in timeline] == ["fast", "slow"]
+        assert all(entry["status"] == ExecutionStatus.COMPLETED.value for entry in timeline)
+        assert timeline[1]["phases"]["data_fetch"]["duration_seconds"] >= 0.04
+
+        summary = orchestrator.get_orchestrator_status()["performance_summary"]["strategy_phases"]
+        assert list(summary) == ["slow", "fast"]
+        assert summary["slow"]["over_budget_runs"] == 1
+        assert summary["fast"]["over_budget_runs"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cprofile_capture_for_requested_strategy(self):
+        orchestrator = _orchestrator({"fast": FakeStrategy(), "other": FakeStrategy()})
+
+        result = await orchestrator.execute_strategies(
+            ["fast", "other"], [{}], {"profile_strategies": ["fast"], "profiler": "cprofile"}
+        )
+
+        assert "_fetch" in result.strategy_results["fast"].profile.profile_output
+        assert result.strategy_results["other"].profile.profile_output is None
@@ -0,0 +1,139 @@
+"""
+Unit tests for the columnar SmartLineMovementFilter path.
+
+Checks that the vectorized filter makes the same keep/drop decisions as the
+row-wise filter on a complete-history corpus. The timing benchmark is opt-in.
+"""
+
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.data.collection.smart_line_movement_filter import (
+    SmartLineMovementFilter,
+    american_odds_change,
+    significant_movement_mask,
+)
+from tests.fixtures.api_responses import ActionNetworkFixtures
+
+
+def _series(movements):
+    """Group movements into book/market/side series."""
+    grouped = defaultdict(list)
+    for movement in movements:
+        grouped[
+            (movement["book_id"], movement["market_type"], movement["side"])
+        ].append(movement)
+    return grouped
+
+
+def _to_arrays(movements):
+    timestamps = np.array(
+        [
+            np.datetime64(
+                datetime.fromisoformat(m["updated_at"].replace("Z", "")), "us"
+            )
+            for m in movements
+        ]
+    )
+    odds = np.array(
+        [np.nan if m["odds"] is None else m["odds"] for m in movements], dtype=float
+    )
+    values = np.array(
+        [np.nan if m["value"] is None else m["value"] for m in movements],
+        dtype=float,
+    )
+    return timestamps, odds, values
+
+
+@pytest.fixture(scope="module")
+def history_corpus():
+    return ActionNetworkFixtures.movement_history()
+
+
+class TestAmericanOddsChange:
+    """Vectorized odds change matches the scalar helper."""
+
+    @pytest.mark.parametrize(
+        "previous,current",
+        [(-150, -140), (130, 110), (-101, 101), (101, -101), (-110, 120), (0, 5)],
+    )
+    def test_matches_scalar(self, previous, current):
+        scalar = SmartLineMovementFilter()._calculate_american_odds_change(
+            previous, current
+        )
+        assert american_odds_change(previous, current) == scalar
+
+    def test_missing_odds_propagate_nan(self):
+        assert np.isnan(american_odds_change(np.nan, -110))
+
+
+class TestColumnarFilter:
+    """Keep/drop parity between the row-wise and columnar filters."""
+
+    def test_short_series_keeps_everything(self):
+        assert significant_movement_mask(np.array([1, 2], dtype=np.int64)).all()
+        assert len(significant_movement_mask(np.array([], dtype=np.int64))) == 0
+
+    def test_compares_against_last_kept_movement(self):
+        hour = 3600 * 1_000_000
+        timestamps = np.array([0, 1, 2, 3, 4 * hour], dtype=np.int64)
+        # -105 is 5 points off the first kept row; -103 is only 2 off -105
+        odds = [-110, -108, -105, -103, -101]
+        mask = significant_movement_mask(timestamps, odds)
+        assert mask.tolist() == [True, False, True, False, True]
+
+    def test_time_gap_is_significant(self):
+        hour = 3600 * 1_000_000
+        timestamps = np.array([0, hour, hour + 1, 3 * hour], dtype=np.int64)
+        mask = significant_movement_mask(timestamps, [-110] * 4, [8.5] * 4)
+        assert mask.tolist() == [True, False, True, True]
+
+    def test_identical_decisions_on_history_corpus(self, history_corpus):
+        row_filter = SmartLineMovementFilter()
+        columnar_filter = SmartLineMovementFilter()
+
+        for series in _series(history_corpus).values():
+            expected = row_filter.filter_movements(series)
+            ordered = sorted(series, key=lambda x: x.get("updated_at", ""))
+            kept = columnar_filter.filter_movement_arrays(*_to_arrays(ordered))
+            assert [ordered[i] for i in kept] == expected
+
+        assert columnar_filter.get_stats() == row_filter.get_stats()
+
+    def test_frame_filter_matches_row_filter(self, history_corpus):
+        frame = pl.DataFrame(history_corpus, infer_schema_length=None)
+        result = SmartLineMovementFilter().filter_movements_frame(
+            frame, group_by=("book_id", "market_type", "side")
+        )
+
+        expected = []
+        for series in _series(history_corpus).values():
+            expected.extend(SmartLineMovementFilter().filter_movements(series))
+
+        assert result.to_dicts() == expected
+
+
+@pytest.mark.benchmark
+def test_columnar_filter_benchmark(history_corpus, record_property):
+    """Time both filters over a complete-history backfill (ENABLE_BENCHMARKS=true)."""
+    frame = pl.DataFrame(history_corpus, infer_schema_length=None)
+    series = list(_series(history_corpus).values())
+
+    start = time.perf_counter()
+    expected = []
+    for movements in series:
+        expected.extend(SmartLineMovementFilter().filter_movements(movements))
+    record_property("row_ms", (time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    result = SmartLineMovementFilter().filter_movements_frame(
+        frame, group_by=("book_id", "market_type", "side")
+    )
+    record_property("columnar_ms", (time.perf_counter() - start) * 1000)
+
+    assert result.to_dicts() == expected
@@ -0,0 +1,157 @@
+"""
+Unit tests for the shared odds math module.
+
+Checks the scalar formulas and that every array form matches its scalar
+form. The cross-book arbitrage scan benchmark is opt-in.
+"""
+
+import itertools
+import time
+
+import numpy as np
+import pytest
+
+from src.core import odds_math
+
+AMERICAN_ODDS = [-350, -150, -110, -101, 101, 110, 150, 400]
+
+
+class TestScalarOddsMath:
+    """Scalar conversions, vig removal, EV, Kelly and arbitrage."""
+
+    @pytest.mark.parametrize(
+        "american,decimal", [(-200, 1.5), (-110, 1 + 100 / 110), (100, 2.0), (150, 2.5)]
+    )
+    def test_american_decimal_round_trip(self, american, decimal):
+        assert odds_math.american_to_decimal(american) == pytest.approx(decimal)
+        assert odds_math.decimal_to_american(decimal) == pytest.approx(american)
+
+    def test_implied_probability_includes_vig(self):
+        assert odds_math.implied_probability(-110) == pytest.approx(110 / 210)
+        assert odds_math.implied_probability(150) == pytest.approx(0.4)
+        assert odds_math.implied_probability(-110) * 2 > 1
+
+    def test_remove_vig_and_fair_odds(self):
+        fair = odds_math.remove_vig([odds_math.implied_probability(-150), odds_math.implied_probability(130)])
+        assert sum(fair) == pytest.approx(1.0)
+
+        fair_a, fair_b = odds_math.fair_odds(-150, 130)
+        assert fair_a == pytest.approx(-138.0)
+        assert fair_b == pytest.approx(138.0)
+        assert odds_math.fair_odds(-110, -110) == pytest.approx((100.0, 100.0))
+
+    def test_expected_value_and_kelly(self):
+        assert odds_math.expected_value(0.55, 2.0) == pytest.approx(0.10)
+        assert odds_math.expected_value(0.55, 2.0, stake=50) == pytest.approx(5.0)
+        assert odds_math.kelly_fraction(0.55, 2.0) == pytest.approx(0.10)
+        assert odds_math.kelly_fraction(0.40, 2.0) < 0
+
+    def test_arbitrage_profit(self):
+        assert odds_math.arbitrage_profit(2.1, 2.05) == pytest.approx(1 - 1 / 2.1 - 1 / 2.05)
+        assert odds_math.arbitrage_profit(1.91, 1.91) == 0.0
+
+    @pytest.mark.parametrize(
+        "previous,current,change", [(-150, -140, 10), (130, 110, -20), (-101, 101, 0), (101, -101, 0)]
+    )
+    def test_american_odds_change(self, previous, current, change):
+        assert odds_math.american_odds_change(previous, current) == change
+
+    def test_invalid_odds_raise(self):
+        with pytest.raises(ZeroDivisionError):
+            odds_math.american_to_decimal(0)
+
+
+class TestVectorizedOddsMath:
+    """Array forms match the scalar forms element by element."""
+
+    def test_conversions_match_scalar(self):
+        odds = np.array(AMERICAN_ODDS, dtype=float)
+        decimal = odds_math.american_to_decimal_array(odds)
+
+        assert decimal == pytest.approx([odds_math.american_to_decimal(o) for o in AMERICAN_ODDS])
+        assert odds_math.decimal_to_american_array(decimal) == pytest.approx(AMERICAN_ODDS)
+        assert odds_math.implied_probability_array(odds) == pytest.approx(
+            [odds_math.implied_probability(o) for o in AMERICAN_ODDS]
+        )
+
+    def test_pairwise_forms_match_scalar(self):
+        pairs = list(itertools.product(AMERICAN_ODDS, repeat=2))
+        odds_a, odds_b = np.array(pairs, dtype=float).T
+        decimal_a = odds_math.american_to_decimal_array(odds_a)
+        decimal_b = odds_math.american_to_decimal_array(odds_b)
+        probability = np.linspace(0.3, 0.7, len(pairs))
+
+        fair_a, fair_b = odds_math.fair_odds_array(odds_a, odds_b)
+        expected = [odds_math.fair_odds(a, b) for a, b in pairs]
+        assert fair_a == pytest.approx([a for a, _ in expected])
+        assert fair_b == pytest.approx([b for _, b in expected])
+
+        assert odds_math.remove_vig_array(
+            np.stack([odds_math.implied_probability_array(odds_a), odds_math.implied_probability_array(odds_b)], axis=-1)
+        ).sum(axis=-1) == pytest.approx(np.ones(len(pairs)))
+        assert odds_math.expected_value_array(probability, decimal_a) == pytest.approx(
+            [odds_math.expected_value(p, d) for p, d in zip(probability, decimal_a, strict=True)]
+        )
+        assert odds_math.kelly_fraction_array(probability, decimal_b) == pytest.approx(
+            [odds_math.kelly_fraction(p, d) for p, d in zip(probability, decimal_b, strict=True)]
+        )
+        assert odds_math.arbitrage_profit_array(decimal_a, decimal_b) == pytest.approx(
+            [odds_math.arbitrage_profit(a, b) for a, b in zip(decimal_a, decimal_b, strict=True)]
+        )
+        assert odds_math.american_odds_change_array(odds_a, odds_b) == pytest.approx(
+            [odds_math.american_odds_change(a, b) for a, b in pairs]
+        )
+
+    def test_invalid_odds_are_nan(self):
+        assert np.isnan(odds_math.american_to_decimal_array([0.0, np.nan])).all()
+        assert np.isnan(odds_math.decimal_to_american_array([1.0])).all()
+        assert odds_math.arbitrage_profit_array([np.nan], [5.0]) == pytest.approx([0.0])
+
+    def test_margin_matrix_covers_every_book_pair(self):
+        home = np.array([[2.10, 1.95, 2.00], [1.80, 1.85, 1.90]])
+        away = np.array([[1.80, 2.05, 1.90], [2.00, 1.95, 2.02]])
+
+        margins = odds_math.arbitrage_margin_matrix(home, away)
+
+        assert margins.shape == (2, 3, 3)
+        for market, i, j in itertools.product(range(2), range(3), range(3)):
+            assert margins[market, i, j] == pytest.approx(1 - 1 / home[market, i] - 1 / away[market, j])
+        assert np.argwhere(margins > 0).tolist() == [[0, 0, 1], [0, 2, 1]]
+
+
+def _cross_book_markets(markets=2000, books=10, seed=11):
+    rng = np.random.default_rng(seed)
+    fair = rng.uniform(0.3, 0.7, size=(markets, 1))
+    vig = rng.uniform(-0.005, 0.05, size=(markets, books, 2))
+    home = 1 / (fair + vig[..., 0])
+    away = 1 / (1 - fair + vig[..., 1])
+    return odds_math.decimal_to_american_array(home), odds_math.decimal_to_american_array(away)
+
+
+@pytest.mark.benchmark
+def test_cross_book_arbitrage_scan_benchmark(record_property):
+    """Time a book-pair arbitrage scan as a loop and as one broadcast (ENABLE_BENCHMARKS=true)."""
+    home, away = _cross_book_markets()
+
+    start = time.perf_counter()
+    loop_pairs = []
+    for market in range(len(home)):
+        for i, home_odds in enumerate(home[market]):
+            for j, away_odds in enumerate(away[market]):
+                profit = odds_math.arbitrage_profit(
+                    odds_math.american_to_decimal(home_odds),
+                    odds_math.american_to_decimal(away_odds),
+                )
+                if profit > 0:
+                    loop_pairs.append((market, i, j))
+    record_property("loop_ms", (time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    margins = odds_math.arbitrage_margin_matrix(
+        odds_math.american_to_decimal_array(home),
+        odds_math.american_to_decimal_array(away),
+    )
+    array_pairs = [tuple(pair) for pair in np.argwhere(margins > 0).tolist()]
+    record_property("array_ms", (time.perf_counter() - start) * 1000)
+
+    assert array_pairs == loop_pairs
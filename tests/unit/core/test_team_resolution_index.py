@@ -0,0 +1,109 @@
+"""
+Tests for the precompiled team resolution index.
+
+Covers alias resolution, source ID lookup and agreement between the
+modules that normalize team names.
+"""
+
+import time
+
+import pytest
+
+from src.core.team_utils import (
+    ACTION_NETWORK_TEAM_IDS,
+    MLB_STATS_API_TEAM_IDS,
+    MLB_TEAM_MAPPINGS,
+    TEAM_ALIASES,
+    get_team_index,
+    normalize_team_name,
+    resolve_team_abbreviation,
+)
+
+
+class TestTeamResolutionIndex:
+    """Test the shared team resolution index."""
+
+    def test_every_mapping_resolves_to_its_abbreviation(self):
+        """Every canonical name and abbreviation resolves via the index."""
+        for name, abbrev in MLB_TEAM_MAPPINGS.items():
+            assert resolve_team_abbreviation(name) == abbrev
+            assert resolve_team_abbreviation(name.upper()) == abbrev
+
+    def test_aliases_resolve_to_known_abbreviations(self):
+        """Aliases only point at abbreviations the database knows about."""
+        index = get_team_index()
+        for alias, abbrev in TEAM_ALIASES.items():
+            assert abbrev in index.abbreviations
+            assert resolve_team_abbreviation(alias) == abbrev
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("CHW", "CWS"),
+            ("WSN", "WSH"),
+            ("  new york yankees ", "NYY"),
+            ("Pittsburgh Baseball Club", "PIT"),
+            ("Nats", "WSH"),
+            ("Cubs", "CHC"),
+            ("Kansas City Baseball", "KC"),
+            ("Chicago", "CWS"),
+        ],
+    )
+    def test_resolve_variants(self, name, expected):
+        """Alternate abbreviations, casing and partial names resolve."""
+        assert resolve_team_abbreviation(name) == expected
+
+    def test_unknown_name_returns_none(self):
+        """Strict resolution never invents an abbreviation."""
+        assert resolve_team_abbreviation("Unknown Team") is None
+        assert resolve_team_abbreviation("") is None
+        assert resolve_team_abbreviation(None) is None
+        assert normalize_team_name("Unknown Team") == "UNK"
+
+    @pytest.mark.parametrize("name", ["city", "Red", "white", "Bay", "Red Wings"])
+    def test_generic_words_do_not_resolve(self, name):
+        """Words shared by team names do not pick a team on their own."""
+        assert resolve_team_abbreviation(name) is None
+
+    def test_unknown_cities_and_placeholders_keep_their_own_abbreviation(self):
+        """"Mexico City" is not Kansas City and "TBD" is not Tampa Bay."""
+        assert resolve_team_abbreviation("Mexico City") is None
+        assert normalize_team_name("Mexico City") == "MEX"
+        assert resolve_team_abbreviation("TBD") is None
+        assert normalize_team_name("TBD") == "TBD"
+
+    def test_source_ids_agree_between_sources(self):
+        """MLB Stats API and Action Network IDs cover the same 30 teams."""
+        index = get_team_index()
+        assert set(MLB_STATS_API_TEAM_IDS.values()) == set(
+            ACTION_NETWORK_TEAM_IDS.values()
+        )
+        assert index.from_source_id("mlb_stats_api", 145) == "CWS"
+        assert index.from_source_id("action_network", "200") == "CWS"
+        assert index.from_source_id("action_network", 999) is None
+
+    def test_pipeline_team_mapping_uses_shared_ids(self):
+        """The staging pipeline mapping is the shared Action Network table."""
+        from src.data.pipeline.team_mappings import get_team_mapping
+
+        assert get_team_mapping("action_network") is ACTION_NETWORK_TEAM_IDS
+
+    def test_fallback_results_are_memoized(self):
+        """Repeated unseen spellings are served from the LRU."""
+        index = get_team_index()
+        before = index.cache_info().hits
+        for _ in range(3):
+            assert index.resolve("Pittsburgh Baseball Club") == "PIT"
+        assert index.cache_info().hits >= before + 2
+
+    def test_resolution_performance(self):
+        """Batch normalization stays fast for a realistic ingest volume."""
+        names = list(MLB_TEAM_MAPPINGS) + list(TEAM_ALIASES)
+        batch = names * (20_000 // len(names) + 1)
+
+        start = time.perf_counter()
+        for name in batch:
+            normalize_team_name(name)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5, f"Normalizing {len(batch)} names took {elapsed:.3f}s"
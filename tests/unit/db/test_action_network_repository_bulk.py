@@ -0,0 +1,194 @@
+"""
+Unit tests for bulk line-history persistence in ActionNetworkRepository.
+
+Covers flattening a game's history into per-market row batches, the one-time
+sportsbook ID load and the single COPY + upsert per market table.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+
+import pytest
+
+from src.data.database.action_network_repository import ActionNetworkRepository
+from src.data.models.unified.actionnetwork import (
+    ActionNetworkHistoricalData,
+    ActionNetworkHistoricalEntry,
+)
+
+
+class FakeConnection:
+    """Minimal asyncpg connection double recording bulk calls."""
+
+    def __init__(self):
+        self.copies = []
+        self.executed = []
+        self.fetches = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetch(self, query, *args):
+        self.fetches += 1
+        return [
+            {"external_id": book_id, "sportsbook_id": int(book_id)}
+            for book_id in args[0]
+        ]
+
+    async def fetchval(self, query, *args):
+        return None
+
+    async def execute(self, query, *args):
+        self.executed.append(query)
+
+    async def executemany(self, query, args):
+        self.executed.append(query)
+
+    async def copy_records_to_table(self, table_name, records, columns):
+        self.copies.append((table_name, list(columns), list(records)))
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    @asynccontextmanager
+    async def get_async_connection(self):
+        yield self.conn
+
+
+class BulkRepository(ActionNetworkRepository):
+    async def _ensure_game_exists(self, conn, historical_data):
+        return 101
+
+
+def _history(entries):
+    return ActionNetworkHistoricalData(
+        game_id=258267,
+        home_team="New York Yankees",
+        away_team="Boston Red Sox",
+        game_datetime=datetime(2025, 7, 1, 19, 5),
+        history_url="https://api.actionnetwork.com/web/v2/markets/event/258267/history",
+        historical_entries=[
+            ActionNetworkHistoricalEntry(event=event, timestamp=timestamp)
+            for event, timestamp in entries
+        ],
+    )
+
+
+def _rows(copy):
+    table, columns, records = copy
+    return [dict(zip(columns, record, strict=True)) for record in records]
+
+
+T1 = datetime(2025, 7, 1, 12, 0)
+T2 = datetime(2025, 7, 1, 13, 0)
+
+
+class TestBulkHistoryPersistence:
+    """Test the flattened bulk write path."""
+
+    @pytest.mark.asyncio
+    async def test_history_written_with_one_copy_per_market(self):
+        """All entries of a game land in one COPY + upsert per market."""
+        database = FakeDatabase()
+        repository = BulkRepository(database)
+        event = {
+            "moneyline": [
+                {"book_id": 15, "side": "home", "odds": -130,
+                 "bet_info": {"tickets": {"percent": 60}, "money": {"percent": 70}}},
+                {"book_id": 15, "side": "away", "odds": 110},
+                {"book_id": 999, "side": "home", "odds": -120},
+            ],
+            "spread": [
+                {"book_id": 30, "side": "home", "value": -1.5, "odds": 140},
+                {"book_id": 30, "side": "away", "value": 1.5, "odds": -160},
+            ],
+            "total": [{"book_id": 68, "total": 8.5, "over_odds": -110, "under_odds": -110}],
+        }
+
+        result = await repository.save_historical_data(
+            _history([(event, T1), (event, T2)])
+        )
+
+        assert result["success"] is True
+        assert result["saved_count"] == 6
+        assert [copy[0] for copy in database.conn.copies] == [
+            "_an_history_moneyline",
+            "_an_history_spread",
+            "_an_history_total",
+        ]
+        moneyline = _rows(database.conn.copies[0])
+        assert [row["odds_timestamp"] for row in moneyline] == [T1, T2]
+        assert moneyline[0]["home_ml"] == -130
+        assert moneyline[0]["away_ml"] == 110
+        assert moneyline[0]["home_bets_percentage"] == 60
+        assert moneyline[0]["sportsbook_id"] == 15
+        assert moneyline[0]["market_type"] == "moneyline"
+        assert moneyline[0]["home_team"] == "NYY"
+        assert _rows(database.conn.copies[2])[0]["market_type"] == "totals"
+        assert result["counters"]["unknown_book_items"] == 2
+        upserts = [q for q in database.conn.executed if "ON CONFLICT (game_id" in q]
+        assert len(upserts) == 3
+        # The history key is a partial index over resolved sportsbooks
+        assert all("WHERE sportsbook_id IS NOT NULL" in q for q in upserts)
+
+    @pytest.mark.asyncio
+    async def test_per_side_spread_items_merge_into_one_row(self):
+        """Home and away items for the same book and time share a row."""
+        database = FakeDatabase()
+        repository = BulkRepository(database)
+        event = {
+            "spread": [
+                {"book_id": 30, "side": "home", "value": -1.5, "odds": 140,
+                 "bet_info": {"tickets": {"percent": 45}}},
+                {"book_id": 30, "side": "away", "value": 1.5, "odds": -160,
+                 "bet_info": {"tickets": {"percent": 55}}},
+            ]
+        }
+
+        await repository.save_historical_data(_history([(event, T1)]))
+
+        (row,) = _rows(database.conn.copies[0])
+        assert (row["home_spread"], row["away_spread"]) == (-1.5, 1.5)
+        assert (row["home_spread_price"], row["away_spread_price"]) == (140, -160)
+        assert (row["home_bets_percentage"], row["away_bets_percentage"]) == (45, 55)
+
+    @pytest.mark.asyncio
+    async def test_sportsbook_ids_loaded_once(self):
+        """Sportsbook IDs are resolved in one query and reused across saves."""
+        database = FakeDatabase()
+        repository = BulkRepository(database)
+        event = {"total": [{"book_id": 68, "total": 9.0}]}
+
+        await repository.save_historical_data(_history([(event, T1)]))
+        await repository.save_historical_data(_history([(event, T2)]))
+
+        assert database.conn.fetches == 1
+
+    @pytest.mark.asyncio
+    async def test_unresolved_sportsbooks_are_skipped(self):
+        """Books without a sportsbook_id would all share one NULL upsert key."""
+        database = FakeDatabase()
+
+        async def fetch(query, *args):
+            return [
+                {"external_id": book_id, "sportsbook_id": 68 if book_id == "68" else None}
+                for book_id in args[0]
+            ]
+
+        database.conn.fetch = fetch
+        repository = BulkRepository(database)
+        event = {
+            "total": [
+                {"book_id": 68, "total": 9.0},
+                {"book_id": 69, "total": 9.0},
+                {"book_id": 71, "total": 8.5},
+            ]
+        }
+
+        result = await repository.save_historical_data(_history([(event, T1)]))
+
+        assert [row["sportsbook_id"] for row in _rows(database.conn.copies[0])] == [68]
+        assert result["counters"]["unresolved_book_items"] == 2
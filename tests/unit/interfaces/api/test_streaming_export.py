@@ -0,0 +1,105 @@
+"""
+Unit tests for the constant-memory analytics export encoders.
+"""
+
+import io
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from src.interfaces.api.streaming_export import stream_export
+
+MODULE = "src.interfaces.api.streaming_export"
+
+COLUMNS = [
+    ("analysis_id", "int4"),
+    ("analysis_timestamp", "timestamptz"),
+    ("confidence_score", "numeric"),
+    ("recommendation", "varchar"),
+]
+
+
+def _rows(start, count):
+    return [
+        (
+            i,
+            datetime(2025, 7, 1, 12, i % 60, tzinfo=timezone.utc),
+            Decimal("0.75") if i % 2 else None,
+            f"BET HOME {i}",
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def _patched_chunks(*chunks):
+    async def iter_query_chunks(query, params, chunk_size):
+        for rows in chunks:
+            yield COLUMNS, rows
+
+    return patch(f"{MODULE}.iter_query_chunks", iter_query_chunks)
+
+
+async def _collect(export_format, *chunks):
+    with _patched_chunks(*chunks):
+        return [part async for part in stream_export("SELECT 1", [], export_format)]
+
+
+class TestStreamExport:
+    """Test incremental encoding of cursor chunks."""
+
+    @pytest.mark.asyncio
+    async def test_csv_writes_header_once(self):
+        """CSV output has one header and one line per row across chunks."""
+        parts = await _collect("csv", _rows(0, 3), _rows(3, 2))
+        lines = b"".join(parts).decode().splitlines()
+
+        assert lines[0] == "analysis_id,analysis_timestamp,confidence_score,recommendation"
+        assert len(lines) == 6
+        assert lines[1] == "0,2025-07-01T12:00:00+00:00,,BET HOME 0"
+        # Header plus one part per chunk: nothing is buffered across chunks
+        assert len(parts) == 3
+
+    @pytest.mark.asyncio
+    async def test_ndjson_rows_are_json_objects(self):
+        """NDJSON emits one object per row with JSON-friendly values."""
+        parts = await _collect("ndjson", _rows(0, 2))
+        records = [json.loads(line) for line in b"".join(parts).decode().splitlines()]
+
+        assert records[1] == {
+            "analysis_id": 1,
+            "analysis_timestamp": "2025-07-01T12:01:00+00:00",
+            "confidence_score": 0.75,
+            "recommendation": "BET HOME 1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_parquet_writes_one_row_group_per_chunk(self):
+        """Parquet chunks become row groups with a schema from the column types."""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        parts = await _collect("parquet", _rows(0, 4), _rows(4, 3))
+        parquet_file = pq.ParquetFile(io.BytesIO(b"".join(parts)))
+        table = parquet_file.read()
+
+        assert parquet_file.num_row_groups == 2
+        assert table.num_rows == 7
+        assert str(table.schema.field("confidence_score").type) == "double"
+        assert table.column("confidence_score").to_pylist()[:2] == [None, 0.75]
+
+    @pytest.mark.asyncio
+    async def test_empty_result_still_has_layout(self):
+        """An empty export yields a header-only CSV."""
+        parts = await _collect("csv", [])
+
+        assert b"".join(parts).decode().strip() == (
+            "analysis_id,analysis_timestamp,confidence_score,recommendation"
+        )
+
+    @pytest.mark.asyncio
+    async def test_unsupported_format_rejected(self):
+        """Only streamable formats are accepted."""
+        with pytest.raises(ValueError):
+            await _collect("pdf", _rows(0, 1))
@@ -0,0 +1,116 @@
+"""
+Unit tests for the per-slate feature and prediction snapshot
+
+Covers single-flight extraction, cutoff keying, the Redis tier and bounds.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.ml.features.slate_snapshot import SlateSnapshot
+
+CUTOFF = datetime(2025, 7, 4, 18, 10)
+
+
+class TestSlateSnapshot:
+    """Test shared feature and prediction snapshots"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_extraction(self):
+        """Callers asking for the same cutoff window wait on one extraction"""
+        snapshot = SlateSnapshot()
+        feature_vector = MagicMock(feature_cutoff_time=CUTOFF)
+        calls = 0
+
+        async def extract():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return feature_vector
+
+        results = await asyncio.gather(
+            *[snapshot.get_features(1, CUTOFF, extract) for _ in range(5)]
+        )
+        assert all(result is feature_vector for result in results)
+        assert await snapshot.get_features(1, CUTOFF, extract) is feature_vector
+        assert calls == 1
+
+        await snapshot.get_features(1, CUTOFF + timedelta(minutes=5), extract)
+        assert calls == 2
+        assert snapshot.get_stats()['shared_inflight'] == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_extraction(self):
+        """Cancelling the first caller leaves the extraction running for the others"""
+        snapshot = SlateSnapshot()
+        feature_vector = MagicMock(feature_cutoff_time=CUTOFF)
+        started = asyncio.Event()
+        calls = 0
+
+        async def extract():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.01)
+            return feature_vector
+
+        first = asyncio.create_task(snapshot.get_features(1, CUTOFF, extract))
+        await started.wait()
+        second = asyncio.create_task(snapshot.get_features(1, CUTOFF, extract))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second is feature_vector
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await snapshot.get_features(1, CUTOFF, extract) is feature_vector
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_results_are_not_cached(self):
+        """A game that cannot be predicted yet is retried on the next request"""
+        snapshot = SlateSnapshot()
+        compute = AsyncMock(side_effect=[None, {'game_id': '1'}])
+
+        assert await snapshot.get_prediction(1, None, compute) is None
+        assert await snapshot.get_prediction(1, None, compute) == {'game_id': '1'}
+        assert snapshot.peek_prediction(1, None) == {'game_id': '1'}
+        assert compute.await_count == 2
+
+        assert snapshot.invalidate(1) == 1
+        assert snapshot.peek_prediction(1, None) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_reuses_vectors_for_same_cutoff(self):
+        """Vectors from Redis are reused only when built for the same cutoff"""
+        redis_store = MagicMock()
+        redis_store.get_feature_vector = AsyncMock(
+            return_value=MagicMock(feature_cutoff_time=CUTOFF - timedelta(hours=1))
+        )
+        redis_store.cache_feature_vector = AsyncMock(return_value=True)
+        snapshot = SlateSnapshot(ttl_seconds=600, redis_store=redis_store)
+        extracted = MagicMock(feature_cutoff_time=CUTOFF)
+        extract = AsyncMock(return_value=extracted)
+
+        assert await snapshot.get_features(1, CUTOFF, extract) is extracted
+        redis_store.cache_feature_vector.assert_awaited_once_with(1, extracted, ttl=600)
+
+        shared = MagicMock(feature_cutoff_time=CUTOFF)
+        redis_store.get_feature_vector.return_value = shared
+        assert await SlateSnapshot(redis_store=redis_store).get_features(1, CUTOFF, extract) is shared
+        assert extract.await_count == 1
+
+    def test_entries_expire_and_are_bounded(self):
+        """Entries expire after the TTL and the oldest are evicted past the limit"""
+        snapshot = SlateSnapshot(max_entries=2)
+        for game_id in (1, 2, 3):
+            snapshot.put_prediction(game_id, None, {'game_id': game_id})
+
+        assert snapshot.peek_prediction(1, None) is None
+        assert snapshot.peek_prediction(3, None) == {'game_id': 3}
+
+        snapshot.configure(ttl_seconds=-1)
+        assert snapshot.peek_prediction(3, None) is None
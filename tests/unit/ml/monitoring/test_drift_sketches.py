@@ -0,0 +1,111 @@
+"""
+Unit tests for mergeable feature drift sketches
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.ml.monitoring.drift_sketches import (
+    FeatureSketch,
+    bin_bounds,
+    bin_index,
+    extract_feature_values,
+    population_stability_index,
+)
+
+
+def _sketch(values):
+    sketch = FeatureSketch()
+    sketch.add_many(values)
+    return sketch
+
+
+class TestFeatureSketch:
+    """Test sketch updates, merging and PSI"""
+
+    def test_bins_cover_values(self):
+        """Every value falls inside the bounds of its bin"""
+        for value in [-250.0, -1.5, -0.0004, 0.0, 0.0004, 0.52, 3.0, 145.0]:
+            lower, upper = bin_bounds(bin_index(value))
+            assert lower <= value <= upper
+
+    def test_merge_matches_single_pass(self):
+        """Merged window sketches equal one sketch over all values"""
+        rng = np.random.default_rng(7)
+        values = rng.normal(0.55, 0.1, 3000)
+
+        merged = FeatureSketch()
+        for chunk in np.array_split(values, 7):
+            merged.merge(_sketch(chunk))
+        single = _sketch(values)
+
+        assert merged.count == single.count == 3000
+        assert merged.bins == single.bins
+        assert merged.mean == pytest.approx(np.mean(values))
+        assert merged.std == pytest.approx(np.std(values))
+        assert merged.min == values.min() and merged.max == values.max()
+
+    def test_round_trip_and_quantiles(self):
+        """Serialized sketches round-trip and quantiles track the data"""
+        values = np.random.default_rng(3).normal(0.5, 0.1, 5000)
+        sketch = FeatureSketch.from_dict(_sketch(values).to_dict())
+
+        stats = sketch.distribution_stats()
+        assert sketch.count == 5000
+        for key, q in [("25", 25), ("50", 50), ("75", 75)]:
+            assert stats["percentiles"][key] == pytest.approx(
+                np.percentile(values, q), rel=0.03
+            )
+
+    def test_psi_detects_shift(self):
+        """PSI is near zero for the same distribution and large for a shift"""
+        rng = np.random.default_rng(11)
+        baseline = _sketch(rng.normal(0.5, 0.1, 5000))
+        same = _sketch(rng.normal(0.5, 0.1, 5000))
+        shifted = _sketch(rng.normal(0.7, 0.1, 5000))
+
+        assert population_stability_index(baseline, same) < 0.05
+        assert population_stability_index(baseline, shifted) > 0.5
+
+    def test_psi_stays_under_threshold_for_identical_distributions(self):
+        """Sampling noise alone does not reach the 0.2 drift threshold"""
+        rng = np.random.default_rng(5)
+        baseline = _sketch(rng.normal(0.5, 0.1, 5000))
+
+        scores = [
+            population_stability_index(baseline, _sketch(rng.normal(0.5, 0.1, 200)))
+            for _ in range(20)
+        ]
+
+        assert population_stability_index(baseline, baseline) == pytest.approx(0.0)
+        assert max(scores) < 0.2
+
+    def test_psi_handles_discrete_features(self):
+        """Point masses collapse quantile edges instead of inflating PSI"""
+        rng = np.random.default_rng(9)
+        baseline = _sketch(rng.integers(0, 3, 5000))
+        current = _sketch(rng.integers(0, 3, 500))
+
+        assert population_stability_index(baseline, current) < 0.05
+
+    def test_extract_feature_values(self):
+        """Numeric features and importances are keyed like the drift service expects"""
+        vector = SimpleNamespace(
+            feature_completeness_score=0.9,
+            temporal_features={"minutes_before_game": 60, "label": "x"},
+            market_features=None,
+            team_features={"home_win_pct": 0.55},
+            betting_splits_features=None,
+        )
+
+        values = extract_feature_values(vector, {"home_win_pct": 0.2, "noise": 0.001})
+
+        assert values == {
+            "home_win_pct": 0.2,
+            "temporal_minutes_before_game": 60.0,
+            "team_home_win_pct": 0.55,
+        }
+        vector.feature_completeness_score = 0.5
+        assert extract_feature_values(vector) == {}
@@ -0,0 +1,126 @@
+"""
+Unit tests for template-rendered, cached explanations
+
+Covers per-format section selection and memoization in
+NaturalLanguageExplanationEngine.
+"""
+
+import pytest
+
+from src.analysis.models.unified_models import ConfidenceLevel, SignalType
+from src.ml.opportunity_detection.explanation_engine import (
+    ExplanationFormat,
+    ExplanationStyle,
+    NaturalLanguageExplanationEngine,
+    UserProfile,
+)
+from src.ml.opportunity_detection.opportunity_scoring_engine import (
+    OpportunityScore,
+    OpportunityTier,
+    RiskProfile,
+    ScoringFactors,
+)
+
+
+def _opportunity(opportunity_id="opp_1", composite_score=72.0):
+    return OpportunityScore(
+        opportunity_id=opportunity_id,
+        game_id="game_1",
+        signal_type=SignalType.SHARP_ACTION,
+        composite_score=composite_score,
+        tier=OpportunityTier.HIGH_VALUE,
+        confidence_level=ConfidenceLevel.HIGH,
+        expected_value=0.03,
+        kelly_fraction=0.04,
+        risk_profile=RiskProfile.MODERATE,
+        scoring_factors=ScoringFactors(
+            strategy_performance=75, ml_confidence=68, market_efficiency=55,
+            data_quality=80, consensus_strength=72, timing_factor=60, value_potential=58
+        ),
+        factor_weights={
+            'strategy_performance': 0.25, 'ml_confidence': 0.2, 'market_efficiency': 0.15,
+            'data_quality': 0.1, 'consensus_strength': 0.15, 'timing_factor': 0.05,
+            'value_potential': 0.1
+        },
+        market_data={'home_team': 'NYY', 'away_team': 'BOS'},
+    )
+
+
+@pytest.fixture
+def engine():
+    return NaturalLanguageExplanationEngine()
+
+
+class TestExplanationTemplates:
+    """Test template rendering and explanation caching"""
+
+    @pytest.mark.asyncio
+    async def test_renders_sections_for_format(self, engine):
+        """Bullet explanations render their sections; narrative skips unused ones"""
+        bullets = await engine.generate_opportunity_explanation(
+            _opportunity(), user_profile=UserProfile(preferred_format=ExplanationFormat.BULLET_POINTS)
+        )
+        components = bullets['components']
+
+        assert components.headline == "High-Value Strong Betting Opportunity - BOS @ NYY"
+        assert components.summary.startswith("This strong opportunity scores 72.0/100")
+        assert components.key_factors[0] == "Strong strategy performance based on historical data (75.0/100)"
+        assert bullets['formatted_text'].splitlines()[0] == f"• {components.headline}"
+        assert "• Key Factors:" in bullets['formatted_text']
+        assert components.detailed_reasoning == ""
+
+        narrative = await engine.generate_opportunity_explanation(
+            _opportunity(), user_profile=UserProfile(preferred_format=ExplanationFormat.NARRATIVE)
+        )
+        components = narrative['components']
+
+        assert components.key_factors == []
+        assert components.stake_guidance == ""
+        assert components.detailed_reasoning.startswith("This represents a high-quality betting opportunity")
+        assert components.headline and components.recommendation
+        assert narrative['formatted_text'].startswith(
+            "Here's what our analysis reveals about this betting opportunity: This strong opportunity"
+        )
+
+    @pytest.mark.asyncio
+    async def test_reuses_rendering_for_same_score_and_profile(self, engine):
+        """Identical scores and profiles hit the cache; ids stay per opportunity"""
+        profile = UserProfile(experience_level=ExplanationStyle.BEGINNER)
+
+        first = await engine.generate_opportunity_explanation(_opportunity("opp_1"), user_profile=profile)
+        second = await engine.generate_opportunity_explanation(_opportunity("opp_2"), user_profile=profile)
+
+        assert engine.cache_hits == 1
+        assert second['formatted_text'] == first['formatted_text']
+        assert second['opportunity_id'] == "opp_2"
+
+        await engine.generate_opportunity_explanation(
+            _opportunity("opp_1"), user_profile=UserProfile(experience_level=ExplanationStyle.PROFESSIONAL)
+        )
+        changed = await engine.generate_opportunity_explanation(
+            _opportunity("opp_1", composite_score=81.0), user_profile=profile
+        )
+
+        assert engine.cache_hits == 1
+        assert engine.cache_misses == 3
+        assert "81.0" in changed['formatted_text']
+
+    @pytest.mark.asyncio
+    async def test_batch_explanations_share_cache(self, engine):
+        """A slate of identical scores is rendered once per profile"""
+        opportunities = [_opportunity(f"opp_{i}") for i in range(10)]
+
+        results = await engine.generate_batch_explanations(opportunities)
+
+        assert [r['opportunity_id'] for r in results] == [o.opportunity_id for o in opportunities]
+        assert engine.get_cache_stats()['entries'] == 1
+        assert engine.cache_hits == 9
+
+    def test_cache_is_bounded(self):
+        """Least recently used explanations are evicted past the configured size"""
+        engine = NaturalLanguageExplanationEngine({'explanation_cache_size': 2})
+
+        for key in ("a", "b", "c"):
+            engine._cache_explanation((key,), (None, key, {}))
+
+        assert list(engine._explanation_cache) == [("b",), ("c",)]
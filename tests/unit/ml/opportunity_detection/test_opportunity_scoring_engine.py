@@ -491,5 +491,121 @@ async def test_scoring_engine_performance():
     assert isinstance(result, OpportunityScore)
 
 
+class TestBatchOpportunityScoring:
+    """Batch scoring must match per-game scoring with one strategy query"""
+
+    @staticmethod
+    def _signal(game_id, index, signal_type, side, **overrides):
+        from src.analysis.models.unified_models import StrategyCategory
+
+        fields = {
+            "signal_id": f"{game_id}_{index}",
+            "signal_type": signal_type,
+            "strategy_category": StrategyCategory.SHARP_ACTION,
+            "game_id": game_id,
+            "home_team": "NYY",
+            "away_team": "BOS",
+            "game_date": datetime.utcnow() + timedelta(hours=5),
+            "recommended_side": side,
+            "bet_type": "moneyline",
+            "confidence_score": 0.55 + 0.1 * (index % 4),
+            "confidence_level": "medium",
+            "signal_strength": 0.4 + 0.15 * (index % 3),
+            "minutes_to_game": 45 + 200 * index,
+            "timing_category": "late",
+            "data_source": "action_network",
+            "quality_score": 0.6 + 0.1 * (index % 3),
+            "validation_passed": index % 2 == 0,
+        }
+        fields.update(overrides)
+        return UnifiedBettingSignal(**fields)
+
+    @pytest.fixture
+    def signals_by_game(self):
+        return {
+            "g1": [
+                self._signal("g1", 0, SignalType.SHARP_ACTION, "home", odds=1.5),
+                self._signal("g1", 1, SignalType.LINE_MOVEMENT, "home", expected_value=0.04),
+            ],
+            "g2": [
+                self._signal("g2", 0, SignalType.SHARP_ACTION, "home", odds=-120.0),
+                self._signal("g2", 1, SignalType.PUBLIC_FADE, "away", odds=2.1),
+                self._signal("g2", 2, SignalType.CONSENSUS, "away"),
+            ],
+            "g3": [self._signal("g3", 3, SignalType.TIMING_BASED, "over")],
+        }
+
+    @pytest.fixture
+    def engine(self):
+        service = Mock()
+        service.get_prediction = AsyncMock(
+            side_effect=lambda game_id, **_: {"home_ml_confidence": 0.7} if game_id != "g3" else None
+        )
+        service.get_cached_prediction = AsyncMock(return_value=None)
+        return OpportunityScoringEngine(prediction_service=service)
+
+    @pytest.fixture
+    def conn(self):
+        conn = Mock()
+        conn.fetch = AsyncMock(return_value=[
+            {"strategy_name": "sharp_action", "win_rate": 61.0, "total_bets": 40, "avg_profit": 1.5},
+        ])
+        return conn
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("risk_profile", list(RiskProfile))
+    async def test_batch_matches_single_game_scoring(self, engine, conn, signals_by_game, risk_profile):
+        from contextlib import asynccontextmanager
+
+        @asynccontextmanager
+        async def connection():
+            yield conn
+
+        with patch(
+            "src.ml.opportunity_detection.opportunity_scoring_engine.get_database_connection",
+            connection,
+        ):
+            batch = await engine.score_opportunities_batch(signals_by_game, risk_profile)
+            singles = [
+                await engine.score_opportunity(signals, game_id, risk_profile)
+                for game_id, signals in signals_by_game.items()
+            ]
+
+        # Every referenced strategy was loaded by the single batch query
+        conn.fetch.assert_awaited_once()
+        assert sorted(conn.fetch.call_args.args[1]) == [
+            "consensus", "line_movement", "public_fade", "sharp_action", "timing_based"
+        ]
+
+        by_game = {score.game_id: score for score in batch}
+        assert [s.composite_score for s in batch] == sorted(
+            (s.composite_score for s in batch), reverse=True
+        )
+        for single in singles:
+            scored = by_game[single.game_id]
+            assert scored.composite_score == pytest.approx(single.composite_score)
+            assert scored.expected_value == pytest.approx(single.expected_value)
+            assert scored.kelly_fraction == pytest.approx(single.kelly_fraction)
+            assert scored.tier == single.tier
+            assert scored.confidence_level == single.confidence_level
+            for factor, value in vars(single.scoring_factors).items():
+                assert getattr(scored.scoring_factors, factor) == pytest.approx(value), factor
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_supplied_predictions(self, engine, signals_by_game):
+        """Historical re-scoring can supply predictions instead of calling the service"""
+        with patch.object(engine, "_load_strategy_performance", AsyncMock(
+            side_effect=lambda names: dict.fromkeys(names, 55.0)
+        )):
+            scores = await engine.score_opportunities_batch(
+                signals_by_game, min_score=0.0, ml_predictions={"g1": {"home_ml_confidence": 0.9}}
+            )
+
+        engine.prediction_service.get_prediction.assert_not_called()
+        by_game = {score.game_id: score for score in scores}
+        assert by_game["g1"].scoring_factors.ml_confidence == pytest.approx(90.0)
+        assert by_game["g2"].scoring_factors.ml_confidence == 25.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
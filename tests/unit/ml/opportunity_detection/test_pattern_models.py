@@ -0,0 +1,136 @@
+"""
+Unit tests for offline-trained pattern recognition models
+
+Covers training, versioned persistence and batched online inference.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.analysis.models.unified_models import (
+    SignalType,
+    StrategyCategory,
+    UnifiedBettingSignal,
+)
+from src.ml.opportunity_detection.pattern_models import (
+    default_pattern_model_dir,
+    load_pattern_models,
+    load_signal_history,
+)
+from src.ml.opportunity_detection.pattern_recognition import MLPatternRecognition
+
+
+def _signals(game_id, count, rng, outlier=False):
+    signal_types = list(SignalType)
+    signals = []
+    for i in range(count):
+        money = 90.0 if outlier and i == 0 else float(rng.normal(50, 5))
+        signals.append(UnifiedBettingSignal(
+            signal_id=f"{game_id}_{i}",
+            signal_type=signal_types[i % 3],
+            strategy_category=StrategyCategory.SHARP_ACTION,
+            game_id=game_id,
+            home_team="NYY",
+            away_team="BOS",
+            game_date=datetime.utcnow() + timedelta(hours=6),
+            recommended_side="home",
+            bet_type="moneyline",
+            confidence_score=float(np.clip(rng.normal(0.65, 0.05), 0, 1)),
+            confidence_level="medium",
+            signal_strength=float(np.clip(rng.normal(0.6, 0.05), 0, 1)),
+            minutes_to_game=int(rng.integers(60, 600)),
+            timing_category="SAME_DAY",
+            data_source="action_network",
+            quality_score=0.8,
+            strategy_data={"money_percentage": money, "bet_percentage": 50.0},
+        ))
+    return signals
+
+
+@pytest.fixture
+def history():
+    rng = np.random.default_rng(5)
+    return {f"hist_{g}": _signals(f"hist_{g}", 6, rng) for g in range(40)}
+
+
+class TestPatternModels:
+    """Test offline training and online inference"""
+
+    @pytest.mark.asyncio
+    async def test_train_persist_and_load(self, history, tmp_path):
+        """A trained version is persisted and loaded by a fresh instance"""
+        trainer = MLPatternRecognition({"model_dir": tmp_path})
+        bundle = await trainer.train_models(history)
+
+        assert bundle.n_training_samples == 240
+        assert bundle.metadata["n_training_games"] == 40
+
+        recognizer = MLPatternRecognition({"model_dir": tmp_path})
+        assert recognizer.load_models()
+        assert recognizer.models.version == bundle.version
+        assert load_pattern_models(tmp_path, version="missing") is None
+
+    @pytest.mark.asyncio
+    async def test_batch_detection_uses_models_without_fitting(self, history, tmp_path):
+        """Online detection is inference only and matches per-game detection"""
+        await MLPatternRecognition({"model_dir": tmp_path}).train_models(history)
+        recognizer = MLPatternRecognition({"model_dir": tmp_path})
+        recognizer.load_models()
+
+        rng = np.random.default_rng(9)
+        slate = {
+            "g1": _signals("g1", 5, rng, outlier=True),
+            "g2": _signals("g2", 4, rng),
+        }
+
+        with patch.object(
+            type(recognizer.models.anomaly_detector), "fit", side_effect=AssertionError("refit")
+        ), patch.object(
+            type(recognizer.models.clusterer), "fit", side_effect=AssertionError("refit")
+        ):
+            batch = await recognizer.detect_patterns_batch(slate)
+            single = await recognizer.detect_patterns(slate["g1"], "g1")
+
+        def summary(patterns):
+            return sorted(
+                (p.pattern_type, tuple(p.contributing_signals), round(p.confidence_score, 6))
+                for p in patterns
+            )
+
+        assert set(batch) == {"g1", "g2"}
+        assert summary(batch["g1"]) == summary(single)
+        assert any(p.anomaly_score < 0 for p in batch["g1"])
+
+    @pytest.mark.asyncio
+    async def test_without_models_skips_model_patterns(self, history, tmp_path):
+        """Without trained models only the rule-based detectors run"""
+        recognizer = MLPatternRecognition({"model_dir": tmp_path})
+        assert not recognizer.load_models()
+
+        patterns = await recognizer.detect_patterns(history["hist_0"], "hist_0")
+
+        assert all(not p.pattern_id.startswith(("anomaly_", "cluster_")) for p in patterns)
+
+    @pytest.mark.asyncio
+    async def test_train_from_signal_history_file(self, history, tmp_path):
+        """The offline training input round-trips through a JSON Lines export"""
+        signals_file = tmp_path / "signals.jsonl"
+        signals_file.write_text(
+            "\n".join(s.model_dump_json() for signals in history.values() for s in signals)
+        )
+
+        loaded = load_signal_history(signals_file)
+        bundle = await MLPatternRecognition(
+            {"model_dir": tmp_path / "models"}
+        ).train_models(loaded)
+
+        assert list(loaded) == list(history)
+        assert bundle.n_training_samples == 240
+
+    def test_default_model_dir_comes_from_settings(self):
+        """The model directory does not depend on the working directory"""
+        assert default_pattern_model_dir().is_absolute()
+        assert MLPatternRecognition().model_dir == default_pattern_model_dir()
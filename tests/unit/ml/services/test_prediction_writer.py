@@ -0,0 +1,164 @@
+"""
+Unit tests for write-behind prediction persistence
+
+Covers batched multi-row upserts, flush triggers and the durable spool.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.config import PROJECT_ROOT, get_settings
+from src.ml.services.prediction_writer import (
+    PREDICTION_COLUMNS,
+    PendingPrediction,
+    PredictionWriteBehind,
+)
+
+
+def _pending(game_id, home_probability=0.6, model_name="lgbm"):
+    feature_vector = SimpleNamespace(
+        id=None,
+        feature_version="v2.1",
+        feature_completeness_score=0.9,
+        market_features={'opening_total': 8.5},
+    )
+    prediction = {
+        'model_name': model_name,
+        'model_version': "3",
+        'home_ml_probability': home_probability,
+        'home_ml_binary': 1,
+        'home_ml_confidence': 0.6,
+        'total_over_probability': 0.45,
+        'total_over_binary': 0,
+        'total_over_confidence': 0.55,
+    }
+    return PendingPrediction.from_prediction(game_id, prediction, feature_vector)
+
+
+class FakeDatabase:
+    """Stands in for get_db_transaction, optionally failing every write"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.conn = MagicMock()
+        self.conn.execute = AsyncMock()
+
+        @asynccontextmanager
+        async def savepoint():
+            yield
+
+        self.conn.transaction = savepoint
+
+    @asynccontextmanager
+    async def transaction(self):
+        if self.fail:
+            raise ConnectionError("postgres unavailable")
+        yield self.conn
+
+    def inserted_rows(self):
+        width = len(PREDICTION_COLUMNS)
+        rows = []
+        for call in self.conn.execute.await_args_list:
+            values = call.args[1:]
+            rows += [values[i:i + width] for i in range(0, len(values), width)]
+        return rows
+
+
+@pytest.fixture
+def database():
+    database = FakeDatabase()
+    with patch("src.ml.services.prediction_writer.get_db_transaction", database.transaction):
+        yield database
+
+
+class TestPredictionWriteBehind:
+    """Test batching, flushing and spooling of served predictions"""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_one_multi_row_upsert(self, database, tmp_path):
+        """A batch is written with one statement; repeated targets keep the latest value"""
+        sketches = MagicMock(merge=AsyncMock())
+        writer = PredictionWriteBehind(sketches, spool_path=str(tmp_path / "spool.jsonl"))
+        writer._queue = asyncio.Queue()
+
+        for pending in [_pending(1, 0.6), _pending(2), _pending(1, 0.7)]:
+            writer._queue.put_nowait(pending)
+        await writer.flush()
+
+        assert database.conn.execute.await_count == 1
+        rows = database.inserted_rows()
+        assert len(rows) == 4
+        assert [row[6] for row in rows if row[0] == 1 and row[4] == "moneyline_home_win"] == [0.7]
+
+        sketches.merge.assert_awaited_once()
+        merged = sketches.merge.await_args.args[4]
+        assert merged['market_opening_total'].count == 3
+        assert writer.get_stats()['stored'] == 3
+
+    @pytest.mark.asyncio
+    async def test_worker_flushes_on_interval(self, database, tmp_path):
+        """Submitted predictions are written once the flush interval elapses"""
+        writer = PredictionWriteBehind(
+            batch_size=50, flush_interval=0.01, spool_path=str(tmp_path / "spool.jsonl")
+        )
+
+        writer.submit(_pending(1))
+        writer.submit(_pending(2))
+        assert database.conn.execute.await_count == 0
+
+        await asyncio.sleep(0.1)
+        assert len(database.inserted_rows()) == 4
+        assert database.conn.execute.await_count == 1
+
+        await writer.stop()
+        assert not writer.running
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_spooled_and_replayed(self, database, tmp_path):
+        """Predictions survive a database outage via the spool file"""
+        spool_path = tmp_path / "spool.jsonl"
+        writer = PredictionWriteBehind(spool_path=str(spool_path))
+        writer._queue = asyncio.Queue()
+
+        database.fail = True
+        writer._queue.put_nowait(_pending(1))
+        writer._queue.put_nowait(_pending(2))
+        await writer.flush()
+
+        assert writer.get_stats()['spooled'] == 2
+        assert len(spool_path.read_text().splitlines()) == 2
+
+        database.fail = False
+        await writer._replay_spool()
+
+        assert not spool_path.exists()
+        assert sorted({row[0] for row in database.inserted_rows()}) == [1, 2]
+        assert writer.get_stats()['replayed'] == 2
+
+    @pytest.mark.asyncio
+    async def test_full_queue_spools_instead_of_blocking(self, database, tmp_path):
+        """Submissions beyond the queue bound go to the spool, not the request path"""
+        spool_path = tmp_path / "spool.jsonl"
+        writer = PredictionWriteBehind(max_queue_size=1, spool_path=str(spool_path))
+        writer._queue = asyncio.Queue(maxsize=1)
+        writer.start = MagicMock()
+
+        writer.submit(_pending(1))
+        writer.submit(_pending(2))
+
+        spooled = [PendingPrediction.from_json(line) for line in spool_path.read_text().splitlines()]
+        assert [pending.game_id for pending in spooled] == [2]
+        assert spooled[0].rows[0][4] == "moneyline_home_win"
+        assert spooled[0].rows[0][-1] == spooled[0].observed_at
+        assert writer._queue.qsize() == 1
+
+    def test_default_spool_path_does_not_depend_on_the_working_directory(self):
+        """The spool lives under the project's data/spool directory by default"""
+        expected = PROJECT_ROOT / "data" / "spool" / "ml_predictions.jsonl"
+
+        assert PredictionWriteBehind().spool_path == expected
+        assert get_settings().ml_pipeline.prediction_spool_path == expected
@@ -0,0 +1,206 @@
+"""
+Unit tests for the batch-native BaseZoneProcessor contract.
+
+Checks that vectorized validation and scoring agree with the per-record
+methods and that per-record overrides are still honoured.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.data.pipeline.base_processor import BaseZoneProcessor
+from src.data.pipeline.unified_staging_processor import (
+    UnifiedStagingProcessor,
+    UnifiedStagingRecord,
+)
+from src.data.pipeline.zone_interface import (
+    DataRecord,
+    ProcessingStatus,
+    ZoneConfig,
+    ZoneType,
+)
+
+
+class RecordingProcessor(BaseZoneProcessor):
+    """Minimal zone that keeps stored records in memory."""
+
+    def __init__(self, **config):
+        super().__init__(
+            ZoneConfig(
+                zone_type=ZoneType.STAGING,
+                schema_name="staging",
+                auto_promotion=False,
+                **config,
+            )
+        )
+        self.stored = []
+
+    async def process_record(self, record, **kwargs):
+        if record.external_id == "explode":
+            raise RuntimeError("boom")
+        return record
+
+    async def store_records(self, records):
+        self.stored.extend(records)
+
+
+class StrictAccuracyProcessor(RecordingProcessor):
+    """Zone with a per-record scoring override."""
+
+    async def _calculate_accuracy_score(self, record):
+        return 0.0 if record.external_id == "inaccurate" else 1.0
+
+
+class CustomValidationProcessor(RecordingProcessor):
+    """Zone with a per-record custom validator."""
+
+    async def validate_record_custom(self, record):
+        return record.external_id != "rejected"
+
+
+class ExplodingHooksProcessor(RecordingProcessor):
+    """Zone whose per-record validation and scoring hooks raise for one record."""
+
+    async def validate_record(self, record):
+        if record.external_id == "bad-validation":
+            raise ValueError("validation boom")
+        return True
+
+    async def get_quality_score(self, record):
+        if record.external_id == "bad-score":
+            raise ValueError("score boom")
+        return 1.0
+
+
+def _records():
+    return [
+        DataRecord(source="action_network", external_id="1", raw_data={"a": 1}),
+        DataRecord(source="action_network", external_id="2"),
+        DataRecord(source="vsin", external_id="", raw_data={"a": 1}),
+        DataRecord(source=None, external_id="3"),
+        DataRecord(source="sbd"),
+        DataRecord(source="", external_id="4", raw_data={"a": 1}),
+    ]
+
+
+class TestBatchContract:
+    """Test vectorized validation and scoring."""
+
+    @pytest.mark.asyncio
+    async def test_score_batch_matches_per_record_scores(self):
+        """Columnar scores equal get_quality_score for every record."""
+        processor = RecordingProcessor()
+        records = _records()
+
+        batch_scores = await processor.score_batch(processor.batch_frame(records), records)
+        record_scores = [await processor.get_quality_score(r) for r in records]
+
+        assert batch_scores == pytest.approx(record_scores)
+
+    @pytest.mark.asyncio
+    async def test_validate_batch_matches_per_record_validation(self):
+        """Columnar validation agrees with validate_record, including errors."""
+        processor = RecordingProcessor()
+        batch_records = _records()
+        single_records = _records()
+
+        valid = await processor.validate_batch(
+            processor.batch_frame(batch_records), batch_records
+        )
+        expected = [await processor.validate_record(r) for r in single_records]
+
+        assert valid == expected
+        assert [r.validation_errors for r in batch_records] == [
+            r.validation_errors for r in single_records
+        ]
+
+    @pytest.mark.asyncio
+    async def test_per_record_overrides_are_used(self):
+        """Zones customizing per-record hooks keep their behaviour."""
+        scoring = StrictAccuracyProcessor()
+        validation = CustomValidationProcessor()
+        records = [
+            DataRecord(source="vsin", external_id="inaccurate"),
+            DataRecord(source="vsin", external_id="rejected"),
+        ]
+        frame = scoring.batch_frame(records)
+
+        scores = await scoring.score_batch(frame, records)
+        valid = await validation.validate_batch(frame, records)
+
+        assert scores[0] < scores[1]
+        assert valid == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_per_record_fallback_isolates_failures(self):
+        """A raising per-record hook fails only its own record."""
+        processor = ExplodingHooksProcessor()
+        records = [
+            DataRecord(source="vsin", external_id="ok"),
+            DataRecord(source="vsin", external_id="bad-validation"),
+            DataRecord(source="vsin", external_id="bad-score"),
+        ]
+
+        result = await processor.process_batch(records)
+
+        assert [r.external_id for r in processor.stored] == ["ok"]
+        assert result.records_failed == 2
+        assert result.errors == ["validation boom", "score boom"]
+        assert result.status == ProcessingStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_unified_staging_batch_scores_match_per_record(self):
+        """The columnar unified staging scores equal the per-record overrides."""
+        processor = UnifiedStagingProcessor(
+            ZoneConfig(zone_type=ZoneType.STAGING, schema_name="staging")
+        )
+        records = [
+            UnifiedStagingRecord(
+                source="action_network", external_game_id="1", sportsbook_name="DraftKings",
+                home_team="NYY", away_team="BOS", data_source="action_network",
+                market_type="moneyline", home_moneyline_odds=-120, away_moneyline_odds=110,
+            ),
+            UnifiedStagingRecord(
+                source="action_network", sportsbook_name="Unknown Book",
+                home_team="NYY", away_team="NYY", market_type="spread",
+                spread_line=Decimal("0"), home_spread_odds=-110, over_odds=9000,
+            ),
+            UnifiedStagingRecord(
+                source="vsin", external_game_id="3", home_team="Mexico City",
+                away_team="TOR", market_type="total", total_line=Decimal("8.5"),
+            ),
+            UnifiedStagingRecord(source="sbd"),
+        ]
+
+        batch_scores = await processor.score_batch(processor.batch_frame(records), records)
+        record_scores = [await processor.get_quality_score(r) for r in records]
+
+        assert batch_scores == pytest.approx(record_scores)
+
+    @pytest.mark.asyncio
+    async def test_process_batch_end_to_end(self):
+        """process_batch routes records through validate, score and transform."""
+        processor = RecordingProcessor(quality_threshold=0.95)
+        records = _records() + [
+            DataRecord(source="vsin", external_id="explode", raw_data={"a": 1})
+        ]
+
+        result = await processor.process_batch(records)
+
+        assert [r.external_id for r in processor.stored] == ["1"]
+        assert result.records_successful == 1
+        assert result.records_failed == len(records) - 1
+        assert result.errors == ["boom"]
+        assert result.status == ProcessingStatus.COMPLETED
+        assert processor.stored[0].quality_score == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        """Empty batches produce an empty, successful result."""
+        processor = RecordingProcessor()
+
+        result = await processor.process_batch([])
+
+        assert result.records_processed == 0
+        assert processor.stored == []
@@ -0,0 +1,274 @@
+"""
+Unit tests for the RAW zone bulk writer.
+
+Covers content-hash deduplication, COPY-based loading, upsert staging and
+transparent decoding of compressed payloads.
+"""
+
+import itertools
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.data.pipeline.raw_storage import (
+    RAW_TABLE_SPECS,
+    RawTableSpec,
+    RawZoneWriter,
+    canonical_payload,
+    decode_raw_payload,
+)
+from src.data.pipeline.staging_action_network_unified_processor import (
+    ActionNetworkUnifiedStagingProcessor,
+)
+
+
+class FakeConnection:
+    """Minimal asyncpg connection double recording COPY and SQL calls."""
+
+    def __init__(self, stored_hashes=None):
+        self.stored_hashes = stored_hashes or []
+        self.copies = []
+        self.executed = []
+        self.fetches = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetch(self, query, *args):
+        self.fetches += 1
+        return self.stored_hashes
+
+    async def execute(self, query, *args):
+        self.executed.append(query)
+
+    async def copy_records_to_table(self, table_name, records, columns, schema_name=None):
+        self.copies.append((schema_name, table_name, list(columns), list(records)))
+
+
+_collection_times = itertools.count()
+
+
+def _odds_row(game_id, book, payload):
+    # Distinct collection times, so rows never share an upsert conflict key
+    return {
+        "external_game_id": game_id,
+        "sportsbook_key": book,
+        "raw_odds": payload,
+        "collected_at": datetime(2025, 7, 1, tzinfo=timezone.utc)
+        + timedelta(seconds=next(_collection_times)),
+    }
+
+
+class TestRawZoneWriter:
+    """Test deduplicated bulk writes."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_payloads_are_skipped(self):
+        """Re-collections identical to the latest payload per key are not written."""
+        writer = RawZoneWriter()
+        connection = FakeConnection()
+        spec = RAW_TABLE_SPECS["action_network_odds"]
+
+        first = await writer.write(
+            connection,
+            spec,
+            [
+                _odds_row("1", "15", {"ml": -110, "total": 8.5}),
+                _odds_row("1", "15", {"total": 8.5, "ml": -110}),
+                _odds_row("1", "30", {"ml": -110, "total": 8.5}),
+            ],
+        )
+        second = await writer.write(
+            connection,
+            spec,
+            [
+                _odds_row("1", "15", {"ml": -110, "total": 8.5}),
+                _odds_row("1", "15", {"ml": -115, "total": 8.5}),
+                _odds_row("1", "15", {"ml": -110, "total": 8.5}),
+            ],
+        )
+
+        assert (first.written, first.duplicates) == (2, 1)
+        # A return to an earlier price is a real movement and is kept
+        assert (second.written, second.duplicates) == (2, 1)
+        # Keys seen by this writer are not looked up again
+        assert connection.fetches == 1
+
+    @pytest.mark.asyncio
+    async def test_latest_hash_is_backfilled_from_database(self):
+        """Deduplication survives restarts through the stored payload hashes."""
+        payload = {"ml": -120}
+        stored = RawZoneWriter().encode(payload).payload_hash
+        connection = FakeConnection(
+            stored_hashes=[
+                {"external_game_id": "9", "sportsbook_key": "15", "payload_hash": stored}
+            ]
+        )
+
+        stats = await RawZoneWriter().write(
+            connection,
+            RAW_TABLE_SPECS["action_network_odds"],
+            [_odds_row("9", "15", payload)],
+        )
+
+        assert stats.duplicates == 1
+        assert connection.copies == []
+
+    @pytest.mark.asyncio
+    async def test_append_tables_copy_directly(self):
+        """Append-only writes go straight to the target table with COPY."""
+        connection = FakeConnection()
+        spec = RawTableSpec(
+            table="raw_data.sbd_betting_splits",
+            payload_column="raw_response",
+            columns=("external_matchup_id", "raw_response", "api_endpoint", "collected_at"),
+            key_columns=("external_matchup_id",),
+        )
+
+        await RawZoneWriter().write(
+            connection,
+            spec,
+            [
+                {
+                    "external_matchup_id": "sr:match:1",
+                    "raw_response": {"a": 1},
+                    "api_endpoint": None,
+                    "collected_at": None,
+                }
+            ],
+        )
+
+        schema, table, columns, records = connection.copies[0]
+        assert (schema, table) == ("raw_data", "sbd_betting_splits")
+        assert columns[-3:] == ["payload_hash", "payload_encoding", "payload_compressed"]
+        assert records[0][1] == '{"a":1}'
+        assert connection.executed == []
+
+    @pytest.mark.asyncio
+    async def test_upsert_tables_stage_through_temp_table(self):
+        """Tables with ON CONFLICT semantics COPY into a temp table first."""
+        connection = FakeConnection()
+
+        await RawZoneWriter().write(
+            connection,
+            RAW_TABLE_SPECS["action_network_games"],
+            [
+                {
+                    "external_game_id": "42",
+                    "raw_response": {"id": 42},
+                    "endpoint_url": None,
+                    "response_status": 200,
+                    "collected_at": None,
+                    "game_date": None,
+                }
+            ],
+        )
+
+        assert connection.copies[0][1] == "_raw_copy_action_network_games"
+        assert "CREATE TEMP TABLE" in connection.executed[0]
+        assert "ON CONFLICT (external_game_id)" in connection.executed[1]
+
+    @pytest.mark.asyncio
+    async def test_batch_rows_sharing_a_conflict_key_collapse_to_the_last(self):
+        """ON CONFLICT DO UPDATE cannot touch one row twice, so only the last row is staged."""
+        connection = FakeConnection()
+        collected_at = datetime(2025, 7, 1, tzinfo=timezone.utc)
+
+        def game(payload):
+            return {
+                "external_game_id": "42",
+                "raw_response": payload,
+                "endpoint_url": None,
+                "response_status": 200,
+                "collected_at": collected_at,
+                "game_date": None,
+            }
+
+        stats = await RawZoneWriter().write(
+            connection,
+            RAW_TABLE_SPECS["action_network_games"],
+            [game({"status": "scheduled"}), game({"status": "live"})],
+        )
+
+        (_, _, columns, records), = connection.copies
+        assert [record[columns.index("raw_response")] for record in records] == [
+            '{"status":"live"}'
+        ]
+        assert (stats.written, stats.superseded, stats.duplicates) == (1, 1, 0)
+
+
+class TestPayloadEncoding:
+    """Test compression and the transparent read path."""
+
+    def test_large_payloads_are_compressed_and_decoded(self):
+        """Payloads above the threshold round-trip through brotli."""
+        writer = RawZoneWriter(compression="br", compression_threshold=1024)
+        payload = {"history": [{"odds": -110 - i % 7, "book": "15"} for i in range(500)]}
+
+        encoded = writer.encode(payload)
+
+        assert encoded.text is None
+        assert encoded.stored_size < encoded.size / 4
+        row = {
+            "raw_odds": None,
+            "payload_encoding": encoded.encoding,
+            "payload_compressed": encoded.compressed,
+        }
+        assert decode_raw_payload(row, "raw_odds") == payload
+
+    def test_small_payloads_stay_json(self):
+        """Payloads under the threshold are stored as plain JSON."""
+        writer = RawZoneWriter(compression="br", compression_threshold=1024)
+
+        encoded = writer.encode({"ml": -110})
+
+        assert encoded.compressed is None
+        assert decode_raw_payload({"raw_odds": encoded.text}, "raw_odds") == {"ml": -110}
+
+    def test_canonical_payload_ignores_key_order(self):
+        """Equal content serializes to identical bytes."""
+        assert canonical_payload({"b": 1, "a": 2}) == canonical_payload({"a": 2, "b": 1})
+
+    def test_unsupported_compression_rejected(self):
+        """Only encodings with a read path can be configured."""
+        with pytest.raises(ValueError):
+            RawZoneWriter(compression="lz4")
+
+    @pytest.mark.asyncio
+    async def test_compressed_odds_reach_the_historical_staging_reader(self):
+        """A compressed raw_odds row is decoded by the staging reader."""
+        writer = RawZoneWriter(compression="br", compression_threshold=64)
+        moneyline = [{"side": "home", "odds": -110 - i, "updated_at": f"t{i}"} for i in range(20)]
+        encoded = writer.encode({"moneyline": moneyline})
+        row = {
+            "id": 11,
+            "external_game_id": "258267",
+            "sportsbook_key": "15",
+            "raw_odds": encoded.text,
+            "payload_encoding": encoded.encoding,
+            "payload_compressed": encoded.compressed,
+            "collected_at": datetime(2025, 7, 18, tzinfo=timezone.utc),
+        }
+        assert row["raw_odds"] is None
+
+        processor = ActionNetworkUnifiedStagingProcessor()
+        seen = []
+
+        async def resolve(action_network_id):
+            return (1, "DraftKings")
+
+        async def process_market_data(market_data, market_type, *args):
+            seen.append((market_type, market_data))
+            return []
+
+        processor.sportsbook_resolver = SimpleNamespace(
+            resolve_action_network_id=resolve
+        )
+        processor._process_market_data = process_market_data
+
+        await processor._extract_from_odds(row, conn=None)
+
+        assert seen == [("moneyline", moneyline)]
@@ -0,0 +1,387 @@
+"""
+Unit tests for the streaming RAW -> STAGING pipeline.
+
+Covers chunked flushing, backpressure, stage error isolation and per-stage
+metrics of StreamingPipeline, and the streaming modes of the staging
+processors built on it.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from src.data.database import connection as db_connection
+from src.data.pipeline import sbd_staging_processor, unified_staging_processor
+from src.data.pipeline.sbd_staging_processor import SBDStagingProcessor
+from src.data.pipeline.streaming import (
+    PipelineStage,
+    StreamingPipeline,
+    raw_row_to_record,
+)
+from src.data.pipeline.unified_staging_processor import (
+    UnifiedStagingProcessor,
+    UnifiedStagingRecord,
+)
+from src.data.pipeline.zone_interface import ZoneConfig, ZoneType
+
+
+async def _numbers(count, produced=None):
+    for i in range(count):
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+
+class TestStreamingPipeline:
+    """Test the bounded-queue streaming pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_items_flow_through_stages_in_chunks(self):
+        """Every item reaches the sink in chunks no larger than chunk_size."""
+        chunks = []
+
+        async def double(item):
+            return item * 2
+
+        async def sink(chunk):
+            chunks.append(list(chunk))
+
+        pipeline = StreamingPipeline(
+            _numbers(1000),
+            [PipelineStage("double", double)],
+            sink,
+            chunk_size=128,
+            queue_size=16,
+        )
+        result = await pipeline.run()
+
+        assert [item for chunk in chunks for item in chunk] == [i * 2 for i in range(1000)]
+        assert max(len(chunk) for chunk in chunks) <= 128
+        assert result.records_read == 1000
+        assert result.records_stored == 1000
+        assert [stage["name"] for stage in result.to_dict()["stages"]] == [
+            "source",
+            "double",
+            "sink",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_items_in_flight(self):
+        """A slow sink stops the source from reading ahead of the queues."""
+        produced = []
+        stored = []
+        max_in_flight = 0
+
+        async def passthrough(item):
+            return item
+
+        async def slow_sink(chunk):
+            nonlocal max_in_flight
+            max_in_flight = max(max_in_flight, len(produced) - len(stored))
+            await asyncio.sleep(0.001)
+            stored.extend(chunk)
+
+        queue_size, chunk_size = 8, 10
+        pipeline = StreamingPipeline(
+            _numbers(500, produced),
+            [PipelineStage("passthrough", passthrough)],
+            slow_sink,
+            chunk_size=chunk_size,
+            queue_size=queue_size,
+        )
+        await pipeline.run()
+
+        assert len(stored) == 500
+        # Two queues, the item held by each task and the chunk being gathered
+        assert max_in_flight <= 2 * queue_size + chunk_size + 4
+
+    @pytest.mark.asyncio
+    async def test_partial_chunks_flush_on_interval(self):
+        """A slow trickle is flushed after flush_interval instead of waiting."""
+        chunks = []
+
+        async def trickle():
+            for i in range(3):
+                yield i
+                await asyncio.sleep(0.05)
+
+        async def sink(chunk):
+            chunks.append(list(chunk))
+
+        pipeline = StreamingPipeline(
+            trickle(), [], sink, chunk_size=100, flush_interval=0.01
+        )
+        await pipeline.run()
+
+        assert chunks == [[0], [1], [2]]
+
+    @pytest.mark.asyncio
+    async def test_stage_errors_are_counted_and_dropped(self):
+        """Failing items are dropped without stopping the stream."""
+        stored = []
+
+        async def reject_odd(item):
+            if item % 2:
+                raise ValueError("odd")
+            return item
+
+        async def sink(chunk):
+            stored.extend(chunk)
+
+        pipeline = StreamingPipeline(
+            _numbers(100),
+            [PipelineStage("reject_odd", reject_odd, workers=3)],
+            sink,
+            chunk_size=7,
+        )
+        result = await pipeline.run()
+
+        assert sorted(stored) == list(range(0, 100, 2))
+        assert result.errors == 50
+        assert result.stages[1].items_out == 50
+
+    @pytest.mark.asyncio
+    async def test_batch_stage_receives_lists(self):
+        """Batch stages see bounded lists and may filter them."""
+        batch_sizes = []
+        stored = []
+
+        async def keep_even(items):
+            batch_sizes.append(len(items))
+            return [item for item in items if item % 2 == 0]
+
+        async def sink(chunk):
+            stored.extend(chunk)
+            return len(chunk)
+
+        pipeline = StreamingPipeline(
+            _numbers(95),
+            [PipelineStage("keep_even", keep_even, batch_size=20)],
+            sink,
+            chunk_size=50,
+        )
+        result = await pipeline.run()
+
+        assert stored == list(range(0, 95, 2))
+        assert max(batch_sizes) <= 20
+        assert result.records_stored == len(stored)
+
+    @pytest.mark.asyncio
+    async def test_sink_failure_aborts_run(self):
+        """Persistence failures propagate instead of silently losing rows."""
+
+        async def failing_sink(chunk):
+            raise RuntimeError("database unavailable")
+
+        pipeline = StreamingPipeline(_numbers(10_000), [], failing_sink, chunk_size=10)
+
+        with pytest.raises(RuntimeError, match="database unavailable"):
+            await pipeline.run()
+
+    def test_invalid_sizes_rejected(self):
+        """Non-positive chunk or queue sizes are configuration errors."""
+        with pytest.raises(ValueError):
+            StreamingPipeline(_numbers(1), [], None, chunk_size=0)
+
+
+class TestRawRowToRecord:
+    """Test conversion of raw zone rows into DataRecords."""
+
+    def test_raw_odds_json_is_parsed_with_sportsbook_key(self):
+        """raw_odds JSON is decoded and tagged with the sportsbook key."""
+        record = raw_row_to_record(
+            {
+                "id": 7,
+                "external_game_id": "258267",
+                "sportsbook_key": "15",
+                "raw_odds": '{"moneyline": []}',
+            }
+        )
+
+        assert record.id == 7
+        assert record.external_id == "258267"
+        assert record.source == "action_network"
+        assert record.raw_data == {"moneyline": [], "_sportsbook_key": "15"}
+
+    def test_invalid_json_is_dropped(self):
+        """Unparseable payloads become None rather than failing the stream."""
+        record = raw_row_to_record({"id": 1, "external_id": "x", "raw_data": "{"})
+
+        assert record.raw_data is None
+
+
+class FakeConnection:
+    """Records executed statements; transactions are no-ops."""
+
+    def __init__(self, events):
+        self.events = events
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, *args):
+        self.events.append(("execute", " ".join(query.split()), args))
+
+
+def _fake_get_connection(events):
+    @asynccontextmanager
+    async def get_connection():
+        yield FakeConnection(events)
+
+    return get_connection
+
+
+def _rows_source(rows):
+    async def stream_query_rows(query, *args, fetch_size=500):
+        for row in rows:
+            yield row
+
+    return stream_query_rows
+
+
+def _staging_config():
+    return ZoneConfig(
+        zone_type=ZoneType.STAGING, schema_name="staging", auto_promotion=False
+    )
+
+
+class TestStreamRawToStaging:
+    """Test UnifiedStagingProcessor.stream_raw_to_staging."""
+
+    @pytest.fixture
+    def processor(self, monkeypatch):
+        events = []
+        rows = [
+            # game 1 / book 15 spans the first chunk boundary
+            {"id": 1, "external_game_id": "g1", "sportsbook_key": "15", "raw_odds": {"home_ml": -120}},
+            {"id": 2, "external_game_id": "g1", "sportsbook_key": "15", "raw_odds": {"away_ml": 110}},
+            {"id": 3, "external_game_id": "g1", "sportsbook_key": "15", "raw_odds": {"over": -105}},
+            {"id": 4, "external_game_id": "g2", "sportsbook_key": "15", "raw_odds": {"home_ml": 140}},
+            {"id": 5, "external_game_id": "g2", "sportsbook_key": "15", "raw_odds": {"under": -110}},
+        ]
+        monkeypatch.setattr(
+            unified_staging_processor, "stream_query_rows", _rows_source(rows)
+        )
+        monkeypatch.setattr(db_connection, "get_connection", _fake_get_connection(events))
+
+        processor = UnifiedStagingProcessor(_staging_config())
+
+        async def resolve(records):
+            return None
+
+        async def transform(record, **kwargs):
+            odds = record.raw_data
+            return UnifiedStagingRecord(
+                id=record.id,
+                source="action_network",
+                external_game_id=record.external_id,
+                sportsbook_external_id=odds["_sportsbook_key"],
+                home_moneyline_odds=odds.get("home_ml"),
+                away_moneyline_odds=odds.get("away_ml"),
+                over_odds=odds.get("over"),
+                under_odds=odds.get("under"),
+                raw_data_table="raw_data.action_network_odds",
+                raw_data_id=record.id,
+            )
+
+        async def store(records):
+            if records:
+                events.append(("store", [r.model_copy() for r in records]))
+
+        monkeypatch.setattr(processor, "_batch_resolve_game_ids", resolve)
+        monkeypatch.setattr(processor, "process_record", transform)
+        monkeypatch.setattr(processor, "store_unified_records", store)
+        processor.events = events
+        return processor
+
+    @pytest.mark.asyncio
+    async def test_groups_spanning_chunks_are_stored_once_and_merged(self, processor):
+        """The trailing group of a chunk is carried over, not split."""
+        result = await processor.stream_raw_to_staging(chunk_size=2, flush_interval=60)
+
+        stored = [r for event in processor.events if event[0] == "store" for r in event[1]]
+        assert [r.external_game_id for r in stored] == ["g1", "g2"]
+        g1, g2 = stored
+        assert (g1.home_moneyline_odds, g1.away_moneyline_odds, g1.over_odds) == (-120, 110, -105)
+        assert (g2.home_moneyline_odds, g2.under_odds) == (140, -110)
+        assert result.records_read == 5
+        assert result.records_stored == 2
+
+    @pytest.mark.asyncio
+    async def test_raw_rows_are_marked_processed_after_their_group_is_stored(
+        self, processor
+    ):
+        """processed_at is set only for rows whose staging record was stored."""
+        await processor.stream_raw_to_staging(chunk_size=2, flush_interval=60)
+
+        raw_ids = {"g1": {1, 2, 3}, "g2": {4, 5}}
+        stored_ids = set()
+        marked_ids = set()
+        for event in processor.events:
+            if event[0] == "store":
+                for record in event[1]:
+                    stored_ids |= raw_ids[record.external_game_id]
+            else:
+                _, query, args = event
+                assert query.startswith(
+                    "UPDATE raw_data.action_network_odds SET processed_at = $1"
+                )
+                assert set(args[1]) <= stored_ids
+                marked_ids |= set(args[1])
+
+        assert marked_ids == {1, 2, 3, 4, 5}
+
+
+class TestStreamSbdRawRecords:
+    """Test SBDStagingProcessor.stream_sbd_raw_records."""
+
+    @pytest.mark.asyncio
+    async def test_only_stored_rows_are_marked_processed(self, monkeypatch):
+        """Rows that fail to parse or store keep processed_at NULL."""
+        events = []
+        rows = [
+            {"id": raw_id, "raw_response": {"id": raw_id, "ok": raw_id != 2}}
+            for raw_id in (1, 2, 3, 4)
+        ]
+        monkeypatch.setattr(
+            sbd_staging_processor, "stream_query_rows", _rows_source(rows)
+        )
+        monkeypatch.setattr(db_connection, "get_connection", _fake_get_connection(events))
+
+        processor = SBDStagingProcessor(_staging_config())
+        processor._initialized = True
+
+        def extract(raw_response):
+            return SimpleNamespace(ok=raw_response["ok"]) if raw_response["ok"] else None
+
+        async def resolve(game_record):
+            return None
+
+        async def get_or_create_game(connection, game_record):
+            return 10
+
+        async def store_split(connection, betting_record):
+            if betting_record.raw_id == 3:
+                raise RuntimeError("constraint violation")
+
+        def extract_split(raw_response):
+            if not raw_response["ok"]:
+                return None
+            return SimpleNamespace(raw_id=raw_response["id"], game_id=None)
+
+        monkeypatch.setattr(processor, "_extract_game_data", extract)
+        monkeypatch.setattr(processor, "_extract_betting_split_data", extract_split)
+        monkeypatch.setattr(processor, "_resolve_mlb_game_id", resolve)
+        monkeypatch.setattr(processor, "_get_or_create_game", get_or_create_game)
+        monkeypatch.setattr(processor, "_store_betting_split", store_split)
+        monkeypatch.setattr(processor, "_detect_sharp_action_signal", lambda record: None)
+
+        result = await processor.stream_sbd_raw_records(chunk_size=10, flush_interval=60)
+
+        updates = [args for _, query, args in events if "processed_at" in query]
+        assert [sorted(args[1]) for args in updates] == [[1, 4]]
+        assert result.records_stored == 2
+        assert result.errors == 1
@@ -0,0 +1,129 @@
+"""
+Unit tests for the watermark-keyed analysis result cache.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from src.services.analytics.analysis_result_cache import AnalysisResultCache, cache_key
+
+
+class Counter:
+    """Compute callback that records how often it ran."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {"call": self.calls}
+
+
+FILTERS = {
+    "start_date": datetime(2025, 6, 1, tzinfo=timezone.utc),
+    "teams": ["NYY", "BOS"],
+    "confidence_threshold": 0.6,
+}
+
+
+class TestCacheKey:
+    """Test canonical hashing of filter sets."""
+
+    def test_equivalent_filter_sets_share_a_key(self):
+        """Key order and list order do not change the key."""
+        reordered = {
+            "confidence_threshold": 0.6,
+            "teams": ["BOS", "NYY"],
+            "start_date": datetime(2025, 6, 1, tzinfo=timezone.utc),
+        }
+
+        assert cache_key("stats", FILTERS, {"rows": 10}) == cache_key("stats", reordered, {"rows": 10})
+
+    def test_watermark_and_operation_are_part_of_the_key(self):
+        base = cache_key("stats", FILTERS, {"rows": 10})
+
+        assert cache_key("stats", FILTERS, {"rows": 11}) != base
+        assert cache_key("attribution", FILTERS, {"rows": 10}) != base
+
+
+class TestAnalysisResultCache:
+    """Test LRU behaviour and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_hit_until_watermark_moves(self):
+        """Identical requests reuse the result until new data lands in the window."""
+        cache = AnalysisResultCache()
+        compute = Counter()
+
+        first = await cache.get_or_compute("stats", FILTERS, {"rows": 10}, compute)
+        second = await cache.get_or_compute("stats", FILTERS, {"rows": 10}, compute)
+        third = await cache.get_or_compute("stats", FILTERS, {"rows": 11}, compute)
+
+        assert first == second == {"call": 1}
+        assert third == {"call": 2}
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = AnalysisResultCache(max_entries=2)
+        compute = Counter()
+
+        await cache.get_or_compute("stats", {"w": 1}, None, compute)
+        await cache.get_or_compute("stats", {"w": 2}, None, compute)
+        await cache.get_or_compute("stats", {"w": 1}, None, compute)
+        await cache.get_or_compute("stats", {"w": 3}, None, compute)
+        await cache.get_or_compute("stats", {"w": 1}, None, compute)
+        await cache.get_or_compute("stats", {"w": 2}, None, compute)
+
+        assert compute.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self):
+        """Simultaneous requests for the same key share one computation."""
+        cache = AnalysisResultCache()
+        compute = Counter()
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("stats", FILTERS, 1, compute) for _ in range(5))
+        )
+
+        assert compute.calls == 1
+        assert all(result == {"call": 1} for result in results)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        cache = AnalysisResultCache()
+
+        async def failing():
+            raise RuntimeError("fit failed")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("stats", FILTERS, 1, failing)
+
+        assert await cache.get_or_compute("stats", FILTERS, 1, lambda: {"ok": True}) == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_falls_back_to_memory(self):
+        """A broken Redis tier degrades to the in-memory cache."""
+        cache = AnalysisResultCache(redis_url="redis://127.0.0.1:1/0")
+        compute = Counter()
+
+        await cache.get_or_compute("stats", FILTERS, 1, compute)
+        await cache.get_or_compute("stats", FILTERS, 1, compute)
+
+        assert compute.calls == 1
+        assert cache.stats()["redis_enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_computes(self):
+        cache = AnalysisResultCache(max_entries=0)
+        compute = Counter()
+
+        await cache.get_or_compute("stats", FILTERS, 1, compute)
+        await cache.get_or_compute("stats", FILTERS, 1, compute)
+
+        assert compute.calls == 2
@@ -0,0 +1,230 @@
+"""
+Unit tests for the cross-book arbitrage and middle scanner.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.core import odds_math
+from src.services.analytics import cross_book_scanner
+from src.services.analytics.cross_book_scanner import CrossBookScanner
+
+
+def quote(game_id, book, **odds):
+    """UnifiedStagingRecord-shaped quote with every market field defaulted."""
+    fields = {
+        "mlb_stats_api_game_id": game_id,
+        "external_game_id": None,
+        "sportsbook_name": book,
+        "sportsbook_id": None,
+        "collected_at": None,
+        "home_moneyline_odds": None,
+        "away_moneyline_odds": None,
+        "spread_line": None,
+        "home_spread_odds": None,
+        "away_spread_odds": None,
+        "total_line": None,
+        "over_odds": None,
+        "under_odds": None,
+    }
+    fields.update(odds)
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture
+def published(monkeypatch):
+    events = []
+    monkeypatch.setattr(
+        cross_book_scanner, "publish_event", lambda event_type, data, source: events.append((event_type, data))
+    )
+    return events
+
+
+class TestArbitrage:
+    """Best-price pairs whose implied probabilities sum below one."""
+
+    def test_moneyline_arbitrage_uses_best_price_per_side(self, published):
+        scanner = CrossBookScanner()
+        found = scanner.ingest(
+            [
+                quote("g1", "DraftKings", home_moneyline_odds=110, away_moneyline_odds=-130),
+                quote("g1", "FanDuel", home_moneyline_odds=-120, away_moneyline_odds=105),
+                quote("g1", "BetMGM", home_moneyline_odds=-105, away_moneyline_odds=-115),
+            ]
+        )
+
+        assert [(o.kind, o.market_type, o.book_a, o.book_b) for o in found] == [
+            ("arbitrage", "moneyline", "DraftKings", "FanDuel")
+        ]
+        assert found[0].margin == pytest.approx(1 - 1 / 2.10 - 1 / 2.05)
+        assert published[0][0] == "cross_book_opportunity"
+        assert published[0][1]["detection_latency_ms"] >= 0
+
+    def test_line_markets_only_pair_compatible_lines(self, published):
+        """Plus-money on both sides of different totals is not arbitrage when both can lose."""
+        scanner = CrossBookScanner()
+        found = scanner.ingest(
+            [
+                quote("g1", "A", total_line=9.0, over_odds=105, under_odds=-125),
+                quote("g1", "B", total_line=8.0, over_odds=-125, under_odds=105),
+            ]
+        )
+        assert [o.kind for o in found] == []
+
+        found = scanner.ingest([quote("g1", "C", total_line=8.0, over_odds=110, under_odds=-130)])
+        assert [(o.kind, o.book_a, o.line_a, o.book_b, o.line_b) for o in found] == [
+            ("arbitrage", "C", 8.0, "B", 8.0)
+        ]
+
+    def test_unchanged_opportunities_publish_once(self, published):
+        scanner = CrossBookScanner()
+        records = [
+            quote("g1", "A", home_moneyline_odds=110, away_moneyline_odds=-130),
+            quote("g1", "B", home_moneyline_odds=-130, away_moneyline_odds=110),
+        ]
+        assert len(scanner.ingest(records)) == 1
+        assert scanner.ingest(records) == []
+        assert len(published) == 1
+
+        # The price moves back; the opportunity closes
+        scanner.ingest([quote("g1", "B", home_moneyline_odds=-130, away_moneyline_odds=-120)])
+        assert scanner.get_opportunities() == []
+
+
+class TestQuotes:
+    """How records update a book's stored quotes."""
+
+    def test_one_sided_record_keeps_the_other_side(self, published):
+        scanner = CrossBookScanner()
+        scanner.ingest(
+            [
+                quote("g1", "A", home_moneyline_odds=-130, away_moneyline_odds=130),
+                quote("g1", "B", home_moneyline_odds=120, away_moneyline_odds=-150),
+            ]
+        )
+
+        # A reprices only its home side; its away price of +130 still stands
+        scanner.ingest([quote("g1", "A", home_moneyline_odds=-140)])
+        assert [(o.book_a, o.odds_a, o.book_b, o.odds_b) for o in scanner.get_opportunities()] == [
+            ("B", 120.0, "A", 130.0)
+        ]
+
+        # A moved total line invalidates the side it did not quote
+        scanner.ingest([quote("g1", "A", total_line=8.5, over_odds=-110, under_odds=-110)])
+        scanner.ingest([quote("g1", "A", total_line=9.0, over_odds=-105)])
+        assert np.isnan(scanner._odds[scanner._game_rows["g1"], cross_book_scanner.TOTAL, 0, 1])
+
+    def test_quotes_are_dated_by_collection_time(self, published):
+        scanner = CrossBookScanner()
+        collected = datetime.now(timezone.utc) - timedelta(minutes=5)
+        found = scanner.ingest(
+            [
+                quote("g1", "A", collected_at=collected, home_moneyline_odds=110, away_moneyline_odds=-130),
+                quote("g1", "B", collected_at=collected, home_moneyline_odds=-130, away_moneyline_odds=110),
+            ]
+        )
+
+        assert found[0].quoted_at == collected
+        assert found[0].ingested_at > collected
+
+        # An older record does not overwrite the newer quote
+        scanner.ingest(
+            [quote("g1", "A", collected_at=collected - timedelta(minutes=1), home_moneyline_odds=-200)]
+        )
+        assert scanner.get_opportunities()[0].odds_a == 110.0
+
+
+class TestMiddles:
+    """Lines far enough apart that a score can win both bets."""
+
+    def test_spread_and_total_middles(self, published):
+        scanner = CrossBookScanner()
+        found = scanner.ingest(
+            [
+                quote("g1", "A", spread_line=1.5, home_spread_odds=-150, away_spread_odds=130,
+                      total_line=7.5, over_odds=-110, under_odds=-110),
+                quote("g1", "B", spread_line=-1.5, home_spread_odds=140, away_spread_odds=-160,
+                      total_line=8.5, over_odds=-110, under_odds=-110),
+            ]
+        )
+        middles = {o.market_type: o for o in found if o.kind == "middle"}
+
+        spread = middles["spread"]
+        assert (spread.book_a, spread.line_a, spread.book_b, spread.line_b) == ("A", 1.5, "B", 1.5)
+        assert spread.middle_width == 3.0
+
+        total = middles["total"]
+        assert (total.side_a, total.book_a, total.line_a, total.side_b, total.book_b, total.line_b) == (
+            "over", "A", 7.5, "under", "B", 8.5
+        )
+        assert total.margin == pytest.approx(1 - 2 * 110 / 210)
+
+    def test_adjacent_whole_number_totals_are_not_middles(self, published):
+        scanner = CrossBookScanner()
+        found = scanner.ingest(
+            [
+                quote("g1", "A", total_line=8.0, over_odds=-110, under_odds=-110),
+                quote("g1", "B", total_line=9.0, over_odds=-110, under_odds=-110),
+            ]
+        )
+        assert found == []
+
+
+class TestMatrix:
+    """Growth, staleness and removal of games and books."""
+
+    def test_grows_and_ignores_stale_quotes(self, published):
+        scanner = CrossBookScanner(initial_games=1, initial_books=1)
+        scanner.ingest(
+            [quote(f"g{game}", f"book{book}", home_moneyline_odds=-110, away_moneyline_odds=-110)
+             for game in range(5) for book in range(3)]
+        )
+        assert scanner.get_stats()["games"] == 5
+        assert scanner.get_stats()["books"] == 3
+
+        scanner.ingest([quote("g0", "book0", home_moneyline_odds=120, away_moneyline_odds=-140)])
+        scanner.ingest([quote("g0", "book1", home_moneyline_odds=-140, away_moneyline_odds=120)])
+        assert len(scanner.get_opportunities("arbitrage")) == 1
+
+        scanner.max_quote_age_seconds = -1
+        assert scanner.scan() == []
+        assert scanner.get_opportunities() == []
+
+        assert scanner.remove_game("g0") is True
+        assert scanner.get_stats()["games"] == 4
+
+
+@pytest.mark.benchmark
+def test_full_slate_detection_latency(published, record_property):
+    """Time a full slate of quotes landing and being published (ENABLE_BENCHMARKS=true)."""
+    rng = np.random.default_rng(7)
+    books = [f"book{i}" for i in range(20)]
+    records = []
+    for game in range(30):
+        fair = rng.uniform(0.35, 0.65)
+        for book in books:
+            vig = rng.uniform(-0.01, 0.03, size=2)
+            home, away = odds_math.decimal_to_american_array(
+                [1 / (fair + vig[0]), 1 / (1 - fair + vig[1])]
+            )
+            records.append(
+                quote(f"g{game}", book, home_moneyline_odds=round(home), away_moneyline_odds=round(away),
+                      spread_line=rng.choice([-1.5, 1.5]), home_spread_odds=-110, away_spread_odds=-110,
+                      total_line=rng.choice([7.5, 8.0, 8.5, 9.0]), over_odds=-110, under_odds=-110)
+            )
+
+    scanner = CrossBookScanner()
+    start = time.perf_counter()
+    found = scanner.ingest(records)
+    record_property("ingest_scan_ms", (time.perf_counter() - start) * 1000)
+    record_property("scan_ms", scanner.get_stats()["last_scan_ms"])
+    record_property(
+        "max_detection_latency_ms", max((o.detection_latency_ms for o in found), default=0.0)
+    )
+
+    assert found
+    assert len(published) == len(found)
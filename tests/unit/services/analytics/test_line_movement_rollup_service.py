@@ -0,0 +1,110 @@
+"""
+Unit tests for the incremental line movement rollup refresh.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from src.core.exceptions import AnalyticsError
+from src.services.analytics.line_movement_rollup_service import (
+    REFRESH_ROLLUPS_SQL,
+    LineMovementRollupService,
+)
+
+MODULE = "src.services.analytics.line_movement_rollup_service"
+
+
+class FakeConnection:
+    """Simulates the watermark row and a history table of ``max_id`` rows."""
+
+    def __init__(self, watermark=0, max_id=0):
+        self.watermark = watermark
+        self.max_id = max_id
+        self.refreshed_ranges = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def fetchval(self, query, *args):
+        return self.watermark
+
+    async def fetchrow(self, query, last_id, limit):
+        upper = min(last_id + limit, self.max_id)
+        count = max(upper - last_id, 0)
+        return {"row_count": count, "max_id": upper if count else None}
+
+    async def execute(self, query, *args):
+        if query is REFRESH_ROLLUPS_SQL:
+            self.refreshed_ranges.append(args)
+            return f"INSERT 0 {(args[1] - args[0]) * 2}"
+        if "UPDATE" in query:
+            self.watermark = args[1]
+        return "UPDATE 1"
+
+
+def _patched(conn):
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    return patch(f"{MODULE}.get_connection", get_connection)
+
+
+class TestLineMovementRollupService:
+    """Test watermark-driven refresh batching."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_drains_backlog_in_batches(self):
+        """New history ids are folded in batch by batch and the watermark advances."""
+        conn = FakeConnection(watermark=100, max_id=350)
+        service = LineMovementRollupService(batch_size=100, overlap_ids=10)
+
+        with _patched(conn):
+            result = await service.refresh()
+
+        assert result.batches == 3
+        assert result.source_rows == 250
+        assert result.last_source_id == 350
+        assert conn.watermark == 350
+        # Each batch re-scans a small window behind the watermark
+        assert conn.refreshed_ranges == [(90, 200), (190, 300), (290, 350)]
+
+    @pytest.mark.asyncio
+    async def test_refresh_is_noop_when_current(self):
+        """A refresh with no new rows runs no aggregation."""
+        conn = FakeConnection(watermark=500, max_id=500)
+
+        with _patched(conn):
+            result = await LineMovementRollupService().refresh()
+
+        assert result.batches == 0
+        assert result.last_source_id == 500
+        assert conn.refreshed_ranges == []
+
+    @pytest.mark.asyncio
+    async def test_max_batches_bounds_a_run(self):
+        """A bounded run leaves the rest of the backlog for the next schedule."""
+        conn = FakeConnection(watermark=0, max_id=1_000)
+
+        with _patched(conn):
+            result = await LineMovementRollupService(batch_size=100).refresh(max_batches=2)
+
+        assert result.batches == 2
+        assert conn.watermark == 200
+
+    @pytest.mark.asyncio
+    async def test_missing_state_row_is_reported(self):
+        """Refreshing before the migration ran surfaces an AnalyticsError."""
+        conn = FakeConnection(watermark=None, max_id=10)
+
+        with _patched(conn):
+            with pytest.raises(AnalyticsError):
+                await LineMovementRollupService().refresh()
+
+    def test_refresh_sql_covers_both_bucket_widths(self):
+        """One statement aggregates the 5-minute and hourly buckets."""
+        assert "('5m', 300)" in REFRESH_ROLLUPS_SQL
+        assert "('1h', 3600)" in REFRESH_ROLLUPS_SQL
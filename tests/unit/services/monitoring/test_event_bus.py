@@ -0,0 +1,78 @@
+"""
+Unit tests for the monitoring event bus.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.services.monitoring.event_bus import MonitoringEventBus
+
+
+class TestMonitoringEventBus:
+    """Test publish/subscribe delivery and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_every_subscriber(self):
+        """Each subscriber receives its own copy of an event."""
+        bus = MonitoringEventBus()
+        first, second = bus.subscribe(), bus.subscribe()
+
+        bus.publish("pipeline_update", {"pipeline_id": "p-1"}, source="metrics")
+
+        for subscription in (first, second):
+            event = await subscription.get(timeout=1)
+            assert event.type == "pipeline_update"
+            assert event.data == {"pipeline_id": "p-1"}
+            assert event.source == "metrics"
+        assert bus.version == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest(self):
+        """A slow subscriber loses its oldest events instead of blocking publishers."""
+        bus = MonitoringEventBus()
+        subscription = bus.subscribe(max_size=2)
+
+        for i in range(5):
+            bus.publish("metrics_delta", {"value": i})
+
+        assert [e.data["value"] for e in subscription.drain()] == [3, 4]
+        assert subscription.dropped == 3
+
+    @pytest.mark.asyncio
+    async def test_filter_and_unsubscribe(self):
+        """Filtered events are skipped and closed subscriptions stop receiving."""
+        bus = MonitoringEventBus()
+        alerts = bus.subscribe(event_filter=lambda e: e.type == "alert")
+
+        bus.publish("metrics_delta", {})
+        bus.publish("alert", {"level": "warning"})
+        assert [e.type for e in alerts.drain()] == ["alert"]
+
+        alerts.close()
+        bus.publish("alert", {})
+        assert bus.subscriber_count == 0
+        assert alerts.drain() == []
+
+    @pytest.mark.asyncio
+    async def test_get_times_out_when_idle(self):
+        """Waiting on an idle bus returns None after the timeout."""
+        subscription = MonitoringEventBus().subscribe()
+
+        assert await subscription.get(timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_publish_from_worker_thread(self):
+        """Events published off the loop are delivered on the subscriber's loop."""
+        bus = MonitoringEventBus()
+        subscription = bus.subscribe()
+
+        thread = threading.Thread(
+            target=bus.publish, args=("collector_health", {"status": "critical"})
+        )
+        thread.start()
+        thread.join()
+
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert event.data == {"status": "critical"}
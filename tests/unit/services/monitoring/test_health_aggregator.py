@@ -0,0 +1,117 @@
+"""
+Unit tests for the TTL-cached concurrent health check aggregator.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.monitoring.health_aggregator import HealthAggregator
+
+
+def _failure(name, error):
+    return {"status": "unhealthy", "error_type": type(error).__name__}
+
+
+def _counting_check(result, delay=0.0):
+    calls = {"count": 0}
+
+    async def check():
+        calls["count"] += 1
+        await asyncio.sleep(delay)
+        return result
+
+    return check, calls
+
+
+class TestHealthAggregator:
+    """Test caching, concurrency and failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_results_cached_for_ttl(self):
+        """A check runs once per TTL regardless of how often it is requested."""
+        aggregator = HealthAggregator()
+        check, calls = _counting_check({"status": "healthy"})
+        aggregator.register("db", check, ttl_seconds=60, timeout_seconds=1, on_error=_failure)
+
+        for _ in range(3):
+            assert await aggregator.refresh() == {"db": {"status": "healthy"}}
+
+        assert calls["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_probes_share_one_execution(self):
+        """A probe storm triggers a single run of each check, concurrently."""
+        aggregator = HealthAggregator()
+        slow_a, calls_a = _counting_check("a", delay=0.1)
+        slow_b, calls_b = _counting_check("b", delay=0.1)
+        aggregator.register("a", slow_a, ttl_seconds=60, timeout_seconds=1, on_error=_failure)
+        aggregator.register("b", slow_b, ttl_seconds=60, timeout_seconds=1, on_error=_failure)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await asyncio.gather(*(aggregator.refresh() for _ in range(20)))
+
+        assert loop.time() - start < 0.18
+        assert all(r == {"a": "a", "b": "b"} for r in results)
+        assert calls_a["count"] == calls_b["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_errors_become_results(self):
+        """Hung or failing checks produce failure results instead of raising."""
+        aggregator = HealthAggregator()
+
+        async def hung():
+            await asyncio.sleep(10)
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        aggregator.register("hung", hung, ttl_seconds=60, timeout_seconds=0.05, on_error=_failure)
+        aggregator.register("broken", broken, ttl_seconds=60, timeout_seconds=1, on_error=_failure)
+
+        results = await aggregator.refresh()
+
+        assert results["hung"] == {"status": "unhealthy", "error_type": "TimeoutError"}
+        assert results["broken"] == {"status": "unhealthy", "error_type": "RuntimeError"}
+
+    @pytest.mark.asyncio
+    async def test_snapshot_never_waits(self):
+        """Snapshots return the last results and refresh stale checks in the background."""
+        aggregator = HealthAggregator()
+        check, calls = _counting_check({"status": "healthy"}, delay=0.05)
+        aggregator.register("db", check, ttl_seconds=0, timeout_seconds=1, on_error=_failure)
+
+        # Nothing cached yet: the caller has to fall back to refresh()
+        assert aggregator.snapshot() is None
+        await aggregator.refresh()
+        count_after_refresh = calls["count"]
+
+        assert aggregator.snapshot() == {"db": {"status": "healthy"}}
+        await asyncio.sleep(0.1)
+        assert calls["count"] > count_after_refresh
+
+    @pytest.mark.asyncio
+    async def test_cancelled_check_becomes_result(self):
+        """A cancelled check yields a failure result rather than a KeyError."""
+        aggregator = HealthAggregator()
+
+        async def cancelled():
+            raise asyncio.CancelledError()
+
+        hung_started = asyncio.Event()
+
+        async def hung():
+            hung_started.set()
+            await asyncio.sleep(10)
+
+        aggregator.register("cancelled", cancelled, ttl_seconds=60, timeout_seconds=1, on_error=_failure)
+        aggregator.register("hung", hung, ttl_seconds=60, timeout_seconds=5, on_error=_failure)
+
+        probe = asyncio.create_task(aggregator.refresh())
+        await hung_started.wait()
+        aggregator._inflight["hung"].cancel()
+        results = await probe
+
+        assert results["cancelled"] == {"status": "unhealthy", "error_type": "RuntimeError"}
+        assert results["hung"] == {"status": "unhealthy", "error_type": "RuntimeError"}
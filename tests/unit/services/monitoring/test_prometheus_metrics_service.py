@@ -210,6 +210,21 @@ class TestBusinessMetrics:
         metrics_service.update_strategy_performance(strategy_name, score)
         # Metrics are updated internally - test passes if no exception
 
+    def test_strategy_phase_recording(self, metrics_service):
+        """Test strategy phase timings land in the per-strategy, per-phase histograms."""
+        metrics_service.record_strategy_phase("sharp_action", "data_fetch", 1.5, 1.2)
+
+        labels = {"strategy": "sharp_action", "phase": "data_fetch"}
+        assert metrics_service.registry.get_sample_value(
+            "mlb_strategy_phase_duration_seconds_sum", labels
+        ) == pytest.approx(1.5)
+        assert metrics_service.registry.get_sample_value(
+            "mlb_strategy_phase_database_seconds_sum", labels
+        ) == pytest.approx(1.2)
+
+        with pytest.raises(ValueError):
+            metrics_service.record_strategy_phase("sharp_action", "", 1.0)
+
     def test_active_strategies_count(self, metrics_service):
         """Test active strategies count setting."""
         count = 7
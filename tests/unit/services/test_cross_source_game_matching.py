@@ -0,0 +1,154 @@
+"""
+Unit tests for the blocking index used by CrossSourceGameMatchingService.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.data.collection.base import DataSource
+from src.services.cross_source_game_matching_service import (
+    GameCandidateIndex,
+    GameMatchCandidate,
+)
+
+TEAMS = {
+    "New York Yankees": "NYY",
+    "Yankees": "NYY",
+    "Boston Red Sox": "BOS",
+    "Red Sox": "BOS",
+    "Tampa Bay Rays": "TB",
+    "Baltimore Orioles": "BAL",
+}
+
+
+def _candidate(external_id, source, home, away, start):
+    return GameMatchCandidate(
+        external_id=external_id,
+        source=source,
+        home_team=home,
+        away_team=away,
+        game_date=start.date(),
+        game_datetime=start,
+    )
+
+
+@pytest.fixture
+def index():
+    return GameCandidateIndex(TEAMS.get)
+
+
+class TestGameCandidateIndex:
+    """Blocking and union-find behaviour."""
+
+    def test_groups_same_game_across_sources(self, index):
+        start = datetime(2025, 7, 1, 19, 5)
+        index.add_all(
+            [
+                _candidate("an_1", DataSource.ACTION_NETWORK, "New York Yankees", "Boston Red Sox", start),
+                _candidate("sbd_1", DataSource.SBD, "Yankees", "Red Sox", start + timedelta(minutes=5)),
+                _candidate("vsin_1", DataSource.VSIN, "Yankees", "Red Sox", start),
+            ]
+        )
+
+        groups = index.groups()
+        assert len(groups) == 1
+        assert {c.external_id for c in groups[0]} == {"an_1", "sbd_1", "vsin_1"}
+
+    def test_different_matchups_on_same_date_stay_apart(self, index):
+        start = datetime(2025, 7, 1, 19, 5)
+        index.add_all(
+            [
+                _candidate("an_1", DataSource.ACTION_NETWORK, "Yankees", "Red Sox", start),
+                _candidate("sbd_2", DataSource.SBD, "Tampa Bay Rays", "Baltimore Orioles", start),
+            ]
+        )
+
+        assert len(index.groups()) == 2
+
+    def test_doubleheader_split_by_time_tolerance(self, index):
+        game1 = datetime(2025, 7, 1, 13, 5)
+        game2 = datetime(2025, 7, 1, 19, 5)
+        index.add_all(
+            [
+                _candidate("an_1", DataSource.ACTION_NETWORK, "Yankees", "Red Sox", game1),
+                _candidate("an_2", DataSource.ACTION_NETWORK, "Yankees", "Red Sox", game2),
+                _candidate("sbd_1", DataSource.SBD, "Yankees", "Red Sox", game1),
+                _candidate("sbd_2", DataSource.SBD, "Yankees", "Red Sox", game2),
+            ]
+        )
+
+        groups = sorted(sorted(c.external_id for c in g) for g in index.groups())
+        assert groups == [["an_1", "sbd_1"], ["an_2", "sbd_2"]]
+
+    def test_one_external_id_per_source(self, index):
+        start = datetime(2025, 7, 1, 19, 5)
+        index.add_all(
+            [
+                _candidate("sbd_1", DataSource.SBD, "Yankees", "Red Sox", start),
+                _candidate("sbd_dup", DataSource.SBD, "Yankees", "Red Sox", start),
+                _candidate("sbd_1", DataSource.SBD, "Yankees", "Red Sox", start),
+            ]
+        )
+
+        assert len(index) == 2
+        assert len(index.groups()) == 2
+
+    def test_incremental_merge(self, index):
+        start = datetime(2025, 7, 1, 19, 5)
+        first = _candidate("an_1", DataSource.ACTION_NETWORK, "Yankees", "Red Sox", start)
+        index.add(first)
+        assert index.group_of(first) == [first]
+
+        later = _candidate("vsin_1", DataSource.VSIN, "Yankees", "Red Sox", start)
+        index.add(later)
+        assert index.group_of(first) == [first, later]
+
+    def test_unresolvable_teams_are_singletons(self, index):
+        start = datetime(2025, 7, 1, 19, 5)
+        index.add_all(
+            [
+                _candidate("an_1", DataSource.ACTION_NETWORK, "Unknown", "Red Sox", start),
+                _candidate("sbd_1", DataSource.SBD, "Unknown", "Red Sox", start),
+            ]
+        )
+
+        assert len(index.groups()) == 2
+
+
+def test_full_season_matching_scales_linearly():
+    """Indexing a season of candidates stays near-linear."""
+
+    def season(days):
+        candidates = []
+        for day in range(days):
+            start = datetime(2025, 4, 1, 19, 5) + timedelta(days=day)
+            for source in (DataSource.ACTION_NETWORK, DataSource.SBD, DataSource.VSIN):
+                for game in range(15):
+                    candidates.append(
+                        _candidate(
+                            f"{source.value}_{day}_{game}",
+                            source,
+                            f"Home {game}",
+                            f"Away {game}",
+                            start,
+                        )
+                    )
+        return candidates
+
+    def standardize(name):
+        return name.split()[-1] if name.split()[0] in ("Home", "Away") else None
+
+    comparisons = []
+    for days in (20, 160):
+        candidates = season(days)
+        index = GameCandidateIndex(standardize)
+        index.add_all(candidates)
+        assert len(index.groups()) == days * 15
+        comparisons.append(index.comparisons)
+
+    # Each candidate is only compared within its (date, home, away) block, so
+    # 8x the candidates costs 8x the comparisons rather than the 64x of
+    # pairwise matching
+    assert comparisons[0] == 20 * 15 * 3
+    assert comparisons[1] == 8 * comparisons[0]
@@ -0,0 +1,252 @@
+"""
+Unit tests for date-batched outcome sync in GameOutcomeService.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.game_outcome_service import GameOutcomeService, MLBStatsAPIClient
+
+MODULE = "src.services.game_outcome_service"
+
+
+def _schedule_game(game_pk, status_code="F", home_runs=5, away_runs=3):
+    return {
+        "gamePk": game_pk,
+        "gameDate": "2025-07-01T23:05:00Z",
+        "status": {
+            "statusCode": status_code,
+            "abstractGameState": "Final" if status_code in ("F", "O") else "Live",
+        },
+        "teams": {
+            "home": {"team": {"name": "New York Yankees"}, "score": home_runs},
+            "away": {"team": {"name": "Boston Red Sox"}, "score": away_runs},
+        },
+        "linescore": {
+            "teams": {"home": {"runs": home_runs}, "away": {"runs": away_runs}}
+        },
+    }
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.status = 200
+        self.payload = payload
+
+    async def json(self):
+        return self.payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Serves schedule responses keyed by date and records requested URLs."""
+
+    def __init__(self, games_by_date):
+        self.games_by_date = games_by_date
+        self.urls = []
+
+    def get(self, url, params=None):
+        self.urls.append((url, params))
+        games = self.games_by_date.get(params["date"], [])
+        return FakeResponse({"dates": [{"games": games}] if games else []})
+
+
+def _client(tmp_path, games_by_date):
+    client = MLBStatsAPIClient(cache_dir=tmp_path)
+    client.session = FakeSession(games_by_date)
+    return client
+
+
+def _mock_connection(rows=None):
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=rows or [])
+    conn.executemany = AsyncMock()
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn.transaction = transaction
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    return conn, get_connection
+
+
+class TestScheduleCache:
+    @pytest.mark.asyncio
+    async def test_final_dates_are_served_from_disk(self, tmp_path):
+        """A date whose games are all final is fetched once, then cached."""
+        games = {"2025-07-01": [_schedule_game(1), _schedule_game(2)]}
+
+        first = _client(tmp_path, games)
+        await first.get_games_for_date("2025-07-01")
+        second = _client(tmp_path, games)
+        cached = await second.get_games_for_date("2025-07-01")
+
+        assert [game["gamePk"] for game in cached] == [1, 2]
+        assert (first.requests_made, second.requests_made) == (1, 0)
+        assert second.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_dates_with_live_games_are_not_cached(self, tmp_path):
+        """Dates with unfinished games are fetched again next time."""
+        games = {"2025-07-01": [_schedule_game(1), _schedule_game(2, "I")]}
+
+        await _client(tmp_path, games).get_games_for_date("2025-07-01")
+        client = _client(tmp_path, games)
+        await client.get_games_for_date("2025-07-01")
+
+        assert client.requests_made == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_dates_share_one_request_each(self, tmp_path):
+        """get_games_for_dates issues one schedule request per date."""
+        games = {
+            "2025-07-01": [_schedule_game(1)],
+            "2025-07-02": [_schedule_game(2), _schedule_game(3)],
+        }
+        client = _client(tmp_path, games)
+
+        schedules = await client.get_games_for_dates(["2025-07-01", "2025-07-02"])
+
+        assert {d: len(g) for d, g in schedules.items()} == {
+            "2025-07-01": 1,
+            "2025-07-02": 2,
+        }
+        assert client.requests_made == 2
+
+    @pytest.mark.asyncio
+    async def test_game_details_fallback_is_limited_and_counted(self, tmp_path):
+        """The linescore fallback goes through the same semaphore and counter."""
+
+        class FeedMissingSession:
+            def __init__(self):
+                self.in_flight = 0
+                self.max_in_flight = 0
+
+            @asynccontextmanager
+            async def get(self, url, params=None):
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                response = FakeResponse({"teams": {"home": {"runs": 4}, "away": {"runs": 2}}})
+                response.status = 200 if url.endswith("/linescore") else 404
+                try:
+                    yield response
+                finally:
+                    self.in_flight -= 1
+
+        client = MLBStatsAPIClient(cache_dir=tmp_path, max_concurrency=1)
+        client.session = FeedMissingSession()
+
+        details = await client.get_game_details("745000", _schedule_game(745000))
+
+        assert details["liveData"]["linescore"]["teams"]["home"]["runs"] == 4
+        assert client.requests_made == 2
+        assert client.session.max_in_flight == 1
+
+    def test_default_cache_dir_comes_from_settings(self):
+        """The schedule cache does not depend on the working directory."""
+        client = MLBStatsAPIClient()
+
+        assert client.cache_dir.is_absolute()
+        assert MLBStatsAPIClient(cache=False).cache_dir is None
+
+    def test_schedule_game_shaped_like_game_details(self):
+        """Schedule games expose the fields outcome processing reads."""
+        game_data = MLBStatsAPIClient.schedule_game_to_game_data(_schedule_game(7))
+
+        assert game_data["gameData"]["status"]["statusCode"] == "F"
+        assert game_data["gameData"]["teams"]["home"]["name"] == "New York Yankees"
+        assert game_data["liveData"]["linescore"]["teams"]["away"]["runs"] == 3
+
+
+class TestBatchedOutcomeSync:
+    @pytest.mark.asyncio
+    async def test_check_uses_schedule_and_bulk_upsert(self, tmp_path):
+        """Games are resolved from their date's schedule and upserted together."""
+        service = GameOutcomeService()
+        games = {"2025-07-01": [_schedule_game(745001), _schedule_game(745002, "I")]}
+        session = FakeSession(games)
+
+        @asynccontextmanager
+        async def client_factory():
+            client = MLBStatsAPIClient(cache_dir=tmp_path)
+            client.session = session
+            yield client
+
+        service.client_factory = client_factory
+        game_datetime = datetime(2025, 7, 1, 23, 5, tzinfo=timezone.utc)
+        service._get_games_needing_outcomes = AsyncMock(
+            return_value=[
+                {
+                    "id": game_id,
+                    "mlb_stats_api_game_id": str(pk),
+                    "home_team": "NYY",
+                    "away_team": "BOS",
+                    "game_datetime": game_datetime,
+                    "game_status": "scheduled",
+                }
+                for game_id, pk in ((1, 745001), (2, 745002))
+            ]
+        )
+        service._get_betting_lines_bulk = AsyncMock(
+            return_value={1: {"total_line": 8.5, "home_spread_line": -1.5}}
+        )
+        conn, get_connection = _mock_connection()
+
+        with patch(f"{MODULE}.get_connection", get_connection):
+            results = await service.check_and_update_game_outcomes(
+                ("2025-07-01", "2025-07-01")
+            )
+
+        assert results["updated_outcomes"] == 1
+        assert results["skipped_games"] == 1
+        assert results["api_requests"] == 1
+        assert len(session.urls) == 1
+
+        outcome_rows = conn.executemany.await_args_list[-1].args[1]
+        assert len(outcome_rows) == 1
+        game_id, home, away, home_score, away_score, home_win, over, cover = outcome_rows[0][:8]
+        assert (game_id, home, away, home_score, away_score) == (1, "NYY", "BOS", 5, 3)
+        assert (home_win, over, cover) == (True, False, True)
+
+    @pytest.mark.asyncio
+    async def test_fetch_skips_existing_outcomes_with_one_query(self, tmp_path):
+        """Existing outcomes are filtered with one lookup for the whole range."""
+        service = GameOutcomeService()
+        games = {
+            "2025-07-01": [_schedule_game(745001)],
+            "2025-07-02": [_schedule_game(745002)],
+        }
+
+        @asynccontextmanager
+        async def client_factory():
+            client = MLBStatsAPIClient(cache_dir=tmp_path)
+            client.session = FakeSession(games)
+            yield client
+
+        service.client_factory = client_factory
+        service._get_existing_outcome_mlb_ids = AsyncMock(return_value={"745001"})
+        service._store_independent_outcomes = AsyncMock()
+
+        results = await service.fetch_and_update_outcomes_from_mlb_api(
+            ("2025-07-01", "2025-07-02")
+        )
+
+        service._get_existing_outcome_mlb_ids.assert_awaited_once()
+        (stored,) = service._store_independent_outcomes.await_args.args
+        assert [o.mlb_stats_api_game_id for o in stored] == ["745002"]
+        assert results["updated_outcomes"] == 1
+        assert results["skipped_games"] == 1
+        assert results["api_requests"] == 2
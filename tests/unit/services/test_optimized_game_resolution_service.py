@@ -0,0 +1,130 @@
+"""
+Unit tests for the persistent resolution cache in OptimizedGameResolutionService.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.data.collection.base import DataSource
+from src.services.optimized_game_resolution_service import (
+    GameResolutionRequest,
+    OptimizedGameResolutionService,
+    ResolutionCache,
+)
+
+MODULE = "src.services.optimized_game_resolution_service"
+
+
+def _mock_connection(rows=None):
+    conn = MagicMock()
+    conn.fetch = AsyncMock(return_value=rows or [])
+    conn.execute = AsyncMock()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    return conn, get_connection
+
+
+def _resolution(mlb_game_id):
+    result = MagicMock()
+    result.mlb_game_id = mlb_game_id
+    result.confidence.value = "HIGH" if mlb_game_id else "NONE"
+    result.match_method = "test"
+    return result
+
+
+class TestResolutionCache:
+    def test_lru_eviction(self):
+        cache = ResolutionCache(max_size=2)
+        cache.put(("action_network", "1"), "m1")
+        cache.put(("action_network", "2"), "m2")
+        cache.get(("action_network", "1"))
+        cache.put(("action_network", "3"), "m3")
+
+        assert ("action_network", "1") in cache
+        assert ("action_network", "2") not in cache
+        assert cache.evictions == 1
+
+    def test_negative_entries_expire(self):
+        cache = ResolutionCache(negative_ttl=60)
+        key = ("vsin", "x")
+        with patch(f"{MODULE}.time.monotonic", return_value=100.0):
+            cache.mark_unresolvable(key)
+            assert cache.is_known_unresolvable(key)
+        with patch(f"{MODULE}.time.monotonic", return_value=161.0):
+            assert not cache.is_known_unresolvable(key)
+
+    def test_negative_entries_are_bounded(self):
+        cache = ResolutionCache(negative_ttl=60, max_negative_size=2)
+        with patch(f"{MODULE}.time.monotonic", return_value=100.0):
+            for external_id in ("a", "b", "c"):
+                cache.mark_unresolvable(("vsin", external_id))
+            assert cache.negative_size == 2
+            assert not cache.is_known_unresolvable(("vsin", "a"))
+
+        # Misses that are never looked up again are swept once expired
+        with patch(f"{MODULE}.time.monotonic", return_value=161.0):
+            cache.mark_unresolvable(("vsin", "d"))
+        assert cache.negative_size == 1
+
+
+class TestOptimizedGameResolutionService:
+    @pytest.fixture
+    def service(self):
+        service = OptimizedGameResolutionService(max_cache_size=100)
+        service._underlying_service = MagicMock()
+        service._underlying_service.resolve_game_id = AsyncMock(
+            return_value=_resolution("745000")
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_preloads_mappings_from_database(self, service):
+        rows = [
+            {
+                "mlb_stats_api_game_id": "745001",
+                "action_network_game_id": "258001",
+                "vsin_game_id": None,
+                "sbd_game_id": "sbd-1",
+            }
+        ]
+        _, get_connection = _mock_connection(rows)
+        with patch(f"{MODULE}.get_connection", get_connection):
+            await service._load_database_cache()
+
+        assert await service.resolve_game_id("258001") == "745001"
+        assert await service.resolve_game_id("sbd-1", source=DataSource.SBD) == "745001"
+        service._underlying_service.resolve_game_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_new_resolution_written_through(self, service):
+        conn, get_connection = _mock_connection()
+        with patch(f"{MODULE}.get_connection", get_connection):
+            result = await service.batch_resolve_games(
+                [
+                    GameResolutionRequest("258002", "NYY", "BOS", date(2025, 7, 1)),
+                    GameResolutionRequest("258002", "NYY", "BOS", date(2025, 7, 1)),
+                ]
+            )
+
+        assert result == {"258002": "745000"}
+        conn.execute.assert_awaited_once()
+        assert "action_network_game_id" in conn.execute.await_args.args[0]
+        assert await service.resolve_game_id("258002") == "745000"
+        assert service._underlying_service.resolve_game_id.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_resolutions_are_negatively_cached(self, service):
+        service._underlying_service.resolve_game_id = AsyncMock(
+            return_value=_resolution(None)
+        )
+
+        assert await service.resolve_game_id("unknown") is None
+        assert await service.resolve_game_id("unknown") is None
+        assert service._underlying_service.resolve_game_id.await_count == 1
+        assert service.get_stats()["negative_cache_hits"] == 1
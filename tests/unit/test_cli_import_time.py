@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark
+
+Guards the lazy command loading in src/interfaces/cli/main.py: importing the
+CLI and rendering help must not pull in the ML, collector or web stacks, and
+the import must stay within a small time budget. Runs in a fresh interpreter
+so modules imported by other tests do not hide regressions.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time of src.interfaces.cli.main, in microseconds
+CLI_IMPORT_BUDGET_US = 500_000
+
+HEAVY_MODULES = [
+    "lightgbm",
+    "mlflow",
+    "sklearn",
+    "polars",
+    "pandas",
+    "fastapi",
+    "playwright",
+    "selenium",
+    "asyncpg",
+    "aiohttp",
+]
+
+PROBE = """
+import json, sys
+from src.interfaces.cli.main import cli
+try:
+    cli(sys.argv[1:], prog_name="cli")
+except SystemExit:
+    pass
+heavy = {heavy!r}
+print(json.dumps(sorted(m for m in heavy if m in sys.modules)))
+"""
+
+
+def _run(args, importtime=False):
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", PROBE.format(heavy=HEAVY_MODULES), *args]
+    return subprocess.run(
+        command, cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120
+    )
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.rstrip().endswith(f"| {module}"):
+            return int(line.split("|")[1])
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+class TestCLIStartup:
+    """Benchmark CLI import cost."""
+
+    def test_help_imports_no_heavy_modules(self):
+        """Top-level help renders without importing any command module."""
+        result = _run(["--help"])
+
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+    def test_cli_import_within_budget(self):
+        """Importing the CLI entry point stays within the startup budget."""
+        result = _run(["--help"], importtime=True)
+
+        assert result.returncode == 0, result.stderr
+        # A module imported from the top level is reported without indentation
+        elapsed_us = _cumulative_import_us(result.stderr, "src.interfaces.cli.main")
+        assert elapsed_us < CLI_IMPORT_BUDGET_US, (
+            f"CLI import took {elapsed_us / 1000:.0f}ms "
+            f"(budget {CLI_IMPORT_BUDGET_US / 1000:.0f}ms)"
+        )
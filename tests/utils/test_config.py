@@ -260,6 +260,11 @@ def is_load_test_enabled() -> bool:
     return os.getenv("ENABLE_LOAD_TESTS", "false").lower() == "true"
 
 
+def is_benchmark_enabled() -> bool:
+    """Check if timing benchmarks are enabled."""
+    return os.getenv("ENABLE_BENCHMARKS", "false").lower() == "true"
+
+
 def skip_if_no_integration() -> bool:
     """Skip test if integration tests are disabled."""
     return not is_integration_test_enabled()